@@ -0,0 +1,131 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of sending bursts of messages with one write per message against encoding each burst
+into the reusable buffer of a batch and writing it once
+'''
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import importlib
+import timeit
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up each burst, weighted roughly as a telemetry stream
+BURST_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+             ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_servo_output_raw', 1))
+
+#Number of messages in a burst and number of bursts sent
+BURST_LENGTH = 50
+BURSTS = 400
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def make_bursts(pymavlab, seed=0):
+
+    """
+    Return bursts of (msgid, fields) with random field values
+
+    """
+
+    rng = random.Random(seed)
+    classes = [getattr(pymavlab.common, name) for name, weight in BURST_MIX for _ in range(weight)]
+    bursts = []
+    for _ in range(BURSTS):
+        burst = []
+        for _ in range(BURST_LENGTH):
+            cls = rng.choice(classes)
+            msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)))
+            burst.append((cls.ID, tuple(getattr(msg, name) for name in cls.FIELDS)))
+        bursts.append(burst)
+    return bursts
+
+
+def run():
+
+    """
+    Return the rate of sending the bursts to the null device with each method, checking that the
+    batch writes the same frames as encoding each message and that they parse without drops
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        pymavlab = load_package(work_path)
+        bursts = make_bursts(pymavlab)
+        messages = pymavlab.MESSAGES
+
+        #The batch numbers its frames as encoding each message with an incrementing sequence does
+        batch = pymavlab.MAVLinkBatch()
+        expected = []
+        seq = 0
+        for burst in bursts[:10]:
+            batch.encode(burst)
+            for msgid, fields in burst:
+                expected.append(messages[msgid](*fields).encode(seq))
+                seq = (seq + 1) & 0xff
+        frames = batch.getvalue()
+        if frames != b''.join(expected):
+            raise AssertionError('Batch frames do not match the frames of each message')
+
+        parser = pymavlab.MAVLinkParser()
+        if (len(parser.parse(frames)) != len(expected) or parser.stats.failed_crc or
+                parser.stats.packets_dropped):
+            raise AssertionError('Batch frames do not parse in sequence')
+
+        def each():
+            write = os.write
+            seq = 0
+            for burst in bursts:
+                for msgid, fields in burst:
+                    write(fd, messages[msgid](*fields).encode(seq))
+                    seq = (seq + 1) & 0xff
+
+        def batched():
+            batch = pymavlab.MAVLinkBatch()
+            write = lambda data: os.write(fd, data)
+            for burst in bursts:
+                batch.encode(burst)
+                batch.flush(write)
+
+        each_time = min(timeit.repeat(each, number=1, repeat=5))
+        batch_time = min(timeit.repeat(batched, number=1, repeat=5))
+        count = BURSTS * BURST_LENGTH
+        return {'messages' : count,
+                'each_per_s' : count / each_time,
+                'batch_per_s' : count / batch_time,
+                'batch_speedup' : each_time / batch_time}
+    finally:
+        os.close(fd)
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Messages:            %d in bursts of %d' % (result['messages'], BURST_LENGTH))
+    print('Write each message:  %10.0f msg/s' % result['each_per_s'])
+    print('Write each burst:    %10.0f msg/s, %.2fx' % (result['batch_per_s'], result['batch_speedup']))
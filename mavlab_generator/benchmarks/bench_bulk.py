@@ -0,0 +1,136 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of the NumPy bulk .tlog decoder against decoding frame by frame
+'''
+
+import os
+import sys
+import time
+import random
+import shutil
+import struct
+import tempfile
+import importlib
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up the synthetic log, weighted roughly as a telemetry stream
+LOG_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+           ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_param_value', 1))
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def write_tlog(pymavlab, frames, seed=0):
+
+    """
+    Build a .tlog buffer of random messages, with a corrupted frame every thousand frames
+
+    """
+
+    rng = random.Random(seed)
+    classes = [getattr(pymavlab.common, name) for name, weight in LOG_MIX for _ in range(weight)]
+    chunks = []
+    for seq in range(frames):
+        cls = rng.choice(classes)
+        msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)))
+        frame = msg.encode(seq)
+        if seq % 1000 == 999:
+            frame = frame[:-1] + bytes([frame[-1] ^ 0xff])
+        chunks.append(struct.pack('>Q', 1000 * seq))
+        chunks.append(frame)
+
+    return b''.join(chunks)
+
+
+def decode_serial(pymavlab, buf):
+
+    """
+    Decode a .tlog buffer one frame at a time with the generated unpack methods
+
+    """
+
+    result = {}
+    position = 0
+    while position + 8 < len(buf):
+        start = position + 8
+        end = start + pymavlab.mavpacket.HEADER_LEN + buf[start + 1] + pymavlab.mavpacket.CHECKSUM_LEN
+        try:
+            msg = pymavlab.decode_packet(buf[start:end])
+            result.setdefault(msg.NAME, []).append(msg)
+        except pymavlab.MAVLinkError:
+            pass
+        position = end
+
+    return result
+
+
+def run(frames=200000):
+
+    """
+    Time both decoders on the same synthetic log and check that they agree
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        buf = write_tlog(pymavlab, frames)
+
+        timer = time.perf_counter()
+        serial = decode_serial(pymavlab, buf)
+        serial_time = time.perf_counter() - timer
+
+        bulk_time = None
+        for _ in range(3):
+            timer = time.perf_counter()
+            bulk = pymavlab.decode_bulk(buf)
+            elapsed = time.perf_counter() - timer
+            if bulk_time is None or elapsed < bulk_time:
+                bulk_time = elapsed
+
+        for name, msgs in serial.items():
+            column = bulk[name]
+            if len(column) != len(msgs):
+                raise AssertionError('Frame count of %s differs' % name)
+            for field in msgs[0].FIELDS:
+                first = getattr(msgs[-1], field)
+                if isinstance(first, tuple):
+                    first = list(first)
+                elif isinstance(first, bytes) and column.dtype[field].kind == 'S':
+                    first = first.rstrip(b'\x00')
+                if column[field][-1].tolist() != first:
+                    raise AssertionError('Field %s of %s differs' % (field, name))
+
+        return {'frames' : frames, 'bytes' : len(buf),
+                'serial_s' : serial_time, 'bulk_s' : bulk_time,
+                'bulk_mb_per_s' : len(buf) / bulk_time / 1e6}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Log:          %d frames, %.1f MB' % (result['frames'], result['bytes'] / 1e6))
+    print('Frame decode: %.3f s' % result['serial_s'])
+    print('Bulk decode:  %.3f s (%.0f MB/s, %.1f s per GB)' % (result['bulk_s'], result['bulk_mb_per_s'],
+                                                              1e3 / result['bulk_mb_per_s']))
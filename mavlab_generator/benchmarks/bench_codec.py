@@ -0,0 +1,120 @@
+'''
+Created on 18 Oct 2026
+
+Throughput benchmark of the generated Python codec in messages per second
+'''
+
+import os
+import sys
+import shutil
+import struct
+import tempfile
+import importlib
+import timeit
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def per_field_unpack(message, payload):
+
+    """
+    Reference decoder which unpacks every field with its own struct call, as a hand written
+    decoder walking the field list would
+
+    """
+
+    values = {}
+    for field in message.fields:
+        fmt = '<%d%s' % (field.array_length, mavgen_python.STRUCT_FORMAT[field.type])
+        values[field.name] = struct.unpack_from(fmt, payload, field.offset)
+    return values
+
+
+def rate(stmt, number):
+
+    """
+    Return the best rate in operations per second of a statement run number times
+
+    """
+
+    return number / min(timeit.repeat(stmt, number=1, repeat=5))
+
+
+def run(number=20000):
+
+    """
+    Measure decode and encode throughput over a mix of every message in the dispatch list
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        schema = {message.id : message for dialect in mavschema.load_schema(DATA_PATH)
+                  for message in dialect.messages}
+
+        messages = [cls() for cls in pymavlab.MESSAGES if cls is not None]
+        payloads = [(msg.ID, msg.pack()) for msg in messages]
+        frames = [msg.encode(seq) for seq, msg in enumerate(messages)]
+        repeats = max(1, number // len(messages))
+        total = repeats * len(messages)
+
+        decode = pymavlab.decode
+        decode_packet = pymavlab.decode_packet
+
+        def run_decode():
+            for _ in range(repeats):
+                for msgid, payload in payloads:
+                    decode(msgid, payload)
+
+        def run_encode():
+            for _ in range(repeats):
+                for msg in messages:
+                    msg.pack()
+
+        def run_frames():
+            for _ in range(repeats):
+                for frame in frames:
+                    decode_packet(frame)
+
+        def run_reference():
+            for _ in range(repeats):
+                for msgid, payload in payloads:
+                    per_field_unpack(schema[msgid], payload)
+
+        return {'messages' : len(messages),
+                'decode_per_s' : rate(run_decode, total),
+                'reference_decode_per_s' : rate(run_reference, total),
+                'encode_per_s' : rate(run_encode, total),
+                'frame_decode_per_s' : rate(run_frames, total)}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Message types:          %d' % result['messages'])
+    print('Payload decode:         %10.0f msg/s' % result['decode_per_s'])
+    print('Per-field decode:       %10.0f msg/s' % result['reference_decode_per_s'])
+    print('Payload encode:         %10.0f msg/s' % result['encode_per_s'])
+    print('Frame decode with CRC:  %10.0f msg/s' % result['frame_decode_per_s'])
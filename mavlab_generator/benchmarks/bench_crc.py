@@ -0,0 +1,136 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of the table driven CRC engine against the original per-byte accumulate loop
+'''
+
+import os
+import sys
+import timeit
+import array
+import xml.etree.ElementTree as ET
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavcrc
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+DIALECTS = ('common.xml', 'ardupilotmega.xml')
+
+SORT_MAPPING = {'double' : 0, 'int64_t' : 0, 'uint64_t': 0, 'int32_t' : 1, 'uint32_t': 1,
+                'float' : 1, 'int16_t' : 3, 'uint16_t': 3, 'int8_t' : 4, 'uint8_t' : 4,
+                'char' : 4}
+
+
+def legacy_accumulate(crc, buf):
+
+    """
+    The shift/xor accumulate loop used by the generator before the table driven engine
+
+    """
+
+    byte_array = array.array('B')
+    byte_array.frombytes(buf.encode('latin-1'))
+
+    for byte in byte_array:
+        tmp = byte ^ (crc & 0xff)
+        tmp = (tmp ^ (tmp<<4)) & 0xff
+        crc = ((crc>>8) & 0xff) ^ (tmp<<8) ^ (tmp<<3) ^ ((tmp>>4) & 0xf)
+
+    return crc
+
+
+def legacy_crc_extra(name, fields):
+
+    """
+    CRC_EXTRA calculated field by field, as the generator used to
+
+    """
+
+    crc = legacy_accumulate(0xffff, name.upper() + ' ')
+    for field_type, field_name, array_size in fields:
+        crc = legacy_accumulate(crc, field_type + ' ')
+        crc = legacy_accumulate(crc, field_name + ' ')
+        if array_size > 1:
+            crc = legacy_accumulate(crc, chr(array_size))
+
+    return (crc&0xFF) ^ (crc>>8)
+
+
+def load_messages():
+
+    """
+    Read (name, fields) of every message in the benchmark dialects in wire order
+
+    """
+
+    messages = []
+    for dialect in DIALECTS:
+        root = ET.parse(os.path.join(DATA_PATH, dialect)).getroot()
+        for msg in root.find('messages').findall('message'):
+            fields = []
+            for field in msg.findall('field'):
+                field_type = field.attrib.get('type').split('[')[0].replace('_mavlink_version', '')
+                if '[' in field.attrib.get('type'):
+                    array_size = int(field.attrib.get('type').split('[')[1].split(']')[0])
+                else:
+                    array_size = 1
+                fields.append((field_type, field.attrib.get('name'), array_size))
+            fields.sort(key = lambda k: SORT_MAPPING[k[0]])
+            messages.append((msg.attrib.get('name'), fields))
+
+    return messages
+
+
+def best_of(function, repeat=5, number=10):
+
+    """
+    Return the fastest time in seconds of a single call to function
+
+    """
+
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def run():
+
+    """
+    Run the CRC benchmarks and return a dictionary of results
+
+    """
+
+    messages = load_messages()
+
+    #The CRC values must match the original implementation exactly
+    for name, fields in messages:
+        if legacy_crc_extra(name, fields) != mavcrc.crc_extra(name, fields):
+            raise AssertionError('CRC_EXTRA mismatch for message %s' % name)
+
+    legacy = best_of(lambda: [legacy_crc_extra(name, fields) for name, fields in messages])
+    table = best_of(lambda: [mavcrc.crc_extra(name, fields) for name, fields in messages])
+
+    #Frame checksum over a maximum length frame
+    frame = bytes(bytearray(i & 0xff for i in range(5 + 255)))
+    frame_text = frame.decode('latin-1')
+    if legacy_accumulate(0xffff, frame_text) != mavcrc.x25crc(frame):
+        raise AssertionError('Frame CRC mismatch')
+
+    legacy_frame = best_of(lambda: legacy_accumulate(0xffff, frame_text), number=200)
+    table_frame = best_of(lambda: mavcrc.x25crc(frame), number=200)
+
+    return {'messages' : len(messages),
+            'crc_extra_legacy_s' : legacy,
+            'crc_extra_table_s' : table,
+            'crc_extra_speedup' : legacy / table,
+            'frame_crc_legacy_s' : legacy_frame,
+            'frame_crc_table_s' : table_frame,
+            'frame_crc_speedup' : legacy_frame / table_frame}
+
+
+if __name__ == '__main__':
+    results = run()
+    print('CRC_EXTRA for %d messages: %.2f ms -> %.2f ms (%.1fx)' % (results['messages'],
+          results['crc_extra_legacy_s'] * 1e3, results['crc_extra_table_s'] * 1e3, results['crc_extra_speedup']))
+    print('Frame CRC (260 bytes): %.1f us -> %.1f us (%.1fx)' % (results['frame_crc_legacy_s'] * 1e6,
+          results['frame_crc_table_s'] * 1e6, results['frame_crc_speedup']))
@@ -0,0 +1,144 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of decoding a large log into columns with one and several worker processes
+'''
+
+import os
+import sys
+import time
+import struct
+import random
+import shutil
+import tempfile
+import importlib
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up the log, weighted roughly as a telemetry stream
+LOG_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+           ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_param_value', 1))
+
+#Number of worker processes of the parallel run
+JOBS = 4
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def write_log(pymavlab, frames, seed=0):
+
+    """
+    Return a .tlog of random messages sent 1 ms apart with a run of noise between records every
+    few hundred frames
+
+    """
+
+    rng = random.Random(seed)
+    classes = [getattr(pymavlab.common, name) for name, weight in LOG_MIX for _ in range(weight)]
+    chunks = []
+    for i in range(frames):
+        cls = rng.choice(classes)
+        msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)), rng.randint(1, 3))
+        if rng.random() < 0.005:
+            chunks.append(bytes([254] + [rng.getrandbits(8) for _ in range(rng.randint(0, 20))]))
+        chunks.append(struct.pack('>Q', i * 1000) + msg.encode(i))
+
+    return b''.join(chunks)
+
+
+def same_columns(first, second):
+
+    """
+    Return whether two decoded logs have the same columns, comparing arrays by their bytes as the
+    random payloads include NaNs
+
+    """
+
+    if sorted(first) != sorted(second):
+        return False
+    for name in first:
+        if sorted(first[name]) != sorted(second[name]):
+            return False
+        for key, column in first[name].items():
+            other = second[name][key]
+            if hasattr(column, 'tobytes'):
+                if column.typecode != other.typecode or column.tobytes() != other.tobytes():
+                    return False
+            elif column != other:
+                return False
+    return True
+
+
+def best_time(fn, repeat=3):
+
+    """
+    Return the result and the best wall time in seconds of calling fn repeat times
+
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def run(frames=100000, copies=8):
+
+    """
+    Decode a log of copies of a block of frames with a single job and with JOBS worker processes,
+    checking that both give the same columns. The speedup depends on the number of CPUs.
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        log_path = os.path.join(work_path, 'fleet.tlog')
+        with open(log_path, 'wb') as fo:
+            fo.write(write_log(pymavlab, frames) * copies)
+
+        serial, serial_time = best_time(lambda: pymavlab.decode_log(log_path, jobs=1))
+        parallel, parallel_time = best_time(lambda: pymavlab.decode_log(log_path, jobs=JOBS))
+        if not same_columns(serial, parallel):
+            raise AssertionError('Decoding with %d jobs does not match decoding with a single job' % JOBS)
+
+        decoded = sum(len(columns['_offset']) for columns in serial.values())
+        if decoded != frames * copies:
+            raise AssertionError('Decoded %d of %d frames' % (decoded, frames * copies))
+
+        size = os.path.getsize(log_path)
+        return {'frames' : decoded,
+                'cpus' : os.cpu_count(),
+                'serial_bytes_per_s' : size / serial_time,
+                'parallel_bytes_per_s' : size / parallel_time,
+                'parallel_speedup' : serial_time / parallel_time}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Decoded frames:   %d on %d CPUs' % (result['frames'], result['cpus']))
+    print('Single job:       %8.1f MB/s' % (result['serial_bytes_per_s'] / 1e6))
+    print('%d jobs:           %8.1f MB/s, %.2fx' % (JOBS, result['parallel_bytes_per_s'] / 1e6,
+                                                  result['parallel_speedup']))
@@ -0,0 +1,83 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of decoding a stream of mixed message IDs through the dense dispatch table against the
+linear case chain that the generated packet class used to walk for every packet
+'''
+
+import os
+import sys
+import random
+import tempfile
+import shutil
+import importlib
+import timeit
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Number of packets in the mixed stream
+STREAM_LENGTH = 100000
+
+
+def case_chain(pymavlab):
+
+    """
+    Return a decoder which compares the message ID against each case in turn, in the order the
+    cases were emitted by the generator, as the switch statement of the packet class did
+
+    """
+
+    cases = [(message.ID, message) for dialect in mavschema.load_schema(DATA_PATH)
+             for message in getattr(pymavlab, dialect.name).MESSAGES]
+
+    def decode(msgid, payload):
+        for case, message in cases:
+            if case == msgid:
+                return message.unpack(payload)
+        raise pymavlab.MAVLinkError('Message (ID = %d) is not defined' % msgid)
+
+    return decode
+
+
+def run():
+
+    """
+    Return the decode rate of the mixed stream with each dispatch method
+
+    """
+
+    output_path = tempfile.mkdtemp()
+    sys.path.insert(0, output_path)
+    try:
+        schema = mavschema.load_schema(DATA_PATH)
+        mavgen_python.generate_python_package(schema, output_path)
+        pymavlab = importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+        #Build a stream of payloads with message IDs drawn uniformly from every defined ID
+        random.seed(0)
+        defined = [message for message in pymavlab.MESSAGES if message is not None]
+        stream = [(message.ID, message().pack()) for message in
+                  (random.choice(defined) for _ in range(STREAM_LENGTH))]
+
+        result = {'messages' : len(defined)}
+        for name, decode in (('chain_per_s', case_chain(pymavlab)), ('table_per_s', pymavlab.decode)):
+            elapsed = min(timeit.repeat(lambda: [decode(msgid, payload) for msgid, payload in stream],
+                                        number=1, repeat=5))
+            result[name] = STREAM_LENGTH / elapsed
+        return result
+    finally:
+        sys.path.remove(output_path)
+        shutil.rmtree(output_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Message IDs:            %d' % result['messages'])
+    print('Case chain decode:      %10.0f msg/s' % result['chain_per_s'])
+    print('Dispatch table decode:  %10.0f msg/s' % result['table_per_s'])
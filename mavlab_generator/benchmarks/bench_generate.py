@@ -0,0 +1,76 @@
+'''
+Created on 18 Oct 2026
+
+End-to-end benchmark of generating MAVLAB from the repository dialects
+'''
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavtiming
+import mavgen_m_deprecated as mavgen
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+
+def generate(output_path, cache_path, clear_cache, force=True, timer=None):
+
+    """
+    Return the wall time in seconds of a single serial generation run
+
+    """
+
+    if clear_cache and os.path.exists(cache_path):
+        shutil.rmtree(cache_path)
+    start = time.perf_counter()
+    mavgen.generate(DATA_PATH, output_path, force=force, jobs=1, cache_path=cache_path, timer=timer)
+    return time.perf_counter() - start
+
+
+def run(repeat=3):
+
+    """
+    Time a cold run compiling the XML, a forced run with a warm schema cache and an incremental run
+    with nothing to regenerate. Generation is serial so that results do not depend on the number
+    of CPUs.
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        output_path = os.path.join(work_path, 'out')
+        cache_path = os.path.join(work_path, 'cache')
+
+        cold = min(generate(output_path, cache_path, True) for _ in range(repeat))
+        warm = min(generate(output_path, cache_path, False) for _ in range(repeat))
+        incremental = min(generate(output_path, cache_path, False, force=False) for _ in range(repeat))
+
+        files = sum(len(filenames) for _, _, filenames in os.walk(os.path.join(output_path, 'mavlab')))
+
+        result = {'files' : files,
+                  'cold_s' : cold,
+                  'warm_s' : warm,
+                  'incremental_s' : incremental}
+
+        #Break a cold run down into phases, tracing memory slows the run so it is timed separately
+        timer = mavtiming.PhaseTimer()
+        generate(output_path, cache_path, True, timer=timer)
+        timer.close()
+        result['cold_phases'] = {name : record['wall_s'] for name, record in timer.phases.items()}
+        return result
+    finally:
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Generated files:      %d' % result['files'])
+    print('Cold (compile XML):   %8.1f ms' % (result['cold_s'] * 1e3))
+    print('Warm schema cache:    %8.1f ms' % (result['warm_s'] * 1e3))
+    print('Incremental no-op:    %8.1f ms' % (result['incremental_s'] * 1e3))
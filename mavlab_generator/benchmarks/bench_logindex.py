@@ -0,0 +1,164 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of building, updating and querying the index of a telemetry log
+'''
+
+import os
+import sys
+import time
+import struct
+import random
+import shutil
+import tempfile
+import importlib
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up the log, weighted roughly as a telemetry stream
+LOG_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+           ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_param_value', 1))
+
+#Systems whose messages are interleaved in the log
+SYSTEMS = (1, 2, 3)
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def write_log(pymavlab, frames, seed=0, start_time=0):
+
+    """
+    Return a .tlog of random messages from SYSTEMS sent 1 ms apart, with a corrupted frame and a
+    run of noise between records every few hundred frames, and the payloads of the valid frames grouped by
+    (msgid, sysid)
+
+    """
+
+    rng = random.Random(seed)
+    classes = [getattr(pymavlab.common, name) for name, weight in LOG_MIX for _ in range(weight)]
+    chunks = []
+    valid = {}
+    for i in range(frames):
+        cls = rng.choice(classes)
+        msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)), rng.choice(SYSTEMS))
+        frame = msg.encode(i)
+        if rng.random() < 0.005:
+            frame = frame[:-1] + bytes([frame[-1] ^ 0xff])
+        else:
+            valid.setdefault((msg.ID, msg.sysid), []).append(msg.pack())
+        frame = struct.pack('>Q', start_time + i * 1000) + frame
+        if rng.random() < 0.005:
+            frame = bytes([254] + [rng.getrandbits(8) for _ in range(rng.randint(0, 20))]) + frame
+        chunks.append(frame)
+
+    return b''.join(chunks), valid
+
+
+def run(frames=200000):
+
+    """
+    Time building the index of a log, updating it after the log grows and querying a time range,
+    checking that every valid frame of the log is indexed. Unlike the stream parser, which resumes
+    the search for frames after the failed checksum as MAVLinkParser.parseChar does, the index also
+    finds frames which start inside the noise before them.
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        log_path = os.path.join(work_path, 'flight.tlog')
+        log, expected = write_log(pymavlab, frames)
+        with open(log_path, 'wb') as fo:
+            fo.write(log)
+
+        start = time.perf_counter()
+        index = pymavlab.open_log(log_path)
+        build = time.perf_counter() - start
+
+        found = {key : [bytes(packet.payload) for _, packet in index.packets(*key)] for key in index.keys()}
+        if found != expected:
+            raise AssertionError('Log index does not match the valid frames of the log')
+        index.close()
+
+        #Grow the log with a frame cut off part way, then complete it
+        extra, added = write_log(pymavlab, frames // 10, seed=1, start_time=frames * 1000)
+        cut = len(extra) - 20
+        with open(log_path, 'ab') as fo:
+            fo.write(extra[:cut])
+
+        start = time.perf_counter()
+        index = pymavlab.open_log(log_path)
+        update = time.perf_counter() - start
+
+        index.close()
+        with open(log_path, 'ab') as fo:
+            fo.write(extra[cut:])
+        index = pymavlab.open_log(log_path)
+
+        if len(index) != sum(len(payloads) for payloads in list(expected.values()) + list(added.values())):
+            raise AssertionError('Updated log index does not match the valid frames of the log')
+        index.close()
+
+        start = time.perf_counter()
+        index = pymavlab.open_log(log_path)
+        load = time.perf_counter() - start
+
+        #Attitude of one system over a tenth of the log
+        msgid = pymavlab.common.msg_attitude.ID
+        t0, t1 = frames * 450, frames * 550
+
+        start = time.perf_counter()
+        selected = [(timestamp, pymavlab.decode(packet.msgid, packet.payload))
+                    for timestamp, packet in index.packets(msgid, 1, t0, t1)]
+        query = time.perf_counter() - start
+        index.close()
+
+        if not selected or any(not t0 <= timestamp <= t1 for timestamp, _ in selected):
+            raise AssertionError('Query returned frames outside of the time range')
+
+        #Without an index every frame of the log is parsed to find the attitude of the system
+        start = time.perf_counter()
+        with open(log_path, 'rb') as fi:
+            packets = pymavlab.MAVLinkParser().parse(fi.read())
+        scanned = [pymavlab.decode(packet.msgid, packet.payload) for packet in packets
+                   if packet.msgid == msgid and packet.sysid == 1]
+        full_parse = time.perf_counter() - start
+
+        return {'frames' : len(index),
+                'selected' : len(selected),
+                'build_bytes_per_s' : len(log) / build,
+                'update_s' : update,
+                'load_s' : load,
+                'query_s' : query,
+                'query_speedup' : full_parse / query}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Indexed frames:     %d' % result['frames'])
+    print('Build:              %8.1f MB/s' % (result['build_bytes_per_s'] / 1e6))
+    print('Update by 10%%:      %8.1f ms' % (result['update_s'] * 1e3))
+    print('Load saved index:   %8.1f ms' % (result['load_s'] * 1e3))
+    print('Query %5d frames:  %8.1f ms, %.0fx faster than parsing the log' % (result['selected'],
+          result['query_s'] * 1e3, result['query_speedup']))
@@ -0,0 +1,224 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of the chunked Python stream parser against a port of MAVLinkParser.parseChar
+'''
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import importlib
+import timeit
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavcrc
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up the stream, weighted roughly as a telemetry stream
+STREAM_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+              ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_param_value', 1))
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def parse_char_reference(buf, crc_extras):
+
+    """
+    Parse a stream one byte at a time with the state machine of MAVLinkParser.parseChar, returning
+    the (msgid, seq, sysid, compid, payload) of every frame and the failedCRC, packetsDropped and
+    packetsReceived counters. Sequence numbers are tracked for each (sysid, compid).
+
+    """
+
+    frames = []
+    failed = dropped = received = 0
+    last_seq = {}
+    state = 'idle'
+    for char in bytearray(buf):
+        if state == 'idle':
+            if char == 254:
+                state = 'stx'
+        elif state == 'stx':
+            length, payload, state = char, bytearray(), 'len'
+        elif state == 'len':
+            seq, state = char, 'seq'
+        elif state == 'seq':
+            sysid, state = char, 'sysid'
+        elif state == 'sysid':
+            compid, state = char, 'compid'
+        elif state == 'compid':
+            msgid = char
+            state = 'payload' if length == 0 else 'msgid'
+        elif state == 'msgid':
+            payload.append(char)
+            if len(payload) == length:
+                state = 'payload'
+        elif state == 'payload':
+            crc = mavcrc.frame_crc(bytes(bytearray([length, seq, sysid, compid, msgid])) + bytes(payload),
+                                   crc_extras[msgid])
+            if char != crc & 0xff:
+                failed += 1
+                state = 'stx' if char == 254 else 'idle'
+            else:
+                state = 'crc1'
+        elif state == 'crc1':
+            if char != crc >> 8:
+                failed += 1
+                state = 'stx' if char == 254 else 'idle'
+            else:
+                if (sysid, compid) in last_seq:
+                    dropped += ((seq - last_seq[sysid, compid]) % 256) - 1
+                last_seq[sysid, compid] = seq
+                received += 1
+                frames.append((msgid, seq, sysid, compid, bytes(payload)))
+                state = 'idle'
+
+    return frames, (failed, dropped, received)
+
+
+def write_stream(pymavlab, frames, seed=0):
+
+    """
+    Build a stream of random messages from two interleaved systems with noise between frames,
+    corrupted checksums and dropped frames, so that every path of the parser is used
+
+    """
+
+    rng = random.Random(seed)
+    classes = [getattr(pymavlab.common, name) for name, weight in STREAM_MIX for _ in range(weight)]
+    chunks = []
+    sequences = [0, 0]
+    for _ in range(frames):
+        cls = rng.choice(classes)
+        sender = rng.randint(0, 1)
+        msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)), sender + 1)
+        frame = msg.encode(sequences[sender])
+        sequences[sender] += 1
+        roll = rng.random()
+        if roll < 0.01:
+            continue
+        elif roll < 0.02:
+            frame = frame[:-2] + bytes([254]) + frame[-1:]
+        elif roll < 0.03:
+            frame = frame[:-1] + bytes([frame[-1] ^ 0xff])
+        elif roll < 0.05:
+            frame = bytes([254] + [rng.getrandbits(8) for _ in range(rng.randint(0, 8))]) + frame
+        chunks.append(frame)
+
+    return b''.join(chunks)
+
+
+def split(buf, seed=0):
+
+    """
+    Split a stream into chunks of random sizes
+
+    """
+
+    rng = random.Random(seed)
+    chunks = []
+    position = 0
+    while position < len(buf):
+        size = rng.randint(1, 600)
+        chunks.append(buf[position:position + size])
+        position += size
+    return chunks
+
+
+def run(frames=200000):
+
+    """
+    Check that the chunked parser matches parseChar on a noisy stream and measure its rate on a
+    clean stream read in 64 KiB chunks, next to the rate of the byte by byte parseChar port on
+    the first 10000 frames of the same stream
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+
+        #Parity with parseChar, including frames split across chunks
+        noisy = write_stream(pymavlab, 20000)
+        expected, counters = parse_char_reference(noisy, pymavlab.CRC_EXTRAS)
+        parser = pymavlab.MAVLinkParser()
+        packets = []
+        for chunk in split(noisy):
+            packets += parser.parse(chunk)
+        found = [(p.msgid, p.seq, p.sysid, p.compid, bytes(p.payload)) for p in packets]
+        stats = parser.stats
+        if found != expected or (stats.failed_crc, stats.packets_dropped, stats.packets_received) != counters:
+            raise AssertionError('Chunked parser does not match parseChar: %r != %r' % (stats, counters))
+
+        #The statistics do not depend on how the stream is split into chunks
+        whole = pymavlab.MAVLinkParser()
+        whole.parse(noisy)
+        chunked, unsplit = stats.snapshot(), whole.stats.snapshot()
+        for snapshot in (chunked, unsplit):
+            for message in snapshot['messages'].values():
+                del message['rate'], message['byte_rate']
+        if chunked != unsplit:
+            raise AssertionError('Statistics depend on the chunks the stream is parsed in')
+
+        clean = b''.join(pymavlab.common.msg_attitude().encode(seq) for seq in range(frames))
+        chunks = [clean[i:i + 65536] for i in range(0, len(clean), 65536)]
+
+        def run_parser():
+            parser = pymavlab.MAVLinkParser()
+            for chunk in chunks:
+                parser.parse(chunk)
+
+        reference_frames = 10000
+        reference = clean[:reference_frames * len(clean) // frames]
+
+        def run_reference():
+            parse_char_reference(reference, pymavlab.CRC_EXTRAS)
+
+        mixed = write_stream(pymavlab, frames, seed=1)
+        mixed_chunks = [mixed[i:i + 65536] for i in range(0, len(mixed), 65536)]
+
+        def run_mixed():
+            parser = pymavlab.MAVLinkParser()
+            for chunk in mixed_chunks:
+                parser.parse(chunk)
+
+        frames_per_s = frames / min(timeit.repeat(run_parser, number=1, repeat=5))
+        reference_per_s = reference_frames / min(timeit.repeat(run_reference, number=1, repeat=3))
+        return {'frames' : frames,
+                'failed_crc' : counters[0],
+                'packets_dropped' : counters[1],
+                'resyncs' : stats.resyncs,
+                'frames_per_s' : frames_per_s,
+                'reference_frames_per_s' : reference_per_s,
+                'reference_speedup' : frames_per_s / reference_per_s,
+                'noisy_bytes_per_s' : len(mixed) / min(timeit.repeat(run_mixed, number=1, repeat=5))}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Parity stream:  %d failed CRC, %d dropped, %d resyncs' % (result['failed_crc'],
+          result['packets_dropped'], result['resyncs']))
+    print('Clean stream:   %10.0f frames/s, %.0fx parseChar at %.0f frames/s' % (result['frames_per_s'],
+          result['reference_speedup'], result['reference_frames_per_s']))
+    print('Noisy stream:   %10.1f MB/s' % (result['noisy_bytes_per_s'] / 1e6))
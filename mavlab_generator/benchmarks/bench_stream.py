@@ -0,0 +1,117 @@
+'''
+Created on 18 Oct 2026
+
+Encode and decode throughput of the generated Python codec on a synthetic telemetry stream whose
+messages arrive at the rates of a typical autopilot stream configuration
+'''
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import importlib
+import timeit
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Rate in Hz of each message in the stream
+STREAM_RATES = (('msg_attitude', 10), ('msg_raw_imu', 10), ('msg_scaled_pressure', 10),
+                ('msg_global_position_int', 3), ('msg_vfr_hud', 4), ('msg_sys_status', 2),
+                ('msg_gps_raw_int', 2), ('msg_rc_channels_raw', 2), ('msg_servo_output_raw', 2),
+                ('msg_nav_controller_output', 2), ('msg_mission_current', 2), ('msg_heartbeat', 1))
+
+#Length of the stream in seconds
+STREAM_SECONDS = 600
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def build_stream(pymavlab, seconds=STREAM_SECONDS, seed=0):
+
+    """
+    Return the messages of a stream in the order they are sent, each filled with random field
+    values. Messages are sent at their rate from a random phase within the first period.
+
+    """
+
+    rng = random.Random(seed)
+    schedule = []
+    for name, rate in STREAM_RATES:
+        cls = getattr(pymavlab.common, name)
+        phase = rng.random() / rate
+        for i in range(seconds * rate):
+            schedule.append((phase + float(i) / rate, cls))
+    schedule.sort(key=lambda item: item[0])
+
+    return [cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN))) for _, cls in schedule]
+
+
+def rate(stmt, number):
+
+    """
+    Return the best rate in operations per second of a statement run number times
+
+    """
+
+    return number / min(timeit.repeat(stmt, number=1, repeat=5))
+
+
+def run():
+
+    """
+    Measure the encode and decode rate of the stream and check that decoding returns the messages
+    that were encoded
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        messages = build_stream(pymavlab)
+        frames = [msg.encode(seq & 0xff) for seq, msg in enumerate(messages)]
+
+        decode_packet = pymavlab.decode_packet
+        for msg, frame in zip(messages, frames):
+            if decode_packet(frame) != msg:
+                raise AssertionError('Decoded %s does not match the encoded message' % msg.NAME)
+
+        def run_encode():
+            for seq, msg in enumerate(messages):
+                msg.encode(seq & 0xff)
+
+        def run_decode():
+            for frame in frames:
+                decode_packet(frame)
+
+        return {'messages' : len(messages),
+                'bytes' : sum(len(frame) for frame in frames),
+                'encode_per_s' : rate(run_encode, len(messages)),
+                'decode_per_s' : rate(run_decode, len(messages))}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Stream:                 %d messages, %.1f kB' % (result['messages'], result['bytes'] / 1e3))
+    print('Frame encode:           %10.0f msg/s' % result['encode_per_s'])
+    print('Frame decode with CRC:  %10.0f msg/s' % result['decode_per_s'])
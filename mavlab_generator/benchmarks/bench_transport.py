@@ -0,0 +1,179 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of the asyncio link layer serving many simulated vehicles over UDP from one process
+'''
+
+import os
+import sys
+import time
+import socket
+import shutil
+import asyncio
+import tempfile
+import importlib
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Number of simulated vehicles, the number of messages each sends and the interval in seconds
+#between bursts of BURST messages, 48 vehicles offer 48000 messages per second
+VEHICLES = 48
+MESSAGES = 2000
+BURST = 10
+BURST_INTERVAL = 0.01
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+async def vehicle(pymavlab, transport, sysid, server_addr, messages):
+
+    """
+    Send messages from a simulated vehicle in bursts of BURST frames every BURST_INTERVAL, then
+    send heartbeats until the ground station replies, as datagrams lost when the socket buffers
+    are full are not resent
+
+    """
+
+    router = transport.MAVLinkRouter()
+    link = await transport.open_udp(pymavlab.MAVLinkParser, router, ('127.0.0.1', 0), server_addr)
+    attitude = pymavlab.common.msg_attitude()
+    attitude.sysid = sysid
+    for i in range(messages):
+        link.send(attitude)
+        if i % BURST == BURST - 1:
+            await asyncio.sleep(BURST_INTERVAL)
+
+    heartbeat = pymavlab.common.msg_heartbeat()
+    heartbeat.sysid = sysid
+    queue = router.queue(pymavlab.SYSID, pymavlab.COMPID)
+    for _ in range(200):
+        link.send(heartbeat)
+        try:
+            reply = await asyncio.wait_for(queue.get(), 0.05)
+            break
+        except asyncio.TimeoutError:
+            pass
+    else:
+        raise AssertionError('Vehicle %d did not receive the reply of the ground station' % sysid)
+
+    link.transport.close()
+    return reply
+
+
+async def serve(pymavlab, transport):
+
+    """
+    Route the messages of every vehicle to its queue, reply to each vehicle once its heartbeat
+    has been received, and return the wall time, the number of packets received, the number of
+    ATTITUDE packets among them and the number dropped by full queues
+
+    """
+
+    router = transport.MAVLinkRouter(maxsize=MESSAGES)
+    server = await transport.open_udp(pymavlab.MAVLinkParser, router, ('127.0.0.1', 0))
+    server_addr = server.transport.get_extra_info('sockname')
+    heartbeat_id = pymavlab.common.msg_heartbeat.ID
+
+    async def consume(sysid):
+        queue = router.queue(sysid, pymavlab.COMPID)
+        while (await queue.get()).msgid != heartbeat_id:
+            pass
+        router.send(sysid, pymavlab.COMPID, pymavlab.common.msg_heartbeat())
+
+    start = time.perf_counter()
+    consumers = [asyncio.ensure_future(consume(sysid)) for sysid in range(1, VEHICLES + 1)]
+    replies = await asyncio.gather(*[vehicle(pymavlab, transport, sysid, server_addr, MESSAGES)
+                                     for sysid in range(1, VEHICLES + 1)])
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - start
+    server.transport.close()
+
+    if any(reply.msgid != heartbeat_id for reply in replies):
+        raise AssertionError('A vehicle did not receive the reply of the ground station')
+
+    #Vehicles also send heartbeats until they are answered, so frames lost are counted from the
+    #ATTITUDE packets alone
+    attitudes = server.stats.message_received[pymavlab.common.msg_attitude.ID]
+    return elapsed, server.stats.packets_received, attitudes, sum(router.dropped.values())
+
+
+async def stream_round_trip(pymavlab, transport):
+
+    """
+    Check that a stream link over a socket pair routes packets and replies
+
+    """
+
+    left, right = socket.socketpair()
+    vehicle_router = transport.MAVLinkRouter()
+    station_router = transport.MAVLinkRouter()
+    vehicle_link = await transport.open_stream(pymavlab.MAVLinkParser, vehicle_router, sock=left)
+    await transport.open_stream(pymavlab.MAVLinkParser, station_router, sock=right)
+
+    heartbeat = pymavlab.common.msg_heartbeat()
+    heartbeat.sysid = 7
+    for _ in range(100):
+        vehicle_link.send(heartbeat)
+    await vehicle_link.drain()
+
+    key = await asyncio.wait_for(station_router.vehicles.get(), 10)
+    queue = station_router.queue(*key)
+    for _ in range(100):
+        await asyncio.wait_for(queue.get(), 10)
+    station_router.send(7, heartbeat.compid, pymavlab.common.msg_heartbeat())
+    await asyncio.wait_for(vehicle_router.queue(pymavlab.SYSID, pymavlab.COMPID).get(), 10)
+
+    left.close()
+    right.close()
+
+
+def run():
+
+    """
+    Measure the rate packets from VEHICLES simulated vehicles are parsed and routed by a single
+    UDP endpoint
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        transport = importlib.import_module(mavgen_python.PACKAGE_NAME + '.mavtransport')
+
+        asyncio.run(stream_round_trip(pymavlab, transport))
+        elapsed, parsed, attitudes, dropped = asyncio.run(serve(pymavlab, transport))
+        return {'vehicles' : VEHICLES,
+                'packets' : parsed,
+                'dropped' : dropped,
+                'lost' : VEHICLES * MESSAGES - attitudes,
+                'offered_per_s' : VEHICLES * MESSAGES / elapsed,
+                'routed_per_s' : parsed / elapsed}
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Vehicles:  %d' % result['vehicles'])
+    print('Received:  %d packets, %d dropped by full queues' % (result['packets'], result['dropped']))
+    print('Lost:      %d of %d ATTITUDE frames' % (result['lost'], result['vehicles'] * MESSAGES))
+    print('Offered:   %10.0f packets/s' % result['offered_per_s'])
+    print('Routed:    %10.0f packets/s' % result['routed_per_s'])
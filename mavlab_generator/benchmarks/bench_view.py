@@ -0,0 +1,149 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of reading a single field of every received packet through a lazy view against decoding
+every field of the message
+'''
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import importlib
+import timeit
+import tracemalloc
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Messages making up the stream, weighted roughly as a telemetry stream
+STREAM_MIX = (('msg_attitude', 10), ('msg_global_position_int', 5), ('msg_vfr_hud', 4),
+              ('msg_sys_status', 1), ('msg_heartbeat', 1), ('msg_param_value', 1))
+
+#Number of frames in the stream
+STREAM_LENGTH = 100000
+
+
+def load_package(output_path):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    schema = mavschema.load_schema(DATA_PATH)
+    mavgen_python.generate_python_package(schema, output_path)
+    sys.path.insert(0, output_path)
+    return importlib.import_module(mavgen_python.PACKAGE_NAME)
+
+
+def check_views(pymavlab, rng):
+
+    """
+    Check that the view of a random payload of every message reads the same fields as the decoded
+    message, comparing by repr as random floats include NaNs
+
+    """
+
+    for message in pymavlab.MESSAGES:
+        if message is None:
+            continue
+        payload = bytes(rng.getrandbits(8) for _ in range(message.LEN))
+        view = pymavlab.decode_view(message.ID, payload, 7, 8)
+        decoded = pymavlab.decode(message.ID, payload, 7, 8)
+        if repr(view.to_dict()) != repr(decoded.to_dict()) or view.to_message() != decoded:
+            raise AssertionError('View of %s does not match the decoded message' % message.NAME)
+        if view.pack() != payload or view.encode(3) != decoded.encode(3):
+            raise AssertionError('View of %s does not encode as the decoded message' % message.NAME)
+
+
+def peak_bytes(fn):
+
+    """
+    Return the peak memory allocated while calling fn, which keeps the messages it decodes
+
+    """
+
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run():
+
+    """
+    Return the rate of reading a field of every GLOBAL_POSITION_INT of a parsed stream and the
+    memory of keeping those messages, decoding each packet into a message and wrapping each packet
+    in a view, and the speedup of selecting the altitude of one system with views
+
+    """
+
+    work_path = tempfile.mkdtemp()
+    try:
+        pymavlab = load_package(work_path)
+        rng = random.Random(0)
+        check_views(pymavlab, rng)
+
+        classes = [getattr(pymavlab.common, name) for name, weight in STREAM_MIX for _ in range(weight)]
+        frames = []
+        for i in range(STREAM_LENGTH):
+            cls = rng.choice(classes)
+            frames.append(cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)),
+                                     rng.randint(1, 3)).encode(i))
+        packets = pymavlab.MAVLinkParser().parse(b''.join(frames))
+        msgid = pymavlab.common.msg_global_position_int.ID
+
+        def eager():
+            decode = pymavlab.decode
+            return [decode(packet.msgid, packet.payload, packet.sysid).alt for packet in packets
+                    if packet.msgid == msgid and packet.sysid == 1]
+
+        def lazy():
+            decode_view = pymavlab.decode_view
+            return [decode_view(packet.msgid, packet.payload, packet.sysid).alt for packet in packets
+                    if packet.msgid == msgid and packet.sysid == 1]
+
+        def eager_all():
+            decode = pymavlab.decode
+            return [decode(packet.msgid, packet.payload).time_boot_ms for packet in packets
+                    if packet.msgid == msgid]
+
+        def lazy_all():
+            decode_view = pymavlab.decode_view
+            return [decode_view(packet.msgid, packet.payload).time_boot_ms for packet in packets
+                    if packet.msgid == msgid]
+
+        if eager() != lazy() or eager_all() != lazy_all():
+            raise AssertionError('Views read different values from the decoded messages')
+
+        result = {'packets' : len(packets)}
+        for name, fn, decode in (('decode', eager_all, pymavlab.decode), ('view', lazy_all, pymavlab.decode_view)):
+            elapsed = min(timeit.repeat(fn, number=1, repeat=5))
+            result['%s_per_s' % name] = len(fn()) / elapsed
+            result['%s_peak_bytes' % name] = peak_bytes(lambda: [decode(packet.msgid, packet.payload)
+                                                                for packet in packets if packet.msgid == msgid])
+        result['select_speedup'] = (min(timeit.repeat(eager, number=1, repeat=5)) /
+                                    min(timeit.repeat(lazy, number=1, repeat=5)))
+        return result
+    finally:
+        sys.path.remove(work_path)
+        shutil.rmtree(work_path)
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Packets:             %d' % result['packets'])
+    print('Decode one field:    %10.0f msg/s, kept %8.1f kB' % (result['decode_per_s'],
+                                                              result['decode_peak_bytes'] / 1e3))
+    print('View one field:      %10.0f msg/s, kept %8.1f kB' % (result['view_per_s'],
+                                                              result['view_peak_bytes'] / 1e3))
+    print('Select one system:   %.2fx faster with views' % result['select_speedup'])
@@ -0,0 +1,150 @@
+'''
+Created on 18 Oct 2026
+
+Benchmark of the memory used to ingest XML with ET.parse and with streaming iterparse
+'''
+
+import os
+import sys
+import shutil
+import filecmp
+import tempfile
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, '..', 'src'))
+
+import mavschema
+import mavgen_m_deprecated as mavgen
+
+DATA_PATH = os.path.join(BENCH_PATH, '..', 'data')
+
+#Largest growth allowed of the streaming ingestion overhead between the smallest and largest scale
+FLAT_RATIO = 2.0
+
+
+def write_scaled_dialect(xml_path, scale):
+
+    """
+    Write a copy of common.xml whose messages and enums are repeated scale times under new names
+
+    Parameters
+    ----------
+    xml_path: string
+        Folder in which the scaled dialect is written
+    scale: integer
+        Number of copies of each message and enum
+    ----------
+
+    """
+
+    root = ET.parse(os.path.join(DATA_PATH, 'common.xml')).getroot()
+    for section, tag in (('messages', 'message'), ('enums', 'enum')):
+        parent = root.find(section)
+        originals = parent.findall(tag)
+        for copy in range(1, scale):
+            for element in originals:
+                duplicate = ET.fromstring(ET.tostring(element))
+                duplicate.set('name', '%s_%d' % (element.get('name'), copy))
+                for entry in duplicate.findall('entry'):
+                    entry.set('name', '%s_%d' % (entry.get('name'), copy))
+                parent.append(duplicate)
+
+    ET.ElementTree(root).write(os.path.join(xml_path, 'common.xml'))
+
+
+def ingestion_memory(filename, streaming):
+
+    """
+    Return the bytes of the compiled dialect kept after ingesting an XML file, and the peak
+    traced memory of ingestion above them. The compiled dialect grows with the file in both
+    modes, the overhead above it is the memory of reading the XML.
+
+    """
+
+    tracemalloc.start()
+    try:
+        dialect = mavschema.compile_dialect(filename, streaming)
+        kept, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del dialect
+    return kept, peak - kept
+
+
+def generate(xml_path, output_path, streaming):
+
+    """
+    Generate MAVLAB from the XML, compiling the schema rather than loading it from a cache
+
+    """
+
+    mavgen.generate(xml_path, output_path, force=True, jobs=1, streaming=streaming,
+                    cache_path=os.path.join(output_path, 'cache'))
+
+
+def same_output(path1, path2):
+
+    """
+    Return whether two generated folders contain identical files
+
+    """
+
+    comparison = filecmp.dircmp(path1, path2)
+    if comparison.left_only or comparison.right_only or comparison.diff_files:
+        return False
+    for subdir in comparison.common_dirs:
+        if not same_output(os.path.join(path1, subdir), os.path.join(path2, subdir)):
+            return False
+    return True
+
+
+def run(scales=(1, 4, 16)):
+
+    """
+    Measure the memory of both ingestion modes for increasingly large dialects, checking that
+    both modes generate the same files and that the streaming overhead does not grow with the
+    size of the dialect
+
+    """
+
+    results = []
+    for scale in scales:
+        work_path = tempfile.mkdtemp()
+        try:
+            xml_path = os.path.join(work_path, 'data')
+            os.makedirs(xml_path)
+            write_scaled_dialect(xml_path, scale)
+            filename = os.path.join(xml_path, 'common.xml')
+
+            schema_bytes, parse_bytes = ingestion_memory(filename, False)
+            _, stream_bytes = ingestion_memory(filename, True)
+
+            generate(xml_path, os.path.join(work_path, 'parse'), False)
+            generate(xml_path, os.path.join(work_path, 'stream'), True)
+            if not same_output(os.path.join(work_path, 'parse'), os.path.join(work_path, 'stream')):
+                raise AssertionError('Streaming output differs at scale %d' % scale)
+
+            results.append({'scale' : scale,
+                            'xml_bytes' : os.path.getsize(filename),
+                            'schema_bytes' : schema_bytes,
+                            'parse_peak_bytes' : parse_bytes,
+                            'stream_peak_bytes' : stream_bytes})
+        finally:
+            shutil.rmtree(work_path)
+
+    if results[-1]['stream_peak_bytes'] > FLAT_RATIO * results[0]['stream_peak_bytes']:
+        raise AssertionError('Streaming ingestion overhead grows from %d to %d bytes' % (
+            results[0]['stream_peak_bytes'], results[-1]['stream_peak_bytes']))
+
+    return results
+
+
+if __name__ == '__main__':
+    print('Memory of ingesting the XML above the compiled schema it produces')
+    print('%8s %12s %14s %14s %14s' % ('scale', 'xml (KB)', 'schema (KB)', 'parse (KB)', 'stream (KB)'))
+    for result in run():
+        print('%8d %12d %14d %14d %14d' % (result['scale'], result['xml_bytes'] // 1024,
+              result['schema_bytes'] // 1024, result['parse_peak_bytes'] // 1024,
+              result['stream_peak_bytes'] // 1024))
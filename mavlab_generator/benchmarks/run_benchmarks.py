@@ -0,0 +1,170 @@
+'''
+Created on 18 Oct 2026
+
+Runs the benchmark suite, saves the results as JSON and flags regressions against a baseline
+
+Each benchmark module is run in its own process so that the packages it generates and imports, and
+the memory it allocates, do not affect the others. Benchmarks whose optional dependencies are not
+installed are recorded as skipped.
+'''
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+
+#Benchmark modules of the suite, in the order they are run
+BENCHMARKS = ('generate', 'crc', 'stream', 'parser', 'transport', 'logindex', 'decode_log', 'codec', 'dispatch', 'view',
+              'batch', 'bulk', 'xml_memory')
+
+#Version of the results file layout
+RESULTS_VERSION = 1
+
+#Metric name endings and whether a larger value is better
+HIGHER_IS_BETTER = ('_per_s', '_speedup')
+LOWER_IS_BETTER = ('_s', '_peak_bytes')
+
+
+def run_benchmark(name):
+
+    """
+    Run a benchmark module in a new process and return its results, or None and the reason it
+    could not be run
+
+    Parameters
+    ----------
+    name: string
+        Name of the benchmark, the module is bench_<name>.py
+    ----------
+
+    """
+
+    code = 'import json, bench_%s as bench; print(json.dumps(bench.run()))' % name
+    process = subprocess.run([sys.executable, '-c', code], cwd=BENCH_PATH, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        lines = process.stderr.strip().splitlines()
+        return None, lines[-1] if lines else 'exit status %d' % process.returncode
+
+    return json.loads(process.stdout.strip().splitlines()[-1]), None
+
+
+def flatten(results, prefix=''):
+
+    """
+    Flatten nested benchmark results into a dictionary of dotted metric names and numbers, lists of
+    results are keyed by their index
+
+    """
+
+    metrics = {}
+    if isinstance(results, dict):
+        items = results.items()
+    elif isinstance(results, list):
+        items = [(str(i), entry) for i, entry in enumerate(results)]
+    else:
+        return {prefix : results} if isinstance(results, (int, float)) else {}
+
+    for key, value in items:
+        metrics.update(flatten(value, '%s.%s' % (prefix, key) if prefix else key))
+    return metrics
+
+
+def compare(results, baseline, threshold):
+
+    """
+    Return the metrics which are worse than the baseline by more than threshold, as a list of
+    (metric, baseline value, new value, relative change) tuples. Metrics that are not timings or
+    rates, such as message counts and the phase breakdown of the generate benchmark, are not
+    compared.
+
+    Parameters
+    ----------
+    results: dictionary
+        Results of the current run, as saved by main
+    baseline: dictionary
+        Results of the baseline run
+    threshold: float
+        Allowed relative change, 0.1 allows 10% slower
+    ----------
+
+    """
+
+    current = flatten(results['results'])
+    previous = flatten(baseline['results'])
+
+    regressions = []
+    for metric in sorted(current):
+        if metric not in previous or not previous[metric]:
+            continue
+        change = (current[metric] - previous[metric]) / float(previous[metric])
+        if metric.endswith(HIGHER_IS_BETTER):
+            worse = -change
+        elif metric.endswith(LOWER_IS_BETTER):
+            worse = change
+        else:
+            continue
+        if worse > threshold:
+            regressions.append((metric, previous[metric], current[metric], change))
+
+    return regressions
+
+
+def main(argv=None):
+
+    """
+    Command line entry point, run python run_benchmarks.py --help for the arguments
+
+    """
+
+    parser = argparse.ArgumentParser(description='Run the MAVLAB benchmark suite')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=None, help='benchmarks to run')
+    parser.add_argument('--output', default='benchmark_results.json', help='file the results are saved to')
+    parser.add_argument('--baseline', default=None, help='results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown flagged as a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    results = {'version' : RESULTS_VERSION,
+               'created' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+               'python' : platform.python_version(),
+               'platform' : platform.platform(),
+               'results' : {},
+               'skipped' : {}}
+
+    for name in args.only or BENCHMARKS:
+        start = time.perf_counter()
+        result, reason = run_benchmark(name)
+        if result is None:
+            results['skipped'][name] = reason
+            print('%-12s skipped: %s' % (name, reason))
+        else:
+            results['results'][name] = result
+            print('%-12s %6.1f s' % (name, time.perf_counter() - start))
+
+    with open(args.output, 'w') as fo:
+        json.dump(results, fo, indent=4, sort_keys=True)
+    print('Results saved to %s' % args.output)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, 'r') as fi:
+        baseline = json.load(fi)
+
+    regressions = compare(results, baseline, args.threshold)
+    for metric, previous, current, change in regressions:
+        print('REGRESSION %-40s %14.6g -> %14.6g (%+.1f%%)' % (metric, previous, current, change * 100))
+    if not regressions:
+        print('No regressions against %s' % args.baseline)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
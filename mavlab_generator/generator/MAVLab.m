@@ -6,7 +6,7 @@ classdef MAVLab
     
     methods(Static, Access=public)
         
-        function generate(xmlPath, outputPath)
+        function generate(xmlPath, outputPath, emission, unchecked)
         %GENERATE: Generates a MATLAB implementation of the MAVLINK 1 library
         %Description:
         %    Generates a MATLAB implemenation of the MAVLINK 1.0 library from a set of XML dialect
@@ -15,6 +15,12 @@ classdef MAVLab
         %Arguments:
         %    xmlPath(string): Path to the folder containing XML dialect files
         %    outputPath(string): Path to where the mavlab folder will be generated (default = '.')
+        %    emission(string): How message classes pack and unpack their payloads. 'accessor' uses
+        %        the MAVLinkPayload get/put functions per element, 'typecast' casts each field
+        %        directly from its byte range (default = 'accessor')
+        %    unchecked(logical): Also generate a fast_ class for each message, whose static encode
+        %        function writes already typed fields into a preallocated frame buffer without
+        %        validating them. The msg_ classes are generated as usual (default = false)
 
             %Start timer
             timer = tic();
@@ -25,10 +31,34 @@ classdef MAVLab
                 outputPath = '.';
             elseif nargin == 1
                 outputPath = '.';
-            elseif nargin > 2
+            elseif nargin > 4
                 disp('ERROR: Too many input arguments!');
                 return;
             end
+            if nargin < 3
+                emission = 'accessor';
+            end
+            if nargin < 4
+                unchecked = false;
+            end
+            
+            %Select the message template for the emission mode
+            switch emission
+                case 'accessor'
+                    messageTemplate = 'message_template.txt';
+                case 'typecast'
+                    messageTemplate = 'message_typecast_template.txt';
+                otherwise
+                    disp(['ERROR: Unknown emission mode: ' emission]);
+                    return;
+            end
+            
+            %Select the template of the unchecked encoders, if they are generated
+            if unchecked
+                uncheckedTemplate = 'message_unchecked_template.txt';
+            else
+                uncheckedTemplate = '';
+            end
 
             fullParsedMsgList = [];
 
@@ -70,7 +100,7 @@ classdef MAVLab
 
                 %Find the message definitions and generate a MATLINK class for each
                 msgList = root.find('mavlink').find('messages').findAll('message');
-                parsedMsgList = MAVLab.generateMessageClasses(messagePath, msgList);
+                parsedMsgList = MAVLab.generateMessageClasses(messagePath, msgList, messageTemplate, uncheckedTemplate);
 
                 %Generate the enumeration class for this dialect
                 enumList = root.find('mavlink').find('enums').findAll('enum');
@@ -100,28 +130,46 @@ classdef MAVLab
     
     methods(Static,Access=private)
         
-        function parsedMsgList = generateMessageClasses(msgPath, msgList)
+        function parsedMsgList = generateMessageClasses(msgPath, msgList, templateName, uncheckedName)
         %GENERATEMESSAGECLASSES: Generates a MAVLINK message class per message in msgList
         %Description:
         %    Generates a class file per message in msgList in the folder specified by messagePath.
         %Arguments:
         %    msgPath(string): Path to the folder where message files will be generated
         %    msgList(MAVStruct): Array of messages to generate classes from
+        %    templateName(string): File name of the message class template
+        %    uncheckedName(string): File name of the unchecked encoder template, '' to skip them
 
 
             %Create an empty cell array for parsed messages
             parsedMsgList = [];
 
             %Load the template for MAVLINK message classes
-            templateFile = fopen('message_template.txt','r');
+            templateFile = fopen(templateName,'r');
             template = char(fread(templateFile,[1 inf]));
             fclose(templateFile);
+            
+            %Load the template for the unchecked encoders
+            if ~isempty(uncheckedName)
+                templateFile = fopen(uncheckedName,'r');
+                uncheckedTemplate = char(fread(templateFile,[1 inf]));
+                fclose(templateFile);
+            end
 
             %Generate a MAVLINK class file for each MAVLINK 1 message in the XML file
             for i = 1:1:size(msgList,2)
                 parsedMsg = MAVLab.generateClassFromMsg(msgPath, msgList(i), template);
                 if ~isempty(parsedMsg)
                     parsedMsgList = cat(2,parsedMsgList,parsedMsg);
+                    
+                    %Write the unchecked encoder of the message next to its class
+                    if ~isempty(uncheckedName)
+                        fastFilename = [msgPath '/fast_' parsedMsg.name '.m'];
+                        disp(['Generating: ' fastFilename]);
+                        fastFile = fopen(fastFilename,'w');
+                        fprintf(fastFile,MAVString(uncheckedTemplate,parsedMsg));
+                        fclose(fastFile);
+                    end
                 end
             end
 
@@ -155,7 +203,7 @@ classdef MAVLab
 
             %Get description if available, otherwise set to 'No description available'
             if ~isempty(msg.find('description'))
-                parsedMsg.desc = strrep(msg.find('description').text,'\n','');
+                parsedMsg.desc = MAVLab.escapeText(msg.find('description').text);
             else
                 parsedMsg.desc = 'No description available';
             end
@@ -174,16 +222,17 @@ classdef MAVLab
 
                 %Get description if available, otherwise set to 'No description available'
                 if fields(i).hasText
-                    fieldDesc = fields(i).text;
+                    fieldDesc = MAVLab.escapeText(fields(i).text);
                 else
                     fieldDesc = 'No description available';
                 end
 
-                %Get the array size of the field
+                %Get the array size of the field, kept as a double as arrays and the message length
+                %can exceed the range of the smaller integer types
                 fieldType = strsplit(fields(i).attributes.type,'[');
                 if size(fieldType,2) > 1
                     arraySize = strsplit(fieldType{2},']');
-                    arraySize = int8(str2double(arraySize{1}));
+                    arraySize = str2double(arraySize{1});
                 else
                     arraySize = 1;
                 end
@@ -201,6 +250,15 @@ classdef MAVLab
             parsedMsg.firstFieldName = parsedMsg.orderedFields(1).name;
             %Find the number of fields in this message
             parsedMsg.numFields = size(parsedMsg.orderedFields,2);
+            
+            %Calculate the range of payload bytes occupied by each field
+            offset = 0;
+            for i = 1:1:size(parsedMsg.orderedFields,2)
+                fieldLength = typeSize.(parsedMsg.orderedFields(i).type)*parsedMsg.orderedFields(i).size;
+                parsedMsg.orderedFields(i).first = offset + 1;
+                parsedMsg.orderedFields(i).last = offset + fieldLength;
+                offset = offset + fieldLength;
+            end
 
             %Calculate the checksum for this message
             crc = uint16(hex2dec('ffff'));
@@ -277,7 +335,7 @@ classdef MAVLab
                     end
                     %Get description if available, otherwise set to 'No description available'
                     if ~isempty(entryList(j).find('description'))
-                        entry.desc = entryList(j).find('description').text;
+                        entry.desc = MAVLab.escapeText(entryList(j).find('description').text);
                         if isempty(entry.desc)
                             entry.desc = 'No description available';
                         end
@@ -312,11 +370,24 @@ classdef MAVLab
             template = char(fread(templateFile,[1 inf]));
             fclose(templateFile);
 
+            %Define the dense dispatch list with an empty entry for every msgid
+            dispatchList = struct('dispatch',struct('handle',repmat({'[]'},1,256),'len',0));
+
+            %Place each message into the dispatch list at its msgid, the first definition is used
+            for i=1:1:size(parsedMsgList.message,2)
+                message = parsedMsgList.message(i);
+                msgid = str2double(message.msgid);
+                if msgid <= 255 && strcmp(dispatchList.dispatch(msgid+1).handle,'[]')
+                    dispatchList.dispatch(msgid+1).handle = ['@msg_' message.name];
+                    dispatchList.dispatch(msgid+1).len = message.msglen;
+                end
+            end
+
             %Write the MAVLINK packet class file
             mavlinkPacketFilename = [mainPath '/MAVLinkPacket.m'];
             disp(['Generating: ' mavlinkPacketFilename]);
             mavlinkPacketFile = fopen(mavlinkPacketFilename,'w');
-            fprintf(mavlinkPacketFile,MAVString(template,parsedMsgList));
+            fprintf(mavlinkPacketFile,MAVString(template,dispatchList));
             fclose(mavlinkPacketFile); 
 
         end
@@ -339,19 +410,27 @@ classdef MAVLab
             crcList = struct('crc',struct('value',{}));
 
             %Initialise all CRCs to 0
-            for i=1:1:255
+            for i=1:1:256
                 crcList.crc(i).value = 0;
             end
 
-            %Place the CRC for each message into crcList in the correct position
+            %Place the CRC for each message into crcList in the correct position, the first definition is used.
+            %Placed msgids are tracked separately as 0 is a valid CRC_EXTRA.
+            placed = false(1,256);
             for i=1:1:size(parsedMsgList.message,2)
                 crc.value = parsedMsgList.message(i).crc;
                 msgid = int64(str2double(parsedMsgList.message(i).msgid));
-                if msgid <= 255
+                if msgid <= 255 && ~placed(msgid+1)
                     crcList.crc(msgid+1) = crc;
+                    placed(msgid+1) = true;
                 end
             end
 
+            %Precompute the checksum of every byte value for the table driven CRC
+            for i=0:1:255
+                crcList.table(i+1).value = MAVLab.accumulate(uint16(0),char(i));
+            end
+
             %Write the MAVLINK CRC class file
             mavlinkCRCFilename = [mainPath '/MAVLinkCRC.m'];
             disp(['Generating: ' mavlinkCRCFilename]);
@@ -373,6 +452,7 @@ classdef MAVLab
             copyfile('master/MAVLinkMessage_master.m',[mainPath '/MAVLinkMessage.m']);
             copyfile('master/MAVLinkPayload_master.m',[mainPath '/MAVLinkPayload.m']);
             copyfile('master/MAVLinkParser_master.m',[mainPath '/MAVLinkParser.m']);
+            copyfile('master/MAVLinkBatch_master.m',[mainPath '/MAVLinkBatch.m']);
             copyfile('master/MAVLinkStats_master.m',[mainPath '/MAVLinkStats.m']);
             copyfile('master/MAVLink_master.m',[mainPath '/MAVLink.m']);
                  
@@ -410,7 +490,22 @@ classdef MAVLab
             orderedFields = parsedFields(ix);
 
         end
-        
+
+        function textOut = escapeText(textIn)
+        %ESCAPETEXT: Prepares XML text for insertion into a template
+        %Description:
+        %    Replaces new lines with spaces so that descriptions stay inside their comment line,
+        %    and escapes the characters interpreted by fprintf when the class file is written.
+        %Arguments:
+        %    textIn(char): Text of an XML description
+
+            textOut = strrep(textIn,char(13),'');
+            textOut = strrep(textOut,char(10),' ');
+            textOut = strrep(textOut,'\','\\');
+            textOut = strrep(textOut,'%','%%');
+
+        end
+
         function crcOut = accumulate(crcIn, buf)
         %ACCUMULATE: Accumulate a buffer of bytes into a checksum
         %Description:
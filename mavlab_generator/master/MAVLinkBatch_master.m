@@ -0,0 +1,134 @@
+classdef MAVLinkBatch < MAVLinkHandle
+    %MAVLINKBATCH: Used to encode many messages into one send buffer
+    %Description:
+    %    Encodes messages given as a message ID and a cell array of typed field values back to back
+    %    into one preallocated buffer, numbering the frames with MAVLink.nextSeq. No message or
+    %    packet objects are created, and the checksums of every frame added by a call to encode are
+    %    calculated together one byte position at a time. flush writes every frame with a single
+    %    write and keeps the buffer for the next batch.
+    
+    properties(Constant, Access = private)
+        MAX_FRAME_LEN = 263;    %Length of a frame with the largest payload
+        CAPACITY = 4096;        %Default size of the send buffer in bytes
+    end
+    
+    properties(Access = private)
+        buffer;
+        count = 0;
+    end
+    
+    methods
+        
+        function obj = MAVLinkBatch(capacity)
+            %MAVLINKBATCH: Create a new MAVLinkBatch object
+            %Arguments:
+            %    capacity(int): Initial size of the send buffer in bytes (default = CAPACITY)
+            if nargin == 0
+                capacity = obj.CAPACITY;
+            end
+            obj.buffer = zeros(max(capacity, obj.MAX_FRAME_LEN),1,'uint8');
+        end
+        
+        function encode(obj,messages)
+            %ENCODE(messages): Append a frame for each message to the send buffer
+            %Description:
+            %    Each row of messages holds a message ID and a cell array of the field values of the
+            %    message, in the order of the arguments of its message class constructor. Values must
+            %    already have the type and size of the fields, as they are cast to bytes unchecked,
+            %    but a message whose fields do not add up to its length is not encoded.
+            %Arguments:
+            %    messages(cell): N by 2 cell array of message IDs and cell arrays of field values
+            
+            n = size(messages,1);
+            first = zeros(n,1);
+            payloadLength = zeros(n,1);
+            msgid = zeros(n,1);
+            added = 0;
+            
+            %Write the header and payload of every frame, leaving room for its checksum
+            for i = 1:1:n
+                id = double(messages{i,1});
+                if id > 255 || isempty(MAVLinkPacket.MESSAGE_CONSTRUCTORS{id + 1})
+                    MAVLink.throwUnsupportedMessageError(id);
+                    continue;
+                end
+                
+                fields = messages{i,2};
+                bytes = cell(1,numel(fields));
+                for j = 1:1:numel(fields)
+                    bytes{j} = typecast(fields{j}(:)','uint8');
+                end
+                bytes = [bytes{:}];
+                len = numel(bytes);
+                if len ~= MAVLinkPacket.MESSAGE_LENGTHS(id + 1)
+                    MAVLink.throwCustomError(sprintf('Fields of message (ID = %d) are not %d bytes long',...
+                        id, MAVLinkPacket.MESSAGE_LENGTHS(id + 1)));
+                    continue;
+                end
+                
+                %Double the buffer when the frame does not fit
+                while obj.count + len + 8 > numel(obj.buffer)
+                    obj.buffer = [obj.buffer; zeros(numel(obj.buffer),1,'uint8')];
+                end
+                
+                added = added + 1;
+                first(added) = obj.count + 1;
+                payloadLength(added) = len;
+                msgid(added) = id;
+                obj.buffer(obj.count + 1:obj.count + 6) = [MAVLinkPacket.STX; len; 0;...
+                    MAVLink.SYSID; MAVLink.COMPID; id];
+                obj.buffer(obj.count + 7:obj.count + 6 + len) = bytes;
+                obj.count = obj.count + len + 8;
+            end
+            first = first(1:added);
+            payloadLength = payloadLength(1:added);
+            msgid = msgid(1:added);
+            
+            %Number the frames that were added, so that skipped messages do not appear as drops
+            obj.buffer(first + 2) = uint8(MAVLink.nextSeq(added));
+            
+            %Calculate the checksums of every frame, one byte position at a time
+            crc = repmat(MAVLinkCRC.CRC_INIT_VALUE, added, 1);
+            for i = 1:1:max([payloadLength; -5]) + 5
+                active = payloadLength + 5 >= i;
+                crc(active) = obj.accumulate(crc(active), obj.buffer(first(active) + i));
+            end
+            crcExtra = MAVLinkCRC.MAVLINK_MESSAGE_CRCS(msgid + 1);
+            crc = obj.accumulate(crc, crcExtra(:));
+            obj.buffer(first + payloadLength + 6) = uint8(bitand(crc, 255));
+            obj.buffer(first + payloadLength + 7) = uint8(bitshift(crc, -8));
+        end
+        
+        function bytes = getBytes(obj)
+            %GETBYTES: Returns the frames in the send buffer
+            bytes = obj.buffer(1:obj.count);
+        end
+        
+        function clear(obj)
+            %CLEAR: Empty the send buffer without sending its frames
+            obj.count = 0;
+        end
+        
+        function flush(obj,out)
+            %FLUSH(out): Write every frame in the send buffer with a single write and empty it
+            %Arguments:
+            %    out: Connection the frames are written to, such as a serial port or UDP object
+            if obj.count > 0
+                write(out,obj.buffer(1:obj.count));
+            end
+            obj.count = 0;
+        end
+        
+    end
+    
+    methods(Static, Access = private)
+        
+        function crc = accumulate(crc,bytes)
+            %ACCUMULATE(crc,bytes): Accumulate one byte into each of an array of checksums
+            index = double(bitand(bitxor(crc, uint16(bytes)), 255)) + 1;
+            table = MAVLinkCRC.CRC_TABLE;
+            crc = bitxor(bitshift(crc, -8), reshape(table(index), size(crc)));
+        end
+        
+    end
+end
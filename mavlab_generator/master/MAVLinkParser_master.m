@@ -2,7 +2,13 @@ classdef MAVLinkParser < MAVLinkHandle
     %MAVLINKPARSER: Used to parse an input stream for MAVLink packets
     %Description:
     %    Parses a stream of chars for MAVLink packets and returns them so that they can be decoded and
-    %    unpacked.
+    %    unpacked. Streams can be parsed one char at a time with parseChar or a chunk at a time with
+    %    parseBuffer, but the two should not be mixed on the same parser.
+    %    
+    %    Packets are taken from a pool of preallocated packets with MAX_PAYLOAD_SIZE buffers, which
+    %    parseChar returns a packet to when its checksum fails. Releasing packets once they have been
+    %    unpacked returns them to the pool too, so a busy link is parsed without allocating packets.
+    %    The pool hits and misses are counted in MAVLink.stats.
     
     properties(Constant, Access = private)
         STATE_UNINIT = 0;
@@ -15,20 +21,54 @@ classdef MAVLinkParser < MAVLinkHandle
         STATE_GOT_MSGID = 7;
         STATE_GOT_PAYLOAD = 8;
         STATE_GOT_CRC1 = 9;
+        
+        POOL_SIZE = 16;         %Default number of packets in the pool
+        MAX_PAYLOAD_SIZE = 255; %Length of the payload buffers of the pooled packets
     end
     
     properties(Access = private)
         msg_received;
         packet;
         state;
-        last_seq;
+        last_seq = -ones(256,256);
+        carry = zeros(0,1,'uint8');
+        pool = {};
+        poolCount = 0;
     end
     
     methods
         
-        function obj = MAVLinkParser()
+        function obj = MAVLinkParser(poolSize)
             %MAVLINKPARSER: Create a new MAVLinkParser object
+            %Arguments:
+            %    poolSize(int): Number of packets kept for reuse (default = POOL_SIZE)
             obj.state = obj.STATE_UNINIT;
+            if nargin == 0
+                poolSize = obj.POOL_SIZE;
+            end
+            
+            %Preallocate the pool with packets whose payload can hold any message
+            obj.pool = cell(poolSize,1);
+            for i = 1:1:poolSize
+                obj.pool{i} = MAVLinkPacket(obj.MAX_PAYLOAD_SIZE);
+            end
+            obj.poolCount = poolSize;
+        end
+        
+        function release(obj,packet)
+            %RELEASE(packet): Return a packet to the pool once it is no longer needed
+            %Description:
+            %    The packet is reset and reused for a later packet, so neither it nor its payload
+            %    should be used after it has been released. Packets are dropped when the pool is full.
+            %    Releasing a packet which is already in the pool does nothing, so that it cannot be
+            %    handed out twice.
+            %Arguments:
+            %    packet(MAVLinkPacket): Packet returned by parseChar or parseBuffer
+            if obj.poolCount < numel(obj.pool) && isa(packet,'MAVLinkPacket') && ~packet.pooled
+                packet.pooled = true;
+                obj.poolCount = obj.poolCount + 1;
+                obj.pool{obj.poolCount} = packet;
+            end
         end
         
         function packet = parseChar(obj,char)
@@ -52,7 +92,7 @@ classdef MAVLinkParser < MAVLinkHandle
 
                     %Get the payload length
                     case obj.STATE_GOT_STX
-                        obj.packet = MAVLinkPacket(char);
+                        obj.packet = obj.acquire(char);
                         obj.state = obj.STATE_GOT_LEN;
 
                     %Get the packet sequence
@@ -91,6 +131,7 @@ classdef MAVLinkParser < MAVLinkHandle
                         obj.packet.generateCRC();
                         if char ~= obj.packet.crc.getLSB()
                             obj.state = obj.STATE_IDLE;
+                            obj.release(obj.packet);
                             MAVLink.stats.incrementFailedCRC();
                             if char == MAVLinkPacket.STX
                                 obj.state = obj.STATE_GOT_STX;
@@ -103,6 +144,7 @@ classdef MAVLinkParser < MAVLinkHandle
                     case obj.STATE_GOT_CRC1
                         if char ~= obj.packet.crc.getMSB()
                             obj.state = obj.STATE_IDLE;
+                            obj.release(obj.packet);
                             MAVLink.stats.incrementFailedCRC();
                             if char == MAVLinkPacket.STX
                                 obj.state = obj.STATE_GOT_STX;
@@ -116,18 +158,7 @@ classdef MAVLinkParser < MAVLinkHandle
                 %If the packet is complete return it
                 if obj.msg_received
                     packet = obj.packet;
-                    
-                    %Check whether any packets have been dropped
-                    if ~isempty(obj.last_seq)
-                        seq_diff = double(packet.seq) - double(obj.last_seq);
-                        if seq_diff < 0
-                            seq_diff = seq_diff + 256;
-                        end
-                        MAVLink.stats.incrementPacketsDropped(seq_diff - 1);
-                    end
-                    
-                    obj.last_seq = packet.seq;
-                    MAVLink.stats.incrementPacketsReceived()
+                    obj.updateStats(packet);
                 else
                     packet = [];
                 end
@@ -137,6 +168,131 @@ classdef MAVLinkParser < MAVLinkHandle
                 packet = [];
             end
         end
+        
+        function packets = parseBuffer(obj,bytes)
+            %PARSEBUFFER(bytes): Parse a chunk of a stream and return every packet found
+            %Description:
+            %    Finds STX candidates with a vectorized search, slices their headers out of the buffer
+            %    and calculates the checksums of every candidate together. Candidates are then
+            %    accepted in order, skipping the bytes that parseChar would consume, so the packets
+            %    returned and the statistics recorded are the same as parsing the chunk one char at a
+            %    time. The bytes of an incomplete packet at the end of the chunk are kept and parsed
+            %    at the start of the next call. Returns a cell array of MAVLinkPackets.
+            %Arguments:
+            %    bytes(uint8): Array of bytes from the stream to be parsed
+            
+            packets = {};
+            if ~isa(bytes,'uint8')
+                MAVLink.throwCustomError('Input "bytes" must be cast to type "uint8" before being passed into this function')
+                return;
+            end
+            
+            buffer = [obj.carry; bytes(:)];
+            obj.carry = zeros(0,1,'uint8');
+            bufferLength = numel(buffer);
+            
+            %Find every STX candidate and the position of the last byte of its packet
+            stx = find(buffer == MAVLinkPacket.STX);
+            payloadLength = zeros(size(stx));
+            hasLength = stx < bufferLength;
+            payloadLength(hasLength) = double(buffer(stx(hasLength) + 1));
+            packetEnd = stx + payloadLength + 7;
+            complete = packetEnd <= bufferLength;
+            
+            %Slice the headers of the complete candidates out of the buffer in one step
+            candidates = stx(complete);
+            candidateLength = payloadLength(complete);
+            headers = buffer(bsxfun(@plus, candidates, 0:5));
+            headers = reshape(headers, numel(candidates), 6);
+            
+            %Calculate the checksums of every complete candidate, one byte position at a time
+            crc = repmat(MAVLinkCRC.CRC_INIT_VALUE, numel(candidates), 1);
+            for i = 1:1:max([candidateLength; -5]) + 5
+                active = candidateLength + 5 >= i;
+                crc(active) = obj.accumulate(crc(active), buffer(candidates(active) + i));
+            end
+            crcExtra = MAVLinkCRC.MAVLINK_MESSAGE_CRCS(double(headers(:,6)) + 1);
+            crc = obj.accumulate(crc, crcExtra(:));
+            validLSB = buffer(candidates + candidateLength + 6) == uint8(bitand(crc, 255));
+            validMSB = buffer(candidates + candidateLength + 7) == uint8(bitshift(crc, -8));
+            
+            %Accept candidates in order, skipping those inside bytes that have already been consumed
+            candidateIndex = cumsum(complete);
+            next = 1;
+            for i = 1:1:numel(stx)
+                if stx(i) < next
+                    continue;
+                elseif ~complete(i)
+                    obj.carry = buffer(stx(i):end);
+                    break;
+                end
+                
+                j = candidateIndex(i);
+                if ~validLSB(j)
+                    MAVLink.stats.incrementFailedCRC();
+                    next = packetEnd(i) - 1;
+                elseif ~validMSB(j)
+                    MAVLink.stats.incrementFailedCRC();
+                    next = packetEnd(i);
+                else
+                    packet = obj.acquire(candidateLength(j));
+                    packet.seq = headers(j,3);
+                    packet.sysid = headers(j,4);
+                    packet.compid = headers(j,5);
+                    packet.msgid = headers(j,6);
+                    packet.payload.setByteBuffer(buffer(stx(i) + 6:packetEnd(i) - 2));
+                    obj.updateStats(packet);
+                    packets{end+1} = packet; %#ok<AGROW>
+                    next = packetEnd(i) + 1;
+                end
+            end
+        end
+    end
+    
+    methods(Access = private)
+        
+        function packet = acquire(obj,payloadLength)
+            %ACQUIRE(payloadLength): Take a packet from the pool, or allocate one if the pool is empty
+            if obj.poolCount > 0
+                packet = obj.pool{obj.poolCount};
+                obj.pool{obj.poolCount} = [];
+                obj.poolCount = obj.poolCount - 1;
+                packet.pooled = false;
+                packet.reset(payloadLength);
+                MAVLink.stats.incrementPoolHits();
+            else
+                packet = MAVLinkPacket(payloadLength);
+                MAVLink.stats.incrementPoolMisses();
+            end
+        end
+        
+        function updateStats(obj,packet)
+            %UPDATESTATS(packet): Record a received packet and any packets its sender dropped before it
+            %Sequence numbers are tracked separately for each system and component, as the packets of
+            %different senders are interleaved in the stream
+            
+            sysid = double(packet.sysid) + 1;
+            compid = double(packet.compid) + 1;
+            dropped = 0;
+            if obj.last_seq(sysid, compid) >= 0
+                dropped = mod(double(packet.seq) - obj.last_seq(sysid, compid), 256) - 1;
+            end
+            
+            obj.last_seq(sysid, compid) = double(packet.seq);
+            MAVLink.stats.recordPacket(packet, dropped);
+        end
+        
+    end
+    
+    methods(Static, Access = private)
+        
+        function crc = accumulate(crc,bytes)
+            %ACCUMULATE(crc,bytes): Accumulate one byte into each of an array of checksums
+            index = double(bitand(bitxor(crc, uint16(bytes)), 255)) + 1;
+            table = MAVLinkCRC.CRC_TABLE;
+            crc = bitxor(bitshift(crc, -8), reshape(table(index), size(crc)));
+        end
+        
     end
 end
 
@@ -6,7 +6,20 @@ classdef MAVLinkStats < MAVLinkHandle
         failedCRC = 0;
         packetsDropped = 0;
         packetsReceived = 0;
+        packetsSkipped = 0;
         packetLoss = 0;
+        
+        %Packets taken from the pools of the parsers and packets allocated when a pool was empty
+        poolHits = 0;
+        poolMisses = 0;
+        
+        %Packets received and dropped by each sender, indexed by sysid * 256 + compid + 1
+        senderReceived = zeros(65536,1);
+        senderDropped = zeros(65536,1);
+        
+        %Packets and bytes received of each message, indexed by msgid + 1
+        messageReceived = zeros(256,1);
+        messageBytes = zeros(256,1);
     end
     
     methods
@@ -14,7 +27,7 @@ classdef MAVLinkStats < MAVLinkHandle
         %Increment failed CRC counter
         function incrementFailedCRC(obj, incr)
             if nargin == 2
-                obj.faiedCRC = obj.failedCRC + incr; 
+                obj.failedCRC = obj.failedCRC + incr; 
             else
                 obj.failedCRC = obj.failedCRC + 1; 
             end
@@ -38,6 +51,58 @@ classdef MAVLinkStats < MAVLinkHandle
             end
         end
         
+        %Increment skipped packet counter, for packets of messages that are not generated
+        function incrementPacketsSkipped(obj, incr)
+            if nargin == 2
+                obj.packetsSkipped = obj.packetsSkipped + incr; 
+            else
+                obj.packetsSkipped = obj.packetsSkipped + 1; 
+            end
+        end
+        
+        %Increment pool hit counter
+        function incrementPoolHits(obj, incr)
+            if nargin == 2
+                obj.poolHits = obj.poolHits + incr; 
+            else
+                obj.poolHits = obj.poolHits + 1; 
+            end
+        end
+        
+        %Increment pool miss counter
+        function incrementPoolMisses(obj, incr)
+            if nargin == 2
+                obj.poolMisses = obj.poolMisses + incr; 
+            else
+                obj.poolMisses = obj.poolMisses + 1; 
+            end
+        end
+        
+        %Record a received packet and the packets its sender dropped before it
+        function recordPacket(obj, packet, dropped)
+            sender = double(packet.sysid) * 256 + double(packet.compid) + 1;
+            msgid = double(packet.msgid) + 1;
+            obj.packetsReceived = obj.packetsReceived + 1;
+            obj.packetsDropped = obj.packetsDropped + dropped;
+            obj.senderReceived(sender) = obj.senderReceived(sender) + 1;
+            obj.senderDropped(sender) = obj.senderDropped(sender) + dropped;
+            obj.messageReceived(msgid) = obj.messageReceived(msgid) + 1;
+            obj.messageBytes(msgid) = obj.messageBytes(msgid) + double(packet.len) + 8;
+        end
+        
+        %Return the counters of the senders and messages that have been received as a struct
+        function snapshot = snapshot(obj)
+            senders = find(obj.senderReceived);
+            messages = find(obj.messageReceived);
+            snapshot = struct('failedCRC', obj.failedCRC, 'packetsDropped', obj.packetsDropped,...
+                'packetsReceived', obj.packetsReceived, 'packetsSkipped', obj.packetsSkipped,...
+                'packetLoss', obj.packetLoss, 'poolHits', obj.poolHits, 'poolMisses', obj.poolMisses,...
+                'sysid', floor((senders - 1) / 256),...
+                'compid', mod(senders - 1, 256), 'senderReceived', obj.senderReceived(senders),...
+                'senderDropped', obj.senderDropped(senders), 'msgid', messages - 1,...
+                'messageReceived', obj.messageReceived(messages), 'messageBytes', obj.messageBytes(messages));
+        end
+        
         %Calculate current packet loss
         function packetLoss = get.packetLoss(obj)
             if obj.packetsReceived > 0
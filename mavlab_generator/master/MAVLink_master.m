@@ -64,6 +64,25 @@ classdef MAVLink
             end
             MAVStats = stats;
         end
+        
+        function seq = nextSeq(count)
+            %NEXTSEQ: Returns the sequence number of the next packet sent
+            %Description:
+            %    Sequence numbers start at 0 and wrap after 255, and are shared by every packet
+            %    encoded by MAVLAB. Passing count reserves count consecutive numbers and returns
+            %    them all.
+            %Arguments:
+            %    count(int): Number of sequence numbers to reserve (default = 1)
+            persistent next;
+            if isempty(next)
+                next = 0;
+            end
+            if nargin == 0
+                count = 1;
+            end
+            seq = mod(next + (0:1:count-1)', 256);
+            next = mod(next + count, 256);
+        end
              
     end
     
@@ -1,8 +1,7 @@
 classdef msg_fence_point < MAVLinkMessage
 	%MSG_FENCE_POINT: MAVLink Message ID = 160
     %Description:
-    %    A fence point. Used to set a point when from
-	      GCS -> MAV. Also used to return a point from MAV -> GCS
+    %    A fence point. Used to set a point when from 	      GCS -> MAV. Also used to return a point from MAV -> GCS
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    lat(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -19,12 +18,12 @@ classdef msg_fence_point < MAVLinkMessage
 	end
 	
 	properties
-        lat	%Latitude of point	|	(single)
-        lng	%Longitude of point	|	(single)
-        target_system	%System ID	|	(uint8)
-        target_component	%Component ID	|	(uint8)
-        idx	%point index (first point is 1, 0 is for return point)	|	(uint8)
-        count	%total number of points (for sanity checking)	|	(uint8)
+        lat	%Latitude of point	|	(single)
+        lng	%Longitude of point	|	(single)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
+        idx	%point index (first point is 1, 0 is for return point)	|	(uint8)
+        count	%total number of points (for sanity checking)	|	(uint8)
     end
 
     methods(Static)
@@ -71,12 +70,12 @@ classdef msg_fence_point < MAVLinkMessage
                     MAVLink.throwTypeError('lat','MAVLinkPacket');
                 end
             elseif nargin >= 6 && isempty(varargin{1})
-                obj.lat = lat;
-                obj.lng = lng;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.idx = idx;
-                obj.count = count;
+                obj.lat = lat;
+                obj.lng = lng;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.idx = idx;
+                obj.count = count;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -1,8 +1,7 @@
 classdef msg_fence_status < MAVLinkMessage
 	%MSG_FENCE_STATUS: MAVLink Message ID = 162
     %Description:
-    %    Status of geo-fencing. Sent in extended
-	    status stream when fencing enabled
+    %    Status of geo-fencing. Sent in extended 	    status stream when fencing enabled
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    breach_time(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -17,10 +16,10 @@ classdef msg_fence_status < MAVLinkMessage
 	end
 	
 	properties
-        breach_time	%time of last breach in milliseconds since boot	|	(uint32)
-        breach_count	%number of fence breaches	|	(uint16)
-        breach_status	%0 if currently inside fence, 1 if outside	|	(uint8)
-        breach_type	%last breach type (see FENCE_BREACH_* enum)	|	(uint8)
+        breach_time	%time of last breach in milliseconds since boot	|	(uint32)
+        breach_count	%number of fence breaches	|	(uint16)
+        breach_status	%0 if currently inside fence, 1 if outside	|	(uint8)
+        breach_type	%last breach type (see FENCE_BREACH_* enum)	|	(uint8)
     end
 
     methods(Static)
@@ -67,10 +66,10 @@ classdef msg_fence_status < MAVLinkMessage
                     MAVLink.throwTypeError('breach_time','MAVLinkPacket');
                 end
             elseif nargin >= 4 && isempty(varargin{1})
-                obj.breach_time = breach_time;
-                obj.breach_count = breach_count;
-                obj.breach_status = breach_status;
-                obj.breach_type = breach_type;
+                obj.breach_time = breach_time;
+                obj.breach_count = breach_count;
+                obj.breach_status = breach_status;
+                obj.breach_type = breach_type;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
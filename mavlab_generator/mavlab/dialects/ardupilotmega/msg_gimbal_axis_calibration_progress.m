@@ -6,4 +6,157 @@ classdef msg_gimbal_axis_calibration_progress < MAVLinkMessage
 	%Arguments:
     %    calibration_axis(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
     %    calibration_axis(uint8): Which gimbal axis we're reporting calibration progress for
-    %    calibration_progress(uint8): The current calibration progress for this axis, 0x64=100
\ No newline at end of file
+    %    calibration_progress(uint8): The current calibration progress for this axis, 0x64=100%
+    %    calibration_status(uint8): The status of the running calibration
+	
+	properties(Constant)
+		ID = 203
+		LEN = 3
+	end
+	
+	properties
+        calibration_axis	%Which gimbal axis we're reporting calibration progress for	|	(uint8)
+        calibration_progress	%The current calibration progress for this axis, 0x64=100%	|	(uint8)
+        calibration_status	%The status of the running calibration	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,calibration_axis,calibration_progress,calibration_status,varargin)
+
+            if nargin == 3 + 1
+                msg = msg_gimbal_axis_calibration_progress(calibration_axis,calibration_progress,calibration_status,varargin);
+            elseif nargin == 2
+                msg = msg_gimbal_axis_calibration_progress(calibration_axis);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_gimbal_axis_calibration_progress(calibration_axis,calibration_progress,calibration_status,varargin)
+        %MSG_GIMBAL_AXIS_CALIBRATION_PROGRESS: Create a new gimbal_axis_calibration_progress message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(calibration_axis,'MAVLinkPacket')
+                    packet = calibration_axis;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('calibration_axis','MAVLinkPacket');
+                end
+            elseif nargin >= 3 && isempty(varargin{1})
+                obj.calibration_axis = calibration_axis;
+                obj.calibration_progress = calibration_progress;
+                obj.calibration_status = calibration_status;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_gimbal_axis_calibration_progress.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_gimbal_axis_calibration_progress.ID;
+                
+                packet.payload.putUINT8(obj.calibration_axis);
+                packet.payload.putUINT8(obj.calibration_progress);
+                packet.payload.putUINT8(obj.calibration_status);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.calibration_axis = payload.getUINT8();
+            obj.calibration_progress = payload.getUINT8();
+            obj.calibration_status = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.calibration_axis,2) ~= 1
+                result = 'calibration_axis';
+            elseif size(obj.calibration_progress,2) ~= 1
+                result = 'calibration_progress';
+            elseif size(obj.calibration_status,2) ~= 1
+                result = 'calibration_status';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.calibration_axis(obj,value)
+            if value == uint8(value)
+                obj.calibration_axis = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.calibration_progress(obj,value)
+            if value == uint8(value)
+                obj.calibration_progress = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.calibration_status(obj,value)
+            if value == uint8(value)
+                obj.calibration_status = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
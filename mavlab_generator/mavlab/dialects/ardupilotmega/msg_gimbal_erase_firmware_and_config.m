@@ -1,11 +1,7 @@
 classdef msg_gimbal_erase_firmware_and_config < MAVLinkMessage
 	%MSG_GIMBAL_ERASE_FIRMWARE_AND_CONFIG: MAVLink Message ID = 208
     %Description:
-    %    Commands the gimbal to erase its firmware image and flash configuration, leaving only the bootloader.  The gimbal will then reboot into the bootloader,
-            ready for the load of a new application firmware image.  Erasing the flash configuration will cause the gimbal to re-perform axis calibration when a
-            new firmware image is loaded, and will cause all tuning parameters to return to their factory defaults.  WARNING: sending this command will render a
-            gimbal inoperable until a new firmware image is loaded onto it.  For this reason, a particular "knock" value must be sent for the command to take effect.
-            Use this command at your own risk
+    %    Commands the gimbal to erase its firmware image and flash configuration, leaving only the bootloader.  The gimbal will then reboot into the bootloader,             ready for the load of a new application firmware image.  Erasing the flash configuration will cause the gimbal to re-perform axis calibration when a             new firmware image is loaded, and will cause all tuning parameters to return to their factory defaults.  WARNING: sending this command will render a             gimbal inoperable until a new firmware image is loaded onto it.  For this reason, a particular "knock" value must be sent for the command to take effect.             Use this command at your own risk
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    knock(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -19,9 +15,9 @@ classdef msg_gimbal_erase_firmware_and_config < MAVLinkMessage
 	end
 	
 	properties
-        knock	%Knock value to confirm this is a valid request	|	(uint32)
-        target_system	%System ID	|	(uint8)
-        target_component	%Component ID	|	(uint8)
+        knock	%Knock value to confirm this is a valid request	|	(uint32)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
     end
 
     methods(Static)
@@ -68,9 +64,9 @@ classdef msg_gimbal_erase_firmware_and_config < MAVLinkMessage
                     MAVLink.throwTypeError('knock','MAVLinkPacket');
                 end
             elseif nargin >= 3 && isempty(varargin{1})
-                obj.knock = knock;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
+                obj.knock = knock;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
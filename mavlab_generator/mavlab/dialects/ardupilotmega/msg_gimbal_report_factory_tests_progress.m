@@ -7,4 +7,171 @@ classdef msg_gimbal_report_factory_tests_progress < MAVLinkMessage
     %    test(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
     %    test(uint8): Which factory test is currently running
     %    test_section(uint8): Which section of the test is currently running.  The meaning of this is test-dependent
-    %    test_section_progress(uint8): The progress of the current test section, 0x64=100
\ No newline at end of file
+    %    test_section_progress(uint8): The progress of the current test section, 0x64=100%
+    %    test_status(uint8): The status of the currently executing test section.  The meaning of this is test and section-dependent
+	
+	properties(Constant)
+		ID = 210
+		LEN = 4
+	end
+	
+	properties
+        test	%Which factory test is currently running	|	(uint8)
+        test_section	%Which section of the test is currently running.  The meaning of this is test-dependent	|	(uint8)
+        test_section_progress	%The progress of the current test section, 0x64=100%	|	(uint8)
+        test_status	%The status of the currently executing test section.  The meaning of this is test and section-dependent	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,test,test_section,test_section_progress,test_status,varargin)
+
+            if nargin == 4 + 1
+                msg = msg_gimbal_report_factory_tests_progress(test,test_section,test_section_progress,test_status,varargin);
+            elseif nargin == 2
+                msg = msg_gimbal_report_factory_tests_progress(test);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_gimbal_report_factory_tests_progress(test,test_section,test_section_progress,test_status,varargin)
+        %MSG_GIMBAL_REPORT_FACTORY_TESTS_PROGRESS: Create a new gimbal_report_factory_tests_progress message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(test,'MAVLinkPacket')
+                    packet = test;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('test','MAVLinkPacket');
+                end
+            elseif nargin >= 4 && isempty(varargin{1})
+                obj.test = test;
+                obj.test_section = test_section;
+                obj.test_section_progress = test_section_progress;
+                obj.test_status = test_status;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_gimbal_report_factory_tests_progress.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_gimbal_report_factory_tests_progress.ID;
+                
+                packet.payload.putUINT8(obj.test);
+                packet.payload.putUINT8(obj.test_section);
+                packet.payload.putUINT8(obj.test_section_progress);
+                packet.payload.putUINT8(obj.test_status);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.test = payload.getUINT8();
+            obj.test_section = payload.getUINT8();
+            obj.test_section_progress = payload.getUINT8();
+            obj.test_status = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.test,2) ~= 1
+                result = 'test';
+            elseif size(obj.test_section,2) ~= 1
+                result = 'test_section';
+            elseif size(obj.test_section_progress,2) ~= 1
+                result = 'test_section_progress';
+            elseif size(obj.test_status,2) ~= 1
+                result = 'test_status';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.test(obj,value)
+            if value == uint8(value)
+                obj.test = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.test_section(obj,value)
+            if value == uint8(value)
+                obj.test_section = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.test_section_progress(obj,value)
+            if value == uint8(value)
+                obj.test_section_progress = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.test_status(obj,value)
+            if value == uint8(value)
+                obj.test_status = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
@@ -1,8 +1,7 @@
 classdef msg_gimbal_request_axis_calibration < MAVLinkMessage
 	%MSG_GIMBAL_REQUEST_AXIS_CALIBRATION: MAVLink Message ID = 213
     %Description:
-    %    Requests any currently uncalibrated gimbal axes to run the axis calibration procedure.  An axis is considered uncalibrated if its commutation calibration
-			slope and intercept are 0
+    %    Requests any currently uncalibrated gimbal axes to run the axis calibration procedure.  An axis is considered uncalibrated if its commutation calibration 			slope and intercept are 0
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    target_system(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -15,8 +14,8 @@ classdef msg_gimbal_request_axis_calibration < MAVLinkMessage
 	end
 	
 	properties
-        target_system	%System ID	|	(uint8)
-        target_component	%Component ID	|	(uint8)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
     end
 
     methods(Static)
@@ -63,8 +62,8 @@ classdef msg_gimbal_request_axis_calibration < MAVLinkMessage
                     MAVLink.throwTypeError('target_system','MAVLinkPacket');
                 end
             elseif nargin >= 2 && isempty(varargin{1})
-                obj.target_system = target_system;
-                obj.target_component = target_component;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -1,10 +1,7 @@
 classdef msg_gimbal_set_factory_parameters < MAVLinkMessage
 	%MSG_GIMBAL_SET_FACTORY_PARAMETERS: MAVLink Message ID = 206
     %Description:
-    %    Set factory configuration parameters (such as assembly date and time, and serial number).  This is only intended to be used
-            during manufacture, not by end users, so it is protected by a simple checksum of sorts (this won't stop anybody determined,
-            it's mostly just to keep the average user from trying to modify these values.  This will need to be revisited if that isn't
-            adequate.
+    %    Set factory configuration parameters (such as assembly date and time, and serial number).  This is only intended to be used             during manufacture, not by end users, so it is protected by a simple checksum of sorts (this won't stop anybody determined,             it's mostly just to keep the average user from trying to modify these values.  This will need to be revisited if that isn't             adequate.
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    magic_1(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -29,20 +26,20 @@ classdef msg_gimbal_set_factory_parameters < MAVLinkMessage
 	end
 	
 	properties
-        magic_1	%Magic number 1 for validation	|	(uint32)
-        magic_2	%Magic number 2 for validation	|	(uint32)
-        magic_3	%Magic number 3 for validation	|	(uint32)
-        serial_number_pt_1	%Unit Serial Number Part 1 (part code, design, language/country)	|	(uint32)
-        serial_number_pt_2	%Unit Serial Number Part 2 (option, year, month)	|	(uint32)
-        serial_number_pt_3	%Unit Serial Number Part 3 (incrementing serial number per month)	|	(uint32)
-        assembly_year	%Assembly Date Year	|	(uint16)
-        target_system	%System ID	|	(uint8)
-        target_component	%Component ID	|	(uint8)
-        assembly_month	%Assembly Date Month	|	(uint8)
-        assembly_day	%Assembly Date Day	|	(uint8)
-        assembly_hour	%Assembly Time Hour	|	(uint8)
-        assembly_minute	%Assembly Time Minute	|	(uint8)
-        assembly_second	%Assembly Time Second	|	(uint8)
+        magic_1	%Magic number 1 for validation	|	(uint32)
+        magic_2	%Magic number 2 for validation	|	(uint32)
+        magic_3	%Magic number 3 for validation	|	(uint32)
+        serial_number_pt_1	%Unit Serial Number Part 1 (part code, design, language/country)	|	(uint32)
+        serial_number_pt_2	%Unit Serial Number Part 2 (option, year, month)	|	(uint32)
+        serial_number_pt_3	%Unit Serial Number Part 3 (incrementing serial number per month)	|	(uint32)
+        assembly_year	%Assembly Date Year	|	(uint16)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
+        assembly_month	%Assembly Date Month	|	(uint8)
+        assembly_day	%Assembly Date Day	|	(uint8)
+        assembly_hour	%Assembly Time Hour	|	(uint8)
+        assembly_minute	%Assembly Time Minute	|	(uint8)
+        assembly_second	%Assembly Time Second	|	(uint8)
     end
 
     methods(Static)
@@ -89,20 +86,20 @@ classdef msg_gimbal_set_factory_parameters < MAVLinkMessage
                     MAVLink.throwTypeError('magic_1','MAVLinkPacket');
                 end
             elseif nargin >= 14 && isempty(varargin{1})
-                obj.magic_1 = magic_1;
-                obj.magic_2 = magic_2;
-                obj.magic_3 = magic_3;
-                obj.serial_number_pt_1 = serial_number_pt_1;
-                obj.serial_number_pt_2 = serial_number_pt_2;
-                obj.serial_number_pt_3 = serial_number_pt_3;
-                obj.assembly_year = assembly_year;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.assembly_month = assembly_month;
-                obj.assembly_day = assembly_day;
-                obj.assembly_hour = assembly_hour;
-                obj.assembly_minute = assembly_minute;
-                obj.assembly_second = assembly_second;
+                obj.magic_1 = magic_1;
+                obj.magic_2 = magic_2;
+                obj.magic_3 = magic_3;
+                obj.serial_number_pt_1 = serial_number_pt_1;
+                obj.serial_number_pt_2 = serial_number_pt_2;
+                obj.serial_number_pt_3 = serial_number_pt_3;
+                obj.assembly_year = assembly_year;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.assembly_month = assembly_month;
+                obj.assembly_day = assembly_day;
+                obj.assembly_hour = assembly_hour;
+                obj.assembly_minute = assembly_minute;
+                obj.assembly_second = assembly_second;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
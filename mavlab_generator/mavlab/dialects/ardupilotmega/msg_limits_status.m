@@ -1,8 +1,7 @@
 classdef msg_limits_status < MAVLinkMessage
 	%MSG_LIMITS_STATUS: MAVLink Message ID = 167
     %Description:
-    %    Status of AP_Limits. Sent in extended
-	    status stream when AP_Limits is enabled
+    %    Status of AP_Limits. Sent in extended 	    status stream when AP_Limits is enabled
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    last_trigger(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -22,15 +21,15 @@ classdef msg_limits_status < MAVLinkMessage
 	end
 	
 	properties
-        last_trigger	%time of last breach in milliseconds since boot	|	(uint32)
-        last_action	%time of last recovery action in milliseconds since boot	|	(uint32)
-        last_recovery	%time of last successful recovery in milliseconds since boot	|	(uint32)
-        last_clear	%time of last all-clear in milliseconds since boot	|	(uint32)
-        breach_count	%number of fence breaches	|	(uint16)
-        limits_state	%state of AP_Limits, (see enum LimitState, LIMITS_STATE)	|	(uint8)
-        mods_enabled	%AP_Limit_Module bitfield of enabled modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
-        mods_required	%AP_Limit_Module bitfield of required modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
-        mods_triggered	%AP_Limit_Module bitfield of triggered modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
+        last_trigger	%time of last breach in milliseconds since boot	|	(uint32)
+        last_action	%time of last recovery action in milliseconds since boot	|	(uint32)
+        last_recovery	%time of last successful recovery in milliseconds since boot	|	(uint32)
+        last_clear	%time of last all-clear in milliseconds since boot	|	(uint32)
+        breach_count	%number of fence breaches	|	(uint16)
+        limits_state	%state of AP_Limits, (see enum LimitState, LIMITS_STATE)	|	(uint8)
+        mods_enabled	%AP_Limit_Module bitfield of enabled modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
+        mods_required	%AP_Limit_Module bitfield of required modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
+        mods_triggered	%AP_Limit_Module bitfield of triggered modules, (see enum moduleid or LIMIT_MODULE)	|	(uint8)
     end
 
     methods(Static)
@@ -77,15 +76,15 @@ classdef msg_limits_status < MAVLinkMessage
                     MAVLink.throwTypeError('last_trigger','MAVLinkPacket');
                 end
             elseif nargin >= 9 && isempty(varargin{1})
-                obj.last_trigger = last_trigger;
-                obj.last_action = last_action;
-                obj.last_recovery = last_recovery;
-                obj.last_clear = last_clear;
-                obj.breach_count = breach_count;
-                obj.limits_state = limits_state;
-                obj.mods_enabled = mods_enabled;
-                obj.mods_required = mods_required;
-                obj.mods_triggered = mods_triggered;
+                obj.last_trigger = last_trigger;
+                obj.last_action = last_action;
+                obj.last_recovery = last_recovery;
+                obj.last_clear = last_clear;
+                obj.breach_count = breach_count;
+                obj.limits_state = limits_state;
+                obj.mods_enabled = mods_enabled;
+                obj.mods_required = mods_required;
+                obj.mods_triggered = mods_triggered;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
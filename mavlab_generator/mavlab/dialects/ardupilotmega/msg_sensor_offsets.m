@@ -1,8 +1,7 @@
 classdef msg_sensor_offsets < MAVLinkMessage
 	%MSG_SENSOR_OFFSETS: MAVLink Message ID = 150
     %Description:
-    %    Offsets and calibrations values for hardware
-        sensors. This makes it easier to debug the calibration process.
+    %    Offsets and calibrations values for hardware         sensors. This makes it easier to debug the calibration process.
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    mag_declination(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -25,18 +24,18 @@ classdef msg_sensor_offsets < MAVLinkMessage
 	end
 	
 	properties
-        mag_declination	%magnetic declination (radians)	|	(single)
-        raw_press	%raw pressure from barometer	|	(int32)
-        raw_temp	%raw temperature from barometer	|	(int32)
-        gyro_cal_x	%gyro X calibration	|	(single)
-        gyro_cal_y	%gyro Y calibration	|	(single)
-        gyro_cal_z	%gyro Z calibration	|	(single)
-        accel_cal_x	%accel X calibration	|	(single)
-        accel_cal_y	%accel Y calibration	|	(single)
-        accel_cal_z	%accel Z calibration	|	(single)
-        mag_ofs_x	%magnetometer X offset	|	(int16)
-        mag_ofs_y	%magnetometer Y offset	|	(int16)
-        mag_ofs_z	%magnetometer Z offset	|	(int16)
+        mag_declination	%magnetic declination (radians)	|	(single)
+        raw_press	%raw pressure from barometer	|	(int32)
+        raw_temp	%raw temperature from barometer	|	(int32)
+        gyro_cal_x	%gyro X calibration	|	(single)
+        gyro_cal_y	%gyro Y calibration	|	(single)
+        gyro_cal_z	%gyro Z calibration	|	(single)
+        accel_cal_x	%accel X calibration	|	(single)
+        accel_cal_y	%accel Y calibration	|	(single)
+        accel_cal_z	%accel Z calibration	|	(single)
+        mag_ofs_x	%magnetometer X offset	|	(int16)
+        mag_ofs_y	%magnetometer Y offset	|	(int16)
+        mag_ofs_z	%magnetometer Z offset	|	(int16)
     end
 
     methods(Static)
@@ -83,18 +82,18 @@ classdef msg_sensor_offsets < MAVLinkMessage
                     MAVLink.throwTypeError('mag_declination','MAVLinkPacket');
                 end
             elseif nargin >= 12 && isempty(varargin{1})
-                obj.mag_declination = mag_declination;
-                obj.raw_press = raw_press;
-                obj.raw_temp = raw_temp;
-                obj.gyro_cal_x = gyro_cal_x;
-                obj.gyro_cal_y = gyro_cal_y;
-                obj.gyro_cal_z = gyro_cal_z;
-                obj.accel_cal_x = accel_cal_x;
-                obj.accel_cal_y = accel_cal_y;
-                obj.accel_cal_z = accel_cal_z;
-                obj.mag_ofs_x = mag_ofs_x;
-                obj.mag_ofs_y = mag_ofs_y;
-                obj.mag_ofs_z = mag_ofs_z;
+                obj.mag_declination = mag_declination;
+                obj.raw_press = raw_press;
+                obj.raw_temp = raw_temp;
+                obj.gyro_cal_x = gyro_cal_x;
+                obj.gyro_cal_y = gyro_cal_y;
+                obj.gyro_cal_z = gyro_cal_z;
+                obj.accel_cal_x = accel_cal_x;
+                obj.accel_cal_y = accel_cal_y;
+                obj.accel_cal_z = accel_cal_z;
+                obj.mag_ofs_x = mag_ofs_x;
+                obj.mag_ofs_y = mag_ofs_y;
+                obj.mag_ofs_z = mag_ofs_z;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
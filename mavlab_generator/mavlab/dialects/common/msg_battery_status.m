@@ -13,4 +13,244 @@ classdef msg_battery_status < MAVLinkMessage
     %    id(uint8): Battery ID
     %    battery_function(uint8): Function of the battery
     %    type(uint8): Type (chemistry) of the battery
-    %    battery_remaining(int8): Remaining battery energy: (0
\ No newline at end of file
+    %    battery_remaining(int8): Remaining battery energy: (0%: 0, 100%: 100), -1: autopilot does not estimate the remaining battery
+	
+	properties(Constant)
+		ID = 147
+		LEN = 36
+	end
+	
+	properties
+        current_consumed	%Consumed charge, in milliampere hours (1 = 1 mAh), -1: autopilot does not provide mAh consumption estimate	|	(int32)
+        energy_consumed	%Consumed energy, in 100*Joules (intergrated U*I*dt)  (1 = 100 Joule), -1: autopilot does not provide energy consumption estimate	|	(int32)
+        temperature	%Temperature of the battery in centi-degrees celsius. INT16_MAX for unknown temperature.	|	(int16)
+        voltages	%Battery voltage of cells, in millivolts (1 = 1 millivolt). Cells above the valid cell count for this battery should have the UINT16_MAX value.	|	(uint16[10])
+        current_battery	%Battery current, in 10*milliamperes (1 = 10 milliampere), -1: autopilot does not measure the current	|	(int16)
+        id	%Battery ID	|	(uint8)
+        battery_function	%Function of the battery	|	(uint8)
+        type	%Type (chemistry) of the battery	|	(uint8)
+        battery_remaining	%Remaining battery energy: (0%: 0, 100%: 100), -1: autopilot does not estimate the remaining battery	|	(int8)
+    end
+
+    methods(Static)
+
+        function send(out,current_consumed,energy_consumed,temperature,voltages,current_battery,id,battery_function,type,battery_remaining,varargin)
+
+            if nargin == 9 + 1
+                msg = msg_battery_status(current_consumed,energy_consumed,temperature,voltages,current_battery,id,battery_function,type,battery_remaining,varargin);
+            elseif nargin == 2
+                msg = msg_battery_status(current_consumed);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_battery_status(current_consumed,energy_consumed,temperature,voltages,current_battery,id,battery_function,type,battery_remaining,varargin)
+        %MSG_BATTERY_STATUS: Create a new battery_status message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(current_consumed,'MAVLinkPacket')
+                    packet = current_consumed;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('current_consumed','MAVLinkPacket');
+                end
+            elseif nargin >= 9 && isempty(varargin{1})
+                obj.current_consumed = current_consumed;
+                obj.energy_consumed = energy_consumed;
+                obj.temperature = temperature;
+                obj.voltages = voltages;
+                obj.current_battery = current_battery;
+                obj.id = id;
+                obj.battery_function = battery_function;
+                obj.type = type;
+                obj.battery_remaining = battery_remaining;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_battery_status.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_battery_status.ID;
+                
+                packet.payload.putINT32(obj.current_consumed);
+                packet.payload.putINT32(obj.energy_consumed);
+                packet.payload.putINT16(obj.temperature);
+                for i=1:1:10
+                    packet.payload.putUINT16(obj.voltages(i));
+                end
+                packet.payload.putINT16(obj.current_battery);
+                packet.payload.putUINT8(obj.id);
+                packet.payload.putUINT8(obj.battery_function);
+                packet.payload.putUINT8(obj.type);
+                packet.payload.putINT8(obj.battery_remaining);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.current_consumed = payload.getINT32();
+            obj.energy_consumed = payload.getINT32();
+            obj.temperature = payload.getINT16();
+            for i=1:1:10
+                obj.voltages(i) = payload.getUINT16();
+            end
+            obj.current_battery = payload.getINT16();
+            obj.id = payload.getUINT8();
+            obj.battery_function = payload.getUINT8();
+            obj.type = payload.getUINT8();
+            obj.battery_remaining = payload.getINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.current_consumed,2) ~= 1
+                result = 'current_consumed';
+            elseif size(obj.energy_consumed,2) ~= 1
+                result = 'energy_consumed';
+            elseif size(obj.temperature,2) ~= 1
+                result = 'temperature';
+            elseif size(obj.voltages,2) ~= 10
+                result = 'voltages';
+            elseif size(obj.current_battery,2) ~= 1
+                result = 'current_battery';
+            elseif size(obj.id,2) ~= 1
+                result = 'id';
+            elseif size(obj.battery_function,2) ~= 1
+                result = 'battery_function';
+            elseif size(obj.type,2) ~= 1
+                result = 'type';
+            elseif size(obj.battery_remaining,2) ~= 1
+                result = 'battery_remaining';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.current_consumed(obj,value)
+            if value == int32(value)
+                obj.current_consumed = int32(value);
+            else
+                MAVLink.throwTypeError('value','int32');
+            end
+        end
+        
+        function set.energy_consumed(obj,value)
+            if value == int32(value)
+                obj.energy_consumed = int32(value);
+            else
+                MAVLink.throwTypeError('value','int32');
+            end
+        end
+        
+        function set.temperature(obj,value)
+            if value == int16(value)
+                obj.temperature = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.voltages(obj,value)
+            if value == uint16(value)
+                obj.voltages = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.current_battery(obj,value)
+            if value == int16(value)
+                obj.current_battery = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.id(obj,value)
+            if value == uint8(value)
+                obj.id = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.battery_function(obj,value)
+            if value == uint8(value)
+                obj.battery_function = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.type(obj,value)
+            if value == uint8(value)
+                obj.type = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.battery_remaining(obj,value)
+            if value == int8(value)
+                obj.battery_remaining = int8(value);
+            else
+                MAVLink.throwTypeError('value','int8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
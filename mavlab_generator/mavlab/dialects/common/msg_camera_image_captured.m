@@ -13,23 +13,23 @@ classdef msg_camera_image_captured < MAVLinkMessage
     %    relative_alt(int32): Altitude above ground in meters, expressed as * 1E3 where image was taken
     %    q(single[4]): Quaternion of camera orientation (w, x, y, z order, zero-rotation is 0, 0, 0, 0)
     %    camera_id(uint8): Camera ID if there are multiple
-    %    file_path(uint8[127]): File path of image taken.
+    %    file_path(uint8[210]): File path of image taken.
 	
 	properties(Constant)
 		ID = 263
-		LEN = 127
+		LEN = 255
 	end
 	
 	properties
-        time_utc	%Timestamp (microseconds since UNIX epoch) in UTC. 0 for unknown.	|	(uint64)
-        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
-        lat	%Latitude, expressed as degrees * 1E7 where image was taken	|	(int32)
-        lon	%Longitude, expressed as degrees * 1E7 where capture was taken	|	(int32)
-        alt	%Altitude in meters, expressed as * 1E3 (AMSL, not WGS84) where image was taken	|	(int32)
-        relative_alt	%Altitude above ground in meters, expressed as * 1E3 where image was taken	|	(int32)
-        q	%Quaternion of camera orientation (w, x, y, z order, zero-rotation is 0, 0, 0, 0)	|	(single[4])
-        camera_id	%Camera ID if there are multiple	|	(uint8)
-        file_path	%File path of image taken.	|	(uint8[127])
+        time_utc	%Timestamp (microseconds since UNIX epoch) in UTC. 0 for unknown.	|	(uint64)
+        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
+        lat	%Latitude, expressed as degrees * 1E7 where image was taken	|	(int32)
+        lon	%Longitude, expressed as degrees * 1E7 where capture was taken	|	(int32)
+        alt	%Altitude in meters, expressed as * 1E3 (AMSL, not WGS84) where image was taken	|	(int32)
+        relative_alt	%Altitude above ground in meters, expressed as * 1E3 where image was taken	|	(int32)
+        q	%Quaternion of camera orientation (w, x, y, z order, zero-rotation is 0, 0, 0, 0)	|	(single[4])
+        camera_id	%Camera ID if there are multiple	|	(uint8)
+        file_path	%File path of image taken.	|	(uint8[210])
     end
 
     methods(Static)
@@ -76,15 +76,15 @@ classdef msg_camera_image_captured < MAVLinkMessage
                     MAVLink.throwTypeError('time_utc','MAVLinkPacket');
                 end
             elseif nargin >= 9 && isempty(varargin{1})
-                obj.time_utc = time_utc;
-                obj.time_boot_ms = time_boot_ms;
-                obj.lat = lat;
-                obj.lon = lon;
-                obj.alt = alt;
-                obj.relative_alt = relative_alt;
-                obj.q = q;
-                obj.camera_id = camera_id;
-                obj.file_path = file_path;
+                obj.time_utc = time_utc;
+                obj.time_boot_ms = time_boot_ms;
+                obj.lat = lat;
+                obj.lon = lon;
+                obj.alt = alt;
+                obj.relative_alt = relative_alt;
+                obj.q = q;
+                obj.camera_id = camera_id;
+                obj.file_path = file_path;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -115,7 +115,7 @@ classdef msg_camera_image_captured < MAVLinkMessage
                     packet.payload.putSINGLE(obj.q(i));
                 end
                 packet.payload.putUINT8(obj.camera_id);
-                for i=1:1:127
+                for i=1:1:210
                     packet.payload.putUINT8(obj.file_path(i));
                 end
 
@@ -146,7 +146,7 @@ classdef msg_camera_image_captured < MAVLinkMessage
                 obj.q(i) = payload.getSINGLE();
             end
             obj.camera_id = payload.getUINT8();
-            for i=1:1:127
+            for i=1:1:210
                 obj.file_path(i) = payload.getUINT8();
             end
 
@@ -175,7 +175,7 @@ classdef msg_camera_image_captured < MAVLinkMessage
                 result = 'q';
             elseif size(obj.camera_id,2) ~= 1
                 result = 'camera_id';
-            elseif size(obj.file_path,2) ~= 127
+            elseif size(obj.file_path,2) ~= 210
                 result = 'file_path';
 
             else
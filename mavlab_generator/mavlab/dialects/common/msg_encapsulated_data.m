@@ -6,16 +6,16 @@ classdef msg_encapsulated_data < MAVLinkMessage
 	%Arguments:
     %    seqnr(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
     %    seqnr(uint16): sequence number (starting with 0 on every transmission)
-    %    data(uint8[127]): image data bytes
+    %    data(uint8[253]): image data bytes
 	
 	properties(Constant)
 		ID = 131
-		LEN = 127
+		LEN = 255
 	end
 	
 	properties
-        seqnr	%sequence number (starting with 0 on every transmission)	|	(uint16)
-        data	%image data bytes	|	(uint8[127])
+        seqnr	%sequence number (starting with 0 on every transmission)	|	(uint16)
+        data	%image data bytes	|	(uint8[253])
     end
 
     methods(Static)
@@ -62,8 +62,8 @@ classdef msg_encapsulated_data < MAVLinkMessage
                     MAVLink.throwTypeError('seqnr','MAVLinkPacket');
                 end
             elseif nargin >= 2 && isempty(varargin{1})
-                obj.seqnr = seqnr;
-                obj.data = data;
+                obj.seqnr = seqnr;
+                obj.data = data;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -85,7 +85,7 @@ classdef msg_encapsulated_data < MAVLinkMessage
                 packet.msgid = msg_encapsulated_data.ID;
                 
                 packet.payload.putUINT16(obj.seqnr);
-                for i=1:1:127
+                for i=1:1:253
                     packet.payload.putUINT8(obj.data(i));
                 end
 
@@ -107,7 +107,7 @@ classdef msg_encapsulated_data < MAVLinkMessage
             payload.resetIndex();
             
             obj.seqnr = payload.getUINT16();
-            for i=1:1:127
+            for i=1:1:253
                 obj.data(i) = payload.getUINT8();
             end
 
@@ -122,7 +122,7 @@ classdef msg_encapsulated_data < MAVLinkMessage
             if 1==0
             elseif size(obj.seqnr,2) ~= 1
                 result = 'seqnr';
-            elseif size(obj.data,2) ~= 127
+            elseif size(obj.data,2) ~= 253
                 result = 'data';
 
             else
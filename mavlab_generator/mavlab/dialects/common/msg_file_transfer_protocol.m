@@ -8,18 +8,18 @@ classdef msg_file_transfer_protocol < MAVLinkMessage
     %    target_network(uint8): Network ID (0 for broadcast)
     %    target_system(uint8): System ID (0 for broadcast)
     %    target_component(uint8): Component ID (0 for broadcast)
-    %    payload(uint8[127]): Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.
+    %    payload(uint8[251]): Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.
 	
 	properties(Constant)
 		ID = 110
-		LEN = 127
+		LEN = 254
 	end
 	
 	properties
-        target_network	%Network ID (0 for broadcast)	|	(uint8)
-        target_system	%System ID (0 for broadcast)	|	(uint8)
-        target_component	%Component ID (0 for broadcast)	|	(uint8)
-        payload	%Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.	|	(uint8[127])
+        target_network	%Network ID (0 for broadcast)	|	(uint8)
+        target_system	%System ID (0 for broadcast)	|	(uint8)
+        target_component	%Component ID (0 for broadcast)	|	(uint8)
+        payload	%Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.	|	(uint8[251])
     end
 
     methods(Static)
@@ -66,10 +66,10 @@ classdef msg_file_transfer_protocol < MAVLinkMessage
                     MAVLink.throwTypeError('target_network','MAVLinkPacket');
                 end
             elseif nargin >= 4 && isempty(varargin{1})
-                obj.target_network = target_network;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.payload = payload;
+                obj.target_network = target_network;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.payload = payload;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -93,7 +93,7 @@ classdef msg_file_transfer_protocol < MAVLinkMessage
                 packet.payload.putUINT8(obj.target_network);
                 packet.payload.putUINT8(obj.target_system);
                 packet.payload.putUINT8(obj.target_component);
-                for i=1:1:127
+                for i=1:1:251
                     packet.payload.putUINT8(obj.payload(i));
                 end
 
@@ -117,7 +117,7 @@ classdef msg_file_transfer_protocol < MAVLinkMessage
             obj.target_network = payload.getUINT8();
             obj.target_system = payload.getUINT8();
             obj.target_component = payload.getUINT8();
-            for i=1:1:127
+            for i=1:1:251
                 obj.payload(i) = payload.getUINT8();
             end
 
@@ -136,7 +136,7 @@ classdef msg_file_transfer_protocol < MAVLinkMessage
                 result = 'target_system';
             elseif size(obj.target_component,2) ~= 1
                 result = 'target_component';
-            elseif size(obj.payload,2) ~= 127
+            elseif size(obj.payload,2) ~= 251
                 result = 'payload';
 
             else
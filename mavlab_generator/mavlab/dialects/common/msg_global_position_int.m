@@ -1,8 +1,7 @@
 classdef msg_global_position_int < MAVLinkMessage
 	%MSG_GLOBAL_POSITION_INT: MAVLink Message ID = 33
     %Description:
-    %    The filtered global position (e.g. fused GPS and accelerometers). The position is in GPS-frame (right-handed, Z-up). It
-               is designed as scaled integer message since the resolution of float is not sufficient.
+    %    The filtered global position (e.g. fused GPS and accelerometers). The position is in GPS-frame (right-handed, Z-up). It                is designed as scaled integer message since the resolution of float is not sufficient.
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    time_boot_ms(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -22,15 +21,15 @@ classdef msg_global_position_int < MAVLinkMessage
 	end
 	
 	properties
-        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
-        lat	%Latitude, expressed as degrees * 1E7	|	(int32)
-        lon	%Longitude, expressed as degrees * 1E7	|	(int32)
-        alt	%Altitude in meters, expressed as * 1000 (millimeters), AMSL (not WGS84 - note that virtually all GPS modules provide the AMSL as well)	|	(int32)
-        relative_alt	%Altitude above ground in meters, expressed as * 1000 (millimeters)	|	(int32)
-        vx	%Ground X Speed (Latitude, positive north), expressed as m/s * 100	|	(int16)
-        vy	%Ground Y Speed (Longitude, positive east), expressed as m/s * 100	|	(int16)
-        vz	%Ground Z Speed (Altitude, positive down), expressed as m/s * 100	|	(int16)
-        hdg	%Vehicle heading (yaw angle) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: UINT16_MAX	|	(uint16)
+        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
+        lat	%Latitude, expressed as degrees * 1E7	|	(int32)
+        lon	%Longitude, expressed as degrees * 1E7	|	(int32)
+        alt	%Altitude in meters, expressed as * 1000 (millimeters), AMSL (not WGS84 - note that virtually all GPS modules provide the AMSL as well)	|	(int32)
+        relative_alt	%Altitude above ground in meters, expressed as * 1000 (millimeters)	|	(int32)
+        vx	%Ground X Speed (Latitude, positive north), expressed as m/s * 100	|	(int16)
+        vy	%Ground Y Speed (Longitude, positive east), expressed as m/s * 100	|	(int16)
+        vz	%Ground Z Speed (Altitude, positive down), expressed as m/s * 100	|	(int16)
+        hdg	%Vehicle heading (yaw angle) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: UINT16_MAX	|	(uint16)
     end
 
     methods(Static)
@@ -77,15 +76,15 @@ classdef msg_global_position_int < MAVLinkMessage
                     MAVLink.throwTypeError('time_boot_ms','MAVLinkPacket');
                 end
             elseif nargin >= 9 && isempty(varargin{1})
-                obj.time_boot_ms = time_boot_ms;
-                obj.lat = lat;
-                obj.lon = lon;
-                obj.alt = alt;
-                obj.relative_alt = relative_alt;
-                obj.vx = vx;
-                obj.vy = vy;
-                obj.vz = vz;
-                obj.hdg = hdg;
+                obj.time_boot_ms = time_boot_ms;
+                obj.lat = lat;
+                obj.lon = lon;
+                obj.alt = alt;
+                obj.relative_alt = relative_alt;
+                obj.vx = vx;
+                obj.vy = vy;
+                obj.vz = vz;
+                obj.hdg = hdg;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -18,20 +18,20 @@ classdef msg_global_position_int_cov < MAVLinkMessage
 	
 	properties(Constant)
 		ID = 63
-		LEN = 127
+		LEN = 181
 	end
 	
 	properties
-        time_usec	%Timestamp (microseconds since system boot or since UNIX epoch)	|	(uint64)
-        lat	%Latitude, expressed as degrees * 1E7	|	(int32)
-        lon	%Longitude, expressed as degrees * 1E7	|	(int32)
-        alt	%Altitude in meters, expressed as * 1000 (millimeters), above MSL	|	(int32)
-        relative_alt	%Altitude above ground in meters, expressed as * 1000 (millimeters)	|	(int32)
-        vx	%Ground X Speed (Latitude), expressed as m/s	|	(single)
-        vy	%Ground Y Speed (Longitude), expressed as m/s	|	(single)
-        vz	%Ground Z Speed (Altitude), expressed as m/s	|	(single)
-        covariance	%Covariance matrix (first six entries are the first ROW, next six entries are the second row, etc.)	|	(single[36])
-        estimator_type	%Class id of the estimator this estimate originated from.	|	(uint8)
+        time_usec	%Timestamp (microseconds since system boot or since UNIX epoch)	|	(uint64)
+        lat	%Latitude, expressed as degrees * 1E7	|	(int32)
+        lon	%Longitude, expressed as degrees * 1E7	|	(int32)
+        alt	%Altitude in meters, expressed as * 1000 (millimeters), above MSL	|	(int32)
+        relative_alt	%Altitude above ground in meters, expressed as * 1000 (millimeters)	|	(int32)
+        vx	%Ground X Speed (Latitude), expressed as m/s	|	(single)
+        vy	%Ground Y Speed (Longitude), expressed as m/s	|	(single)
+        vz	%Ground Z Speed (Altitude), expressed as m/s	|	(single)
+        covariance	%Covariance matrix (first six entries are the first ROW, next six entries are the second row, etc.)	|	(single[36])
+        estimator_type	%Class id of the estimator this estimate originated from.	|	(uint8)
     end
 
     methods(Static)
@@ -78,16 +78,16 @@ classdef msg_global_position_int_cov < MAVLinkMessage
                     MAVLink.throwTypeError('time_usec','MAVLinkPacket');
                 end
             elseif nargin >= 10 && isempty(varargin{1})
-                obj.time_usec = time_usec;
-                obj.lat = lat;
-                obj.lon = lon;
-                obj.alt = alt;
-                obj.relative_alt = relative_alt;
-                obj.vx = vx;
-                obj.vy = vy;
-                obj.vz = vz;
-                obj.covariance = covariance;
-                obj.estimator_type = estimator_type;
+                obj.time_usec = time_usec;
+                obj.lat = lat;
+                obj.lon = lon;
+                obj.alt = alt;
+                obj.relative_alt = relative_alt;
+                obj.vx = vx;
+                obj.vy = vy;
+                obj.vz = vz;
+                obj.covariance = covariance;
+                obj.estimator_type = estimator_type;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -1,8 +1,7 @@
 classdef msg_gps_raw_int < MAVLinkMessage
 	%MSG_GPS_RAW_INT: MAVLink Message ID = 24
     %Description:
-    %    The global position, as returned by the Global Positioning System (GPS). This is
-                NOT the global position estimate of the system, but rather a RAW sensor value. See message GLOBAL_POSITION for the global position estimate. Coordinate frame is right-handed, Z-axis up (GPS frame).
+    %    The global position, as returned by the Global Positioning System (GPS). This is                 NOT the global position estimate of the system, but rather a RAW sensor value. See message GLOBAL_POSITION for the global position estimate. Coordinate frame is right-handed, Z-axis up (GPS frame).
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    time_usec(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -23,16 +22,16 @@ classdef msg_gps_raw_int < MAVLinkMessage
 	end
 	
 	properties
-        time_usec	%Timestamp (microseconds since UNIX epoch or microseconds since system boot)	|	(uint64)
-        lat	%Latitude (WGS84), in degrees * 1E7	|	(int32)
-        lon	%Longitude (WGS84), in degrees * 1E7	|	(int32)
-        alt	%Altitude (AMSL, NOT WGS84), in meters * 1000 (positive for up). Note that virtually all GPS modules provide the AMSL altitude in addition to the WGS84 altitude.	|	(int32)
-        eph	%GPS HDOP horizontal dilution of position (unitless). If unknown, set to: UINT16_MAX	|	(uint16)
-        epv	%GPS VDOP vertical dilution of position (unitless). If unknown, set to: UINT16_MAX	|	(uint16)
-        vel	%GPS ground speed (m/s * 100). If unknown, set to: UINT16_MAX	|	(uint16)
-        cog	%Course over ground (NOT heading, but direction of movement) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: UINT16_MAX	|	(uint16)
-        fix_type	%See the GPS_FIX_TYPE enum.	|	(uint8)
-        satellites_visible	%Number of satellites visible. If unknown, set to 255	|	(uint8)
+        time_usec	%Timestamp (microseconds since UNIX epoch or microseconds since system boot)	|	(uint64)
+        lat	%Latitude (WGS84), in degrees * 1E7	|	(int32)
+        lon	%Longitude (WGS84), in degrees * 1E7	|	(int32)
+        alt	%Altitude (AMSL, NOT WGS84), in meters * 1000 (positive for up). Note that virtually all GPS modules provide the AMSL altitude in addition to the WGS84 altitude.	|	(int32)
+        eph	%GPS HDOP horizontal dilution of position (unitless). If unknown, set to: UINT16_MAX	|	(uint16)
+        epv	%GPS VDOP vertical dilution of position (unitless). If unknown, set to: UINT16_MAX	|	(uint16)
+        vel	%GPS ground speed (m/s * 100). If unknown, set to: UINT16_MAX	|	(uint16)
+        cog	%Course over ground (NOT heading, but direction of movement) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: UINT16_MAX	|	(uint16)
+        fix_type	%See the GPS_FIX_TYPE enum.	|	(uint8)
+        satellites_visible	%Number of satellites visible. If unknown, set to 255	|	(uint8)
     end
 
     methods(Static)
@@ -79,16 +78,16 @@ classdef msg_gps_raw_int < MAVLinkMessage
                     MAVLink.throwTypeError('time_usec','MAVLinkPacket');
                 end
             elseif nargin >= 10 && isempty(varargin{1})
-                obj.time_usec = time_usec;
-                obj.lat = lat;
-                obj.lon = lon;
-                obj.alt = alt;
-                obj.eph = eph;
-                obj.epv = epv;
-                obj.vel = vel;
-                obj.cog = cog;
-                obj.fix_type = fix_type;
-                obj.satellites_visible = satellites_visible;
+                obj.time_usec = time_usec;
+                obj.lat = lat;
+                obj.lon = lon;
+                obj.alt = alt;
+                obj.eph = eph;
+                obj.epv = epv;
+                obj.vel = vel;
+                obj.cog = cog;
+                obj.fix_type = fix_type;
+                obj.satellites_visible = satellites_visible;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
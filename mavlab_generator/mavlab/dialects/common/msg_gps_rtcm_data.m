@@ -7,17 +7,17 @@ classdef msg_gps_rtcm_data < MAVLinkMessage
     %    flags(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
     %    flags(uint8): LSB: 1 means message is fragmented
     %    len(uint8): data length
-    %    data(uint8[127]): RTCM message (may be fragmented)
+    %    data(uint8[180]): RTCM message (may be fragmented)
 	
 	properties(Constant)
 		ID = 233
-		LEN = 127
+		LEN = 182
 	end
 	
 	properties
-        flags	%LSB: 1 means message is fragmented	|	(uint8)
-        len	%data length	|	(uint8)
-        data	%RTCM message (may be fragmented)	|	(uint8[127])
+        flags	%LSB: 1 means message is fragmented	|	(uint8)
+        len	%data length	|	(uint8)
+        data	%RTCM message (may be fragmented)	|	(uint8[180])
     end
 
     methods(Static)
@@ -64,9 +64,9 @@ classdef msg_gps_rtcm_data < MAVLinkMessage
                     MAVLink.throwTypeError('flags','MAVLinkPacket');
                 end
             elseif nargin >= 3 && isempty(varargin{1})
-                obj.flags = flags;
-                obj.len = len;
-                obj.data = data;
+                obj.flags = flags;
+                obj.len = len;
+                obj.data = data;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -89,7 +89,7 @@ classdef msg_gps_rtcm_data < MAVLinkMessage
                 
                 packet.payload.putUINT8(obj.flags);
                 packet.payload.putUINT8(obj.len);
-                for i=1:1:127
+                for i=1:1:180
                     packet.payload.putUINT8(obj.data(i));
                 end
 
@@ -112,7 +112,7 @@ classdef msg_gps_rtcm_data < MAVLinkMessage
             
             obj.flags = payload.getUINT8();
             obj.len = payload.getUINT8();
-            for i=1:1:127
+            for i=1:1:180
                 obj.data(i) = payload.getUINT8();
             end
 
@@ -129,7 +129,7 @@ classdef msg_gps_rtcm_data < MAVLinkMessage
                 result = 'flags';
             elseif size(obj.len,2) ~= 1
                 result = 'len';
-            elseif size(obj.data,2) ~= 127
+            elseif size(obj.data,2) ~= 180
                 result = 'data';
 
             else
@@ -1,8 +1,7 @@
 classdef msg_hil_gps < MAVLinkMessage
 	%MSG_HIL_GPS: MAVLink Message ID = 113
     %Description:
-    %    The global position, as returned by the Global Positioning System (GPS). This is
-                 NOT the global position estimate of the sytem, but rather a RAW sensor value. See message GLOBAL_POSITION for the global position estimate. Coordinate frame is right-handed, Z-axis up (GPS frame).
+    %    The global position, as returned by the Global Positioning System (GPS). This is                  NOT the global position estimate of the sytem, but rather a RAW sensor value. See message GLOBAL_POSITION for the global position estimate. Coordinate frame is right-handed, Z-axis up (GPS frame).
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    time_usec(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -26,19 +25,19 @@ classdef msg_hil_gps < MAVLinkMessage
 	end
 	
 	properties
-        time_usec	%Timestamp (microseconds since UNIX epoch or microseconds since system boot)	|	(uint64)
-        lat	%Latitude (WGS84), in degrees * 1E7	|	(int32)
-        lon	%Longitude (WGS84), in degrees * 1E7	|	(int32)
-        alt	%Altitude (AMSL, not WGS84), in meters * 1000 (positive for up)	|	(int32)
-        eph	%GPS HDOP horizontal dilution of position in cm (m*100). If unknown, set to: 65535	|	(uint16)
-        epv	%GPS VDOP vertical dilution of position in cm (m*100). If unknown, set to: 65535	|	(uint16)
-        vel	%GPS ground speed (m/s * 100). If unknown, set to: 65535	|	(uint16)
-        vn	%GPS velocity in cm/s in NORTH direction in earth-fixed NED frame	|	(int16)
-        ve	%GPS velocity in cm/s in EAST direction in earth-fixed NED frame	|	(int16)
-        vd	%GPS velocity in cm/s in DOWN direction in earth-fixed NED frame	|	(int16)
-        cog	%Course over ground (NOT heading, but direction of movement) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: 65535	|	(uint16)
-        fix_type	%0-1: no fix, 2: 2D fix, 3: 3D fix. Some applications will not use the value of this field unless it is at least two, so always correctly fill in the fix.	|	(uint8)
-        satellites_visible	%Number of satellites visible. If unknown, set to 255	|	(uint8)
+        time_usec	%Timestamp (microseconds since UNIX epoch or microseconds since system boot)	|	(uint64)
+        lat	%Latitude (WGS84), in degrees * 1E7	|	(int32)
+        lon	%Longitude (WGS84), in degrees * 1E7	|	(int32)
+        alt	%Altitude (AMSL, not WGS84), in meters * 1000 (positive for up)	|	(int32)
+        eph	%GPS HDOP horizontal dilution of position in cm (m*100). If unknown, set to: 65535	|	(uint16)
+        epv	%GPS VDOP vertical dilution of position in cm (m*100). If unknown, set to: 65535	|	(uint16)
+        vel	%GPS ground speed (m/s * 100). If unknown, set to: 65535	|	(uint16)
+        vn	%GPS velocity in cm/s in NORTH direction in earth-fixed NED frame	|	(int16)
+        ve	%GPS velocity in cm/s in EAST direction in earth-fixed NED frame	|	(int16)
+        vd	%GPS velocity in cm/s in DOWN direction in earth-fixed NED frame	|	(int16)
+        cog	%Course over ground (NOT heading, but direction of movement) in degrees * 100, 0.0..359.99 degrees. If unknown, set to: 65535	|	(uint16)
+        fix_type	%0-1: no fix, 2: 2D fix, 3: 3D fix. Some applications will not use the value of this field unless it is at least two, so always correctly fill in the fix.	|	(uint8)
+        satellites_visible	%Number of satellites visible. If unknown, set to 255	|	(uint8)
     end
 
     methods(Static)
@@ -85,19 +84,19 @@ classdef msg_hil_gps < MAVLinkMessage
                     MAVLink.throwTypeError('time_usec','MAVLinkPacket');
                 end
             elseif nargin >= 13 && isempty(varargin{1})
-                obj.time_usec = time_usec;
-                obj.lat = lat;
-                obj.lon = lon;
-                obj.alt = alt;
-                obj.eph = eph;
-                obj.epv = epv;
-                obj.vel = vel;
-                obj.vn = vn;
-                obj.ve = ve;
-                obj.vd = vd;
-                obj.cog = cog;
-                obj.fix_type = fix_type;
-                obj.satellites_visible = satellites_visible;
+                obj.time_usec = time_usec;
+                obj.lat = lat;
+                obj.lon = lon;
+                obj.alt = alt;
+                obj.eph = eph;
+                obj.epv = epv;
+                obj.vel = vel;
+                obj.vn = vn;
+                obj.ve = ve;
+                obj.vd = vd;
+                obj.cog = cog;
+                obj.fix_type = fix_type;
+                obj.satellites_visible = satellites_visible;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -1,4 +1,327 @@
 classdef msg_hil_rc_inputs_raw < MAVLinkMessage
 	%MSG_HIL_RC_INPUTS_RAW: MAVLink Message ID = 92
     %Description:
-    %    Sent from simulation to autopilot. The RAW values of the RC channels received. The standard PPM modulation is as follows: 1000 microseconds: 0
\ No newline at end of file
+    %    Sent from simulation to autopilot. The RAW values of the RC channels received. The standard PPM modulation is as follows: 1000 microseconds: 0%, 2000 microseconds: 100%. Individual receivers/transmitters might violate this specification.
+    %    Can also be constructed by using a MAVLinkPacket as the only argument
+	%Arguments:
+    %    time_usec(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
+    %    time_usec(uint64): Timestamp (microseconds since UNIX epoch or microseconds since system boot)
+    %    chan1_raw(uint16): RC channel 1 value, in microseconds
+    %    chan2_raw(uint16): RC channel 2 value, in microseconds
+    %    chan3_raw(uint16): RC channel 3 value, in microseconds
+    %    chan4_raw(uint16): RC channel 4 value, in microseconds
+    %    chan5_raw(uint16): RC channel 5 value, in microseconds
+    %    chan6_raw(uint16): RC channel 6 value, in microseconds
+    %    chan7_raw(uint16): RC channel 7 value, in microseconds
+    %    chan8_raw(uint16): RC channel 8 value, in microseconds
+    %    chan9_raw(uint16): RC channel 9 value, in microseconds
+    %    chan10_raw(uint16): RC channel 10 value, in microseconds
+    %    chan11_raw(uint16): RC channel 11 value, in microseconds
+    %    chan12_raw(uint16): RC channel 12 value, in microseconds
+    %    rssi(uint8): Receive signal strength indicator, 0: 0%, 255: 100%
+	
+	properties(Constant)
+		ID = 92
+		LEN = 33
+	end
+	
+	properties
+        time_usec	%Timestamp (microseconds since UNIX epoch or microseconds since system boot)	|	(uint64)
+        chan1_raw	%RC channel 1 value, in microseconds	|	(uint16)
+        chan2_raw	%RC channel 2 value, in microseconds	|	(uint16)
+        chan3_raw	%RC channel 3 value, in microseconds	|	(uint16)
+        chan4_raw	%RC channel 4 value, in microseconds	|	(uint16)
+        chan5_raw	%RC channel 5 value, in microseconds	|	(uint16)
+        chan6_raw	%RC channel 6 value, in microseconds	|	(uint16)
+        chan7_raw	%RC channel 7 value, in microseconds	|	(uint16)
+        chan8_raw	%RC channel 8 value, in microseconds	|	(uint16)
+        chan9_raw	%RC channel 9 value, in microseconds	|	(uint16)
+        chan10_raw	%RC channel 10 value, in microseconds	|	(uint16)
+        chan11_raw	%RC channel 11 value, in microseconds	|	(uint16)
+        chan12_raw	%RC channel 12 value, in microseconds	|	(uint16)
+        rssi	%Receive signal strength indicator, 0: 0%, 255: 100%	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,time_usec,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,rssi,varargin)
+
+            if nargin == 14 + 1
+                msg = msg_hil_rc_inputs_raw(time_usec,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,rssi,varargin);
+            elseif nargin == 2
+                msg = msg_hil_rc_inputs_raw(time_usec);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_hil_rc_inputs_raw(time_usec,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,rssi,varargin)
+        %MSG_HIL_RC_INPUTS_RAW: Create a new hil_rc_inputs_raw message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(time_usec,'MAVLinkPacket')
+                    packet = time_usec;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('time_usec','MAVLinkPacket');
+                end
+            elseif nargin >= 14 && isempty(varargin{1})
+                obj.time_usec = time_usec;
+                obj.chan1_raw = chan1_raw;
+                obj.chan2_raw = chan2_raw;
+                obj.chan3_raw = chan3_raw;
+                obj.chan4_raw = chan4_raw;
+                obj.chan5_raw = chan5_raw;
+                obj.chan6_raw = chan6_raw;
+                obj.chan7_raw = chan7_raw;
+                obj.chan8_raw = chan8_raw;
+                obj.chan9_raw = chan9_raw;
+                obj.chan10_raw = chan10_raw;
+                obj.chan11_raw = chan11_raw;
+                obj.chan12_raw = chan12_raw;
+                obj.rssi = rssi;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_hil_rc_inputs_raw.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_hil_rc_inputs_raw.ID;
+                
+                packet.payload.putUINT64(obj.time_usec);
+                packet.payload.putUINT16(obj.chan1_raw);
+                packet.payload.putUINT16(obj.chan2_raw);
+                packet.payload.putUINT16(obj.chan3_raw);
+                packet.payload.putUINT16(obj.chan4_raw);
+                packet.payload.putUINT16(obj.chan5_raw);
+                packet.payload.putUINT16(obj.chan6_raw);
+                packet.payload.putUINT16(obj.chan7_raw);
+                packet.payload.putUINT16(obj.chan8_raw);
+                packet.payload.putUINT16(obj.chan9_raw);
+                packet.payload.putUINT16(obj.chan10_raw);
+                packet.payload.putUINT16(obj.chan11_raw);
+                packet.payload.putUINT16(obj.chan12_raw);
+                packet.payload.putUINT8(obj.rssi);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.time_usec = payload.getUINT64();
+            obj.chan1_raw = payload.getUINT16();
+            obj.chan2_raw = payload.getUINT16();
+            obj.chan3_raw = payload.getUINT16();
+            obj.chan4_raw = payload.getUINT16();
+            obj.chan5_raw = payload.getUINT16();
+            obj.chan6_raw = payload.getUINT16();
+            obj.chan7_raw = payload.getUINT16();
+            obj.chan8_raw = payload.getUINT16();
+            obj.chan9_raw = payload.getUINT16();
+            obj.chan10_raw = payload.getUINT16();
+            obj.chan11_raw = payload.getUINT16();
+            obj.chan12_raw = payload.getUINT16();
+            obj.rssi = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.time_usec,2) ~= 1
+                result = 'time_usec';
+            elseif size(obj.chan1_raw,2) ~= 1
+                result = 'chan1_raw';
+            elseif size(obj.chan2_raw,2) ~= 1
+                result = 'chan2_raw';
+            elseif size(obj.chan3_raw,2) ~= 1
+                result = 'chan3_raw';
+            elseif size(obj.chan4_raw,2) ~= 1
+                result = 'chan4_raw';
+            elseif size(obj.chan5_raw,2) ~= 1
+                result = 'chan5_raw';
+            elseif size(obj.chan6_raw,2) ~= 1
+                result = 'chan6_raw';
+            elseif size(obj.chan7_raw,2) ~= 1
+                result = 'chan7_raw';
+            elseif size(obj.chan8_raw,2) ~= 1
+                result = 'chan8_raw';
+            elseif size(obj.chan9_raw,2) ~= 1
+                result = 'chan9_raw';
+            elseif size(obj.chan10_raw,2) ~= 1
+                result = 'chan10_raw';
+            elseif size(obj.chan11_raw,2) ~= 1
+                result = 'chan11_raw';
+            elseif size(obj.chan12_raw,2) ~= 1
+                result = 'chan12_raw';
+            elseif size(obj.rssi,2) ~= 1
+                result = 'rssi';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.time_usec(obj,value)
+            if value == uint64(value)
+                obj.time_usec = uint64(value);
+            else
+                MAVLink.throwTypeError('value','uint64');
+            end
+        end
+        
+        function set.chan1_raw(obj,value)
+            if value == uint16(value)
+                obj.chan1_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan2_raw(obj,value)
+            if value == uint16(value)
+                obj.chan2_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan3_raw(obj,value)
+            if value == uint16(value)
+                obj.chan3_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan4_raw(obj,value)
+            if value == uint16(value)
+                obj.chan4_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan5_raw(obj,value)
+            if value == uint16(value)
+                obj.chan5_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan6_raw(obj,value)
+            if value == uint16(value)
+                obj.chan6_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan7_raw(obj,value)
+            if value == uint16(value)
+                obj.chan7_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan8_raw(obj,value)
+            if value == uint16(value)
+                obj.chan8_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan9_raw(obj,value)
+            if value == uint16(value)
+                obj.chan9_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan10_raw(obj,value)
+            if value == uint16(value)
+                obj.chan10_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan11_raw(obj,value)
+            if value == uint16(value)
+                obj.chan11_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan12_raw(obj,value)
+            if value == uint16(value)
+                obj.chan12_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.rssi(obj,value)
+            if value == uint8(value)
+                obj.rssi = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
@@ -20,22 +20,22 @@ classdef msg_local_position_ned_cov < MAVLinkMessage
 	
 	properties(Constant)
 		ID = 64
-		LEN = 127
+		LEN = 225
 	end
 	
 	properties
-        time_usec	%Timestamp (microseconds since system boot or since UNIX epoch)	|	(uint64)
-        x	%X Position	|	(single)
-        y	%Y Position	|	(single)
-        z	%Z Position	|	(single)
-        vx	%X Speed (m/s)	|	(single)
-        vy	%Y Speed (m/s)	|	(single)
-        vz	%Z Speed (m/s)	|	(single)
-        ax	%X Acceleration (m/s^2)	|	(single)
-        ay	%Y Acceleration (m/s^2)	|	(single)
-        az	%Z Acceleration (m/s^2)	|	(single)
-        covariance	%Covariance matrix upper right triangular (first nine entries are the first ROW, next eight entries are the second row, etc.)	|	(single[45])
-        estimator_type	%Class id of the estimator this estimate originated from.	|	(uint8)
+        time_usec	%Timestamp (microseconds since system boot or since UNIX epoch)	|	(uint64)
+        x	%X Position	|	(single)
+        y	%Y Position	|	(single)
+        z	%Z Position	|	(single)
+        vx	%X Speed (m/s)	|	(single)
+        vy	%Y Speed (m/s)	|	(single)
+        vz	%Z Speed (m/s)	|	(single)
+        ax	%X Acceleration (m/s^2)	|	(single)
+        ay	%Y Acceleration (m/s^2)	|	(single)
+        az	%Z Acceleration (m/s^2)	|	(single)
+        covariance	%Covariance matrix upper right triangular (first nine entries are the first ROW, next eight entries are the second row, etc.)	|	(single[45])
+        estimator_type	%Class id of the estimator this estimate originated from.	|	(uint8)
     end
 
     methods(Static)
@@ -82,18 +82,18 @@ classdef msg_local_position_ned_cov < MAVLinkMessage
                     MAVLink.throwTypeError('time_usec','MAVLinkPacket');
                 end
             elseif nargin >= 12 && isempty(varargin{1})
-                obj.time_usec = time_usec;
-                obj.x = x;
-                obj.y = y;
-                obj.z = z;
-                obj.vx = vx;
-                obj.vy = vy;
-                obj.vz = vz;
-                obj.ax = ax;
-                obj.ay = ay;
-                obj.az = az;
-                obj.covariance = covariance;
-                obj.estimator_type = estimator_type;
+                obj.time_usec = time_usec;
+                obj.x = x;
+                obj.y = y;
+                obj.z = z;
+                obj.vx = vx;
+                obj.vy = vy;
+                obj.vz = vz;
+                obj.ax = ax;
+                obj.ay = ay;
+                obj.az = az;
+                obj.covariance = covariance;
+                obj.estimator_type = estimator_type;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
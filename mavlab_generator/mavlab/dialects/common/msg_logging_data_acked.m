@@ -10,20 +10,20 @@ classdef msg_logging_data_acked < MAVLinkMessage
     %    target_component(uint8): component ID of the target
     %    length(uint8): data length
     %    first_message_offset(uint8): offset into data where first message starts. This can be used for recovery, when a previous message got lost (set to 255 if no start exists).
-    %    data(uint8[127]): logged data
+    %    data(uint8[249]): logged data
 	
 	properties(Constant)
 		ID = 267
-		LEN = 127
+		LEN = 255
 	end
 	
 	properties
-        sequence	%sequence number (can wrap)	|	(uint16)
-        target_system	%system ID of the target	|	(uint8)
-        target_component	%component ID of the target	|	(uint8)
-        length	%data length	|	(uint8)
-        first_message_offset	%offset into data where first message starts. This can be used for recovery, when a previous message got lost (set to 255 if no start exists).	|	(uint8)
-        data	%logged data	|	(uint8[127])
+        sequence	%sequence number (can wrap)	|	(uint16)
+        target_system	%system ID of the target	|	(uint8)
+        target_component	%component ID of the target	|	(uint8)
+        length	%data length	|	(uint8)
+        first_message_offset	%offset into data where first message starts. This can be used for recovery, when a previous message got lost (set to 255 if no start exists).	|	(uint8)
+        data	%logged data	|	(uint8[249])
     end
 
     methods(Static)
@@ -70,12 +70,12 @@ classdef msg_logging_data_acked < MAVLinkMessage
                     MAVLink.throwTypeError('sequence','MAVLinkPacket');
                 end
             elseif nargin >= 6 && isempty(varargin{1})
-                obj.sequence = sequence;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.length = length;
-                obj.first_message_offset = first_message_offset;
-                obj.data = data;
+                obj.sequence = sequence;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.length = length;
+                obj.first_message_offset = first_message_offset;
+                obj.data = data;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -101,7 +101,7 @@ classdef msg_logging_data_acked < MAVLinkMessage
                 packet.payload.putUINT8(obj.target_component);
                 packet.payload.putUINT8(obj.length);
                 packet.payload.putUINT8(obj.first_message_offset);
-                for i=1:1:127
+                for i=1:1:249
                     packet.payload.putUINT8(obj.data(i));
                 end
 
@@ -127,7 +127,7 @@ classdef msg_logging_data_acked < MAVLinkMessage
             obj.target_component = payload.getUINT8();
             obj.length = payload.getUINT8();
             obj.first_message_offset = payload.getUINT8();
-            for i=1:1:127
+            for i=1:1:249
                 obj.data(i) = payload.getUINT8();
             end
 
@@ -150,7 +150,7 @@ classdef msg_logging_data_acked < MAVLinkMessage
                 result = 'length';
             elseif size(obj.first_message_offset,2) ~= 1
                 result = 'first_message_offset';
-            elseif size(obj.data,2) ~= 127
+            elseif size(obj.data,2) ~= 249
                 result = 'data';
 
             else
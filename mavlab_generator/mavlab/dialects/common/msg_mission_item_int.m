@@ -1,8 +1,7 @@
 classdef msg_mission_item_int < MAVLinkMessage
 	%MSG_MISSION_ITEM_INT: MAVLink Message ID = 73
     %Description:
-    %    Message encoding a mission item. This message is emitted to announce
-                the presence of a mission item and to set a mission item on the system. The mission item can be either in x, y, z meters (type: LOCAL) or x:lat, y:lon, z:altitude. Local frame is Z-down, right handed (NED), global frame is Z-up, right handed (ENU). See alsohttp://qgroundcontrol.org/mavlink/waypoint_protocol.
+    %    Message encoding a mission item. This message is emitted to announce                 the presence of a mission item and to set a mission item on the system. The mission item can be either in x, y, z meters (type: LOCAL) or x:lat, y:lon, z:altitude. Local frame is Z-down, right handed (NED), global frame is Z-up, right handed (ENU). See alsohttp://qgroundcontrol.org/mavlink/waypoint_protocol.
     %    Can also be constructed by using a MAVLinkPacket as the only argument
 	%Arguments:
     %    param1(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
@@ -27,20 +26,20 @@ classdef msg_mission_item_int < MAVLinkMessage
 	end
 	
 	properties
-        param1	%PARAM1, see MAV_CMD enum	|	(single)
-        param2	%PARAM2, see MAV_CMD enum	|	(single)
-        param3	%PARAM3, see MAV_CMD enum	|	(single)
-        param4	%PARAM4, see MAV_CMD enum	|	(single)
-        x	%PARAM5 / local: x position in meters * 1e4, global: latitude in degrees * 10^7	|	(int32)
-        y	%PARAM6 / y position: local: x position in meters * 1e4, global: longitude in degrees *10^7	|	(int32)
-        z	%PARAM7 / z position: global: altitude in meters (relative or absolute, depending on frame.	|	(single)
-        seq	%Waypoint ID (sequence number). Starts at zero. Increases monotonically for each waypoint, no gaps in the sequence (0,1,2,3,4).	|	(uint16)
-        command	%The scheduled action for the MISSION. see MAV_CMD in common.xml MAVLink specs	|	(uint16)
-        target_system	%System ID	|	(uint8)
-        target_component	%Component ID	|	(uint8)
-        frame	%The coordinate system of the MISSION. see MAV_FRAME in mavlink_types.h	|	(uint8)
-        current	%false:0, true:1	|	(uint8)
-        autocontinue	%autocontinue to next wp	|	(uint8)
+        param1	%PARAM1, see MAV_CMD enum	|	(single)
+        param2	%PARAM2, see MAV_CMD enum	|	(single)
+        param3	%PARAM3, see MAV_CMD enum	|	(single)
+        param4	%PARAM4, see MAV_CMD enum	|	(single)
+        x	%PARAM5 / local: x position in meters * 1e4, global: latitude in degrees * 10^7	|	(int32)
+        y	%PARAM6 / y position: local: x position in meters * 1e4, global: longitude in degrees *10^7	|	(int32)
+        z	%PARAM7 / z position: global: altitude in meters (relative or absolute, depending on frame.	|	(single)
+        seq	%Waypoint ID (sequence number). Starts at zero. Increases monotonically for each waypoint, no gaps in the sequence (0,1,2,3,4).	|	(uint16)
+        command	%The scheduled action for the MISSION. see MAV_CMD in common.xml MAVLink specs	|	(uint16)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
+        frame	%The coordinate system of the MISSION. see MAV_FRAME in mavlink_types.h	|	(uint8)
+        current	%false:0, true:1	|	(uint8)
+        autocontinue	%autocontinue to next wp	|	(uint8)
     end
 
     methods(Static)
@@ -87,20 +86,20 @@ classdef msg_mission_item_int < MAVLinkMessage
                     MAVLink.throwTypeError('param1','MAVLinkPacket');
                 end
             elseif nargin >= 14 && isempty(varargin{1})
-                obj.param1 = param1;
-                obj.param2 = param2;
-                obj.param3 = param3;
-                obj.param4 = param4;
-                obj.x = x;
-                obj.y = y;
-                obj.z = z;
-                obj.seq = seq;
-                obj.command = command;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.frame = frame;
-                obj.current = current;
-                obj.autocontinue = autocontinue;
+                obj.param1 = param1;
+                obj.param2 = param2;
+                obj.param3 = param3;
+                obj.param4 = param4;
+                obj.x = x;
+                obj.y = y;
+                obj.z = z;
+                obj.seq = seq;
+                obj.command = command;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.frame = frame;
+                obj.current = current;
+                obj.autocontinue = autocontinue;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
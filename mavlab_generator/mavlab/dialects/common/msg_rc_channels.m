@@ -1,4 +1,432 @@
 classdef msg_rc_channels < MAVLinkMessage
 	%MSG_RC_CHANNELS: MAVLink Message ID = 65
     %Description:
-    %    The PPM values of the RC channels received. The standard PPM modulation is as follows: 1000 microseconds: 0
\ No newline at end of file
+    %    The PPM values of the RC channels received. The standard PPM modulation is as follows: 1000 microseconds: 0%, 2000 microseconds: 100%. Individual receivers/transmitters might violate this specification.
+    %    Can also be constructed by using a MAVLinkPacket as the only argument
+	%Arguments:
+    %    time_boot_ms(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
+    %    time_boot_ms(uint32): Timestamp (milliseconds since system boot)
+    %    chan1_raw(uint16): RC channel 1 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan2_raw(uint16): RC channel 2 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan3_raw(uint16): RC channel 3 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan4_raw(uint16): RC channel 4 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan5_raw(uint16): RC channel 5 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan6_raw(uint16): RC channel 6 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan7_raw(uint16): RC channel 7 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan8_raw(uint16): RC channel 8 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan9_raw(uint16): RC channel 9 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan10_raw(uint16): RC channel 10 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan11_raw(uint16): RC channel 11 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan12_raw(uint16): RC channel 12 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan13_raw(uint16): RC channel 13 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan14_raw(uint16): RC channel 14 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan15_raw(uint16): RC channel 15 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan16_raw(uint16): RC channel 16 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan17_raw(uint16): RC channel 17 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chan18_raw(uint16): RC channel 18 value, in microseconds. A value of UINT16_MAX implies the channel is unused.
+    %    chancount(uint8): Total number of RC channels being received. This can be larger than 18, indicating that more channels are available but not given in this message. This value should be 0 when no RC channels are available.
+    %    rssi(uint8): Receive signal strength indicator, 0: 0%, 100: 100%, 255: invalid/unknown.
+	
+	properties(Constant)
+		ID = 65
+		LEN = 42
+	end
+	
+	properties
+        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
+        chan1_raw	%RC channel 1 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan2_raw	%RC channel 2 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan3_raw	%RC channel 3 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan4_raw	%RC channel 4 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan5_raw	%RC channel 5 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan6_raw	%RC channel 6 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan7_raw	%RC channel 7 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan8_raw	%RC channel 8 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan9_raw	%RC channel 9 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan10_raw	%RC channel 10 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan11_raw	%RC channel 11 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan12_raw	%RC channel 12 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan13_raw	%RC channel 13 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan14_raw	%RC channel 14 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan15_raw	%RC channel 15 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan16_raw	%RC channel 16 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan17_raw	%RC channel 17 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chan18_raw	%RC channel 18 value, in microseconds. A value of UINT16_MAX implies the channel is unused.	|	(uint16)
+        chancount	%Total number of RC channels being received. This can be larger than 18, indicating that more channels are available but not given in this message. This value should be 0 when no RC channels are available.	|	(uint8)
+        rssi	%Receive signal strength indicator, 0: 0%, 100: 100%, 255: invalid/unknown.	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,time_boot_ms,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,chan13_raw,chan14_raw,chan15_raw,chan16_raw,chan17_raw,chan18_raw,chancount,rssi,varargin)
+
+            if nargin == 21 + 1
+                msg = msg_rc_channels(time_boot_ms,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,chan13_raw,chan14_raw,chan15_raw,chan16_raw,chan17_raw,chan18_raw,chancount,rssi,varargin);
+            elseif nargin == 2
+                msg = msg_rc_channels(time_boot_ms);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_rc_channels(time_boot_ms,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,chan9_raw,chan10_raw,chan11_raw,chan12_raw,chan13_raw,chan14_raw,chan15_raw,chan16_raw,chan17_raw,chan18_raw,chancount,rssi,varargin)
+        %MSG_RC_CHANNELS: Create a new rc_channels message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(time_boot_ms,'MAVLinkPacket')
+                    packet = time_boot_ms;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('time_boot_ms','MAVLinkPacket');
+                end
+            elseif nargin >= 21 && isempty(varargin{1})
+                obj.time_boot_ms = time_boot_ms;
+                obj.chan1_raw = chan1_raw;
+                obj.chan2_raw = chan2_raw;
+                obj.chan3_raw = chan3_raw;
+                obj.chan4_raw = chan4_raw;
+                obj.chan5_raw = chan5_raw;
+                obj.chan6_raw = chan6_raw;
+                obj.chan7_raw = chan7_raw;
+                obj.chan8_raw = chan8_raw;
+                obj.chan9_raw = chan9_raw;
+                obj.chan10_raw = chan10_raw;
+                obj.chan11_raw = chan11_raw;
+                obj.chan12_raw = chan12_raw;
+                obj.chan13_raw = chan13_raw;
+                obj.chan14_raw = chan14_raw;
+                obj.chan15_raw = chan15_raw;
+                obj.chan16_raw = chan16_raw;
+                obj.chan17_raw = chan17_raw;
+                obj.chan18_raw = chan18_raw;
+                obj.chancount = chancount;
+                obj.rssi = rssi;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_rc_channels.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_rc_channels.ID;
+                
+                packet.payload.putUINT32(obj.time_boot_ms);
+                packet.payload.putUINT16(obj.chan1_raw);
+                packet.payload.putUINT16(obj.chan2_raw);
+                packet.payload.putUINT16(obj.chan3_raw);
+                packet.payload.putUINT16(obj.chan4_raw);
+                packet.payload.putUINT16(obj.chan5_raw);
+                packet.payload.putUINT16(obj.chan6_raw);
+                packet.payload.putUINT16(obj.chan7_raw);
+                packet.payload.putUINT16(obj.chan8_raw);
+                packet.payload.putUINT16(obj.chan9_raw);
+                packet.payload.putUINT16(obj.chan10_raw);
+                packet.payload.putUINT16(obj.chan11_raw);
+                packet.payload.putUINT16(obj.chan12_raw);
+                packet.payload.putUINT16(obj.chan13_raw);
+                packet.payload.putUINT16(obj.chan14_raw);
+                packet.payload.putUINT16(obj.chan15_raw);
+                packet.payload.putUINT16(obj.chan16_raw);
+                packet.payload.putUINT16(obj.chan17_raw);
+                packet.payload.putUINT16(obj.chan18_raw);
+                packet.payload.putUINT8(obj.chancount);
+                packet.payload.putUINT8(obj.rssi);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.time_boot_ms = payload.getUINT32();
+            obj.chan1_raw = payload.getUINT16();
+            obj.chan2_raw = payload.getUINT16();
+            obj.chan3_raw = payload.getUINT16();
+            obj.chan4_raw = payload.getUINT16();
+            obj.chan5_raw = payload.getUINT16();
+            obj.chan6_raw = payload.getUINT16();
+            obj.chan7_raw = payload.getUINT16();
+            obj.chan8_raw = payload.getUINT16();
+            obj.chan9_raw = payload.getUINT16();
+            obj.chan10_raw = payload.getUINT16();
+            obj.chan11_raw = payload.getUINT16();
+            obj.chan12_raw = payload.getUINT16();
+            obj.chan13_raw = payload.getUINT16();
+            obj.chan14_raw = payload.getUINT16();
+            obj.chan15_raw = payload.getUINT16();
+            obj.chan16_raw = payload.getUINT16();
+            obj.chan17_raw = payload.getUINT16();
+            obj.chan18_raw = payload.getUINT16();
+            obj.chancount = payload.getUINT8();
+            obj.rssi = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.time_boot_ms,2) ~= 1
+                result = 'time_boot_ms';
+            elseif size(obj.chan1_raw,2) ~= 1
+                result = 'chan1_raw';
+            elseif size(obj.chan2_raw,2) ~= 1
+                result = 'chan2_raw';
+            elseif size(obj.chan3_raw,2) ~= 1
+                result = 'chan3_raw';
+            elseif size(obj.chan4_raw,2) ~= 1
+                result = 'chan4_raw';
+            elseif size(obj.chan5_raw,2) ~= 1
+                result = 'chan5_raw';
+            elseif size(obj.chan6_raw,2) ~= 1
+                result = 'chan6_raw';
+            elseif size(obj.chan7_raw,2) ~= 1
+                result = 'chan7_raw';
+            elseif size(obj.chan8_raw,2) ~= 1
+                result = 'chan8_raw';
+            elseif size(obj.chan9_raw,2) ~= 1
+                result = 'chan9_raw';
+            elseif size(obj.chan10_raw,2) ~= 1
+                result = 'chan10_raw';
+            elseif size(obj.chan11_raw,2) ~= 1
+                result = 'chan11_raw';
+            elseif size(obj.chan12_raw,2) ~= 1
+                result = 'chan12_raw';
+            elseif size(obj.chan13_raw,2) ~= 1
+                result = 'chan13_raw';
+            elseif size(obj.chan14_raw,2) ~= 1
+                result = 'chan14_raw';
+            elseif size(obj.chan15_raw,2) ~= 1
+                result = 'chan15_raw';
+            elseif size(obj.chan16_raw,2) ~= 1
+                result = 'chan16_raw';
+            elseif size(obj.chan17_raw,2) ~= 1
+                result = 'chan17_raw';
+            elseif size(obj.chan18_raw,2) ~= 1
+                result = 'chan18_raw';
+            elseif size(obj.chancount,2) ~= 1
+                result = 'chancount';
+            elseif size(obj.rssi,2) ~= 1
+                result = 'rssi';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.time_boot_ms(obj,value)
+            if value == uint32(value)
+                obj.time_boot_ms = uint32(value);
+            else
+                MAVLink.throwTypeError('value','uint32');
+            end
+        end
+        
+        function set.chan1_raw(obj,value)
+            if value == uint16(value)
+                obj.chan1_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan2_raw(obj,value)
+            if value == uint16(value)
+                obj.chan2_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan3_raw(obj,value)
+            if value == uint16(value)
+                obj.chan3_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan4_raw(obj,value)
+            if value == uint16(value)
+                obj.chan4_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan5_raw(obj,value)
+            if value == uint16(value)
+                obj.chan5_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan6_raw(obj,value)
+            if value == uint16(value)
+                obj.chan6_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan7_raw(obj,value)
+            if value == uint16(value)
+                obj.chan7_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan8_raw(obj,value)
+            if value == uint16(value)
+                obj.chan8_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan9_raw(obj,value)
+            if value == uint16(value)
+                obj.chan9_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan10_raw(obj,value)
+            if value == uint16(value)
+                obj.chan10_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan11_raw(obj,value)
+            if value == uint16(value)
+                obj.chan11_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan12_raw(obj,value)
+            if value == uint16(value)
+                obj.chan12_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan13_raw(obj,value)
+            if value == uint16(value)
+                obj.chan13_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan14_raw(obj,value)
+            if value == uint16(value)
+                obj.chan14_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan15_raw(obj,value)
+            if value == uint16(value)
+                obj.chan15_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan16_raw(obj,value)
+            if value == uint16(value)
+                obj.chan16_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan17_raw(obj,value)
+            if value == uint16(value)
+                obj.chan17_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan18_raw(obj,value)
+            if value == uint16(value)
+                obj.chan18_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chancount(obj,value)
+            if value == uint8(value)
+                obj.chancount = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.rssi(obj,value)
+            if value == uint8(value)
+                obj.rssi = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
@@ -1,4 +1,267 @@
 classdef msg_rc_channels_override < MAVLinkMessage
 	%MSG_RC_CHANNELS_OVERRIDE: MAVLink Message ID = 70
     %Description:
-    %    The RAW values of the RC channels sent to the MAV to override info received from the RC radio. A value of UINT16_MAX means no change to that channel. A value of 0 means control of that channel should be released back to the RC radio. The standard PPM modulation is as follows: 1000 microseconds: 0
\ No newline at end of file
+    %    The RAW values of the RC channels sent to the MAV to override info received from the RC radio. A value of UINT16_MAX means no change to that channel. A value of 0 means control of that channel should be released back to the RC radio. The standard PPM modulation is as follows: 1000 microseconds: 0%, 2000 microseconds: 100%. Individual receivers/transmitters might violate this specification.
+    %    Can also be constructed by using a MAVLinkPacket as the only argument
+	%Arguments:
+    %    chan1_raw(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
+    %    chan1_raw(uint16): RC channel 1 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan2_raw(uint16): RC channel 2 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan3_raw(uint16): RC channel 3 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan4_raw(uint16): RC channel 4 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan5_raw(uint16): RC channel 5 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan6_raw(uint16): RC channel 6 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan7_raw(uint16): RC channel 7 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    chan8_raw(uint16): RC channel 8 value, in microseconds. A value of UINT16_MAX means to ignore this field.
+    %    target_system(uint8): System ID
+    %    target_component(uint8): Component ID
+	
+	properties(Constant)
+		ID = 70
+		LEN = 18
+	end
+	
+	properties
+        chan1_raw	%RC channel 1 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan2_raw	%RC channel 2 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan3_raw	%RC channel 3 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan4_raw	%RC channel 4 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan5_raw	%RC channel 5 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan6_raw	%RC channel 6 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan7_raw	%RC channel 7 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        chan8_raw	%RC channel 8 value, in microseconds. A value of UINT16_MAX means to ignore this field.	|	(uint16)
+        target_system	%System ID	|	(uint8)
+        target_component	%Component ID	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,target_system,target_component,varargin)
+
+            if nargin == 10 + 1
+                msg = msg_rc_channels_override(chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,target_system,target_component,varargin);
+            elseif nargin == 2
+                msg = msg_rc_channels_override(chan1_raw);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_rc_channels_override(chan1_raw,chan2_raw,chan3_raw,chan4_raw,chan5_raw,chan6_raw,chan7_raw,chan8_raw,target_system,target_component,varargin)
+        %MSG_RC_CHANNELS_OVERRIDE: Create a new rc_channels_override message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(chan1_raw,'MAVLinkPacket')
+                    packet = chan1_raw;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('chan1_raw','MAVLinkPacket');
+                end
+            elseif nargin >= 10 && isempty(varargin{1})
+                obj.chan1_raw = chan1_raw;
+                obj.chan2_raw = chan2_raw;
+                obj.chan3_raw = chan3_raw;
+                obj.chan4_raw = chan4_raw;
+                obj.chan5_raw = chan5_raw;
+                obj.chan6_raw = chan6_raw;
+                obj.chan7_raw = chan7_raw;
+                obj.chan8_raw = chan8_raw;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_rc_channels_override.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_rc_channels_override.ID;
+                
+                packet.payload.putUINT16(obj.chan1_raw);
+                packet.payload.putUINT16(obj.chan2_raw);
+                packet.payload.putUINT16(obj.chan3_raw);
+                packet.payload.putUINT16(obj.chan4_raw);
+                packet.payload.putUINT16(obj.chan5_raw);
+                packet.payload.putUINT16(obj.chan6_raw);
+                packet.payload.putUINT16(obj.chan7_raw);
+                packet.payload.putUINT16(obj.chan8_raw);
+                packet.payload.putUINT8(obj.target_system);
+                packet.payload.putUINT8(obj.target_component);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.chan1_raw = payload.getUINT16();
+            obj.chan2_raw = payload.getUINT16();
+            obj.chan3_raw = payload.getUINT16();
+            obj.chan4_raw = payload.getUINT16();
+            obj.chan5_raw = payload.getUINT16();
+            obj.chan6_raw = payload.getUINT16();
+            obj.chan7_raw = payload.getUINT16();
+            obj.chan8_raw = payload.getUINT16();
+            obj.target_system = payload.getUINT8();
+            obj.target_component = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.chan1_raw,2) ~= 1
+                result = 'chan1_raw';
+            elseif size(obj.chan2_raw,2) ~= 1
+                result = 'chan2_raw';
+            elseif size(obj.chan3_raw,2) ~= 1
+                result = 'chan3_raw';
+            elseif size(obj.chan4_raw,2) ~= 1
+                result = 'chan4_raw';
+            elseif size(obj.chan5_raw,2) ~= 1
+                result = 'chan5_raw';
+            elseif size(obj.chan6_raw,2) ~= 1
+                result = 'chan6_raw';
+            elseif size(obj.chan7_raw,2) ~= 1
+                result = 'chan7_raw';
+            elseif size(obj.chan8_raw,2) ~= 1
+                result = 'chan8_raw';
+            elseif size(obj.target_system,2) ~= 1
+                result = 'target_system';
+            elseif size(obj.target_component,2) ~= 1
+                result = 'target_component';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.chan1_raw(obj,value)
+            if value == uint16(value)
+                obj.chan1_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan2_raw(obj,value)
+            if value == uint16(value)
+                obj.chan2_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan3_raw(obj,value)
+            if value == uint16(value)
+                obj.chan3_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan4_raw(obj,value)
+            if value == uint16(value)
+                obj.chan4_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan5_raw(obj,value)
+            if value == uint16(value)
+                obj.chan5_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan6_raw(obj,value)
+            if value == uint16(value)
+                obj.chan6_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan7_raw(obj,value)
+            if value == uint16(value)
+                obj.chan7_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.chan8_raw(obj,value)
+            if value == uint16(value)
+                obj.chan8_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.target_system(obj,value)
+            if value == uint8(value)
+                obj.target_system = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.target_component(obj,value)
+            if value == uint8(value)
+                obj.target_component = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
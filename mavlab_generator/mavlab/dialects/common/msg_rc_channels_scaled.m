@@ -1,4 +1,282 @@
 classdef msg_rc_channels_scaled < MAVLinkMessage
 	%MSG_RC_CHANNELS_SCALED: MAVLink Message ID = 34
     %Description:
-    %    The scaled values of the RC channels received. (-100
\ No newline at end of file
+    %    The scaled values of the RC channels received. (-100%) -10000, (0%) 0, (100%) 10000. Channels that are inactive should be set to UINT16_MAX.
+    %    Can also be constructed by using a MAVLinkPacket as the only argument
+	%Arguments:
+    %    time_boot_ms(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
+    %    time_boot_ms(uint32): Timestamp (milliseconds since system boot)
+    %    chan1_scaled(int16): RC channel 1 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan2_scaled(int16): RC channel 2 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan3_scaled(int16): RC channel 3 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan4_scaled(int16): RC channel 4 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan5_scaled(int16): RC channel 5 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan6_scaled(int16): RC channel 6 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan7_scaled(int16): RC channel 7 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    chan8_scaled(int16): RC channel 8 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.
+    %    port(uint8): Servo output port (set of 8 outputs = 1 port). Most MAVs will just use one, but this allows for more than 8 servos.
+    %    rssi(uint8): Receive signal strength indicator, 0: 0%, 100: 100%, 255: invalid/unknown.
+	
+	properties(Constant)
+		ID = 34
+		LEN = 22
+	end
+	
+	properties
+        time_boot_ms	%Timestamp (milliseconds since system boot)	|	(uint32)
+        chan1_scaled	%RC channel 1 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan2_scaled	%RC channel 2 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan3_scaled	%RC channel 3 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan4_scaled	%RC channel 4 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan5_scaled	%RC channel 5 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan6_scaled	%RC channel 6 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan7_scaled	%RC channel 7 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        chan8_scaled	%RC channel 8 value scaled, (-100%) -10000, (0%) 0, (100%) 10000, (invalid) INT16_MAX.	|	(int16)
+        port	%Servo output port (set of 8 outputs = 1 port). Most MAVs will just use one, but this allows for more than 8 servos.	|	(uint8)
+        rssi	%Receive signal strength indicator, 0: 0%, 100: 100%, 255: invalid/unknown.	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,time_boot_ms,chan1_scaled,chan2_scaled,chan3_scaled,chan4_scaled,chan5_scaled,chan6_scaled,chan7_scaled,chan8_scaled,port,rssi,varargin)
+
+            if nargin == 11 + 1
+                msg = msg_rc_channels_scaled(time_boot_ms,chan1_scaled,chan2_scaled,chan3_scaled,chan4_scaled,chan5_scaled,chan6_scaled,chan7_scaled,chan8_scaled,port,rssi,varargin);
+            elseif nargin == 2
+                msg = msg_rc_channels_scaled(time_boot_ms);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_rc_channels_scaled(time_boot_ms,chan1_scaled,chan2_scaled,chan3_scaled,chan4_scaled,chan5_scaled,chan6_scaled,chan7_scaled,chan8_scaled,port,rssi,varargin)
+        %MSG_RC_CHANNELS_SCALED: Create a new rc_channels_scaled message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(time_boot_ms,'MAVLinkPacket')
+                    packet = time_boot_ms;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('time_boot_ms','MAVLinkPacket');
+                end
+            elseif nargin >= 11 && isempty(varargin{1})
+                obj.time_boot_ms = time_boot_ms;
+                obj.chan1_scaled = chan1_scaled;
+                obj.chan2_scaled = chan2_scaled;
+                obj.chan3_scaled = chan3_scaled;
+                obj.chan4_scaled = chan4_scaled;
+                obj.chan5_scaled = chan5_scaled;
+                obj.chan6_scaled = chan6_scaled;
+                obj.chan7_scaled = chan7_scaled;
+                obj.chan8_scaled = chan8_scaled;
+                obj.port = port;
+                obj.rssi = rssi;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_rc_channels_scaled.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_rc_channels_scaled.ID;
+                
+                packet.payload.putUINT32(obj.time_boot_ms);
+                packet.payload.putINT16(obj.chan1_scaled);
+                packet.payload.putINT16(obj.chan2_scaled);
+                packet.payload.putINT16(obj.chan3_scaled);
+                packet.payload.putINT16(obj.chan4_scaled);
+                packet.payload.putINT16(obj.chan5_scaled);
+                packet.payload.putINT16(obj.chan6_scaled);
+                packet.payload.putINT16(obj.chan7_scaled);
+                packet.payload.putINT16(obj.chan8_scaled);
+                packet.payload.putUINT8(obj.port);
+                packet.payload.putUINT8(obj.rssi);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.time_boot_ms = payload.getUINT32();
+            obj.chan1_scaled = payload.getINT16();
+            obj.chan2_scaled = payload.getINT16();
+            obj.chan3_scaled = payload.getINT16();
+            obj.chan4_scaled = payload.getINT16();
+            obj.chan5_scaled = payload.getINT16();
+            obj.chan6_scaled = payload.getINT16();
+            obj.chan7_scaled = payload.getINT16();
+            obj.chan8_scaled = payload.getINT16();
+            obj.port = payload.getUINT8();
+            obj.rssi = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.time_boot_ms,2) ~= 1
+                result = 'time_boot_ms';
+            elseif size(obj.chan1_scaled,2) ~= 1
+                result = 'chan1_scaled';
+            elseif size(obj.chan2_scaled,2) ~= 1
+                result = 'chan2_scaled';
+            elseif size(obj.chan3_scaled,2) ~= 1
+                result = 'chan3_scaled';
+            elseif size(obj.chan4_scaled,2) ~= 1
+                result = 'chan4_scaled';
+            elseif size(obj.chan5_scaled,2) ~= 1
+                result = 'chan5_scaled';
+            elseif size(obj.chan6_scaled,2) ~= 1
+                result = 'chan6_scaled';
+            elseif size(obj.chan7_scaled,2) ~= 1
+                result = 'chan7_scaled';
+            elseif size(obj.chan8_scaled,2) ~= 1
+                result = 'chan8_scaled';
+            elseif size(obj.port,2) ~= 1
+                result = 'port';
+            elseif size(obj.rssi,2) ~= 1
+                result = 'rssi';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.time_boot_ms(obj,value)
+            if value == uint32(value)
+                obj.time_boot_ms = uint32(value);
+            else
+                MAVLink.throwTypeError('value','uint32');
+            end
+        end
+        
+        function set.chan1_scaled(obj,value)
+            if value == int16(value)
+                obj.chan1_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan2_scaled(obj,value)
+            if value == int16(value)
+                obj.chan2_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan3_scaled(obj,value)
+            if value == int16(value)
+                obj.chan3_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan4_scaled(obj,value)
+            if value == int16(value)
+                obj.chan4_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan5_scaled(obj,value)
+            if value == int16(value)
+                obj.chan5_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan6_scaled(obj,value)
+            if value == int16(value)
+                obj.chan6_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan7_scaled(obj,value)
+            if value == int16(value)
+                obj.chan7_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.chan8_scaled(obj,value)
+            if value == int16(value)
+                obj.chan8_scaled = int16(value);
+            else
+                MAVLink.throwTypeError('value','int16');
+            end
+        end
+        
+        function set.port(obj,value)
+            if value == uint8(value)
+                obj.port = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+        function set.rssi(obj,value)
+            if value == uint8(value)
+                obj.rssi = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
@@ -13,15 +13,15 @@ classdef msg_resource_request < MAVLinkMessage
 	
 	properties(Constant)
 		ID = 142
-		LEN = 127
+		LEN = 243
 	end
 	
 	properties
-        request_id	%Request ID. This ID should be re-used when sending back URI contents	|	(uint8)
-        uri_type	%The type of requested URI. 0 = a file via URL. 1 = a UAVCAN binary	|	(uint8)
-        uri	%The requested unique resource identifier (URI). It is not necessarily a straight domain name (depends on the URI type enum)	|	(uint8[120])
-        transfer_type	%The way the autopilot wants to receive the URI. 0 = MAVLink FTP. 1 = binary stream.	|	(uint8)
-        storage	%The storage path the autopilot wants the URI to be stored in. Will only be valid if the transfer_type has a storage associated (e.g. MAVLink FTP).	|	(uint8[120])
+        request_id	%Request ID. This ID should be re-used when sending back URI contents	|	(uint8)
+        uri_type	%The type of requested URI. 0 = a file via URL. 1 = a UAVCAN binary	|	(uint8)
+        uri	%The requested unique resource identifier (URI). It is not necessarily a straight domain name (depends on the URI type enum)	|	(uint8[120])
+        transfer_type	%The way the autopilot wants to receive the URI. 0 = MAVLink FTP. 1 = binary stream.	|	(uint8)
+        storage	%The storage path the autopilot wants the URI to be stored in. Will only be valid if the transfer_type has a storage associated (e.g. MAVLink FTP).	|	(uint8[120])
     end
 
     methods(Static)
@@ -68,11 +68,11 @@ classdef msg_resource_request < MAVLinkMessage
                     MAVLink.throwTypeError('request_id','MAVLinkPacket');
                 end
             elseif nargin >= 5 && isempty(varargin{1})
-                obj.request_id = request_id;
-                obj.uri_type = uri_type;
-                obj.uri = uri;
-                obj.transfer_type = transfer_type;
-                obj.storage = storage;
+                obj.request_id = request_id;
+                obj.uri_type = uri_type;
+                obj.uri = uri;
+                obj.transfer_type = transfer_type;
+                obj.storage = storage;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
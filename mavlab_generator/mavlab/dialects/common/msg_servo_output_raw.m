@@ -1,4 +1,267 @@
 classdef msg_servo_output_raw < MAVLinkMessage
 	%MSG_SERVO_OUTPUT_RAW: MAVLink Message ID = 36
     %Description:
-    %    The RAW values of the servo outputs (for RC input from the remote, use the RC_CHANNELS messages). The standard PPM modulation is as follows: 1000 microseconds: 0
\ No newline at end of file
+    %    The RAW values of the servo outputs (for RC input from the remote, use the RC_CHANNELS messages). The standard PPM modulation is as follows: 1000 microseconds: 0%, 2000 microseconds: 100%.
+    %    Can also be constructed by using a MAVLinkPacket as the only argument
+	%Arguments:
+    %    time_usec(MAVLinkPacket): Alternative way to construct a message using a MAVLinkPacket
+    %    time_usec(uint32): Timestamp (microseconds since system boot)
+    %    servo1_raw(uint16): Servo output 1 value, in microseconds
+    %    servo2_raw(uint16): Servo output 2 value, in microseconds
+    %    servo3_raw(uint16): Servo output 3 value, in microseconds
+    %    servo4_raw(uint16): Servo output 4 value, in microseconds
+    %    servo5_raw(uint16): Servo output 5 value, in microseconds
+    %    servo6_raw(uint16): Servo output 6 value, in microseconds
+    %    servo7_raw(uint16): Servo output 7 value, in microseconds
+    %    servo8_raw(uint16): Servo output 8 value, in microseconds
+    %    port(uint8): Servo output port (set of 8 outputs = 1 port). Most MAVs will just use one, but this allows to encode more than 8 servos.
+	
+	properties(Constant)
+		ID = 36
+		LEN = 21
+	end
+	
+	properties
+        time_usec	%Timestamp (microseconds since system boot)	|	(uint32)
+        servo1_raw	%Servo output 1 value, in microseconds	|	(uint16)
+        servo2_raw	%Servo output 2 value, in microseconds	|	(uint16)
+        servo3_raw	%Servo output 3 value, in microseconds	|	(uint16)
+        servo4_raw	%Servo output 4 value, in microseconds	|	(uint16)
+        servo5_raw	%Servo output 5 value, in microseconds	|	(uint16)
+        servo6_raw	%Servo output 6 value, in microseconds	|	(uint16)
+        servo7_raw	%Servo output 7 value, in microseconds	|	(uint16)
+        servo8_raw	%Servo output 8 value, in microseconds	|	(uint16)
+        port	%Servo output port (set of 8 outputs = 1 port). Most MAVs will just use one, but this allows to encode more than 8 servos.	|	(uint8)
+    end
+
+    methods(Static)
+
+        function send(out,time_usec,servo1_raw,servo2_raw,servo3_raw,servo4_raw,servo5_raw,servo6_raw,servo7_raw,servo8_raw,port,varargin)
+
+            if nargin == 10 + 1
+                msg = msg_servo_output_raw(time_usec,servo1_raw,servo2_raw,servo3_raw,servo4_raw,servo5_raw,servo6_raw,servo7_raw,servo8_raw,port,varargin);
+            elseif nargin == 2
+                msg = msg_servo_output_raw(time_usec);
+            else
+                MAVLink.throwCustomError('The number of function arguments is not valid');
+                return;
+            end
+
+            packet = msg.pack();
+            if ~isempty(packet)
+                buffer = packet.encode();
+                write(out,buffer);
+            else
+                MAVLink.throwCustomError('The packet could not be verified');
+            end
+        
+        end
+
+    end
+
+    methods
+
+        function obj = msg_servo_output_raw(time_usec,servo1_raw,servo2_raw,servo3_raw,servo4_raw,servo5_raw,servo6_raw,servo7_raw,servo8_raw,port,varargin)
+        %MSG_SERVO_OUTPUT_RAW: Create a new servo_output_raw message object
+        
+            obj.msgid = obj.ID;
+            obj.sysid = MAVLink.SYSID;
+            obj.compid = MAVLink.COMPID;
+
+            if nargin == 1 
+                if isa(time_usec,'MAVLinkPacket')
+                    packet = time_usec;
+                    obj.sysid = packet.sysid;
+                    obj.compid = packet.compid;
+                    obj.unpack(packet.payload);
+                else
+                    MAVLink.throwTypeError('time_usec','MAVLinkPacket');
+                end
+            elseif nargin >= 10 && isempty(varargin{1})
+                obj.time_usec = time_usec;
+                obj.servo1_raw = servo1_raw;
+                obj.servo2_raw = servo2_raw;
+                obj.servo3_raw = servo3_raw;
+                obj.servo4_raw = servo4_raw;
+                obj.servo5_raw = servo5_raw;
+                obj.servo6_raw = servo6_raw;
+                obj.servo7_raw = servo7_raw;
+                obj.servo8_raw = servo8_raw;
+                obj.port = port;
+            elseif nargin ~= 0
+                MAVLink.throwCustomError('The number of constructer arguments is not valid');
+            end
+
+        end
+
+        function packet = pack(obj)
+        %PACK: Packs this MAVLink message into a MAVLinkPacket
+        %Description:
+        %    Packs the fields of a message into a MAVLinkPacket which can be encoded
+        %    for transmission.
+
+            errorField = obj.verify();
+            if errorField == 0
+
+                packet = MAVLinkPacket(msg_servo_output_raw.LEN);
+                packet.sysid = MAVLink.SYSID;
+                packet.compid = MAVLink.COMPID;
+                packet.msgid = msg_servo_output_raw.ID;
+                
+                packet.payload.putUINT32(obj.time_usec);
+                packet.payload.putUINT16(obj.servo1_raw);
+                packet.payload.putUINT16(obj.servo2_raw);
+                packet.payload.putUINT16(obj.servo3_raw);
+                packet.payload.putUINT16(obj.servo4_raw);
+                packet.payload.putUINT16(obj.servo5_raw);
+                packet.payload.putUINT16(obj.servo6_raw);
+                packet.payload.putUINT16(obj.servo7_raw);
+                packet.payload.putUINT16(obj.servo8_raw);
+                packet.payload.putUINT8(obj.port);
+
+            else
+                packet = [];
+                MAVLink.throwPackingError(errorField);
+            end
+
+        end
+
+        function unpack(obj, payload)
+        %UNPACK: Unpacks a MAVLinkPayload into this MAVLink message
+        %Description:
+        %    Extracts the data from a MAVLinkPayload and attempts to store it in the fields
+        %    of this message.
+        %Arguments:
+        %    payload(MAVLinkPayload): The payload to be unpacked into this MAVLink message
+
+            payload.resetIndex();
+            
+            obj.time_usec = payload.getUINT32();
+            obj.servo1_raw = payload.getUINT16();
+            obj.servo2_raw = payload.getUINT16();
+            obj.servo3_raw = payload.getUINT16();
+            obj.servo4_raw = payload.getUINT16();
+            obj.servo5_raw = payload.getUINT16();
+            obj.servo6_raw = payload.getUINT16();
+            obj.servo7_raw = payload.getUINT16();
+            obj.servo8_raw = payload.getUINT16();
+            obj.port = payload.getUINT8();
+
+        end
+        
+        function result = verify(obj)
+        %VERIFY: Determine whether all fields of this message are full
+        %Description:
+        %    Finds the first empty field in this message and returns its name. If there are no
+        %    empty fields return 0.
+
+            if 1==0
+            elseif size(obj.time_usec,2) ~= 1
+                result = 'time_usec';
+            elseif size(obj.servo1_raw,2) ~= 1
+                result = 'servo1_raw';
+            elseif size(obj.servo2_raw,2) ~= 1
+                result = 'servo2_raw';
+            elseif size(obj.servo3_raw,2) ~= 1
+                result = 'servo3_raw';
+            elseif size(obj.servo4_raw,2) ~= 1
+                result = 'servo4_raw';
+            elseif size(obj.servo5_raw,2) ~= 1
+                result = 'servo5_raw';
+            elseif size(obj.servo6_raw,2) ~= 1
+                result = 'servo6_raw';
+            elseif size(obj.servo7_raw,2) ~= 1
+                result = 'servo7_raw';
+            elseif size(obj.servo8_raw,2) ~= 1
+                result = 'servo8_raw';
+            elseif size(obj.port,2) ~= 1
+                result = 'port';
+
+            else
+                result = 0;
+            end
+        end
+
+        function set.time_usec(obj,value)
+            if value == uint32(value)
+                obj.time_usec = uint32(value);
+            else
+                MAVLink.throwTypeError('value','uint32');
+            end
+        end
+        
+        function set.servo1_raw(obj,value)
+            if value == uint16(value)
+                obj.servo1_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo2_raw(obj,value)
+            if value == uint16(value)
+                obj.servo2_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo3_raw(obj,value)
+            if value == uint16(value)
+                obj.servo3_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo4_raw(obj,value)
+            if value == uint16(value)
+                obj.servo4_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo5_raw(obj,value)
+            if value == uint16(value)
+                obj.servo5_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo6_raw(obj,value)
+            if value == uint16(value)
+                obj.servo6_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo7_raw(obj,value)
+            if value == uint16(value)
+                obj.servo7_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.servo8_raw(obj,value)
+            if value == uint16(value)
+                obj.servo8_raw = uint16(value);
+            else
+                MAVLink.throwTypeError('value','uint16');
+            end
+        end
+        
+        function set.port(obj,value)
+            if value == uint8(value)
+                obj.port = uint8(value);
+            else
+                MAVLink.throwTypeError('value','uint8');
+            end
+        end
+        
+    end
+
+end
\ No newline at end of file
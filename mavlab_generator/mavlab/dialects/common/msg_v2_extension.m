@@ -9,19 +9,19 @@ classdef msg_v2_extension < MAVLinkMessage
     %    target_network(uint8): Network ID (0 for broadcast)
     %    target_system(uint8): System ID (0 for broadcast)
     %    target_component(uint8): Component ID (0 for broadcast)
-    %    payload(uint8[127]): Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.
+    %    payload(uint8[249]): Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.
 	
 	properties(Constant)
 		ID = 248
-		LEN = 127
+		LEN = 254
 	end
 	
 	properties
-        message_type	%A code that identifies the software component that understands this message (analogous to usb device classes or mime type strings).  If this code is less than 32768, it is considered a 'registered' protocol extension and the corresponding entry should be added to https://github.com/mavlink/mavlink/extension-message-ids.xml.  Software creators can register blocks of message IDs as needed (useful for GCS specific metadata, etc...). Message_types greater than 32767 are considered local experiments and should not be checked in to any widely distributed codebase.	|	(uint16)
-        target_network	%Network ID (0 for broadcast)	|	(uint8)
-        target_system	%System ID (0 for broadcast)	|	(uint8)
-        target_component	%Component ID (0 for broadcast)	|	(uint8)
-        payload	%Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.	|	(uint8[127])
+        message_type	%A code that identifies the software component that understands this message (analogous to usb device classes or mime type strings).  If this code is less than 32768, it is considered a 'registered' protocol extension and the corresponding entry should be added to https://github.com/mavlink/mavlink/extension-message-ids.xml.  Software creators can register blocks of message IDs as needed (useful for GCS specific metadata, etc...). Message_types greater than 32767 are considered local experiments and should not be checked in to any widely distributed codebase.	|	(uint16)
+        target_network	%Network ID (0 for broadcast)	|	(uint8)
+        target_system	%System ID (0 for broadcast)	|	(uint8)
+        target_component	%Component ID (0 for broadcast)	|	(uint8)
+        payload	%Variable length payload. The length is defined by the remaining message length when subtracting the header and other fields.  The entire content of this block is opaque unless you understand any the encoding message_type.  The particular encoding used can be extension specific and might not always be documented as part of the mavlink specification.	|	(uint8[249])
     end
 
     methods(Static)
@@ -68,11 +68,11 @@ classdef msg_v2_extension < MAVLinkMessage
                     MAVLink.throwTypeError('message_type','MAVLinkPacket');
                 end
             elseif nargin >= 5 && isempty(varargin{1})
-                obj.message_type = message_type;
-                obj.target_network = target_network;
-                obj.target_system = target_system;
-                obj.target_component = target_component;
-                obj.payload = payload;
+                obj.message_type = message_type;
+                obj.target_network = target_network;
+                obj.target_system = target_system;
+                obj.target_component = target_component;
+                obj.payload = payload;
             elseif nargin ~= 0
                 MAVLink.throwCustomError('The number of constructer arguments is not valid');
             end
@@ -97,7 +97,7 @@ classdef msg_v2_extension < MAVLinkMessage
                 packet.payload.putUINT8(obj.target_network);
                 packet.payload.putUINT8(obj.target_system);
                 packet.payload.putUINT8(obj.target_component);
-                for i=1:1:127
+                for i=1:1:249
                     packet.payload.putUINT8(obj.payload(i));
                 end
 
@@ -122,7 +122,7 @@ classdef msg_v2_extension < MAVLinkMessage
             obj.target_network = payload.getUINT8();
             obj.target_system = payload.getUINT8();
             obj.target_component = payload.getUINT8();
-            for i=1:1:127
+            for i=1:1:249
                 obj.payload(i) = payload.getUINT8();
             end
 
@@ -143,7 +143,7 @@ classdef msg_v2_extension < MAVLinkMessage
                 result = 'target_system';
             elseif size(obj.target_component,2) ~= 1
                 result = 'target_component';
-            elseif size(obj.payload,2) ~= 127
+            elseif size(obj.payload,2) ~= 249
                 result = 'payload';
 
             else
@@ -3,7 +3,8 @@ classdef MAVLinkCRC < MAVLinkHandle
 %Handles the crc x.25 checksum system used by MAVLink
     
     properties(Constant) 
-        MAVLINK_MESSAGE_CRCS = uint8([50,124,137,0,237,217,104,119,0,0,0,89,0,0,0,0,0,0,0,0,214,159,220,168,24,23,170,144,67,115,39,246,185,104,237,244,222,212,9,254,230,28,28,132,221,232,11,153,41,39,78,196,0,0,15,3,0,0,0,0,0,167,183,119,191,118,148,21,0,243,124,0,0,38,20,158,152,143,0,0,0,106,49,22,143,140,5,150,0,231,183,63,54,47,0,0,0,0,0,0,175,102,158,208,56,93,138,108,32,185,186,34,174,124,237,4,76,128,56,116,134,237,203,250,87,203,220,25,226,46,29,98,85,6,229,203,1,195,109,168,181,47,72,131,127,0,103,154,178,200,134,219,208,188,84,22,19,21,134,0,78,68,189,127,154,21,21,144,1,234,73,181,22,83,167,138,234,240,47,189,52,174,229,85,0,0,72,0,0,0,0,92,36,71,98,0,0,0,0,0,134,205,94,128,54,63,112,201,221,226,238,103,235,14,0,77,50,163,115,47,0,0,0,0,0,0,0,0,0,0,163,105,151,132,150,0,0,0,0,0,0,90,104,85,95,130,184,81,215,204,49,170,44,83,46,0]);
+        MAVLINK_MESSAGE_CRCS = uint8([50,124,137,0,237,217,104,119,0,0,0,89,0,0,0,0,0,0,0,0,214,159,220,168,24,23,170,144,67,115,39,246,185,104,237,244,222,212,9,254,230,28,28,132,221,232,11,153,41,39,78,196,0,0,15,3,0,0,0,0,0,167,183,119,191,118,148,21,0,243,124,0,0,38,20,158,152,143,0,0,0,106,49,22,143,140,5,150,0,231,183,63,54,47,0,0,0,0,0,0,175,102,158,208,56,93,138,108,32,185,84,34,174,124,237,4,76,128,56,116,134,237,203,250,87,203,220,25,226,46,29,223,85,6,229,203,1,195,109,168,181,47,72,131,127,0,103,154,178,200,134,219,208,188,84,22,19,21,134,0,78,68,189,127,154,21,21,144,1,234,73,181,22,83,167,138,234,240,47,189,52,174,229,85,0,0,72,0,0,0,0,92,36,71,98,0,0,0,0,0,134,205,94,128,54,63,112,201,221,226,238,103,235,14,0,77,50,163,115,47,0,0,0,0,0,0,0,0,0,0,163,105,151,35,150,0,0,0,0,0,0,90,104,85,95,130,184,81,8,204,49,170,44,83,46,0,]);
+        CRC_TABLE = uint16([0 4489 8978 12955 17956 22445 25910 29887 35912 40385 44890 48851 51820 56293 59774 63735 4225 264 13203 8730 22181 18220 30135 25662 40137 36160 49115 44626 56045 52068 63999 59510 8450 12427 528 5017 26406 30383 17460 21949 44362 48323 36440 40913 60270 64231 51324 55797 12675 8202 4753 792 30631 26158 21685 17724 48587 44098 40665 36688 64495 60006 55549 51572 16900 21389 24854 28831 1056 5545 10034 14011 52812 57285 60766 64727 34920 39393 43898 47859 21125 17164 29079 24606 5281 1320 14259 9786 57037 53060 64991 60502 39145 35168 48123 43634 25350 29327 16404 20893 9506 13483 1584 6073 61262 65223 52316 56789 43370 47331 35448 39921 29575 25102 20629 16668 13731 9258 5809 1848 65487 60998 56541 52564 47595 43106 39673 35696 33800 38273 42778 46739 49708 54181 57662 61623 2112 6601 11090 15067 20068 24557 28022 31999 38025 34048 47003 42514 53933 49956 61887 57398 6337 2376 15315 10842 24293 20332 32247 27774 42250 46211 34328 38801 58158 62119 49212 53685 10562 14539 2640 7129 28518 32495 19572 24061 46475 41986 38553 34576 62383 57894 53437 49460 14787 10314 6865 2904 32743 28270 23797 19836 50700 55173 58654 62615 32808 37281 41786 45747 19012 23501 26966 30943 3168 7657 12146 16123 54925 50948 62879 58390 37033 33056 46011 41522 23237 19276 31191 26718 7393 3432 16371 11898 59150 63111 50204 54677 41258 45219 33336 37809 27462 31439 18516 23005 11618 15595 3696 8185 63375 58886 54429 50452 45483 40994 37561 33584 31687 27214 22741 18780 15843 11370 7921 3960 ]);
         CRC_INIT_VALUE = uint16(hex2dec('ffff'));
     end
     
@@ -20,19 +21,29 @@ classdef MAVLinkCRC < MAVLinkHandle
         
         function updateChecksum(obj, char)
             if char == uint8(char)
-                char = uint8(char);
-                crcBytes = typecast(uint16(obj.crcValue),'uint8');
-                temp = bitxor(char,crcBytes(1));
-                temp = bitxor(temp,bitshift(temp,4));
-                crcAccum = bitxor(uint16(crcBytes(2)),bitshift(uint16(temp),8));
-                crcAccum = bitxor(crcAccum,bitshift(uint16(temp),3));
-                crcAccum = bitxor(crcAccum,bitshift(uint16(temp),-4));
-                obj.crcValue = crcAccum;
+                index = double(bitxor(bitand(obj.crcValue,255),uint16(char))) + 1;
+                obj.crcValue = bitxor(bitshift(obj.crcValue,-8),obj.CRC_TABLE(index));
             else
                 fprintf(2,'MAVLAB-ERROR | MAVLinkCRC.updateChecksum()\n\t Input "char" is not of type "uint8"\n');
             end
         end
         
+        %Function: Calculate the checksum of a whole header and payload vector
+        %bytes should run from the length byte to the end of the payload, if msgid is given
+        %the checksum is finished with the CRC of that message
+        function computeChecksum(obj, bytes, msgid)
+            if nargin == 3
+                bytes = [bytes(:); obj.MAVLINK_MESSAGE_CRCS(double(msgid) + 1)];
+            end
+            crc = obj.CRC_INIT_VALUE;
+            table = obj.CRC_TABLE;
+            bytes = uint16(bytes);
+            for i = 1:1:numel(bytes)
+                crc = bitxor(bitshift(crc,-8),table(double(bitxor(bitand(crc,255),bytes(i))) + 1));
+            end
+            obj.crcValue = crc;
+        end
+        
         %Function: Initialises the checksum value
         function startChecksum(obj)
             obj.crcValue = obj.CRC_INIT_VALUE;
@@ -40,7 +51,7 @@ classdef MAVLinkCRC < MAVLinkHandle
         
         %Function: Hash the checksum with the MAVLink message CRC
         function finishChecksum(obj, msgid)
-           obj.updateChecksum(obj.MAVLINK_MESSAGE_CRCS(msgid + 1)) 
+           obj.updateChecksum(obj.MAVLINK_MESSAGE_CRCS(double(msgid) + 1)) 
         end
         
         %Getter: MSB
@@ -5,6 +5,11 @@ classdef MAVLinkPacket < MAVLinkHandle
     %Constant public variables
     properties(Constant)
         STX = 254;  %The 'magic' byte
+        
+        %Constructor and payload length of each message, indexed by msgid + 1
+        %CRC_EXTRA is looked up in MAVLinkCRC.MAVLINK_MESSAGE_CRCS, which covers every message
+        MESSAGE_CONSTRUCTORS = {@msg_heartbeat,@msg_sys_status,@msg_system_time,[],@msg_ping,@msg_change_operator_control,@msg_change_operator_control_ack,@msg_auth_key,[],[],[],@msg_set_mode,[],[],[],[],[],[],[],[],@msg_param_request_read,@msg_param_request_list,@msg_param_value,@msg_param_set,@msg_gps_raw_int,@msg_gps_status,@msg_scaled_imu,@msg_raw_imu,@msg_raw_pressure,@msg_scaled_pressure,@msg_attitude,@msg_attitude_quaternion,@msg_local_position_ned,@msg_global_position_int,@msg_rc_channels_scaled,@msg_rc_channels_raw,@msg_servo_output_raw,@msg_mission_request_partial_list,@msg_mission_write_partial_list,@msg_mission_item,@msg_mission_request,@msg_mission_set_current,@msg_mission_current,@msg_mission_request_list,@msg_mission_count,@msg_mission_clear_all,@msg_mission_item_reached,@msg_mission_ack,@msg_set_gps_global_origin,@msg_gps_global_origin,@msg_param_map_rc,@msg_mission_request_int,[],[],@msg_safety_set_allowed_area,@msg_safety_allowed_area,[],[],[],[],[],@msg_attitude_quaternion_cov,@msg_nav_controller_output,@msg_global_position_int_cov,@msg_local_position_ned_cov,@msg_rc_channels,@msg_request_data_stream,@msg_data_stream,[],@msg_manual_control,@msg_rc_channels_override,[],[],@msg_mission_item_int,@msg_vfr_hud,@msg_command_int,@msg_command_long,@msg_command_ack,[],[],[],@msg_manual_setpoint,@msg_set_attitude_target,@msg_attitude_target,@msg_set_position_target_local_ned,@msg_position_target_local_ned,@msg_set_position_target_global_int,@msg_position_target_global_int,[],@msg_local_position_ned_system_global_offset,@msg_hil_state,@msg_hil_controls,@msg_hil_rc_inputs_raw,@msg_hil_actuator_controls,[],[],[],[],[],[],@msg_optical_flow,@msg_global_vision_position_estimate,@msg_vision_position_estimate,@msg_vision_speed_estimate,@msg_vicon_position_estimate,@msg_highres_imu,@msg_optical_flow_rad,@msg_hil_sensor,@msg_sim_state,@msg_radio_status,@msg_file_transfer_protocol,@msg_timesync,@msg_camera_trigger,@msg_hil_gps,@msg_hil_optical_flow,@msg_hil_state_quaternion,@msg_scaled_imu2,@msg_log_request_list,@msg_log_entry,@msg_log_request_data,@msg_log_data,@msg_log_erase,@msg_log_request_end,@msg_gps_inject_data,@msg_gps2_raw,@msg_power_status,@msg_serial_control,@msg_gps_rtk,@msg_gps2_rtk,@msg_scaled_imu3,@msg_data_transmission_handshake,@msg_encapsulated_data,@msg_distance_sensor,@msg_terrain_request,@msg_terrain_data,@msg_terrain_check,@msg_terrain_report,@msg_scaled_pressure2,@msg_att_pos_mocap,@msg_set_actuator_control_target,@msg_actuator_control_target,@msg_altitude,@msg_resource_request,@msg_scaled_pressure3,@msg_follow_target,[],@msg_control_system_state,@msg_battery_status,@msg_autopilot_version,@msg_landing_target,@msg_sensor_offsets,@msg_set_mag_offsets,@msg_meminfo,@msg_ap_adc,@msg_digicam_configure,@msg_digicam_control,@msg_mount_configure,@msg_mount_control,@msg_mount_status,[],@msg_fence_point,@msg_fence_fetch_point,@msg_fence_status,@msg_ahrs,@msg_simstate,@msg_hwstatus,@msg_radio,@msg_limits_status,@msg_wind,@msg_data16,@msg_data32,@msg_data64,@msg_data96,@msg_rangefinder,@msg_airspeed_autocal,@msg_rally_point,@msg_rally_fetch_point,@msg_compassmot_status,@msg_ahrs2,@msg_camera_status,@msg_camera_feedback,@msg_battery2,@msg_ahrs3,@msg_autopilot_version_request,[],[],@msg_led_control,[],[],[],[],@msg_mag_cal_progress,@msg_mag_cal_report,@msg_ekf_status_report,@msg_pid_tuning,[],[],[],[],[],@msg_gimbal_report,@msg_gimbal_control,@msg_gimbal_reset,@msg_gimbal_axis_calibration_progress,@msg_gimbal_set_home_offsets,@msg_gimbal_home_offset_calibration_result,@msg_gimbal_set_factory_parameters,@msg_gimbal_factory_parameters_loaded,@msg_gimbal_erase_firmware_and_config,@msg_gimbal_perform_factory_tests,@msg_gimbal_report_factory_tests_progress,@msg_gimbal_request_axis_calibration_status,@msg_gimbal_report_axis_calibration_status,@msg_gimbal_request_axis_calibration,[],@msg_gopro_heartbeat,@msg_gopro_get_request,@msg_gopro_get_response,@msg_gopro_set_request,@msg_gopro_set_response,[],[],[],[],[],[],[],[],[],[],@msg_estimator_status,@msg_wind_cov,@msg_gps_input,@msg_gps_rtcm_data,@msg_high_latency,[],[],[],[],[],[],@msg_vibration,@msg_home_position,@msg_set_home_position,@msg_message_interval,@msg_extended_sys_state,@msg_adsb_vehicle,@msg_collision,@msg_v2_extension,@msg_memory_vect,@msg_debug_vect,@msg_named_value_float,@msg_named_value_int,@msg_statustext,@msg_debug,[],};
+        MESSAGE_LENGTHS = uint8([9,31,12,0,14,28,3,32,0,0,0,6,0,0,0,0,0,0,0,0,20,2,25,23,30,101,22,26,16,14,28,32,28,28,22,22,21,6,6,37,4,4,2,2,4,2,2,3,13,12,37,4,0,0,27,25,0,0,0,0,0,72,26,181,225,42,6,4,0,11,18,0,0,37,20,35,33,3,0,0,0,22,39,37,53,51,53,51,0,28,56,42,33,81,0,0,0,0,0,0,26,32,32,20,32,62,44,64,84,9,254,16,12,36,44,64,22,6,14,12,97,2,2,113,35,6,79,35,35,22,13,255,14,18,43,8,22,14,36,43,41,32,243,14,93,0,100,36,60,30,42,8,4,12,15,13,6,15,14,0,12,3,8,28,44,3,9,22,12,18,34,66,98,8,48,19,3,20,24,29,45,4,40,2,0,0,29,0,0,0,0,27,44,22,25,0,0,0,0,0,42,14,2,3,2,1,33,1,6,2,4,2,3,2,0,1,3,2,4,2,0,0,0,0,0,0,0,0,0,0,42,40,63,182,40,0,0,0,0,0,0,32,52,53,6,2,38,19,254,36,30,18,18,51,9,0,]);
     end
     
     %Private variables
@@ -16,6 +21,7 @@ classdef MAVLinkPacket < MAVLinkHandle
         msgid;      %ID of the message type contained in the payload
         payload;    %The packet payload
         crc;        %The crc object for this packet
+        pooled = false; %True while the packet is held in the pool of a parser
     end
     
     %Publically accessible object variables
@@ -32,31 +38,32 @@ classdef MAVLinkPacket < MAVLinkHandle
         function generateCRC(obj)   
             if isempty(obj.crc)
                 obj.crc = MAVLinkCRC();
-            else
-                obj.crc.start_checksum();
             end
             
-            obj.crc.updateChecksum(uint8(obj.len));
-            obj.crc.updateChecksum(uint8(obj.seq));
-            obj.crc.updateChecksum(uint8(obj.sysid));
-            obj.crc.updateChecksum(uint8(obj.compid));
-            obj.crc.updateChecksum(uint8(obj.msgid));
-            
-            obj.payload.resetIndex();
-            for i = 1:1:obj.payload.getLength()
-                obj.crc.updateChecksum(obj.payload.getUINT8());
-            end
-            obj.crc.finishChecksum(uint8(obj.msgid));
+            obj.crc.computeChecksum([uint8(obj.len); uint8(obj.seq); uint8(obj.sysid); uint8(obj.compid);...
+                uint8(obj.msgid); obj.payload.getByteBuffer()], obj.msgid);
         end
         
         %Function: Encode the packet into a byte buffer for transmission
+        %Each packet encoded is numbered with the next sequence number of MAVLink.nextSeq
         function byteBuffer = encode(obj)
-            obj.seq = 1;
+            obj.seq = MAVLink.nextSeq();
             obj.generateCRC();
             byteBuffer = cat(1,uint8(obj.STX),uint8(obj.len),uint8(obj.seq),uint8(obj.sysid),...
                 uint8(obj.compid),uint8(obj.msgid),obj.payload.getByteBuffer(),obj.crc.getLSB(), obj.crc.getMSB());
         end
         
+        %Function: Reset the packet so that it can be reused for a payload of another length
+        %The payload buffer and CRC object of the packet are kept
+        function reset(obj, payloadLength)
+            obj.len = payloadLength;
+            obj.seq = [];
+            obj.sysid = [];
+            obj.compid = [];
+            obj.msgid = [];
+            obj.payload.reset(payloadLength);
+        end
+        
         %Getter: isPayloadFull
         function fillStatus = isPayloadFull(obj)
             fillStatus = obj.payload.isPayloadFull();
@@ -64,422 +71,12 @@ classdef MAVLinkPacket < MAVLinkHandle
         
         %Function: Unpack the payload and return the correct message type
         function message = unpack(obj)
-            message = [];
-            switch obj.msgid 
-                case 150
-                    message = msg_sensor_offsets(obj);
-                case 151
-                    message = msg_set_mag_offsets(obj);
-                case 152
-                    message = msg_meminfo(obj);
-                case 153
-                    message = msg_ap_adc(obj);
-                case 154
-                    message = msg_digicam_configure(obj);
-                case 155
-                    message = msg_digicam_control(obj);
-                case 156
-                    message = msg_mount_configure(obj);
-                case 157
-                    message = msg_mount_control(obj);
-                case 158
-                    message = msg_mount_status(obj);
-                case 160
-                    message = msg_fence_point(obj);
-                case 161
-                    message = msg_fence_fetch_point(obj);
-                case 162
-                    message = msg_fence_status(obj);
-                case 163
-                    message = msg_ahrs(obj);
-                case 164
-                    message = msg_simstate(obj);
-                case 165
-                    message = msg_hwstatus(obj);
-                case 166
-                    message = msg_radio(obj);
-                case 167
-                    message = msg_limits_status(obj);
-                case 168
-                    message = msg_wind(obj);
-                case 169
-                    message = msg_data16(obj);
-                case 170
-                    message = msg_data32(obj);
-                case 171
-                    message = msg_data64(obj);
-                case 172
-                    message = msg_data96(obj);
-                case 173
-                    message = msg_rangefinder(obj);
-                case 174
-                    message = msg_airspeed_autocal(obj);
-                case 175
-                    message = msg_rally_point(obj);
-                case 176
-                    message = msg_rally_fetch_point(obj);
-                case 177
-                    message = msg_compassmot_status(obj);
-                case 178
-                    message = msg_ahrs2(obj);
-                case 179
-                    message = msg_camera_status(obj);
-                case 180
-                    message = msg_camera_feedback(obj);
-                case 181
-                    message = msg_battery2(obj);
-                case 182
-                    message = msg_ahrs3(obj);
-                case 183
-                    message = msg_autopilot_version_request(obj);
-                case 186
-                    message = msg_led_control(obj);
-                case 191
-                    message = msg_mag_cal_progress(obj);
-                case 192
-                    message = msg_mag_cal_report(obj);
-                case 193
-                    message = msg_ekf_status_report(obj);
-                case 194
-                    message = msg_pid_tuning(obj);
-                case 200
-                    message = msg_gimbal_report(obj);
-                case 201
-                    message = msg_gimbal_control(obj);
-                case 202
-                    message = msg_gimbal_reset(obj);
-                case 203
-                    message = msg_gimbal_axis_calibration_progress(obj);
-                case 204
-                    message = msg_gimbal_set_home_offsets(obj);
-                case 205
-                    message = msg_gimbal_home_offset_calibration_result(obj);
-                case 206
-                    message = msg_gimbal_set_factory_parameters(obj);
-                case 207
-                    message = msg_gimbal_factory_parameters_loaded(obj);
-                case 208
-                    message = msg_gimbal_erase_firmware_and_config(obj);
-                case 209
-                    message = msg_gimbal_perform_factory_tests(obj);
-                case 210
-                    message = msg_gimbal_report_factory_tests_progress(obj);
-                case 211
-                    message = msg_gimbal_request_axis_calibration_status(obj);
-                case 212
-                    message = msg_gimbal_report_axis_calibration_status(obj);
-                case 213
-                    message = msg_gimbal_request_axis_calibration(obj);
-                case 215
-                    message = msg_gopro_heartbeat(obj);
-                case 216
-                    message = msg_gopro_get_request(obj);
-                case 217
-                    message = msg_gopro_get_response(obj);
-                case 218
-                    message = msg_gopro_set_request(obj);
-                case 219
-                    message = msg_gopro_set_response(obj);
-                case 0
-                    message = msg_heartbeat(obj);
-                case 1
-                    message = msg_sys_status(obj);
-                case 2
-                    message = msg_system_time(obj);
-                case 4
-                    message = msg_ping(obj);
-                case 5
-                    message = msg_change_operator_control(obj);
-                case 6
-                    message = msg_change_operator_control_ack(obj);
-                case 7
-                    message = msg_auth_key(obj);
-                case 11
-                    message = msg_set_mode(obj);
-                case 20
-                    message = msg_param_request_read(obj);
-                case 21
-                    message = msg_param_request_list(obj);
-                case 22
-                    message = msg_param_value(obj);
-                case 23
-                    message = msg_param_set(obj);
-                case 24
-                    message = msg_gps_raw_int(obj);
-                case 25
-                    message = msg_gps_status(obj);
-                case 26
-                    message = msg_scaled_imu(obj);
-                case 27
-                    message = msg_raw_imu(obj);
-                case 28
-                    message = msg_raw_pressure(obj);
-                case 29
-                    message = msg_scaled_pressure(obj);
-                case 30
-                    message = msg_attitude(obj);
-                case 31
-                    message = msg_attitude_quaternion(obj);
-                case 32
-                    message = msg_local_position_ned(obj);
-                case 33
-                    message = msg_global_position_int(obj);
-                case 34
-                    message = msg_rc_channels_scaled(obj);
-                case 35
-                    message = msg_rc_channels_raw(obj);
-                case 36
-                    message = msg_servo_output_raw(obj);
-                case 37
-                    message = msg_mission_request_partial_list(obj);
-                case 38
-                    message = msg_mission_write_partial_list(obj);
-                case 39
-                    message = msg_mission_item(obj);
-                case 40
-                    message = msg_mission_request(obj);
-                case 41
-                    message = msg_mission_set_current(obj);
-                case 42
-                    message = msg_mission_current(obj);
-                case 43
-                    message = msg_mission_request_list(obj);
-                case 44
-                    message = msg_mission_count(obj);
-                case 45
-                    message = msg_mission_clear_all(obj);
-                case 46
-                    message = msg_mission_item_reached(obj);
-                case 47
-                    message = msg_mission_ack(obj);
-                case 48
-                    message = msg_set_gps_global_origin(obj);
-                case 49
-                    message = msg_gps_global_origin(obj);
-                case 50
-                    message = msg_param_map_rc(obj);
-                case 51
-                    message = msg_mission_request_int(obj);
-                case 54
-                    message = msg_safety_set_allowed_area(obj);
-                case 55
-                    message = msg_safety_allowed_area(obj);
-                case 61
-                    message = msg_attitude_quaternion_cov(obj);
-                case 62
-                    message = msg_nav_controller_output(obj);
-                case 63
-                    message = msg_global_position_int_cov(obj);
-                case 64
-                    message = msg_local_position_ned_cov(obj);
-                case 65
-                    message = msg_rc_channels(obj);
-                case 66
-                    message = msg_request_data_stream(obj);
-                case 67
-                    message = msg_data_stream(obj);
-                case 69
-                    message = msg_manual_control(obj);
-                case 70
-                    message = msg_rc_channels_override(obj);
-                case 73
-                    message = msg_mission_item_int(obj);
-                case 74
-                    message = msg_vfr_hud(obj);
-                case 75
-                    message = msg_command_int(obj);
-                case 76
-                    message = msg_command_long(obj);
-                case 77
-                    message = msg_command_ack(obj);
-                case 81
-                    message = msg_manual_setpoint(obj);
-                case 82
-                    message = msg_set_attitude_target(obj);
-                case 83
-                    message = msg_attitude_target(obj);
-                case 84
-                    message = msg_set_position_target_local_ned(obj);
-                case 85
-                    message = msg_position_target_local_ned(obj);
-                case 86
-                    message = msg_set_position_target_global_int(obj);
-                case 87
-                    message = msg_position_target_global_int(obj);
-                case 89
-                    message = msg_local_position_ned_system_global_offset(obj);
-                case 90
-                    message = msg_hil_state(obj);
-                case 91
-                    message = msg_hil_controls(obj);
-                case 92
-                    message = msg_hil_rc_inputs_raw(obj);
-                case 93
-                    message = msg_hil_actuator_controls(obj);
-                case 100
-                    message = msg_optical_flow(obj);
-                case 101
-                    message = msg_global_vision_position_estimate(obj);
-                case 102
-                    message = msg_vision_position_estimate(obj);
-                case 103
-                    message = msg_vision_speed_estimate(obj);
-                case 104
-                    message = msg_vicon_position_estimate(obj);
-                case 105
-                    message = msg_highres_imu(obj);
-                case 106
-                    message = msg_optical_flow_rad(obj);
-                case 107
-                    message = msg_hil_sensor(obj);
-                case 108
-                    message = msg_sim_state(obj);
-                case 109
-                    message = msg_radio_status(obj);
-                case 110
-                    message = msg_file_transfer_protocol(obj);
-                case 111
-                    message = msg_timesync(obj);
-                case 112
-                    message = msg_camera_trigger(obj);
-                case 113
-                    message = msg_hil_gps(obj);
-                case 114
-                    message = msg_hil_optical_flow(obj);
-                case 115
-                    message = msg_hil_state_quaternion(obj);
-                case 116
-                    message = msg_scaled_imu2(obj);
-                case 117
-                    message = msg_log_request_list(obj);
-                case 118
-                    message = msg_log_entry(obj);
-                case 119
-                    message = msg_log_request_data(obj);
-                case 120
-                    message = msg_log_data(obj);
-                case 121
-                    message = msg_log_erase(obj);
-                case 122
-                    message = msg_log_request_end(obj);
-                case 123
-                    message = msg_gps_inject_data(obj);
-                case 124
-                    message = msg_gps2_raw(obj);
-                case 125
-                    message = msg_power_status(obj);
-                case 126
-                    message = msg_serial_control(obj);
-                case 127
-                    message = msg_gps_rtk(obj);
-                case 128
-                    message = msg_gps2_rtk(obj);
-                case 129
-                    message = msg_scaled_imu3(obj);
-                case 130
-                    message = msg_data_transmission_handshake(obj);
-                case 131
-                    message = msg_encapsulated_data(obj);
-                case 132
-                    message = msg_distance_sensor(obj);
-                case 133
-                    message = msg_terrain_request(obj);
-                case 134
-                    message = msg_terrain_data(obj);
-                case 135
-                    message = msg_terrain_check(obj);
-                case 136
-                    message = msg_terrain_report(obj);
-                case 137
-                    message = msg_scaled_pressure2(obj);
-                case 138
-                    message = msg_att_pos_mocap(obj);
-                case 139
-                    message = msg_set_actuator_control_target(obj);
-                case 140
-                    message = msg_actuator_control_target(obj);
-                case 141
-                    message = msg_altitude(obj);
-                case 142
-                    message = msg_resource_request(obj);
-                case 143
-                    message = msg_scaled_pressure3(obj);
-                case 144
-                    message = msg_follow_target(obj);
-                case 146
-                    message = msg_control_system_state(obj);
-                case 147
-                    message = msg_battery_status(obj);
-                case 148
-                    message = msg_autopilot_version(obj);
-                case 149
-                    message = msg_landing_target(obj);
-                case 230
-                    message = msg_estimator_status(obj);
-                case 231
-                    message = msg_wind_cov(obj);
-                case 232
-                    message = msg_gps_input(obj);
-                case 233
-                    message = msg_gps_rtcm_data(obj);
-                case 234
-                    message = msg_high_latency(obj);
-                case 241
-                    message = msg_vibration(obj);
-                case 242
-                    message = msg_home_position(obj);
-                case 243
-                    message = msg_set_home_position(obj);
-                case 244
-                    message = msg_message_interval(obj);
-                case 245
-                    message = msg_extended_sys_state(obj);
-                case 246
-                    message = msg_adsb_vehicle(obj);
-                case 247
-                    message = msg_collision(obj);
-                case 248
-                    message = msg_v2_extension(obj);
-                case 249
-                    message = msg_memory_vect(obj);
-                case 250
-                    message = msg_debug_vect(obj);
-                case 251
-                    message = msg_named_value_float(obj);
-                case 252
-                    message = msg_named_value_int(obj);
-                case 253
-                    message = msg_statustext(obj);
-                case 254
-                    message = msg_debug(obj);
-                case 256
-                    message = msg_setup_signing(obj);
-                case 257
-                    message = msg_button_change(obj);
-                case 258
-                    message = msg_play_tune(obj);
-                case 259
-                    message = msg_camera_information(obj);
-                case 260
-                    message = msg_camera_settings(obj);
-                case 261
-                    message = msg_storage_information(obj);
-                case 262
-                    message = msg_camera_capture_status(obj);
-                case 263
-                    message = msg_camera_image_captured(obj);
-                case 264
-                    message = msg_flight_information(obj);
-                case 265
-                    message = msg_mount_orientation(obj);
-                case 266
-                    message = msg_logging_data(obj);
-                case 267
-                    message = msg_logging_data_acked(obj);
-                case 268
-                    message = msg_logging_ack(obj);
-                otherwise
-                    MAVLink.throwUnsupportedMessageError(obj.msgid);
+            constructor = obj.MESSAGE_CONSTRUCTORS{double(obj.msgid) + 1};
+            if isempty(constructor)
+                message = [];
+                MAVLink.stats.incrementPacketsSkipped();
+            else
+                message = constructor(obj);
             end
         end
 
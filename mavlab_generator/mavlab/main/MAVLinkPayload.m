@@ -66,6 +66,25 @@ classdef MAVLinkPayload < MAVLinkHandle
             end
         end
         
+        function reset(obj, payloadLength)
+        %RESET: Empty the payload so that it can be reused for a payload of another length
+        %Description:
+        %    Keeps the bytebuffer when it is large enough for the new length, otherwise replaces it
+        %    with one of MAX_PAYLOAD_SIZE bytes, so a reused payload is only ever grown once.
+        %Arguments:
+        %    payloadLength(int): The length of the new payload
+            if payloadLength > obj.MAX_PAYLOAD_SIZE
+                MAVLink.throwCustomError('Payload length has been capped to 255 bytes');
+                payloadLength = obj.MAX_PAYLOAD_SIZE;
+            end
+            if numel(obj.byteBuffer) < payloadLength
+                obj.byteBuffer = zeros(obj.MAX_PAYLOAD_SIZE,1,'uint8');
+            end
+            obj.length = payloadLength;
+            obj.index = 1;
+            obj.isFull = 0;
+        end
+        
         function resetIndex(obj)
         %RESETINDEX: Reset the buffer index
             obj.index = 1;
@@ -80,7 +99,28 @@ classdef MAVLinkPayload < MAVLinkHandle
         
         function byteBuffer = getByteBuffer(obj)
         %GETBYTEBUFFER: Returns the contents of the bytebuffer
-            byteBuffer = obj.byteBuffer;
+            if numel(obj.byteBuffer) == obj.length
+                byteBuffer = obj.byteBuffer;
+            else
+                byteBuffer = obj.byteBuffer(1:obj.length);
+            end
+        end
+        
+        function setByteBuffer(obj, byteBuffer)
+        %SETBYTEBUFFER: Replace the contents of the bytebuffer in a single step
+        %Arguments:
+        %    byteBuffer(uint8): Array of bytes which must be the same length as the payload
+            if isa(byteBuffer,'uint8')
+                if numel(byteBuffer) == obj.length
+                    obj.byteBuffer(1:obj.length) = byteBuffer(:);
+                    obj.isFull = 1;
+                    obj.resetIndex();
+                else
+                    MAVLink.throwIndexError();
+                end
+            else
+                MAVLink.throwTypeError('byteBuffer','uint8');
+            end
         end
         
         function length = getLength(obj)
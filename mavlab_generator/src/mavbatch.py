@@ -0,0 +1,144 @@
+'''
+Created on 18 Oct 2026
+
+Encoding of many messages back to back into one reusable send buffer, written with a single call
+'''
+
+import struct
+from binascii import crc_hqx
+
+from mavpacket import MAVLinkError, STX, HEADER_LEN, CHECKSUM_LEN, SYSID, COMPID
+from mavparser import REVERSED_BITS, reversed_extras
+from mavcrc import CRC_INIT_VALUE
+
+#Initial size of the send buffer in bytes, the buffer is doubled when a batch does not fit
+BATCH_CAPACITY = 4096
+
+_header = struct.Struct('<BBBBBB')
+
+
+class MAVLinkBatch(object):
+
+    """
+    Encodes messages given as (msgid, fields) back to back into one send buffer, numbering the
+    frames with the sequence of the batch, so that a burst of messages is sent with a single write.
+    No message objects are created, the fields are packed straight into the buffer, and the
+    checksums of the frames added by a call to encode are calculated over a single bit reversed
+    copy of them, as the parser does. The buffer is kept and reused after every flush.
+
+    Parameters
+    ----------
+    messages: sequence of MAVLinkMessage subclasses
+        Dispatch list of message classes indexed by message ID, None where the ID is not defined
+    sysid: integer
+        ID of the sending system (default = SYSID)
+    compid: integer
+        ID of the sending component (default = COMPID)
+    capacity: integer
+        Initial size of the send buffer in bytes (default = BATCH_CAPACITY)
+    ----------
+
+    """
+
+    def __init__(self, messages, sysid=SYSID, compid=COMPID, capacity=BATCH_CAPACITY):
+        self.messages = list(messages) + [None] * (256 - len(messages))
+        self.extras = reversed_extras([0 if message is None else message.CRC_EXTRA for message in self.messages])
+        self.sysid = sysid
+        self.compid = compid
+        self.buffer = bytearray(max(capacity, 1))
+        self.size = 0
+        self.seq = 0
+
+    def __len__(self):
+        return self.size
+
+    def encode(self, items):
+
+        """
+        Append a frame for each message to the buffer, returning the number of frames added
+
+        Parameters
+        ----------
+        items: iterable of (integer, sequence) tuples
+            Message ID and field values of each message, in the order of the arguments of the
+            message class constructor with arrays as sequences
+        ----------
+
+        """
+
+        messages = self.messages
+        buffer = self.buffer
+        first = position = self.size
+        seq = self.seq
+        sysid = self.sysid
+        compid = self.compid
+        frames = []
+
+        for msgid, fields in items:
+            message = messages[msgid]
+            if message is None:
+                raise MAVLinkError('Message (ID = %d) is not defined' % msgid)
+
+            end = position + HEADER_LEN + message.LEN
+            while end + CHECKSUM_LEN > len(buffer):
+                buffer.extend(bytes(len(buffer)))
+            _header.pack_into(buffer, position, STX, message.LEN, seq, sysid, compid, msgid)
+            message.pack_into(buffer, position + HEADER_LEN, *fields)
+            frames.append((position, end, msgid))
+            position = end + CHECKSUM_LEN
+            seq = (seq + 1) & 0xff
+
+        #Checksum every frame of the batch from a single reversed copy of the frames
+        extras = self.extras
+        reversed_view = memoryview(buffer[first:position].translate(REVERSED_BITS))
+        for start, end, msgid in frames:
+            crc = crc_hqx(extras[msgid], crc_hqx(reversed_view[start - first + 1:end - first], CRC_INIT_VALUE))
+            buffer[end] = REVERSED_BITS[crc >> 8]
+            buffer[end + 1] = REVERSED_BITS[crc & 0xff]
+
+        self.size = position
+        self.seq = seq
+        return len(frames)
+
+    def getvalue(self):
+
+        """
+        Return a copy of the frames in the buffer
+
+        """
+
+        return bytes(self.buffer[:self.size])
+
+    def clear(self):
+
+        """
+        Empty the buffer without sending its frames, the sequence number is kept
+
+        """
+
+        self.size = 0
+
+    def flush(self, write):
+
+        """
+        Write every frame in the buffer with a single call and empty the buffer, returning the
+        number of bytes written. The data is a view of the buffer which is released after the call,
+        so write must copy or send it before it returns, as file and socket writes do.
+
+        Parameters
+        ----------
+        write: callable
+            Called once with the frames, such as the write method of a file or transport
+        ----------
+
+        """
+
+        size = self.size
+        if size:
+            view = memoryview(self.buffer)[:size]
+            try:
+                write(view)
+            finally:
+                view.release()
+        self.size = 0
+        return size
@@ -0,0 +1,191 @@
+'''
+Created on 18 Oct 2026
+
+Bulk decoding of raw MAVLINK logs into one NumPy structured array per message type
+'''
+
+import numpy as np
+
+from mavcrc import CRC_INIT_VALUE, CRC_TABLE
+from mavpacket import STX, HEADER_LEN, CHECKSUM_LEN
+
+#Length of the big-endian microsecond timestamp preceding every frame of a .tlog file
+TIMESTAMP_LEN = 8
+
+#Number of bytes gathered by a single indexing operation, bounding the size of the index array
+GATHER_BLOCK = 1 << 22
+
+_crc_table = np.array(CRC_TABLE, dtype=np.uint16)
+
+
+def frame_dtype(message, timestamps=True):
+
+    """
+    Return a structured dtype which overlays a whole frame of a message, so that the header and
+    payload fields of a block of frames can be read without copying
+
+    Parameters
+    ----------
+    message: MAVLinkMessage subclass
+        Generated message class providing LEN and DTYPE
+    timestamps: boolean
+        Frames are preceded by a .tlog timestamp (default = True)
+    ----------
+
+    """
+
+    payload = np.dtype(message.DTYPE)
+    prefix = TIMESTAMP_LEN if timestamps else 0
+
+    names = ['_seq', '_sysid', '_compid']
+    formats = ['u1', 'u1', 'u1']
+    offsets = [prefix + 2, prefix + 3, prefix + 4]
+    if timestamps:
+        names.insert(0, '_timestamp')
+        formats.insert(0, '>u8')
+        offsets.insert(0, 0)
+
+    for name in payload.names:
+        field, offset = payload.fields[name][:2]
+        names.append(name)
+        formats.append(field)
+        offsets.append(prefix + HEADER_LEN + offset)
+
+    return np.dtype({'names' : names, 'formats' : formats, 'offsets' : offsets,
+                     'itemsize' : prefix + HEADER_LEN + message.LEN + CHECKSUM_LEN})
+
+
+def checksum(columns, crc_extra):
+
+    """
+    Return the checksum of every row of a block of frames. The CRC is accumulated one byte
+    position at a time for all frames, reusing buffers so no temporaries are allocated.
+
+    Parameters
+    ----------
+    columns: 2D numpy array of uint8
+        Frames from the length byte to the end of the payload, one frame per row
+    crc_extra: integer
+        CRC_EXTRA of the message carried by the frames
+    ----------
+
+    """
+
+    crc = np.full(len(columns), CRC_INIT_VALUE, dtype=np.uint16)
+    index = np.empty(len(columns), dtype=np.uint16)
+    for column in range(columns.shape[1] + 1):
+        if column < columns.shape[1]:
+            np.bitwise_xor(crc, columns[:, column], out=index)
+        else:
+            np.bitwise_xor(crc, crc_extra, out=index)
+        index &= 0xff
+        crc >>= 8
+        crc ^= _crc_table.take(index)
+
+    return crc
+
+
+def find_frames(data, timestamps=True, lengths=None):
+
+    """
+    Return the positions of the STX byte of every complete frame in a buffer. Frames are chained
+    by their length byte, when the chain breaks the next STX after the expected position is used.
+
+    Parameters
+    ----------
+    data: numpy array of uint8
+        Raw log contents
+    timestamps: boolean
+        Frames are preceded by a .tlog timestamp (default = True)
+    lengths: numpy array of integers
+        Payload length of every message ID, -1 for unknown IDs. STX bytes whose header does not
+        match are ignored so that the chain resynchronizes on real frames (default = None)
+    ----------
+
+    """
+
+    prefix = TIMESTAMP_LEN if timestamps else 0
+    size = len(data)
+
+    stx = np.flatnonzero(data == STX)
+    stx = stx[(stx >= prefix) & (stx + HEADER_LEN <= size)]
+    if lengths is not None:
+        stx = stx[lengths[data[stx + 5]] == data[stx + 1]]
+    ends = stx + (HEADER_LEN + CHECKSUM_LEN) + data[stx + 1]
+
+    #Index of the first candidate at or after the position where the following frame should start,
+    #with an extra entry for the end of the buffer which leads back to itself
+    count = len(stx)
+    jump = np.append(np.searchsorted(stx, ends + prefix), count)
+
+    #Mark every candidate reached by following the chain from the first one. Jumps are doubled each
+    #pass so that after n passes every candidate within 2**n frames of the start is marked.
+    on_chain = np.zeros(count + 1, dtype=bool)
+    on_chain[0] = True
+    while jump[0] != count:
+        on_chain[jump[on_chain]] = True
+        jump = jump[jump]
+
+    chain = np.flatnonzero(on_chain[:count])
+    return stx[chain[ends[chain] <= size]]
+
+
+def decode_frames(buf, messages, timestamps=True):
+
+    """
+    Decode every frame of a raw buffer into one structured array per message name. Frames of
+    unknown messages, with an unexpected length or with an invalid checksum are discarded.
+
+    Parameters
+    ----------
+    buf: bytes-like or numpy array
+        Raw log contents
+    messages: list of MAVLinkMessage subclasses
+        Dispatch list of message classes indexed by message ID
+    timestamps: boolean
+        Frames are preceded by a .tlog timestamp (default = True)
+    ----------
+
+    """
+
+    data = np.frombuffer(buf, dtype=np.uint8)
+    prefix = TIMESTAMP_LEN if timestamps else 0
+
+    lengths = np.array([-1 if message is None else message.LEN for message in messages], dtype=np.intp)
+    positions = find_frames(data, timestamps, lengths)
+    msgids = data[positions + 5]
+
+    #Group the frames by message ID, keeping each group in log order
+    order = np.argsort(msgids, kind='stable')
+    positions = positions[order]
+    msgids = msgids[order]
+    bounds = np.flatnonzero(np.diff(msgids)) + 1
+
+    result = {}
+    for group in np.split(np.arange(len(positions)), bounds):
+        if len(group) == 0:
+            continue
+
+        message = messages[msgids[group[0]]]
+        if message is None:
+            continue
+
+        group_positions = positions[group]
+
+        #Gather the frames in blocks into an array overlaid by the frame dtype
+        dtype = frame_dtype(message, timestamps)
+        frames = np.empty(len(group_positions), dtype=dtype)
+        columns = frames.view(np.uint8).reshape(len(frames), dtype.itemsize)
+        offsets = np.arange(dtype.itemsize)
+        block = max(1, GATHER_BLOCK // dtype.itemsize)
+        for first in range(0, len(frames), block):
+            start = group_positions[first:first + block] - prefix
+            columns[first:first + block] = data[start[:, None] + offsets]
+
+        #Checksum every frame at once, one byte position at a time
+        crc = checksum(columns[:, prefix + 1:prefix + HEADER_LEN + message.LEN], message.CRC_EXTRA)
+        received = columns[:, -2] | (columns[:, -1].astype(np.uint16) << 8)
+
+        result[message.NAME] = frames[crc == received]
+
+    return result
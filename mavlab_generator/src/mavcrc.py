@@ -0,0 +1,125 @@
+'''
+Created on 18 Oct 2026
+
+Table driven CRC-16/X.25 engine used by MAVLINK for CRC_EXTRA and frame checksums
+'''
+
+#CRC-16/X.25 (MCRF4XX) constants as used by MAVLINK
+CRC_INIT_VALUE = 0xffff
+CRC_POLYNOMIAL = 0x8408
+
+
+def _build_table():
+
+    """
+    Build the 256 entry lookup table for the reflected X.25 polynomial
+
+    """
+
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ CRC_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+
+    return tuple(table)
+
+CRC_TABLE = _build_table()
+
+
+def accumulate(crc, buf):
+
+    """
+    Accumulate bytes into a CRC using the precomputed lookup table
+
+    Parameters
+    ----------
+    crc: integer
+        The CRC which bytes are being accumulated in to
+    buf: bytes, bytearray, memoryview or string
+        Buffer containing bytes to be accumulated. Strings are encoded as latin-1 so that
+        every character maps on to exactly one byte
+    ----------
+
+    """
+
+    if isinstance(buf, str):
+        buf = buf.encode('latin-1')
+
+    #Iterating over a bytes-like object yields integers directly
+    table = CRC_TABLE
+    for byte in buf:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
+
+    return crc
+
+
+def x25crc(buf, crc=CRC_INIT_VALUE):
+
+    """
+    Calculate the X.25 checksum of a whole buffer
+
+    Parameters
+    ----------
+    buf: bytes, bytearray, memoryview or string
+        Buffer containing the bytes to be checksummed
+    crc: integer
+        Initial CRC value (default = 0xffff)
+    ----------
+
+    """
+
+    return accumulate(crc, buf)
+
+
+def crc_extra(name, fields):
+
+    """
+    Calculate the CRC_EXTRA seed byte of a message in a single pass
+
+    Parameters
+    ----------
+    name: string
+        Name of the message as it appears in the XML definition
+    fields: list of tuples
+        (type, name, array_size) of every field in wire order. The type must be the XML
+        C type with any '_mavlink_version' suffix removed
+    ----------
+
+    """
+
+    #Build the whole signature first so the table only has to be walked once
+    signature = [name.upper(), ' ']
+    for field_type, field_name, array_size in fields:
+        signature.append(field_type)
+        signature.append(' ')
+        signature.append(field_name)
+        signature.append(' ')
+        if array_size > 1:
+            signature.append(chr(array_size))
+
+    crc = accumulate(CRC_INIT_VALUE, ''.join(signature))
+    return (crc & 0xff) ^ (crc >> 8)
+
+
+def frame_crc(header_payload, crc_extra_byte):
+
+    """
+    Calculate the checksum of a MAVLINK frame
+
+    Parameters
+    ----------
+    header_payload: bytes-like
+        The frame from the length byte to the end of the payload (STX excluded)
+    crc_extra_byte: integer
+        CRC_EXTRA of the message carried by the frame
+    ----------
+
+    """
+
+    crc = accumulate(CRC_INIT_VALUE, header_payload)
+    return (crc >> 8) ^ CRC_TABLE[(crc ^ crc_extra_byte) & 0xff]
@@ -4,17 +4,78 @@ Created on 23 Jun 2017
 @author: Samuel
 '''
 
-#Import the ElementTree XML module using the C implementation if available 
-try:
-    import xml.etree.cElementTree as ET
-except ImportError:
-    import xml.etree.ElementTree as ET
-    
 #Import modules needed for file system
 import os
-import array
-from os.path import basename
+import sys
+import argparse
+import cProfile
 from shutil import copyfile
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import mavcrc
+import mavschema
+import mavprofile
+import mavtemplate
+import mavtiming
+import mavgen_python
+from mavoutput import Manifest, OutputFile, hash_text, hash_record
+
+#Ways in which message classes can pack and unpack their payloads, and the template of each
+EMISSION_MODES = ('accessor', 'typecast')
+MESSAGE_TEMPLATES = {'accessor' : 'message_template.txt', 'typecast' : 'message_typecast_template.txt'}
+
+#Template of the unchecked encoder generated next to each message class when requested
+UNCHECKED_TEMPLATE = 'message_unchecked_template.txt'
+
+#Folder containing the master copies of the fixed classes
+MASTER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'master')
+
+class SerialExecutor(object):
+    
+    """
+    Executor with the interface of a ProcessPoolExecutor which runs each task immediately in the
+    current process. Used when generating with a single job.
+    
+    """
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+    
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def map(self, fn, *iterables, **kwargs):
+        return map(fn, *iterables)
+    
+    
+def create_executor(jobs=None):
+    
+    """
+    Create the executor used to spread generation over worker processes
+    
+    Parameters
+    ----------
+    jobs: integer
+        Number of worker processes (default = None, one per CPU)
+    ----------
+    
+    """
+    
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+        
+    if jobs <= 1:
+        return SerialExecutor()
+    return ProcessPoolExecutor(max_workers=jobs)
+
 
 def accumulate(crc, buf):
     
@@ -31,317 +92,122 @@ def accumulate(crc, buf):
     
     """        
     
-    byte_array = array.array('B')
-    if isinstance(buf, array.array):
-        byte_array.extend(buf)
+    return mavcrc.accumulate(crc, buf)
+
+
+def matlab_type(xml_type):
+    
+    """
+    Return the MATLAB type of an XML field type, removing the trailing _t and replacing char with
+    uint8 and float with single
+    
+    """
+    
+    field_type = xml_type.split('_')[0]
+    if field_type == 'char':
+        return 'uint8'
+    if field_type == 'float':
+        return 'single'
+    return field_type
+
+
+#MATLAB type of each XML field type, looked up once per field when building the schema
+MATLAB_TYPES = {xml_type : matlab_type(xml_type) for xml_type in mavschema.TYPE_SIZE}
+
+
+def message_schema(message):
+    
+    """
+    Convert a compiled message into the schema used by the message class templates, with MATLAB
+    field types and the range of payload bytes occupied by each field
+    
+    Parameters
+    ----------
+    message: mavschema.Message
+        Compiled message definition
+    ----------
+    
+    """
+    
+    fields = []
+    for field in message.fields:
+        field_type = MATLAB_TYPES[field.type]
+        fields.append({'type' : field_type,
+                       'typeUpper' : field_type.upper(),
+                       'name' : field.name,
+                       'desc' : field.description.strip().replace('\n',' ') or 'No description available',
+                       'size' : field.array_length,
+                       'first' : field.offset + 1,
+                       'last' : field.offset + mavschema.TYPE_SIZE[field.type] * field.array_length})
+    
+    #Get message description if available
+    if message.description != None:
+        desc = message.description.strip().replace('\n',' ')
     else:
-        byte_array.fromstring(buf)
-        
-    for byte in byte_array:
-        tmp = byte ^ (crc & 0xff)
-        tmp = (tmp ^ (tmp<<4)) & 0xff
-        crc = ((crc>>8) & 0xff) ^ (tmp<<8) ^ (tmp<<3) ^ ((tmp>>4) & 0xf)
-        
-    return crc
+        desc = 'No description available'
+        
+    return {'msgid' : message.id,
+            'name' : message.name.lower(),
+            'nameUpper' : message.name.upper(),
+            'desc' : desc,
+            'msglen' : message.length,
+            'crc' : message.crc_extra,
+            'orderedFields' : fields,
+            'firstFieldName' : fields[0]['name'],
+            'numFields' : len(fields)}
 
 
-def generate_class_from_msg(msg_path, msg):
+def generate_class_from_msg(msg_path, message, emission='accessor', unchecked=False):
     
     """
-    Generate a MATLAB class from an XML message definition
+    Generate a MATLAB class from a compiled message definition, and its unchecked encoder class
+    when requested
     
     Parameters
     ----------
     msg_path: string
         Path to the generation location for the message class
-    msg: XML Element
-        Message element to be parsed and converted
+    message: mavschema.Message
+        Compiled message definition to be converted
+    emission: string
+        How the payload is packed and unpacked, one of EMISSION_MODES (default = 'accessor')
+    unchecked: boolean
+        Also generate the fast_ class encoding typed fields without validation (default = False)
     ----------
     
     """
     
-    #Get top level message attributes
-    msgid = msg.attrib.get('id')
-    name = str.lower(msg.attrib.get('name'))
-    class_name = 'msg_' + name
+    schema = message_schema(message)
+    template = mavtemplate.load_template(MESSAGE_TEMPLATES[emission])
+    with OutputFile('%s/msg_%s.m' % (msg_path, message.name.lower())) as fo:
+        fo.write(template.render(schema))
     
-    #Create the message class file and generate MATLAB code
-    with open('%s/%s.m' % (msg_path, class_name), 'w') as fo:
-        
-        #Get message description if available
-        if msg.find('description') != None:
-            desc = msg.find('description').text.replace('\n',' ')
-        else:
-            desc = "None"
-            
-        #Generate the class header and summary
-        fo.write('''\
-\
-classdef %s < mavlink_message
-    %%MAVLINK Message Class
-    %%Name: %s\tID: %s
-    %%Description: %s
-\
-        ''' % (class_name, name, msgid, desc))
-        
-        #Look-up dictionaries
-        type_size = {'double' : 8, 'int64_t' : 8, 'uint64_t': 8, 'int32_t' : 4, 'uint32_t': 4,
-                      'float' : 4, 'int16_t' : 2, 'uint16_t': 2, 'int8_t' : 1, 'uint8_t': 1,
-                      'char' : 1, 'uint8_t_mavlink_version' : 1}
-        
-        sort_mapping = {'double' : 0, 'int64_t' : 0, 'uint64_t': 0, 'int32_t' : 1, 'uint32_t': 1,
-                      'float' : 1, 'int16_t' : 3, 'uint16_t': 3, 'int8_t' : 4, 'uint8_t' : 4,
-                      'char' : 4, 'uint8_t_mavlink_version' : 4}
-            
-        #Get message fields
-        fields = []
-        msglen = 0;
+    if unchecked:
+        template = mavtemplate.load_template(UNCHECKED_TEMPLATE)
+        with OutputFile('%s/fast_%s.m' % (msg_path, message.name.lower())) as fo:
+            fo.write(template.render(schema))
         
-        for field in msg.findall('field'):
-            
-            field_type = field.attrib.get('type').split('[')[0]
-            if '[' in field.attrib.get('type'):
-                array_size = int(field.attrib.get('type').split('[')[1].split(']')[0])
-            else:
-                array_size = 1
-                
-            if field_type == 'uint8_t_mavlink_version':
-                field_type = 'uint8_t'
-                
-            msglen += type_size[field_type]*array_size
-            
-            fields.append({'type' : field_type, 
-                           'name' : field.attrib.get('name'), 
-                           'desc' : field.text.replace('\n',' '),
-                           'size' : array_size})
-            
-        #Sort message fields
-        fields.sort(key = lambda k: sort_mapping[k['type']])
-        
-        #Calculate the XML checksum for this message using original XML
-        crc = 0xffff
-        crc = accumulate(crc,name.upper() + ' ')
-        
-        for field in fields:            
-            crc = accumulate(crc,field['type'] + ' ')
-            crc = accumulate(crc,field['name'] + ' ')
-            if field['size'] > 1:
-                crc = accumulate(crc,chr(field['size']))
-              
-        crc = (crc&0xFF) ^ (crc>>8)
-        
-        #Re-format field strings
-        for field in fields:
-            field['type'] = field['type'].split('_')[0]
-            field['name'] = field['name'].lower()
-        
-            if field['type'] == 'char':
-                field['type'] = 'uint8'
-                
-            if field['type'] == 'float':
-                field['type'] = 'single'
-        
-        #Generate class properties
-        fo.write('''\
+    #Return a parsed message
+    return parsed_message(message)
     
-    properties(Constant)
-        ID = %s
-        LEN = %s
-    end
+
+def parsed_message(message):
     
-    properties\
-    \
-    ''' % (msgid, msglen))
-        
-        #Insert a variable per field
-        for field in fields:
-            if field['size'] == 1:
-                fo.write('\n\t\t%s\t%%%s (%s)' % (field['name'], field['desc'], field['type']))
-            else:
-                fo.write('\n\t\t%s\t%%%s (%s[%s])' % (field['name'], field['desc'], field['type'], field['size']))
-        fo.write('\n\tend\n')
-        
-        #Generate class constructors
-        fo.write('''\
+    """
+    Return the dictionary of a compiled message used to build the packet and CRC classes
     
-    methods
-        
-        %%Constructor: %s
-        %%packet should be a fully constructed MAVLINK packet\
-        \
-        ''' % class_name)
-        
-        fo.write('\n\t\tfunction obj = %s(packet' % class_name)
-        for field in fields:
-            fo.write(',%s' % field['name'])
-        fo.write(')')
-        
-        fo.write('''
-        
-            obj.msgid = obj.ID;
-            obj.sysid = mavlink.SYSID;
-            obj.compid = mavlink.COMPID;
-
-            if nargin == 1
-            
-                if isa(packet,'mavlink_packet')
-                    obj.sysid = packet.sysid;
-                    obj.compid = packet.compid;
-                    obj.unpack(packet.payload);
-                else
-                    mavlink.throwTypeError('packet','mavlink_packet');
-                end
-                
-            elseif nargin == %s
-        \
-        ''' % str(len(fields)+1))
-        
-        for field in fields:
-            fo.write('\n\t\t\t\tobj.%s = %s;' % (field['name'],field['name']))
-            
-        fo.write('''
-        
-            elseif nargin ~= 0
-                mavlink.throwCustomError('The number of constructor arguments is not valid');
-            end
-        
-        end
-        \
-        ''')
-        
-        #Generate message pack function
-        fo.write('''\
-        
-        %%Function: Packs this MAVLINK message into a packet for transmission
-        function packet = pack(obj)
-        
-            errorField = obj.verify();
-            if errorField == 0
-        
-                packet = mavlink_packet(%s.LEN);
-                packet.sysid = mavlink.SYSID;
-                packet.compid = mavlink.COMPID;
-                packet.msgid = %s.ID;
-        \
-        ''' % (class_name, class_name))
-        
-        for field in fields:
-            
-            if field['size'] > 1:
-                fo.write('''\
-            
-                for i = 1:%s
-                    packet.payload.put%s(obj.%s(i));
-                end
-                \
-                ''' % (field['size'], field['type'].upper(), field['name']))
-            else:
-                fo.write('\n\t\t\t\tpacket.payload.put%s(obj.%s);\n' % (field['type'].upper(), field['name']))
-        
-        fo.write('''\
-        
-            else
-                packet = [];
-                mavlink.throwPackingError(errorField);
-            end
-            
-        end
-        \
-        ''')
-        
-        #Generate message unpack function
-        fo.write('''\
-        
-        %Function: Unpacks a MAVLINK payload and stores the data in this message
-        function unpack(obj, payload)
-        
-            payload.resetIndex();
-        ''')
-        
-        for field in fields:
-            
-            if field['size'] > 1:
-                fo.write('''\
-            
-            for i = 1:%s
-                obj.%s(i) = payload.get%s();
-            end
-            \
-                ''' % (field['size'], field['name'], field['type'].upper()))
-            else:
-                fo.write('\n\t\t\tobj.%s = payload.get%s();\n' % (field['name'], field['type'].upper()))
-                
-        fo.write('\n\t\tend\n')
-        
-        #Generate verification function
-        fo.write('''\
-        
-        %Function: Returns either 0 or the name of the first encountered empty field.
-        function result = verify(obj)
-        \
-        ''')
-        
-        for i in range(0,len(fields)):
-            field = fields[i]
-            if i == 0:
-                fo.write('''\
-            
-            if size(obj.%s,2) ~= %s
-                result = '%s';\
-            \
-                ''' % (field['name'], field['size'], field['name']))
-            else:
-                fo.write('''\
-            
-            elseif size(obj.%s,2) ~= %s
-                result = '%s';\
-            \
-                '''% (field['name'], field['size'], field['name']))
-                
-        fo.write('''
-            else
-                result = 0;
-            end
-            
-        end
-            \
-        ''')
-        
-        #Generate setters for integer message fields
-        for field in fields:
-            
-            if field['type'] == 'double' or field['type'] == 'single':
-                fo.write('''\
-        
-        function set.%s(obj,value)
-            obj.%s = %s(value);
-        end
-        \
-                ''' % (field['name'], field['name'], field['type']))        
-            
-            else:
-                
-                fo.write('''\
-            
-        function set.%s(obj,value)
-            if value == %s(value)
-                obj.%s = %s(value);
-            else
-                mavlink.throwTypeError('value','%s');
-            end
-        end
-        \
-                ''' % (field['name'], field['type'], field['name'], field['type'], field['type']))
-        
-        #End of class
-        fo.write('\n\tend\nend')
-        
-        #Return a parsed message
-        parsed_msg = {'name' : name, 'msgid' : msgid, 'crc' : crc}
-        return parsed_msg
+    Parameters
+    ----------
+    message: mavschema.Message
+        Compiled message definition
+    ----------
+    
+    """
     
+    return {'name' : message.name.lower(), 'msgid' : message.id, 'len' : message.length, 'crc' : message.crc_extra}
+
 
-def generate_enum_class(message_path, xml_name, enum_list):
+def generate_enum_class(message_path, xml_name, enum_list, manifest=None):
     
     """
     Generate a class to store all enumerators in the current XML file
@@ -352,46 +218,49 @@ def generate_enum_class(message_path, xml_name, enum_list):
         Path to the generation location for the enumerator class
     xml_name: string
         Name of the current MAVLINK XML being parsed
-    enum_list: XML elements
-        List of enumerators from the XML file
+    enum_list: mavschema.Enum list
+        List of compiled enums from the XML file
+    manifest: Manifest
+        Manifest used to skip the file if it is unchanged (default = None)
     ----------
     
     """
     
-    with open('%s/%s.m' % (message_path, xml_name), 'w') as fo:
+    #Every entry of every enum is an enumerator of the class
+    entries = [{'name' : entry.name.upper(), 'value' : entry.value,
+                'desc' : (entry.description or '').strip().replace('\n',' ') or 'No description available'}
+               for enum in enum_list for entry in enum.entries]
+    
+    template = mavtemplate.load_template('enum_template.txt')
+    with OutputFile('%s/%s.m' % (message_path, xml_name), manifest) as fo:
+        fo.write(template.render({'xmlName' : xml_name, 'xmlNameUpper' : xml_name.upper(), 'enum' : entries}))
         
-        fo.write('''\
-\
-classdef %s < uint16
-    %%MAVLINK Enumeration Class
-    %%Contains enumerators for the %s MAVLINK XML file
-            
-    enumeration\
-\
-        ''' % (xml_name, xml_name))
         
-        for enum in enum_list.findall('enum'):
-            enum_counter = 0
-            for entry in enum.findall('entry'):
-            
-                name = entry.attrib.get('name').upper()
-                value = entry.attrib.get('value')
-                
-                if value == None:
-                    value = enum_counter
-                    enum_counter += 1
-            
-                if entry.find('description') != None:
-                    desc = entry.find('description').text
-                else:
-                    desc = "None"
-                    
-                fo.write('\n\t\t%s (%s) %%%s' % (name, value, desc))
+def dispatch_list(parsed_msg_list):
+    
+    """
+    Return a dense list of parsed messages indexed by message ID, None where the ID is not defined.
+    The first definition of each message ID is used and IDs which do not fit in a MAVLINK 1 frame
+    are left out.
+    
+    Parameters
+    ----------
+    parsed_msg_list: dictionary list
+        List of parsed MAVLINK messages
+    ----------
+    
+    """
+    
+    dispatch = [None] * 256
+    for parsed_msg in parsed_msg_list:
+        msgid = int(parsed_msg['msgid'])
+        if msgid <= 255 and dispatch[msgid] is None:
+            dispatch[msgid] = parsed_msg
             
-        fo.write('\n\tend\n\nend')
-        
-        
-def generate_packet_class(main_path, parsed_msg_list):
+    return dispatch
+
+
+def generate_packet_class(main_path, parsed_msg_list, manifest=None):
     
     """
     Generate the MAVLINK packet class
@@ -402,108 +271,20 @@ def generate_packet_class(main_path, parsed_msg_list):
         Path to the generation location for main classes
     parsed_msg_list: dictionary list
         List of parsed MAVLINK messages
+    manifest: Manifest
+        Manifest used to skip the file if it is unchanged (default = None)
     """
     
-    with open('%s/mavlink_packet.m' % main_path, 'w') as fo:
-        
-        fo.write('''\
-\
-classdef mavlink_packet < handle
-    %%MAVLINK_PACKET Class
-    %%Used to encode and decode MAVLINK packets
-    
-    %%Constant public variables
-    properties(Constant)
-        STX = 254;  %The 'magic' byte
-    end
-    
-    %%Private variables
-    properties
-        len;        %%Length of the packet payload
-        seq;        %%Sequence number of the current packet
-        sysid;      %%ID of the sending system
-        compid;     %%ID of the sending component
-        msgid;      %%ID of the message type contained in the payload
-        payload;    %%The packet payload
-        crc;        %%The crc object for this packet
-    end
-    
-    %%Publically accessible object variables
-    methods
-        
-        %%Constructor: mavlink_packet
-        %%payloadLength should be an integer between 0 and MAX_PAYLOAD_SIZE
-        function obj = mavlink_packet(payloadLength)
-            obj.len = payloadLength;
-            obj.payload = mavlink_payload(payloadLength);
-        end
-        
-        %%Function: Generate the CRC checksum for the packet
-        function generateCRC(obj)   
-            if isempty(obj.crc)
-                obj.crc = mavlink_crc();
-            else
-                obj.crc.start_checksum();
-            end
-            
-            obj.crc.updateChecksum(uint8(obj.len));
-            obj.crc.updateChecksum(uint8(obj.seq));
-            obj.crc.updateChecksum(uint8(obj.sysid));
-            obj.crc.updateChecksum(uint8(obj.compid));
-            obj.crc.updateChecksum(uint8(obj.msgid));
-            
-            obj.payload.resetIndex();
-            for i = 1:1:obj.payload.getLength()
-                obj.crc.updateChecksum(obj.payload.getUINT8());
-            end
-            obj.crc.finishChecksum(uint8(obj.msgid));
-        end
-        
-        %%Function: Encode the packet into a byte buffer for transmission
-        function byteBuffer = encode(obj)
-            obj.seq = 1;
-            obj.generateCRC();
-            byteBuffer = cat(1,uint8(obj.STX),uint8(obj.len),uint8(obj.seq),uint8(obj.sysid),...
-                uint8(obj.compid),uint8(obj.msgid),obj.payload.getByteBuffer(),obj.crc.getLSB(), obj.crc.getMSB());
-        end
-        
-        %%Getter: isPayloadFull
-        function fillStatus = isPayloadFull(obj)
-            fillStatus = obj.payload.isPayloadFull();
-        end
-        
-        %%Function: Unpack the payload and return the correct message type
-        function message = unpack(obj)
-            message = [];
-            switch obj.msgid\
-\
-        ''')
-        
-        for parsed_msg in parsed_msg_list:
-            fo.write('''
-                
-                case %s
-                    message = msg_%s(obj);\
-                \
-            ''' % (parsed_msg['msgid'], parsed_msg['name']))
-            
-        fo.write('''
-
-                otherwise
-                    mavlink.throwUnsupportedMessageError(obj.msgid);
-                    
-            end
-            
-        end
-        
-    end
+    dispatch = [{'handle' : '[]', 'len' : 0} if msg is None else
+                {'handle' : '@msg_%s' % msg['name'], 'len' : msg['len']}
+                for msg in dispatch_list(parsed_msg_list)]
     
-end
-\
-        ''')
+    template = mavtemplate.load_template('MAVLinkPacket_template.txt')
+    with OutputFile('%s/MAVLinkPacket.m' % main_path, manifest) as fo:
+        fo.write(template.render({'dispatch' : dispatch}))
         
 
-def copy_fixed_classes(main_path):
+def copy_fixed_classes(main_path, manifest=None):
     
     """
     Copy the fixed classes that do not generation into the main folder of MAVLAB
@@ -512,19 +293,27 @@ def copy_fixed_classes(main_path):
     ----------
     main_path: string
         Path to the generation location for main classes
+    manifest: Manifest
+        Manifest used to skip classes that are unchanged (default = None)
     ----------
     
     """
     
     #Copy fixed classes
-    copyfile('../master/mavlink_message_master.m','%s/mavlink_message.m' % main_path)
-    copyfile('../master/mavlink_payload_master.m','%s/mavlink_payload.m' % main_path)
-    copyfile('../master/mavlink_parser_master.m','%s/mavlink_parser.m' % main_path)
-    copyfile('../master/mavlink_stats_master.m','%s/mavlink_stats.m' % main_path)
-    copyfile('../master/mavlink_master.m','%s/mavlink.m' % main_path)
+    for class_name in ('MAVLinkHandle', 'MAVLinkMessage', 'MAVLinkPayload', 'MAVLinkParser', 'MAVLinkBatch', 'MAVLinkStats',
+                       'MAVLink'):
+        master = os.path.join(MASTER_PATH, '%s_master.m' % class_name)
+        filename = '%s/%s.m' % (main_path, class_name)
+        with open(master, 'r') as fi:
+            digest = hash_text(fi.read())
+        if manifest is None or not manifest.is_current(filename, digest):
+            copyfile(master, filename)
+        if manifest is not None:
+            manifest.record(filename, digest)
     
     
-def generate_message_classes(message_path, msg_list):
+def generate_message_classes(message_path, msg_list, manifest=None, executor=None, emission='accessor',
+                             unchecked=False):
     
     """
     Generate a MATLAB class for each message in the current XML file
@@ -533,24 +322,82 @@ def generate_message_classes(message_path, msg_list):
     ----------
     message_path: string
         Path to the generation location for message classes
-    msg_list: XML element list
-        List of message elements from the current XML file
+    msg_list: mavschema.Message list
+        List of compiled messages from the current XML file
+    manifest: Manifest
+        Manifest used to skip messages whose definition is unchanged (default = None)
+    executor: Executor
+        Executor used to generate the classes in parallel (default = None, generate serially)
+    emission: string
+        How the payload is packed and unpacked, one of EMISSION_MODES (default = 'accessor')
+    unchecked: boolean
+        Also generate the fast_ class of each message (default = False)
     ----------
     
     """
     
-    #Create an empty list for parsed messages
+    if executor is None:
+        executor = SerialExecutor()
+
+    #Classes depend on the text of the templates they are rendered from as well as the message, and
+    #hash_record also covers the generator version
+    template_digests = [mavtemplate.load_template(MESSAGE_TEMPLATES[emission]).digest]
+    if unchecked:
+        template_digests.append(mavtemplate.load_template(UNCHECKED_TEMPLATE).digest)
+
+    #Submit a task for each message that needs a new class
+    results = []
+    for message in msg_list:
+        filename = '%s/msg_%s.m' % (message_path, message.name.lower())
+        fast_filename = '%s/fast_%s.m' % (message_path, message.name.lower())
+        digest = hash_record([message, emission, unchecked, template_digests])
+        if manifest is not None and manifest.is_current(filename, digest) and (
+                not unchecked or manifest.is_current(fast_filename, digest)):
+            results.append(parsed_message(message))
+        else:
+            future = executor.submit(generate_class_from_msg, message_path, message, emission, unchecked)
+            results.append(future.result() if future.done() else future)
+        if manifest is not None:
+            manifest.record(filename, digest)
+            if unchecked:
+                manifest.record(fast_filename, digest)
+    
+    #Create an empty list for parsed messages, collecting results in the order of the message list
     parsed_msg_list = []
     
-    #Generate a class for each message entry
-    for msg in msg_list.findall('message'):
-        parsed_msg = generate_class_from_msg(message_path, msg)
-        parsed_msg_list.insert(int(parsed_msg['msgid']), parsed_msg)
+    for result in results:
+        if isinstance(result, Future):
+            result = result.result()
+        parsed_msg_list.append(result)
         
     return parsed_msg_list
 
 
-def generate_crc_class(main_path, parsed_msg_list):
+def generate_enum_task(message_path, xml_name, enum_list, manifest):
+    
+    """
+    Generate the enumeration class of a dialect in a worker process and return the manifest
+    entries that were recorded, so that they can be merged into the manifest of the main process
+    
+    Parameters
+    ----------
+    message_path: string
+        Path to the generation location for the enumerator class
+    xml_name: string
+        Name of the current MAVLINK XML being parsed
+    enum_list: mavschema.Enum list
+        List of compiled enums from the XML file
+    manifest: Manifest
+        Manifest used to skip the file if it is unchanged
+    ----------
+    
+    """
+    
+    generate_enum_class(message_path, xml_name, enum_list, manifest)
+    return manifest.current
+
+
+def generate_crc_class(main_path, parsed_msg_list, manifest=None):
     
     """
     Generate a MATLAB class to handle the checksum process
@@ -561,118 +408,95 @@ def generate_crc_class(main_path, parsed_msg_list):
         Path to the generation location for main classes
     parsed_msg_list: dictionary list
         List of parsed MAVLINK messages
+    manifest: Manifest
+        Manifest used to skip the file if it is unchanged (default = None)
     ----------
     
     """
     
-    #Sort parsed message list by message ID and initialise the CRC list
-    parsed_msg_list.sort(key = lambda k: int(k['msgid']))
-    crc_list = [0] * 255
+    #Place the CRC of each message at its message ID, next to the precomputed table used to
+    #accumulate one byte per lookup
+    crc_list = [{'value' : 0 if msg is None else msg['crc']} for msg in dispatch_list(parsed_msg_list)]
+    table = [{'value' : value} for value in mavcrc.CRC_TABLE]
     
-    for parsed_msg in parsed_msg_list:
-        crc_list.insert(int(parsed_msg['msgid']), parsed_msg['crc'])
-    
-    #Write the MAVLINK CRC class
-    with open('%s/mavlink_crc.m' % main_path, 'w') as fo:
-        
-        #Write class definition and start of properties
-        fo.write('''\
-\
-classdef mavlink_crc < handle
-    %%MAVLINK CRC Class
-    %%Handles the crc x.25 checksum system used by MAVLINK
-    
-    properties(Constant)\
-\
-        ''')
-        
-        #Write the MAVLINK CRC array
-        fo.write('\n\t\tMAVLINK_MESSAGE_CRCS = uint8([...\n\t\t\t')
-        char_count = 0
-        for crc in crc_list:
-            char_count += len(str(crc)) + 1
-            if char_count > 80:
-                fo.write('...\n\t\t\t')
-                char_count = 0
-            fo.write('%d,' % crc)  
-        fo.write('0]);\n')
-        
-        #Write the rest of the MAVLINK CRC class
-        fo.write('''\
-\
-        CRC_INIT_VALUE = uint16(hex2dec('ffff'));
-    end
+    template = mavtemplate.load_template('MAVLinkCRC_template.txt')
+    with OutputFile('%s/MAVLinkCRC.m' % main_path, manifest) as fo:
+        fo.write(template.render({'crc' : crc_list, 'table' : table}))
+                
     
-    properties
-        crcValue;
-    end
+def default_cache_path(xml_path):
     
-    methods
-        
-        %%Constructor: mavlink_crc
-        function obj = mavlink_crc()
-            obj.startChecksum();
-        end
-        
-        function updateChecksum(obj, char)
-            if char == uint8(char)
-                char = uint8(char);
-                crcBytes = typecast(uint16(obj.crcValue),'uint8');
-                temp = bitxor(char,crcBytes(1));
-                temp = bitxor(temp,bitshift(temp,4));
-                crcAccum = bitxor(uint16(crcBytes(2)),bitshift(uint16(temp),8));
-                crcAccum = bitxor(crcAccum,bitshift(uint16(temp),3));
-                crcAccum = bitxor(crcAccum,bitshift(uint16(temp),-4));
-                obj.crcValue = crcAccum;
-            else
-                fprintf(2,'MAVLAB-ERROR | mavlink_crc.updateChecksum()\\n\\t Input "char" is not of type "uint8"\\n');
-            end
-        end
-        
-        %%Function: Initialises the checksum value
-        function startChecksum(obj)
-            obj.crcValue = obj.CRC_INIT_VALUE;
-        end
-        
-        %%Function: Hash the checksum with the mavlink message CRC
-        function finishChecksum(obj, msgid)
-           obj.updateChecksum(obj.MAVLINK_MESSAGE_CRCS(msgid + 1)) 
-        end
-        
-        %%Getter: MSB
-        function msb = getMSB(obj)
-            crcBytes = typecast(uint16(obj.crcValue),'uint8');
-            msb = crcBytes(2);
-        end
-        
-        %%Getter: LSB
-        function lsb = getLSB(obj)
-            crcBytes = typecast(uint16(obj.crcValue),'uint8');
-            lsb = crcBytes(1);
-        end
-        
-    end
+    """
+    Return the default location of the schema cache, a folder named cache next to the XML folder
     
-end\
-        
-        ''')
-                
+    """
     
-def generate(xml_path, output_path):
+    return os.path.join(os.path.dirname(os.path.abspath(xml_path)), 'cache')
+
+
+def generate(xml_path, output_path, force=False, jobs=None, streaming=False, cache_path=None, python=False,
+             emission='accessor', unchecked=False, select=None, timer=None):
     
     """
     Generate the full MATLAB implementation of the MAVLINK protocol from an XML source file
     
+    Dialects are resolved through their include tags, so a message shared by several dialects is
+    generated once. Conflicting definitions are reported and returned, the definition of the
+    included dialect is used.
+    
+    Only files whose source definition has changed since the last run are rewritten, using the
+    manifest stored in the generated MAVLAB folder. Classes of messages that no longer exist are
+    removed.
+    
+    A profile given as select restricts the message and enumeration classes, and the packet
+    dispatch table, to the messages and enums a deployment uses. The CRC class keeps the CRC_EXTRA
+    of every message in the dialects so that packets of other messages still pass their checksum
+    and are counted as skipped when unpacked.
+    
     Parameters
     ----------
     xml_path: string
         Path to the folder containing the MAVLINK XML dialect files
     output_path: string
         Path to the generation location for MAVLAB
+    force: boolean
+        Regenerate every file regardless of the manifest (default = False)
+    jobs: integer
+        Number of worker processes used to generate message and enumeration classes
+        (default = None, one per CPU)
+    streaming: boolean
+        Stream each XML file with iterparse and free every message and enum once it has been
+        compiled, instead of loading the whole document (default = False)
+    cache_path: string
+        Folder used to cache the compiled schema (default = None, a cache folder next to xml_path)
+    python: boolean
+        Also generate the pymavlab Python package next to the MAVLAB folder (default = False)
+    emission: string
+        How message classes pack and unpack their payloads. 'accessor' calls the payload get and
+        put functions per element, 'typecast' casts each field directly from its byte range
+        (default = 'accessor')
+    unchecked: boolean
+        Also generate a fast_ class for each message, whose static encode function writes already
+        typed fields into a preallocated frame buffer without validating them. The msg_ classes
+        are generated as usual. (default = False)
+    select: string or mavprofile.Profile
+        Profile, or path to a profile file, selecting the messages and enums to generate
+        (default = None, generate everything)
+    timer: mavtiming.PhaseTimer
+        Timer recording the wall time and peak memory of each phase (default = None, do not time)
     ----------
     
     """
     
+    if emission not in EMISSION_MODES:
+        raise ValueError('Unknown emission mode: %s' % emission)
+    
+    if select is not None and not isinstance(select, mavprofile.Profile):
+        select = mavprofile.load_profile(select)
+        
+    if timer is None:
+        timer = mavtiming.NullTimer()
+    
     full_parsed_msg_list = []
     
     #Create the folder system at the output path
@@ -683,39 +507,152 @@ def generate(xml_path, output_path):
     main_path = '%s/main' % mavlab_path    
     if not os.path.exists(main_path):
         os.makedirs(main_path)
+        
+    #Load the manifest of the previous generation run
+    manifest = Manifest(mavlab_path, force)
+    
+    #Compile the XML files and the files they include, or load them from the schema cache if they
+    #have not changed. Each message is generated once, by the first dialect defining it.
+    if cache_path is None:
+        cache_path = default_cache_path(xml_path)
+    with timer.phase('xml_parse'):
+        schema, conflicts = mavschema.resolve_schema(xml_path, cache_path, streaming)
+    for conflict in conflicts:
+        sys.stderr.write('MAVLAB-WARNING | %s\n' % mavschema.describe_conflict(conflict))
+    
+    #Every message in the dialects is checksummed, even when the profile does not generate it
+    known_msg_list = [parsed_message(message) for dialect in schema for message in dialect.messages]
+    
+    #Keep only the messages and enums selected by the profile
+    selected = schema
+    if select is not None:
+        selected, unused = mavprofile.apply_profile(schema, select)
+        for pattern in unused:
+            sys.stderr.write('MAVLAB-WARNING | Profile pattern %s does not match anything\n' % pattern)
+    
+    #Dialects are processed in include order so that the merged message list is always the same
+    with create_executor(jobs) as executor:
+        
+        enum_futures = []
+        for dialect in selected:
+            
+            #Dialects with nothing selected by the profile are not generated
+            if select is not None and not dialect.messages and not dialect.enums:
+                continue
+        
+            #Create a folder for this dialect
+            message_path = '%s/dialects/%s' % (mavlab_path, dialect.name)
+            if not os.path.exists(message_path):
+                os.makedirs(message_path)
+                
+            #Generate the enumeration class for this XML file while the messages are generated
+            if select is None or dialect.enums:
+                with timer.phase('enum_emission'):
+                    enum_futures.append(executor.submit(generate_enum_task, message_path, dialect.name, dialect.enums,
+                                                        manifest))
+            
+            #Generate a MATLAB class file for each message
+            with timer.phase('message_emission'):
+                parsed_msg_list = generate_message_classes(message_path, dialect.messages, manifest, executor, emission,
+                                                           unchecked)
+            
+            full_parsed_msg_list += parsed_msg_list
+            
+        #Merge the manifest entries recorded by the enumeration workers
+        with timer.phase('enum_emission'):
+            for future in enum_futures:
+                manifest.current.update(future.result())
     
-    for filename in os.listdir(xml_path):
-        if not filename.endswith('.xml'):
-            continue
-        fullname = os.path.join(xml_path, filename)
-    
-        #Load the MAVLINK message definition XML document and get the root
-        tree = ET.parse(fullname)
-        root = tree.getroot()
-        xml_name = basename(fullname).split('.')[0]
+    with timer.phase('packet_crc_classes'):
+        
+        #Generate the MAVLINK packet class
+        generate_packet_class(main_path, full_parsed_msg_list, manifest)
+        
+        #Generate the MAVLINK CRC class
+        generate_crc_class(main_path, known_msg_list, manifest)
+        
+    #Copy fixed classes into the main folder
+    with timer.phase('file_copy'):
+        copy_fixed_classes(main_path, manifest)
     
-        #Create a folder for this dialect
-        message_path = '%s/%s' % (mavlab_path, xml_name)
-        if not os.path.exists(message_path):
-            os.makedirs(message_path)
+    #Remove classes that are no longer generated and store the new manifest
+    with timer.phase('manifest'):
+        manifest.save()
     
-        #Find the message list and generate a MATLAB class file for each message
-        msg_list = root.find('messages')
-        parsed_msg_list = generate_message_classes(message_path, msg_list)
-        
-        #Generate the enumeration class for this XML file
-        enum_list = root.find('enums')
-        generate_enum_class(message_path, xml_name, enum_list)
+    #Generate the Python package from the same schema
+    if python:
+        with timer.phase('python_package'):
+            mavgen_python.generate_python_package(schema, output_path, force)
         
-        full_parsed_msg_list += parsed_msg_list
+    return conflicts
+
+
+def main(argv=None):
     
-    #Generate the MAVLINK packet class
-    generate_packet_class(main_path, full_parsed_msg_list)
+    """
+    Command line entry point, run python mavgen_m_deprecated.py --help for the arguments
     
-    #Generate the MAVLINK CRC class
-    generate_crc_class(main_path, full_parsed_msg_list)
+    Parameters
+    ----------
+    argv: string list
+        Command line arguments (default = None, use sys.argv)
+    ----------
+    
+    """
+    
+    parser = argparse.ArgumentParser(description='Generate the MATLAB implementation of the MAVLINK protocol')
+    parser.add_argument('xml_path', help='folder containing the MAVLINK XML dialect files')
+    parser.add_argument('output_path', help='folder in which the mavlab folder is generated')
+    parser.add_argument('--force', action='store_true', help='regenerate every file regardless of the manifest')
+    parser.add_argument('--jobs', type=int, default=None, help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--streaming', action='store_true', help='stream the XML files with iterparse')
+    parser.add_argument('--cache', default=None, help='folder used to cache the compiled schema')
+    parser.add_argument('--python', action='store_true', help='also generate the pymavlab Python package')
+    parser.add_argument('--emission', choices=EMISSION_MODES, default='accessor',
+                        help='how message classes pack and unpack their payloads')
+    parser.add_argument('--unchecked', action='store_true',
+                        help='also generate fast_ encoders which write typed fields without validation')
+    parser.add_argument('--select', default=None, metavar='PROFILE_FILE',
+                        help='generation profile selecting the messages and enums to generate')
+    parser.add_argument('--profile', action='store_true',
+                        help='report the wall time and peak memory of each generation phase')
+    parser.add_argument('--profile-json', default=None, metavar='FILE',
+                        help='write the phase report as JSON to FILE, or - for stdout (implies --profile)')
+    parser.add_argument('--cprofile', default=None, metavar='FILE', help='write a cProfile dump of the run to FILE')
+    args = parser.parse_args(argv)
+    
+    timer = None
+    if args.profile or args.profile_json:
+        timer = mavtiming.PhaseTimer()
+    
+    profiler = None
+    if args.cprofile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    try:
+        generate(args.xml_path, args.output_path, force=args.force, jobs=args.jobs, streaming=args.streaming,
+                 cache_path=args.cache, python=args.python, emission=args.emission,
+                 unchecked=args.unchecked, select=args.select,
+                 timer=timer)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+        if timer is not None:
+            timer.close()
+    
+    if timer is not None:
+        if args.profile:
+            print(timer.table())
+        if args.profile_json == '-':
+            print(timer.to_json())
+        elif args.profile_json:
+            with open(args.profile_json, 'w') as fo:
+                fo.write(timer.to_json())
+                
+    return 0
         
-    #Copy fixed classes into the main folder
-    copy_fixed_classes(main_path)
         
-generate('../data', '../')
\ No newline at end of file
+if __name__ == '__main__':
+    sys.exit(main())
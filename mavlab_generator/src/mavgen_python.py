@@ -0,0 +1,606 @@
+'''
+Created on 18 Oct 2026
+
+Generates a Python package implementing the MAVLINK messages of the compiled schema
+'''
+
+import os
+import re
+import struct
+import keyword
+
+from mavoutput import Manifest, OutputFile
+
+#Name of the generated Python package
+PACKAGE_NAME = 'pymavlab'
+
+#Fixed modules copied from the source folder into the generated package
+FIXED_MODULES = ('mavcrc', 'mavpacket', 'mavmessage', 'mavbulk', 'mavstats', 'mavparser', 'mavtransport', 'mavlogindex',
+                 'mavparallel', 'mavbatch')
+
+#Imports of a fixed module from the source folder, made relative when it is copied into the package
+FIXED_IMPORT_PATTERN = re.compile(r'^from (%s) import ' % '|'.join(FIXED_MODULES), re.MULTILINE)
+
+#Number of message IDs which can be carried by a MAVLINK 1 frame
+MAX_MSGID = 255
+
+#Struct format character of each MAVLINK field type
+STRUCT_FORMAT = {'double' : 'd', 'int64_t' : 'q', 'uint64_t': 'Q', 'int32_t' : 'i', 'uint32_t': 'I',
+                 'float' : 'f', 'int16_t' : 'h', 'uint16_t': 'H', 'int8_t' : 'b', 'uint8_t': 'B',
+                 'char' : 'c'}
+
+#Little-endian NumPy type of each MAVLINK field type
+DTYPE_FORMAT = {'double' : '<f8', 'int64_t' : '<i8', 'uint64_t': '<u8', 'int32_t' : '<i4', 'uint32_t': '<u4',
+                'float' : '<f4', 'int16_t' : '<i2', 'uint16_t': '<u2', 'int8_t' : '<i1', 'uint8_t': '<u1',
+                'char' : 'S1'}
+
+
+def python_name(name):
+
+    """
+    Return a field name which is a valid Python identifier
+
+    """
+
+    if keyword.iskeyword(name):
+        return name + '_'
+    return name
+
+
+def class_name(message):
+
+    """
+    Return the name of the Python class generated for a message
+
+    """
+
+    return 'msg_%s' % message.name.lower()
+
+
+def is_bytes_field(field):
+
+    """
+    Return whether a field is packed as a single bytes object. Character and uint8_t arrays are
+    packed as strings, every other array is packed as a tuple of values.
+
+    """
+
+    return field.array_length > 1 and field.type in ('char', 'uint8_t')
+
+
+def field_format(field):
+
+    """
+    Return the struct format of a single field, without the byte order
+
+    """
+
+    if field.array_length == 1:
+        return STRUCT_FORMAT[field.type]
+    elif is_bytes_field(field):
+        return '%ds' % field.array_length
+    return '%d%s' % (field.array_length, STRUCT_FORMAT[field.type])
+
+
+def struct_format(message):
+
+    """
+    Return the struct format of a message payload with its fields in wire order
+
+    """
+
+    return '<' + ''.join(field_format(field) for field in message.fields)
+
+
+def view_name(message):
+
+    """
+    Return the name of the Python view class generated for a message
+
+    """
+
+    return 'view_%s' % message.name.lower()
+
+
+def dtype_spec(message):
+
+    """
+    Return the Python source of the NumPy structured dtype of a message payload. Character arrays
+    are fixed length strings, every other array is a sub-array of fixed shape.
+
+    """
+
+    spec = []
+    for field in message.fields:
+        name = python_name(field.name)
+        if field.array_length == 1:
+            spec.append("('%s', '%s')" % (name, DTYPE_FORMAT[field.type]))
+        elif field.type == 'char':
+            spec.append("('%s', 'S%d')" % (name, field.array_length))
+        else:
+            spec.append("('%s', '%s', (%d,))" % (name, DTYPE_FORMAT[field.type], field.array_length))
+
+    return '[%s]' % ', '.join(spec)
+
+
+def default_value(field):
+
+    """
+    Return the Python source of the default value of a field
+
+    """
+
+    if field.array_length == 1:
+        if field.type == 'char':
+            return "b'\\x00'"
+        elif field.type in ('float', 'double'):
+            return '0.0'
+        return '0'
+    elif is_bytes_field(field):
+        return "b''"
+    elif field.type in ('float', 'double'):
+        return '(0.0,) * %d' % field.array_length
+    return '(0,) * %d' % field.array_length
+
+
+def generate_message_source(message):
+
+    """
+    Return the Python source of a message class. Packing and unpacking are a single call to the
+    precompiled struct of the message, arrays are sliced out of the unpacked tuple.
+
+    Parameters
+    ----------
+    message: mavschema.Message
+        Compiled message definition
+    ----------
+
+    """
+
+    names = [python_name(field.name) for field in message.fields]
+    lines = []
+    lines.append('class %s(MAVLinkMessage):' % class_name(message))
+    lines.append('')
+    lines.append('    """')
+    if message.description:
+        lines.append('    %s' % ' '.join(message.description.split()).replace('\\', '\\\\'))
+    else:
+        lines.append('    %s' % message.name)
+    lines.append('')
+    lines.append('    """')
+    lines.append('')
+    lines.append('    __slots__ = (%s)' % ''.join("'%s', " % name for name in names))
+    lines.append('')
+    lines.append('    ID = %d' % message.id)
+    lines.append("    NAME = '%s'" % message.name)
+    lines.append('    LEN = %d' % message.length)
+    lines.append('    CRC_EXTRA = %d' % message.crc_extra)
+    lines.append('    FIELDS = (%s)' % ''.join("'%s', " % name for name in names))
+    lines.append("    STRUCT = Struct('%s')" % struct_format(message))
+    lines.append('    DTYPE = %s' % dtype_spec(message))
+    lines.append('')
+
+    #Constructor with every field as a keyword argument
+    args = ''.join(', %s=%s' % (name, default_value(field)) for name, field in zip(names, message.fields))
+    lines.append('    def __init__(self%s, sysid=SYSID, compid=COMPID):' % args)
+    for name in names:
+        lines.append('        self.%s = %s' % (name, name))
+    lines.append('        self.sysid = sysid')
+    lines.append('        self.compid = compid')
+    lines.append('')
+
+    #Pack the fields with a single call, unpacking any numeric arrays into the argument list
+    values = []
+    arguments = []
+    for name, field in zip(names, message.fields):
+        star = '*' if field.array_length > 1 and not is_bytes_field(field) else ''
+        values.append('%sself.%s' % (star, name))
+        arguments.append('%s%s' % (star, name))
+    lines.append('    def pack(self):')
+    lines.append('        return self.STRUCT.pack(%s)' % ', '.join(values))
+    lines.append('')
+
+    #Pack field values straight into a buffer, as the batch encoder does without creating messages
+    lines.append('    @classmethod')
+    lines.append('    def pack_into(cls, buffer, offset, %s):' % ', '.join(names))
+    lines.append('        cls.STRUCT.pack_into(buffer, offset, %s)' % ', '.join(arguments))
+    lines.append('')
+
+    #Unpack the payload with a single call, assigning scalars directly when there are no arrays
+    lines.append('    @classmethod')
+    lines.append('    def unpack(cls, payload, sysid=SYSID, compid=COMPID):')
+    lines.append('        msg = _new(cls)')
+    if names and all(field.array_length == 1 or is_bytes_field(field) for field in message.fields):
+        targets = ', '.join('msg.%s' % name for name in names)
+        if len(names) == 1:
+            targets += ','
+        lines.append('        %s = cls.STRUCT.unpack_from(payload)' % targets)
+    elif names:
+        lines.append('        values = cls.STRUCT.unpack_from(payload)')
+        index = 0
+        for name, field in zip(names, message.fields):
+            if field.array_length > 1 and not is_bytes_field(field):
+                lines.append('        msg.%s = values[%d:%d]' % (name, index, index + field.array_length))
+                index += field.array_length
+            else:
+                lines.append('        msg.%s = values[%d]' % (name, index))
+                index += 1
+    lines.append('        msg.sysid = sysid')
+    lines.append('        msg.compid = compid')
+    lines.append('        return msg')
+    lines.append('')
+
+    return '\n'.join(lines) + '\n\n'
+
+
+def generate_view_source(message):
+
+    """
+    Return the Python source of the view class of a message. Each field is a property unpacking
+    the field at its offset in the payload with the precompiled struct of its format.
+
+    Parameters
+    ----------
+    message: mavschema.Message
+        Compiled message definition
+    ----------
+
+    """
+
+    names = [python_name(field.name) for field in message.fields]
+    lines = []
+    lines.append('class %s(MAVLinkView):' % view_name(message))
+    lines.append('')
+    lines.append('    """')
+    lines.append('    %s received, decoding each field when it is read' % message.name)
+    lines.append('')
+    lines.append('    """')
+    lines.append('')
+    lines.append('    __slots__ = ()')
+    lines.append('')
+    lines.append('    MESSAGE = %s' % class_name(message))
+    lines.append('    ID = %d' % message.id)
+    lines.append("    NAME = '%s'" % message.name)
+    lines.append('    LEN = %d' % message.length)
+    lines.append('    CRC_EXTRA = %d' % message.crc_extra)
+    lines.append('    FIELDS = %s.FIELDS' % class_name(message))
+
+    #Numeric arrays are returned as the whole unpacked tuple, every other field as its single value
+    offset = 0
+    for name, field in zip(names, message.fields):
+        fmt = field_format(field)
+        item = '' if field.array_length > 1 and not is_bytes_field(field) else '[0]'
+        lines.append('')
+        lines.append('    @property')
+        lines.append('    def %s(self):' % name)
+        lines.append('        return _unpack_%s(self._payload, %d)%s' % (fmt, offset, item))
+        offset += struct.calcsize('<' + fmt)
+
+    lines.append('')
+    return '\n'.join(lines) + '\n\n'
+
+
+def generate_dialect_module(package_path, dialect, manifest=None):
+
+    """
+    Generate the Python module of a dialect containing its enumeration constants and message classes
+
+    Parameters
+    ----------
+    package_path: string
+        Path to the generated Python package
+    dialect: mavschema.Dialect
+        Compiled dialect
+    manifest: Manifest
+        Manifest used to skip the module if it is unchanged (default = None)
+    ----------
+
+    """
+
+    with OutputFile('%s/%s.py' % (package_path, dialect.name), manifest) as fo:
+        fo.write('''\
+\'\'\'
+MAVLINK messages of the %s dialect, generated by MAVLAB
+\'\'\'
+
+from struct import Struct
+
+from .mavpacket import SYSID, COMPID
+from .mavmessage import MAVLinkMessage, MAVLinkView
+
+_new = object.__new__
+
+''' % dialect.name)
+
+        #Unpacking function of every field format used by the views of the dialect
+        formats = sorted(set(field_format(field) for message in dialect.messages for field in message.fields))
+        for fmt in formats:
+            fo.write("_unpack_%s = Struct('<%s').unpack_from\n" % (fmt, fmt))
+        fo.write('\n')
+
+        for enum in dialect.enums:
+            fo.write('#%s\n' % enum.name)
+            for entry in enum.entries:
+                fo.write('%s = %s\n' % (entry.name, entry.value))
+            fo.write('\n')
+
+        fo.write('\n')
+        for message in dialect.messages:
+            fo.write(generate_message_source(message))
+            fo.write(generate_view_source(message))
+
+        fo.write('MESSAGES = (%s)\n' % ''.join('%s, ' % class_name(message) for message in dialect.messages))
+        fo.write('VIEWS = (%s)\n' % ''.join('%s, ' % view_name(message) for message in dialect.messages))
+
+
+def generate_init_module(package_path, schema, manifest=None):
+
+    """
+    Generate the package module containing the dispatch list used to decode payloads by message ID
+
+    Parameters
+    ----------
+    package_path: string
+        Path to the generated Python package
+    schema: list of mavschema.Dialect
+        Compiled dialects, the first definition of each message ID is used
+    manifest: Manifest
+        Manifest used to skip the module if it is unchanged (default = None)
+    ----------
+
+    """
+
+    with OutputFile('%s/__init__.py' % package_path, manifest) as fo:
+        fo.write('''\
+\'\'\'
+MAVLINK 1 codec generated by MAVLAB
+\'\'\'
+
+from .mavpacket import MAVLinkPacket, MAVLinkError, SYSID, COMPID
+from .mavmessage import MAVLinkMessage, MAVLinkView
+from .mavstats import MAVLinkStats
+from . import mavparser
+from . import mavlogindex
+from . import mavparallel
+from . import mavbatch
+''')
+        for dialect in schema:
+            fo.write('from . import %s\n' % dialect.name)
+
+        fo.write('''
+#Message and view class of every message ID, None where the ID is not defined
+MESSAGES = [None] * %d
+VIEWS = [None] * %d
+''' % (MAX_MSGID + 1, MAX_MSGID + 1))
+        for dialect in schema:
+            fo.write('''\
+for _message, _view in zip(%s.MESSAGES, %s.VIEWS):
+    if _message.ID <= %d and MESSAGES[_message.ID] is None:
+        MESSAGES[_message.ID] = _message
+        VIEWS[_message.ID] = _view
+''' % (dialect.name, dialect.name, MAX_MSGID))
+
+        fo.write('''\
+
+#CRC_EXTRA and payload length of every message ID
+CRC_EXTRAS = [0 if _message is None else _message.CRC_EXTRA for _message in MESSAGES]
+MESSAGE_LENGTHS = [0 if _message is None else _message.LEN for _message in MESSAGES]
+
+
+class MAVLinkParser(mavparser.MAVLinkParser):
+
+    """
+    Parses a stream for frames a chunk at a time, checking them with the CRC_EXTRA of this package
+
+    Parameters
+    ----------
+    stats: MAVLinkStats
+        Statistics updated by the parser (default = None, create new statistics)
+    ----------
+
+    """
+
+    def __init__(self, stats=None):
+        mavparser.MAVLinkParser.__init__(self, CRC_EXTRAS, stats)
+
+
+class MAVLinkBatch(mavbatch.MAVLinkBatch):
+
+    """
+    Encodes the messages of this package back to back into one reusable send buffer
+
+    Parameters
+    ----------
+    sysid: integer
+        ID of the sending system (default = SYSID)
+    compid: integer
+        ID of the sending component (default = COMPID)
+    capacity: integer
+        Initial size of the send buffer in bytes (default = mavbatch.BATCH_CAPACITY)
+    ----------
+
+    """
+
+    def __init__(self, sysid=SYSID, compid=COMPID, capacity=mavbatch.BATCH_CAPACITY):
+        mavbatch.MAVLinkBatch.__init__(self, MESSAGES, sysid, compid, capacity)
+
+
+def open_log(log_path, index_path=None, timestamps=None):
+
+    """
+    Open the index of a telemetry log, building or updating it as needed
+
+    Parameters
+    ----------
+    log_path: string
+        Path to the log
+    index_path: string
+        Path to the index (default = None, saved next to the log)
+    timestamps: boolean
+        Each frame is preceded by an 8 byte timestamp (default = None, True for .tlog files)
+    ----------
+
+    """
+
+    return mavlogindex.MAVLinkLogIndex.open(log_path, CRC_EXTRAS, index_path, timestamps)
+
+
+def decode_log(log_path, jobs=None, timestamps=None):
+
+    """
+    Decode every frame of a log into one dictionary of columns per message name, using a pool of
+    worker processes for large logs
+
+    Parameters
+    ----------
+    log_path: string
+        Path to the log
+    jobs: integer
+        Number of worker processes (default = None, one per CPU)
+    timestamps: boolean
+        Each frame is preceded by an 8 byte timestamp (default = None, True for .tlog files)
+    ----------
+
+    """
+
+    return mavparallel.decode_log(log_path, MESSAGES, CRC_EXTRAS, jobs, timestamps)
+
+
+def decode(msgid, payload, sysid=SYSID, compid=COMPID):
+
+    """
+    Decode a payload into a message using the dispatch list
+
+    Parameters
+    ----------
+    msgid: integer
+        ID of the message contained in the payload
+    payload: bytes-like
+        Buffer containing the message payload
+    ----------
+
+    """
+
+    message = MESSAGES[msgid]
+    if message is None:
+        raise MAVLinkError('Message (ID = %d) is not defined' % msgid)
+    if len(payload) < message.LEN:
+        raise MAVLinkError('Payload of message (ID = %d) is shorter than %d bytes' % (msgid, message.LEN))
+    return message.unpack(payload, sysid, compid)
+
+
+def decode_view(msgid, payload, sysid=SYSID, compid=COMPID):
+
+    """
+    Wrap a payload in the view of its message using the dispatch list, without decoding any field
+
+    Parameters
+    ----------
+    msgid: integer
+        ID of the message contained in the payload
+    payload: bytes-like
+        Buffer containing the message payload, kept by the view rather than copied
+    ----------
+
+    """
+
+    view = VIEWS[msgid]
+    if view is None:
+        raise MAVLinkError('Message (ID = %d) is not defined' % msgid)
+    if len(payload) < view.LEN:
+        raise MAVLinkError('Payload of message (ID = %d) is shorter than %d bytes' % (msgid, view.LEN))
+    return view(payload, sysid, compid)
+
+
+def decode_packet(buf):
+
+    """
+    Decode a single complete frame into a message, verifying its checksum
+
+    Parameters
+    ----------
+    buf: bytes-like
+        Buffer starting with the STX byte of the frame
+    ----------
+
+    """
+
+    packet = MAVLinkPacket.decode(buf, CRC_EXTRAS)
+    return decode(packet.msgid, packet.payload, packet.sysid, packet.compid)
+
+
+def decode_bulk(buf, timestamps=True):
+
+    """
+    Decode every frame of a raw buffer into one NumPy structured array per message name. NumPy is
+    only imported when this function is called.
+
+    Parameters
+    ----------
+    buf: bytes-like or numpy array
+        Raw log contents, a numpy.memmap of the log file avoids reading it into memory
+    timestamps: boolean
+        Each frame is preceded by the 8 byte timestamp of a .tlog file (default = True)
+    ----------
+
+    """
+
+    from .mavbulk import decode_frames
+    return decode_frames(buf, MESSAGES, timestamps)
+''')
+
+
+def copy_fixed_modules(package_path, manifest=None):
+
+    """
+    Copy the fixed runtime modules from the source folder into the generated package, making the
+    imports between them relative to the package
+
+    Parameters
+    ----------
+    package_path: string
+        Path to the generated Python package
+    manifest: Manifest
+        Manifest used to skip modules that are unchanged (default = None)
+    ----------
+
+    """
+
+    src_path = os.path.dirname(os.path.abspath(__file__))
+    for module in FIXED_MODULES:
+        with open(os.path.join(src_path, '%s.py' % module), 'r') as fi:
+            text = fi.read()
+        with OutputFile('%s/%s.py' % (package_path, module), manifest) as fo:
+            fo.write(FIXED_IMPORT_PATTERN.sub(r'from .\1 import ', text))
+
+
+def generate_python_package(schema, output_path, force=False):
+
+    """
+    Generate the Python implementation of the MAVLINK protocol from a compiled schema
+
+    Parameters
+    ----------
+    schema: list of mavschema.Dialect
+        Compiled dialects
+    output_path: string
+        Path to the generation location, the package is generated in a pymavlab folder
+    force: boolean
+        Regenerate every module regardless of the manifest (default = False)
+    ----------
+
+    """
+
+    package_path = '%s/%s' % (output_path, PACKAGE_NAME)
+    if not os.path.exists(package_path):
+        os.makedirs(package_path)
+
+    manifest = Manifest(package_path, force)
+
+    for dialect in schema:
+        generate_dialect_module(package_path, dialect, manifest)
+
+    generate_init_module(package_path, schema, manifest)
+    copy_fixed_modules(package_path, manifest)
+
+    manifest.save()
@@ -0,0 +1,356 @@
+'''
+Created on 18 Oct 2026
+
+Index of the frames of a telemetry log, saved next to the log, giving random access by message,
+system and time without parsing the whole log
+'''
+
+import os
+import sys
+import mmap
+import heapq
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from binascii import crc_hqx
+
+from mavpacket import MAVLinkPacket, STX, HEADER_LEN, CHECKSUM_LEN, MAX_PAYLOAD_SIZE
+from mavparser import REVERSED_BITS, reversed_extras
+from mavcrc import CRC_INIT_VALUE
+
+#Extension of the index file saved next to the log
+INDEX_EXTENSION = '.idx'
+
+#Identifies an index file and the version of its layout
+INDEX_MAGIC = b'MAVLABIX'
+INDEX_VERSION = 2
+
+#Number of bytes of the log scanned at a time, frames starting in a block may run into the next
+SCAN_BLOCK = 1 << 22
+MAX_FRAME_LEN = HEADER_LEN + MAX_PAYLOAD_SIZE + CHECKSUM_LEN
+
+#Number of leading bytes of the log whose CRC-32 identifies it in the index
+SIGNATURE_LEN = 4096
+
+#Length of the big-endian microsecond timestamp preceding every frame of a .tlog file
+TIMESTAMP_LEN = 8
+
+_header = struct.Struct('<8sBBBxQIII')
+_group = struct.Struct('<BBI')
+_timestamp = struct.Struct('>Q')
+_stx = bytes([STX])
+
+
+class MAVLinkLogIndex(object):
+
+    """
+    Offsets of every valid frame of a log, grouped by message ID and system ID, with the .tlog
+    timestamp of each frame where the log has them. The log is memory-mapped and scanned once,
+    later calls to update only scan the bytes written since, so a log that is still being written
+    can be indexed as it grows.
+
+    Offsets point at the STX byte of a frame. Timestamps are assumed to increase through the log,
+    as they do in a .tlog file, when selecting a time range.
+
+    Parameters
+    ----------
+    log_path: string
+        Path to the log
+    crc_extras: sequence of integers
+        CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+    timestamps: boolean
+        Each frame is preceded by an 8 byte timestamp (default = None, True for .tlog files)
+    ----------
+
+    """
+
+    def __init__(self, log_path, crc_extras, timestamps=None):
+        self.log_path = log_path
+        self.extras = reversed_extras(crc_extras)
+        self.extras_crc = zlib.crc32(bytes(crc_extras))
+        self.timestamps = log_path.endswith('.tlog') if timestamps is None else timestamps
+        self.groups = {}
+        self.scanned = 0
+        self.resume = None
+        self.signature = 0
+        self.log = None
+        self.map = None
+
+    @classmethod
+    def open(cls, log_path, crc_extras, index_path=None, timestamps=None):
+
+        """
+        Load the index of a log, or build it if it has not been saved or no longer matches the log,
+        then index any frames written since it was saved and save it
+
+        Parameters
+        ----------
+        log_path: string
+            Path to the log
+        crc_extras: sequence of integers
+            CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+        index_path: string
+            Path to the index (default = None, the log path with INDEX_EXTENSION appended)
+        timestamps: boolean
+            Each frame is preceded by an 8 byte timestamp (default = None, True for .tlog files)
+        ----------
+
+        """
+
+        if index_path is None:
+            index_path = log_path + INDEX_EXTENSION
+
+        index = cls(log_path, crc_extras, timestamps)
+        if os.path.exists(index_path):
+            index.load(index_path)
+        if index.update():
+            index.save(index_path)
+        return index
+
+    def __len__(self):
+        return sum(len(offsets) for offsets, _ in self.groups.values())
+
+    def keys(self):
+
+        """
+        Return the sorted (msgid, sysid) of every group of frames in the log
+
+        """
+
+        return sorted(self.groups)
+
+    def remap(self):
+
+        """
+        Memory-map the log as it is now, returning its size
+
+        """
+
+        self.close()
+        self.log = open(self.log_path, 'rb')
+        size = os.fstat(self.log.fileno()).st_size
+        if size:
+            self.map = mmap.mmap(self.log.fileno(), 0, access=mmap.ACCESS_READ)
+        return size
+
+    def close(self):
+
+        """
+        Unmap and close the log. Payloads returned by packets must be released first.
+
+        """
+
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def update(self):
+
+        """
+        Index the frames written to the log since it was last scanned, returning the number of new
+        frames. The index is rebuilt if the log has been truncated or replaced.
+
+        """
+
+        size = self.remap()
+        signature = zlib.crc32(self.map[:min(self.scanned, SIGNATURE_LEN)]) if size else 0
+        if size < self.scanned or signature != self.signature:
+            self.groups = {}
+            self.scanned = 0
+
+        count = len(self)
+        floor = max([offsets[-1] + 1 for offsets, _ in self.groups.values()] + [0])
+        self.resume = None
+        position = self.scanned
+        while position < size:
+            position = self.scan_block(position, size, floor)
+        self.scanned = size if self.resume is None else self.resume
+        self.signature = zlib.crc32(self.map[:min(self.scanned, SIGNATURE_LEN)]) if size else 0
+        return len(self) - count
+
+    def scan_block(self, position, size, floor):
+
+        """
+        Index the frames starting in the SCAN_BLOCK bytes from position and return the position the
+        next scan starts from. Frames before floor are already indexed. The first frame that runs
+        past the end of the log is where the next update resumes, as the rest of it may not have
+        been written yet.
+
+        """
+
+        limit = min(SCAN_BLOCK, size - position)
+        buf = self.map[position:position + limit + MAX_FRAME_LEN]
+        reversed_buf = buf.translate(REVERSED_BITS)
+        reversed_view = memoryview(reversed_buf)
+        find = buf.find
+        extras = self.extras
+        groups = self.groups
+        prefix = TIMESTAMP_LEN if self.timestamps else 0
+        log = self.map
+
+        start = find(_stx, prefix if position == 0 else 0)
+        while 0 <= start < limit:
+            end = start + HEADER_LEN + buf[start + 1] if start + 1 < len(buf) else len(buf)
+            if end + CHECKSUM_LEN > len(buf):
+                #Keep searching, the STX may be a byte of a frame or timestamp rather than a frame
+                if self.resume is None:
+                    self.resume = position + start
+                start = find(_stx, start + 1)
+                continue
+
+            crc = crc_hqx(extras[buf[start + 5]], crc_hqx(reversed_view[start + 1:end], CRC_INIT_VALUE))
+            if crc >> 8 != reversed_buf[end] or crc & 0xff != reversed_buf[end + 1]:
+                start = find(_stx, start + 1)
+                continue
+
+            if position + start >= floor:
+                key = (buf[start + 5], buf[start + 3])
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = (array('Q'), array('Q'))
+                group[0].append(position + start)
+                if prefix:
+                    if start >= prefix:
+                        group[1].append(_timestamp.unpack_from(buf, start - prefix)[0])
+                    else:
+                        group[1].append(_timestamp.unpack_from(log, position + start - prefix)[0])
+            start = find(_stx, end + CHECKSUM_LEN)
+
+        return position + (len(buf) if start < 0 else start)
+
+    def save(self, index_path):
+
+        """
+        Save the index to a file
+
+        Parameters
+        ----------
+        index_path: string
+            Path to the index file
+        ----------
+
+        """
+
+        with open(index_path + '.tmp', 'wb') as fo:
+            fo.write(_header.pack(INDEX_MAGIC, INDEX_VERSION, self.timestamps, sys.byteorder == 'big',
+                                  self.scanned, self.signature, self.extras_crc, len(self.groups)))
+            for (msgid, sysid), (offsets, timestamps) in sorted(self.groups.items()):
+                fo.write(_group.pack(msgid, sysid, len(offsets)))
+                offsets.tofile(fo)
+                timestamps.tofile(fo)
+        os.replace(index_path + '.tmp', index_path)
+
+    def load(self, index_path):
+
+        """
+        Load an index saved by save. An index of another layout, one saved with a different
+        timestamps setting or CRC_EXTRA table, or one which is truncated or corrupt, is ignored and
+        the log is indexed from the start.
+
+        Parameters
+        ----------
+        index_path: string
+            Path to the index file
+        ----------
+
+        """
+
+        with open(index_path, 'rb') as fi:
+            header = fi.read(_header.size)
+            if len(header) < _header.size:
+                return
+            magic, version, timestamps, big_endian, scanned, signature, extras_crc, count = _header.unpack(header)
+            if (magic != INDEX_MAGIC or version != INDEX_VERSION or timestamps != self.timestamps or
+                    extras_crc != self.extras_crc):
+                return
+
+            #A group longer than the rest of the file is corrupt, it is not read into memory
+            size = os.fstat(fi.fileno()).st_size
+            groups = {}
+            try:
+                for _ in range(count):
+                    msgid, sysid, length = _group.unpack(fi.read(_group.size))
+                    if fi.tell() + length * (16 if timestamps else 8) > size:
+                        return
+                    offsets = array('Q')
+                    offsets.fromfile(fi, length)
+                    stamps = array('Q')
+                    stamps.fromfile(fi, length if timestamps else 0)
+                    if big_endian != (sys.byteorder == 'big'):
+                        offsets.byteswap()
+                        stamps.byteswap()
+                    if length and offsets[-1] >= scanned:
+                        return
+                    groups[msgid, sysid] = (offsets, stamps)
+            except (struct.error, EOFError):
+                return
+
+        self.groups = groups
+        self.scanned = scanned
+        self.signature = signature
+
+    def select(self, msgid, sysid=None, t0=None, t1=None):
+
+        """
+        Return the (timestamp, offset) of the frames of a message in the order they were logged,
+        the timestamp is None for logs without timestamps
+
+        Parameters
+        ----------
+        msgid: integer
+            ID of the message
+        sysid: integer
+            ID of the sending system (default = None, all systems)
+        t0: integer
+            First timestamp in microseconds included (default = None, from the start of the log)
+        t1: integer
+            Last timestamp in microseconds included (default = None, to the end of the log)
+        ----------
+
+        """
+
+        if sysid is None:
+            keys = [key for key in self.groups if key[0] == msgid]
+        else:
+            keys = [(msgid, sysid)] if (msgid, sysid) in self.groups else []
+
+        selections = []
+        for key in keys:
+            offsets, timestamps = self.groups[key]
+            first, last = 0, len(offsets)
+            if self.timestamps:
+                if t0 is not None:
+                    first = bisect_left(timestamps, t0)
+                if t1 is not None:
+                    last = bisect_right(timestamps, t1)
+                selections.append(zip(timestamps[first:last], offsets[first:last]))
+            elif t0 is not None or t1 is not None:
+                raise ValueError('Log %s has no timestamps to select a time range' % self.log_path)
+            else:
+                selections.append(((None, offset) for offset in offsets))
+
+        if len(selections) == 1:
+            return list(selections[0])
+        return list(heapq.merge(*selections, key=lambda item: item[1]))
+
+    def packets(self, msgid, sysid=None, t0=None, t1=None):
+
+        """
+        Yield the (timestamp, MAVLinkPacket) of the frames of a message selected as select does.
+        Payloads are views of the memory-mapped log, which are valid until the index is closed.
+
+        """
+
+        if self.map is None:
+            self.remap()
+
+        view = memoryview(self.map)
+        log = self.map
+        for timestamp, offset in self.select(msgid, sysid, t0, t1):
+            end = offset + HEADER_LEN + log[offset + 1]
+            yield timestamp, MAVLinkPacket(msgid, view[offset + HEADER_LEN:end], log[offset + 2],
+                                           log[offset + 3], log[offset + 4])
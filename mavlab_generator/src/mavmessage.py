@@ -0,0 +1,212 @@
+'''
+Created on 18 Oct 2026
+
+Base classes of the generated Python message classes, mirroring the MATLAB MAVLinkMessage class,
+and of the views decoding the fields of a received payload as they are read
+'''
+
+from abc import ABCMeta, abstractmethod
+
+from mavpacket import MAVLinkPacket, SYSID, COMPID
+
+
+class MAVLinkMessage(metaclass=ABCMeta):
+
+    """
+    A decoded MAVLINK message. Subclasses are generated for each message definition and provide
+    the ID, NAME, LEN, CRC_EXTRA, FIELDS, STRUCT and DTYPE class attributes and implement the
+    abstract pack, pack_into and unpack methods.
+
+    """
+
+    __slots__ = ('sysid', 'compid')
+
+    ID = None
+    NAME = None
+    LEN = 0
+    CRC_EXTRA = 0
+    FIELDS = ()
+    STRUCT = None
+    DTYPE = []
+
+    @abstractmethod
+    def pack(self):
+
+        """
+        Pack the message fields into a payload
+
+        """
+
+    @classmethod
+    @abstractmethod
+    def pack_into(cls, buffer, offset, *fields):
+
+        """
+        Pack field values, in the order of the constructor arguments, into a buffer at offset
+
+        """
+
+    @classmethod
+    @abstractmethod
+    def unpack(cls, payload, sysid=SYSID, compid=COMPID):
+
+        """
+        Unpack a payload into a new message
+
+        Parameters
+        ----------
+        payload: bytes-like
+            Buffer containing the message payload
+        sysid: integer
+            ID of the sending system (default = SYSID)
+        compid: integer
+            ID of the sending component (default = COMPID)
+        ----------
+
+        """
+
+    def to_packet(self, seq=0):
+
+        """
+        Pack the message into a packet ready to be encoded
+
+        Parameters
+        ----------
+        seq: integer
+            Sequence number of the packet (default = 0)
+        ----------
+
+        """
+
+        return MAVLinkPacket(self.ID, self.pack(), seq, self.sysid, self.compid)
+
+    def encode(self, seq=0):
+
+        """
+        Encode the message into a complete frame for transmission
+
+        Parameters
+        ----------
+        seq: integer
+            Sequence number of the packet (default = 0)
+        ----------
+
+        """
+
+        return self.to_packet(seq).encode(self.CRC_EXTRA)
+
+    def to_dict(self):
+
+        """
+        Return the message fields as a dictionary
+
+        """
+
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.pack() == other.pack()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '%s(%s)' % (self.NAME, ', '.join('%s=%r' % (name, getattr(self, name)) for name in self.FIELDS))
+
+
+class MAVLinkView(object):
+
+    """
+    A received MAVLINK message whose fields are decoded from the payload when they are read.
+    Subclasses are generated for each message definition, with a property unpacking each field at
+    its offset in the payload, so filtering or routing on a field does not decode the others.
+
+    The payload is kept in _payload rather than copied, as some messages have a payload field, so a
+    view of a reused buffer is only valid until the buffer is overwritten. Each read decodes the
+    field again, use to_message to decode every field once when most of them are needed.
+
+    Parameters
+    ----------
+    payload: bytes-like
+        Buffer containing the message payload, at least LEN bytes long
+    sysid: integer
+        ID of the sending system (default = SYSID)
+    compid: integer
+        ID of the sending component (default = COMPID)
+    ----------
+
+    """
+
+    __slots__ = ('_payload', 'sysid', 'compid')
+
+    MESSAGE = MAVLinkMessage
+    ID = None
+    NAME = None
+    LEN = 0
+    CRC_EXTRA = 0
+    FIELDS = ()
+
+    def __init__(self, payload, sysid=SYSID, compid=COMPID):
+        self._payload = payload
+        self.sysid = sysid
+        self.compid = compid
+
+    def to_message(self):
+
+        """
+        Decode every field of the payload into a message
+
+        """
+
+        return self.MESSAGE.unpack(self._payload, self.sysid, self.compid)
+
+    def pack(self):
+
+        """
+        Return the payload as bytes, without the bytes past the message length
+
+        """
+
+        return bytes(self._payload[:self.LEN])
+
+    def to_packet(self, seq=0):
+
+        """
+        Return a packet carrying the payload, ready to be encoded
+
+        Parameters
+        ----------
+        seq: integer
+            Sequence number of the packet (default = 0)
+        ----------
+
+        """
+
+        return MAVLinkPacket(self.ID, self.pack(), seq, self.sysid, self.compid)
+
+    def encode(self, seq=0):
+
+        """
+        Encode the payload into a complete frame for forwarding
+
+        Parameters
+        ----------
+        seq: integer
+            Sequence number of the packet (default = 0)
+        ----------
+
+        """
+
+        return self.to_packet(seq).encode(self.CRC_EXTRA)
+
+    def to_dict(self):
+
+        """
+        Return the message fields as a dictionary
+
+        """
+
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        return '%s(%s)' % (self.NAME, ', '.join('%s=%r' % (name, getattr(self, name)) for name in self.FIELDS))
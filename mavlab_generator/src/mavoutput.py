@@ -0,0 +1,163 @@
+'''
+Created on 18 Oct 2026
+
+Output files and the manifest used to skip regenerating unchanged files
+'''
+
+import os
+import json
+import hashlib
+
+#Version of the generated code, stored in the manifest so that upgrades regenerate every file
+GENERATOR_VERSION = '1.4'
+
+#Name of the manifest written to the root of the generated MAVLAB folder
+MANIFEST_NAME = 'manifest.json'
+
+
+class Manifest(object):
+    
+    """
+    Record of the files produced by a generation run and the hash of the input used for each
+    
+    Parameters
+    ----------
+    path: string
+        Path to the generated MAVLAB folder that the manifest describes
+    force: boolean
+        Ignore any existing manifest so that every file is regenerated
+    ----------
+    
+    """
+    
+    def __init__(self, path, force=False):
+        self.path = path
+        self.filename = os.path.join(path, MANIFEST_NAME)
+        self.version = None
+        self.previous = {}
+        self.current = {}
+        
+        if os.path.exists(self.filename):
+            with open(self.filename, 'r') as fi:
+                manifest = json.load(fi)
+            self.version = manifest.get('version')
+            self.previous = manifest.get('files', {})
+            
+        if force:
+            self.version = None
+            
+    def key(self, filename):
+        
+        """
+        Return the manifest key of a file, which is its path relative to the MAVLAB folder
+        
+        """
+        
+        return os.path.relpath(filename, self.path).replace(os.sep, '/')
+    
+    def is_current(self, filename, digest):
+        
+        """
+        Return whether a file exists and was generated from input with the given hash
+        
+        """
+        
+        return (self.version == GENERATOR_VERSION and self.previous.get(self.key(filename)) == digest
+                and os.path.exists(filename))
+    
+    def record(self, filename, digest):
+        
+        """
+        Record that a file has been generated from input with the given hash
+        
+        """
+        
+        self.current[self.key(filename)] = digest
+        
+    def save(self):
+        
+        """
+        Remove files that are no longer generated and write the manifest if it has changed
+        
+        """
+        
+        for key in self.previous:
+            if key not in self.current:
+                filename = os.path.join(self.path, key)
+                if os.path.exists(filename):
+                    os.remove(filename)
+                    
+        if self.version != GENERATOR_VERSION or self.current != self.previous:
+            with open(self.filename, 'w') as fo:
+                json.dump({'version' : GENERATOR_VERSION, 'files' : self.current}, fo, indent=4, sort_keys=True)
+                
+
+class OutputFile(object):
+    
+    """
+    Context manager which buffers a generated file and only writes it if its content changed, with
+    a single write call. With a manifest, the hash of the content is updated as it is written.
+    Line endings are written as given.
+    
+    Parameters
+    ----------
+    filename: string
+        Path of the file to be generated
+    manifest: Manifest
+        Manifest used to skip unchanged files (default = None, always write)
+    ----------
+    
+    """
+    
+    def __init__(self, filename, manifest=None):
+        self.filename = filename
+        self.manifest = manifest
+        self.chunks = []
+        self.hash = None
+        
+    def __enter__(self):
+        self.chunks = []
+        if self.manifest is not None:
+            self.hash = hashlib.sha1(GENERATOR_VERSION.encode('utf-8'))
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            return False
+        
+        if self.manifest is None:
+            with open(self.filename, 'w', newline='') as fo:
+                fo.write(''.join(self.chunks))
+            return False
+        
+        digest = self.hash.hexdigest()
+        if not self.manifest.is_current(self.filename, digest):
+            with open(self.filename, 'w', newline='') as fo:
+                fo.write(''.join(self.chunks))
+        self.manifest.record(self.filename, digest)
+        return False
+    
+    def write(self, text):
+        self.chunks.append(text)
+        if self.hash is not None:
+            self.hash.update(text.encode('utf-8'))
+        
+        
+def hash_text(text):
+    
+    """
+    Return the hash of a string combined with the generator version
+    
+    """
+    
+    return hashlib.sha1((GENERATOR_VERSION + text).encode('utf-8')).hexdigest()
+
+
+def hash_record(record):
+    
+    """
+    Return the hash of a compiled schema record, which is the normalized form of its XML definition
+    
+    """
+    
+    return hash_text(json.dumps(record))
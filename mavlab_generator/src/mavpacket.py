@@ -0,0 +1,125 @@
+'''
+Created on 18 Oct 2026
+
+Python implementation of the MAVLINK 1 packet, mirroring the MATLAB MAVLinkPacket class
+'''
+
+import struct
+
+from mavcrc import frame_crc
+
+#Frame constants
+STX = 254
+HEADER_LEN = 6
+CHECKSUM_LEN = 2
+MAX_PAYLOAD_SIZE = 255
+
+#System and component ID used for all transmissions
+SYSID = 255
+COMPID = 1
+
+_header = struct.Struct('<BBBBBB')
+_checksum = struct.Struct('<H')
+
+
+class MAVLinkError(Exception):
+
+    """
+    Raised when a MAVLINK frame cannot be encoded or decoded
+
+    """
+
+
+class MAVLinkPacket(object):
+
+    """
+    A single MAVLINK 1 frame
+
+    Parameters
+    ----------
+    msgid: integer
+        ID of the message type contained in the payload
+    payload: bytes-like
+        The packet payload
+    seq: integer
+        Sequence number of the packet
+    sysid: integer
+        ID of the sending system
+    compid: integer
+        ID of the sending component
+    ----------
+
+    """
+
+    __slots__ = ('seq', 'sysid', 'compid', 'msgid', 'payload', 'crc')
+
+    def __init__(self, msgid, payload, seq=0, sysid=SYSID, compid=COMPID):
+        self.msgid = msgid
+        self.payload = payload
+        self.seq = seq
+        self.sysid = sysid
+        self.compid = compid
+        self.crc = None
+
+    @property
+    def len(self):
+        return len(self.payload)
+
+    def encode(self, crc_extra):
+
+        """
+        Encode the packet into a byte buffer for transmission
+
+        Parameters
+        ----------
+        crc_extra: integer
+            CRC_EXTRA of the message carried by this packet
+        ----------
+
+        """
+
+        if len(self.payload) > MAX_PAYLOAD_SIZE:
+            raise MAVLinkError('Payload length %d exceeds %d bytes' % (len(self.payload), MAX_PAYLOAD_SIZE))
+
+        frame = bytearray(_header.pack(STX, len(self.payload), self.seq & 0xff, self.sysid,
+                                       self.compid, self.msgid))
+        frame += self.payload
+        self.crc = frame_crc(memoryview(frame)[1:], crc_extra)
+        frame += _checksum.pack(self.crc)
+        return bytes(frame)
+
+    @classmethod
+    def decode(cls, buf, crc_extras):
+
+        """
+        Decode a single complete frame and verify its checksum
+
+        Parameters
+        ----------
+        buf: bytes-like
+            Buffer starting with the STX byte of the frame
+        crc_extras: sequence of integers
+            CRC_EXTRA of every message indexed by message ID
+        ----------
+
+        """
+
+        view = memoryview(buf)
+        if len(view) < HEADER_LEN + CHECKSUM_LEN:
+            raise MAVLinkError('Frame is shorter than the MAVLINK header')
+
+        stx, length, seq, sysid, compid, msgid = _header.unpack_from(view)
+        if stx != STX:
+            raise MAVLinkError('Frame does not start with the STX byte')
+
+        end = HEADER_LEN + length
+        if len(view) < end + CHECKSUM_LEN:
+            raise MAVLinkError('Frame is shorter than its payload length')
+
+        crc = frame_crc(view[1:end], crc_extras[msgid])
+        if crc != _checksum.unpack_from(view, end)[0]:
+            raise MAVLinkError('Checksum of message (ID = %d) is not valid' % msgid)
+
+        packet = cls(msgid, bytes(view[HEADER_LEN:end]), seq, sysid, compid)
+        packet.crc = crc
+        return packet
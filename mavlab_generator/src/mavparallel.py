@@ -0,0 +1,308 @@
+'''
+Created on 18 Oct 2026
+
+Decoding of large logs in parallel, splitting the log into byte ranges decoded by a process pool
+whose columns are merged back in log order
+'''
+
+import os
+import re
+import mmap
+import struct
+from array import array
+from itertools import chain
+from binascii import crc_hqx
+from concurrent.futures import ProcessPoolExecutor
+
+from mavpacket import STX, HEADER_LEN, CHECKSUM_LEN, MAX_PAYLOAD_SIZE
+from mavparser import REVERSED_BITS, reversed_extras
+from mavcrc import CRC_INIT_VALUE
+
+#Smallest range given to a worker, smaller logs are split into fewer ranges
+MIN_RANGE = 1 << 20
+
+#Number of bytes of a range scanned at a time
+SCAN_BLOCK = 1 << 22
+MAX_FRAME_LEN = HEADER_LEN + MAX_PAYLOAD_SIZE + CHECKSUM_LEN
+
+#Length of the big-endian microsecond timestamp preceding every frame of a .tlog file
+TIMESTAMP_LEN = 8
+
+#Array type code of each struct format character, None for fields kept as bytes
+ARRAY_TYPECODE = {'d' : 'd', 'q' : 'q', 'Q' : 'Q', 'i' : 'i', 'I' : 'I', 'f' : 'f', 'h' : 'h',
+                  'H' : 'H', 'b' : 'b', 'B' : 'B', 'c' : None, 's' : None}
+
+_format_item = re.compile(r'(\d*)([a-zA-Z])')
+_timestamp = struct.Struct('>Q')
+_stx = bytes([STX])
+
+
+def message_layout(message):
+
+    """
+    Return the (NAME, LEN, struct format, fields) of a generated message class, where fields lists
+    the (name, array type code, number of values) of every field in wire order
+
+    Parameters
+    ----------
+    message: MAVLinkMessage subclass
+        Generated message class providing NAME, LEN, FIELDS and STRUCT
+    ----------
+
+    """
+
+    fields = []
+    for name, (count, code) in zip(message.FIELDS, _format_item.findall(message.STRUCT.format)):
+        if code == 's':
+            fields.append((name, None, 1))
+        else:
+            fields.append((name, ARRAY_TYPECODE[code], int(count or 1)))
+
+    return message.NAME, message.LEN, message.STRUCT.format, fields
+
+
+def frame_end(data, position, extras):
+
+    """
+    Return the position after the checksum of the frame starting at position, or -1 if there is
+    no complete frame with a valid checksum there
+
+    """
+
+    if position + HEADER_LEN > len(data):
+        return -1
+    end = position + HEADER_LEN + data[position + 1]
+    if end + CHECKSUM_LEN > len(data):
+        return -1
+
+    reversed_frame = data[position + 1:end].translate(REVERSED_BITS)
+    crc = crc_hqx(extras[data[position + 5]], crc_hqx(reversed_frame, CRC_INIT_VALUE))
+    if crc >> 8 != REVERSED_BITS[data[end]] or crc & 0xff != REVERSED_BITS[data[end + 1]]:
+        return -1
+    return end + CHECKSUM_LEN
+
+
+def resync_point(data, position, extras):
+
+    """
+    Return the position of the first frame with a valid checksum at or after position, or the
+    length of the data if there is none
+
+    """
+
+    start = data.find(_stx, position)
+    while start >= 0 and frame_end(data, start, extras) < 0:
+        start = data.find(_stx, start + 1)
+    return len(data) if start < 0 else start
+
+
+def columns(layout, blob):
+
+    """
+    Unpack the payloads of a message into one column per field. Numeric fields are arrays, with
+    the values of array fields stored one frame after another, and character fields are lists of
+    bytes.
+
+    """
+
+    name, length, fmt, fields = layout
+    items = list(zip(*struct.Struct(fmt).iter_unpack(blob))) if blob else []
+
+    result = {}
+    index = 0
+    for field, typecode, count in fields:
+        if not items:
+            result[field] = array(typecode) if typecode else []
+        elif typecode is None:
+            result[field] = list(items[index])
+        elif count == 1:
+            result[field] = array(typecode, items[index])
+        else:
+            result[field] = array(typecode, chain.from_iterable(zip(*items[index:index + count])))
+        index += count
+
+    return result
+
+
+def decode_range(log_path, start, stop, layouts, crc_extras, timestamps):
+
+    """
+    Decode the frames of a log whose STX byte is from start up to stop, returning the position the
+    search for the next frame continues from and the columns of every message ID found. The
+    search may continue past stop when the last frame runs over it.
+
+    Frames are found as MAVLinkLogIndex finds them, searching from the byte after an STX whose
+    frame fails its checksum and from the end of a valid frame. Frames of unknown messages or whose
+    length differs from the message length are skipped.
+
+    Parameters
+    ----------
+    log_path: string
+        Path to the log
+    start: integer
+        Position the search for frames starts from
+    stop: integer
+        Position of the first STX byte not decoded
+    layouts: list
+        message_layout of every message ID, None where the ID is not defined
+    crc_extras: sequence of integers
+        CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+    timestamps: boolean
+        Each frame is preceded by an 8 byte timestamp
+    ----------
+
+    """
+
+    extras = reversed_extras(crc_extras)
+    prefix = TIMESTAMP_LEN if timestamps else 0
+    groups = {}
+
+    with open(log_path, 'rb') as fi:
+        size = os.fstat(fi.fileno()).st_size
+        if size == 0:
+            return 0, {}
+        log = mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            position = start
+            while position < stop:
+                limit = min(SCAN_BLOCK, stop - position)
+                buf = log[position:position + limit + MAX_FRAME_LEN]
+                reversed_buf = buf.translate(REVERSED_BITS)
+                reversed_view = memoryview(reversed_buf)
+                find = buf.find
+
+                index = find(_stx)
+                while 0 <= index < limit:
+                    end = index + HEADER_LEN + buf[index + 1] if index + 1 < len(buf) else len(buf)
+                    if end + CHECKSUM_LEN > len(buf):
+                        index = find(_stx, index + 1)
+                        continue
+
+                    msgid = buf[index + 5]
+                    crc = crc_hqx(extras[msgid], crc_hqx(reversed_view[index + 1:end], CRC_INIT_VALUE))
+                    if crc >> 8 != reversed_buf[end] or crc & 0xff != reversed_buf[end + 1]:
+                        index = find(_stx, index + 1)
+                        continue
+
+                    layout = layouts[msgid]
+                    if layout is not None and end - index - HEADER_LEN == layout[1]:
+                        group = groups.get(msgid)
+                        if group is None:
+                            group = groups[msgid] = (array('Q'), array('Q'), bytearray(), bytearray(),
+                                                     bytearray(), bytearray())
+                        group[0].append(position + index)
+                        if prefix:
+                            group[1].append(_timestamp.unpack_from(log, position + index - prefix)[0])
+                        group[2].append(buf[index + 2])
+                        group[3].append(buf[index + 3])
+                        group[4].append(buf[index + 4])
+                        group[5].extend(buf[index + HEADER_LEN:end])
+                    index = find(_stx, end + CHECKSUM_LEN)
+
+                position += len(buf) if index < 0 else index
+        finally:
+            log.close()
+
+    result = {}
+    for msgid, (offsets, stamps, seq, sysid, compid, blob) in groups.items():
+        result[msgid] = columns(layouts[msgid], bytes(blob))
+        result[msgid]['_offset'] = offsets
+        if prefix:
+            result[msgid]['_timestamp'] = stamps
+        result[msgid]['_seq'] = array('B', seq)
+        result[msgid]['_sysid'] = array('B', sysid)
+        result[msgid]['_compid'] = array('B', compid)
+
+    return min(position, size), result
+
+
+def split_log(log_path, crc_extras, parts, timestamps):
+
+    """
+    Split a log into at most parts byte ranges, each starting at a frame with a valid checksum,
+    and return the (start, stop) of every range
+
+    """
+
+    size = os.path.getsize(log_path)
+    parts = max(1, min(parts, size // MIN_RANGE))
+    starts = [TIMESTAMP_LEN if timestamps else 0]
+    if parts > 1:
+        extras = reversed_extras(crc_extras)
+        with open(log_path, 'rb') as fi:
+            log = mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for part in range(1, parts):
+                    boundary = size * part // parts
+                    start = resync_point(log[boundary:boundary + SCAN_BLOCK], 0, extras) + boundary
+                    if start > starts[-1]:
+                        starts.append(min(start, size))
+            finally:
+                log.close()
+
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def decode_log(log_path, messages, crc_extras, jobs=None, timestamps=None):
+
+    """
+    Decode every frame of a log into one dictionary of columns per message name, splitting the log
+    into byte ranges decoded by a pool of worker processes. Every message has _offset, _seq,
+    _sysid and _compid columns, and _timestamp for logs with timestamps, with its frames in log
+    order. Frames of different messages can be put back in log order by their _offset.
+
+    Each range starts at a frame with a valid checksum. A worker decodes the frames starting in its
+    range, including a last frame which runs into the next range. Should that frame run over the
+    start of the next range, the next range is decoded again from the end of the frame, so the
+    result is always that of decoding the log with a single job.
+
+    Parameters
+    ----------
+    log_path: string
+        Path to the log
+    messages: list of MAVLinkMessage subclasses
+        Dispatch list of message classes indexed by message ID
+    crc_extras: sequence of integers
+        CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+    jobs: integer
+        Number of worker processes (default = None, one per CPU)
+    timestamps: boolean
+        Each frame is preceded by an 8 byte timestamp (default = None, True for .tlog files)
+    ----------
+
+    """
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if timestamps is None:
+        timestamps = log_path.endswith('.tlog')
+
+    layouts = [None if message is None else message_layout(message) for message in messages]
+    layouts += [None] * (256 - len(layouts))
+    crc_extras = list(crc_extras)
+    ranges = split_log(log_path, crc_extras, jobs, timestamps)
+
+    if len(ranges) == 1:
+        parts = [decode_range(log_path, start, stop, layouts, crc_extras, timestamps) for start, stop in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as executor:
+            futures = [executor.submit(decode_range, log_path, start, stop, layouts, crc_extras, timestamps)
+                       for start, stop in ranges]
+            parts = [future.result() for future in futures]
+
+    #Decode a range again from where the previous range stopped if it did not stop at its start
+    for i in range(1, len(ranges)):
+        if parts[i - 1][0] != ranges[i][0]:
+            parts[i] = decode_range(log_path, parts[i - 1][0], ranges[i][1], layouts, crc_extras, timestamps)
+
+    result = {}
+    for _, groups in parts:
+        for msgid in sorted(groups):
+            name = layouts[msgid][0]
+            if name not in result:
+                result[name] = groups[msgid]
+            else:
+                for key, column in groups[msgid].items():
+                    result[name][key].extend(column)
+
+    return result
@@ -0,0 +1,159 @@
+'''
+Created on 18 Oct 2026
+
+Python implementation of the MATLAB MAVLinkParser which parses a stream a chunk at a time
+'''
+
+from binascii import crc_hqx
+
+from mavpacket import MAVLinkPacket, STX, HEADER_LEN, CHECKSUM_LEN
+from mavcrc import CRC_INIT_VALUE
+from mavstats import MAVLinkStats
+
+#Every byte value with its bits reversed. The reflected X.25 checksum of a buffer is the bit
+#reversal of the CCITT checksum, calculated by binascii.crc_hqx, of the buffer with every byte
+#reversed, so a chunk is reversed once and each frame is then checksummed in C.
+REVERSED_BITS = bytes(int('{:08b}'.format(byte)[::-1], 2) for byte in range(256))
+
+_stx = bytes([STX])
+
+
+def reversed_extras(crc_extras):
+
+    """
+    Return the CRC_EXTRA of every message ID as a single bit reversed byte, padded to 256 IDs, to
+    be checksummed after the reversed bytes of a frame
+
+    Parameters
+    ----------
+    crc_extras: sequence of integers
+        CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+    ----------
+
+    """
+
+    extras = [bytes([REVERSED_BITS[crc_extra]]) for crc_extra in crc_extras]
+    return extras + [b'\x00'] * (256 - len(extras))
+
+
+class MAVLinkParser(object):
+
+    """
+    Parses a stream for MAVLINK 1 frames a chunk at a time. Frames are found and checked as
+    MAVLinkParser.parseChar would, including resynchronising on an STX byte in place of a failed
+    checksum byte, and the bytes of an incomplete frame at the end of a chunk are kept and parsed
+    with the next chunk. Sequence numbers are tracked for each (sysid, compid).
+
+    Parameters
+    ----------
+    crc_extras: sequence of integers
+        CRC_EXTRA of every message indexed by message ID, 0 where the ID is not defined
+    stats: MAVLinkStats
+        Statistics updated by the parser (default = None, create new statistics)
+    ----------
+
+    """
+
+    def __init__(self, crc_extras, stats=None):
+        self.extras = reversed_extras(crc_extras)
+        self.stats = MAVLinkStats() if stats is None else stats
+        self.carry = b''
+        self.synced = True
+
+    def parse(self, chunk):
+
+        """
+        Parse the next chunk of the stream and return a list of the MAVLinkPackets it completes
+
+        Parameters
+        ----------
+        chunk: bytes-like
+            The next bytes of the stream
+        ----------
+
+        """
+
+        buf = self.carry + chunk if self.carry else bytes(chunk)
+        size = len(buf)
+        reversed_buf = buf.translate(REVERSED_BITS)
+        reversed_view = memoryview(reversed_buf)
+
+        find = buf.find
+        extras = self.extras
+        stats = self.stats
+        sender_seq = stats.sender_seq
+        sender_received = stats.sender_received
+        sender_dropped = stats.sender_dropped
+        message_received = stats.message_received
+        message_bytes = stats.message_bytes
+        synced = self.synced
+        failed = dropped = resyncs = 0
+        packets = []
+        append = packets.append
+
+        #Bytes discarded while searching for an STX, or a failed checksum, lose synchronisation and
+        #the next valid frame counts as a resync
+        start = find(_stx)
+        if start != 0 and size:
+            synced = False
+        while start >= 0:
+            if start + 1 >= size:
+                break
+            end = start + HEADER_LEN + buf[start + 1]
+            if end + CHECKSUM_LEN > size:
+                break
+
+            msgid = buf[start + 5]
+            crc = crc_hqx(extras[msgid], crc_hqx(reversed_view[start + 1:end], CRC_INIT_VALUE))
+
+            #A failed checksum byte is the first byte searched for the next STX
+            if crc >> 8 != reversed_buf[end]:
+                failed += 1
+                synced = False
+                start = find(_stx, end)
+                continue
+            if crc & 0xff != reversed_buf[end + 1]:
+                failed += 1
+                synced = False
+                start = find(_stx, end + 1)
+                continue
+
+            if not synced:
+                resyncs += 1
+                synced = True
+
+            #Sequence numbers are tracked for each sender
+            seq = buf[start + 2]
+            sysid = buf[start + 3]
+            compid = buf[start + 4]
+            key = sysid << 8 | compid
+            last = sender_seq[key]
+            sender_seq[key] = seq
+            sender_received[key] += 1
+            if last >= 0:
+                drop = ((seq - last) & 0xff) - 1
+                sender_dropped[key] += drop
+                dropped += drop
+            else:
+                stats.senders.append(key)
+            message_received[msgid] += 1
+            message_bytes[msgid] += end + CHECKSUM_LEN - start
+
+            append(MAVLinkPacket(msgid, buf[start + HEADER_LEN:end], seq, sysid, compid))
+
+            #On a clean link the next frame follows the checksum, so the search is skipped
+            start = end + CHECKSUM_LEN
+            if start >= size:
+                start = -1
+            elif buf[start] != STX:
+                synced = False
+                start = find(_stx, start)
+
+        self.carry = buf[start:] if start >= 0 else b''
+        self.synced = synced
+        stats.failed_crc += failed
+        stats.packets_dropped += dropped
+        stats.packets_received += len(packets)
+        stats.resyncs += resyncs
+        stats.tick()
+        return packets
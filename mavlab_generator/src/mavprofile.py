@@ -0,0 +1,113 @@
+'''
+Created on 18 Oct 2026
+
+Generation profiles, which select the messages and enums of a compiled schema that a deployment uses
+
+A profile is a text file with one entry per line. Each entry is the keyword message or enum followed
+by a name pattern, which may contain the shell wildcards *, ? and [...]. Patterns are not case
+sensitive, blank lines and text after a # are ignored. For example
+
+    #Telemetry used by the ground station
+    message HEARTBEAT
+    message GLOBAL_POSITION_*
+    enum MAV_*
+'''
+
+import fnmatch
+from collections import namedtuple
+
+#Selected message and enum patterns, in upper case
+Profile = namedtuple('Profile', ['messages', 'enums'])
+
+
+def parse_profile(text, filename='<profile>'):
+
+    """
+    Parse the text of a profile into a Profile
+
+    Parameters
+    ----------
+    text: string
+        Contents of the profile
+    filename: string
+        Name of the profile used in error messages (default = '<profile>')
+    ----------
+
+    """
+
+    messages = []
+    enums = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.split('#')[0].strip()
+        if not line:
+            continue
+
+        parts = line.split()
+        if len(parts) != 2 or parts[0].lower() not in ('message', 'enum'):
+            raise ValueError('%s:%d: expected "message <pattern>" or "enum <pattern>"' % (filename, line_number))
+
+        if parts[0].lower() == 'message':
+            messages.append(parts[1].upper())
+        else:
+            enums.append(parts[1].upper())
+
+    return Profile(tuple(messages), tuple(enums))
+
+
+def load_profile(filename):
+
+    """
+    Load a profile from a file
+
+    Parameters
+    ----------
+    filename: string
+        Path to the profile
+    ----------
+
+    """
+
+    with open(filename, 'r') as fi:
+        return parse_profile(fi.read(), filename)
+
+
+def matches(name, patterns):
+
+    """
+    Return whether a message or enum name matches any of a list of profile patterns
+
+    """
+
+    name = name.upper()
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def apply_profile(schema, profile):
+
+    """
+    Return the dialects of a schema keeping only the messages and enums selected by a profile, and
+    the list of patterns which did not select anything
+
+    Parameters
+    ----------
+    schema: list of mavschema.Dialect
+        Compiled dialects
+    profile: Profile
+        Profile selecting the messages and enums to keep
+    ----------
+
+    """
+
+    selected = []
+    used = set()
+    for dialect in schema:
+        messages = tuple(message for message in dialect.messages if matches(message.name, profile.messages))
+        enums = tuple(enum for enum in dialect.enums if matches(enum.name, profile.enums))
+        used.update(pattern for pattern in profile.messages
+                    if any(fnmatch.fnmatchcase(message.name.upper(), pattern) for message in messages))
+        used.update(pattern for pattern in profile.enums
+                    if any(fnmatch.fnmatchcase(enum.name.upper(), pattern) for enum in enums))
+        selected.append(dialect._replace(messages=messages, enums=enums))
+
+    unused = [pattern for pattern in profile.messages + profile.enums if pattern not in used]
+    return selected, unused
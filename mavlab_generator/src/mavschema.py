@@ -0,0 +1,415 @@
+'''
+Created on 18 Oct 2026
+
+Compiles MAVLINK XML dialects into an immutable schema shared by every code emitter
+'''
+
+#Import the ElementTree XML module using the C implementation if available
+try:
+    import xml.etree.cElementTree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+import os
+import json
+import hashlib
+from os.path import basename
+from collections import namedtuple
+
+import mavcrc
+
+#Version of the schema layout, stored in every cache file so stale caches are recompiled
+SCHEMA_VERSION = 1
+
+#Size in bytes of each MAVLINK field type
+TYPE_SIZE = {'double' : 8, 'int64_t' : 8, 'uint64_t': 8, 'int32_t' : 4, 'uint32_t': 4,
+             'float' : 4, 'int16_t' : 2, 'uint16_t': 2, 'int8_t' : 1, 'uint8_t': 1,
+             'char' : 1}
+
+#Schema records
+Field = namedtuple('Field', ['name', 'type', 'array_length', 'offset', 'description'])
+Message = namedtuple('Message', ['id', 'name', 'description', 'fields', 'length', 'crc_extra'])
+EnumEntry = namedtuple('EnumEntry', ['name', 'value', 'description'])
+Enum = namedtuple('Enum', ['name', 'entries'])
+Dialect = namedtuple('Dialect', ['name', 'version', 'includes', 'messages', 'enums'])
+Conflict = namedtuple('Conflict', ['kind', 'dialect', 'message', 'kept_dialect', 'kept_message'])
+
+
+def compile_message(msg):
+
+    """
+    Compile a message element into a Message with its fields in wire order
+
+    Parameters
+    ----------
+    msg: XML Element
+        Message element to be compiled
+    ----------
+
+    """
+
+    name = msg.attrib.get('name')
+    if msg.find('description') != None:
+        description = msg.find('description').text
+    else:
+        description = None
+
+    #Get message fields, MAVLINK 1 does not transmit fields after the extensions tag
+    fields = []
+    for field in msg:
+        if field.tag == 'extensions':
+            break
+        if field.tag != 'field':
+            continue
+
+        field_type = field.attrib.get('type')
+        if '[' in field_type:
+            array_length = int(field_type.split('[')[1].split(']')[0])
+            field_type = field_type.split('[')[0]
+        else:
+            array_length = 1
+
+        if field_type == 'uint8_t_mavlink_version':
+            field_type = 'uint8_t'
+
+        fields.append((field.attrib.get('name'), field_type, array_length, field.text or ''))
+
+    #Sort fields into descending type size, keeping the XML order of fields of the same size
+    fields.sort(key = lambda k: -TYPE_SIZE[k[1]])
+
+    #Calculate field offsets and the payload length
+    wire_fields = []
+    offset = 0
+    for field_name, field_type, array_length, field_desc in fields:
+        wire_fields.append(Field(field_name, field_type, array_length, offset, field_desc))
+        offset += TYPE_SIZE[field_type] * array_length
+
+    crc_extra = mavcrc.crc_extra(name, [(field.type, field.name, field.array_length) for field in wire_fields])
+
+    return Message(int(msg.attrib.get('id')), name, description, tuple(wire_fields), offset, crc_extra)
+
+
+def compile_enum(enum):
+
+    """
+    Compile an enum element into an Enum, numbering entries without a value from 0
+
+    Parameters
+    ----------
+    enum: XML Element
+        Enum element to be compiled
+    ----------
+
+    """
+
+    entries = []
+    enum_counter = 0
+    for entry in enum.findall('entry'):
+
+        value = entry.attrib.get('value')
+        if value == None:
+            value = str(enum_counter)
+            enum_counter += 1
+
+        if entry.find('description') != None:
+            desc = entry.find('description').text
+        else:
+            desc = None
+
+        entries.append(EnumEntry(entry.attrib.get('name'), value, desc))
+
+    return Enum(enum.attrib.get('name'), tuple(entries))
+
+
+def iterparse_elements(filename, tags):
+
+    """
+    Stream the elements of an XML file using iterparse. Each element with a tag in tags is yielded
+    as soon as it is closed, after which it is cleared and removed from the tree so that memory
+    use does not grow with the size of the file.
+
+    Parameters
+    ----------
+    filename: string
+        Path to the MAVLINK XML file
+    tags: set of strings
+        Tags of the elements to be yielded
+    ----------
+
+    """
+
+    parents = []
+    for event, elem in ET.iterparse(filename, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+
+        parents.pop()
+        if elem.tag not in tags:
+            continue
+
+        yield elem
+
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+
+def compile_dialect(filename, streaming=False):
+
+    """
+    Compile a MAVLINK XML file into a Dialect
+
+    Parameters
+    ----------
+    filename: string
+        Path to the MAVLINK XML file
+    streaming: boolean
+        Stream the file with iterparse instead of loading the whole document (default = False)
+    ----------
+
+    """
+
+    if streaming:
+        elements = iterparse_elements(filename, {'message', 'enum', 'include', 'version'})
+    else:
+        root = ET.parse(filename).getroot()
+        elements = root.iter()
+
+    version = None
+    includes = []
+    messages = []
+    enums = []
+    for elem in elements:
+        if elem.tag == 'message':
+            messages.append(compile_message(elem))
+        elif elem.tag == 'enum':
+            enums.append(compile_enum(elem))
+        elif elem.tag == 'include':
+            includes.append(elem.text.strip())
+        elif elem.tag == 'version':
+            version = int(elem.text)
+
+    return Dialect(basename(filename).split('.')[0], version, tuple(includes), tuple(messages), tuple(enums))
+
+
+def dialect_from_json(data):
+
+    """
+    Rebuild a Dialect from the nested lists it is stored as in JSON
+
+    """
+
+    name, version, includes, messages, enums = data
+    return Dialect(name, version, tuple(includes),
+                   tuple(Message(msgid, msg_name, desc, tuple(Field(*field) for field in fields), length, crc)
+                         for msgid, msg_name, desc, fields, length, crc in messages),
+                   tuple(Enum(enum_name, tuple(EnumEntry(*entry) for entry in entries))
+                         for enum_name, entries in enums))
+
+
+def hash_file(filename):
+
+    """
+    Return the SHA1 hash of the contents of a file
+
+    """
+
+    with open(filename, 'rb') as fi:
+        return hashlib.sha1(fi.read()).hexdigest()
+
+
+def load_dialect(filename, cache_path=None, streaming=False):
+
+    """
+    Load the compiled Dialect of an XML file from the cache, compiling and caching it if the cache
+    is missing, stale or was written by another schema version
+
+    Parameters
+    ----------
+    filename: string
+        Path to the MAVLINK XML file
+    cache_path: string
+        Folder containing the schema cache (default = None, do not cache)
+    streaming: boolean
+        Stream the file with iterparse if it has to be compiled (default = False)
+    ----------
+
+    """
+
+    if cache_path is None:
+        return compile_dialect(filename, streaming)
+
+    source_hash = hash_file(filename)
+    cache_file = os.path.join(cache_path, '%s.json' % basename(filename).split('.')[0])
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as fi:
+                cache = json.load(fi)
+            if cache['schema_version'] == SCHEMA_VERSION and cache['source_hash'] == source_hash:
+                return dialect_from_json(cache['dialect'])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    dialect = compile_dialect(filename, streaming)
+
+    if not os.path.exists(cache_path):
+        os.makedirs(cache_path)
+    with open(cache_file, 'w') as fo:
+        json.dump({'schema_version' : SCHEMA_VERSION, 'source_hash' : source_hash, 'dialect' : dialect},
+                  fo, separators=(',', ':'))
+
+    return dialect
+
+
+def load_schema(xml_path, cache_path=None, streaming=False):
+
+    """
+    Load the compiled Dialect of every XML file in a folder, in file name order
+
+    Parameters
+    ----------
+    xml_path: string
+        Path to the folder containing the MAVLINK XML dialect files
+    cache_path: string
+        Folder containing the schema cache (default = None, do not cache)
+    streaming: boolean
+        Stream files with iterparse if they have to be compiled (default = False)
+    ----------
+
+    """
+
+    return [load_dialect(os.path.join(xml_path, filename), cache_path, streaming)
+            for filename in sorted(os.listdir(xml_path)) if filename.endswith('.xml')]
+
+
+def include_order(xml_path, cache_path=None, streaming=False):
+
+    """
+    Load every XML file in a folder together with the files they include, returning each Dialect
+    once with the dialects it includes placed before it. Files are visited in file name order and
+    include paths are relative to the including file.
+
+    Parameters
+    ----------
+    xml_path: string
+        Path to the folder containing the MAVLINK XML dialect files
+    cache_path: string
+        Folder containing the schema cache (default = None, do not cache)
+    streaming: boolean
+        Stream files with iterparse if they have to be compiled (default = False)
+    ----------
+
+    """
+
+    dialects = []
+    visited = set()
+
+    def visit(filename):
+        filename = os.path.abspath(filename)
+        if filename in visited:
+            return
+        visited.add(filename)
+
+        if not os.path.exists(filename):
+            raise IOError('Included dialect %s does not exist' % filename)
+
+        dialect = load_dialect(filename, cache_path, streaming)
+        for include in dialect.includes:
+            visit(os.path.join(os.path.dirname(filename), include))
+        dialects.append(dialect)
+
+    for filename in sorted(os.listdir(xml_path)):
+        if filename.endswith('.xml'):
+            visit(os.path.join(xml_path, filename))
+
+    return dialects
+
+
+def merge_dialects(dialects):
+
+    """
+    Remove messages which are already defined by an earlier dialect, so that each message is kept
+    once by the first dialect defining it. Definitions which reuse a message ID with another name,
+    or a message name with another ID or CRC_EXTRA, are returned as conflicts and the earlier
+    definition is kept.
+
+    Parameters
+    ----------
+    dialects: list of Dialect
+        Compiled dialects with included dialects first
+    ----------
+
+    """
+
+    by_id = {}
+    by_name = {}
+    merged = []
+    conflicts = []
+    for dialect in dialects:
+        messages = []
+        for message in dialect.messages:
+            if message.id in by_id:
+                kept_dialect, kept = by_id[message.id]
+                if kept.name != message.name:
+                    conflicts.append(Conflict('id', dialect.name, message, kept_dialect, kept))
+                elif kept.crc_extra != message.crc_extra:
+                    conflicts.append(Conflict('crc', dialect.name, message, kept_dialect, kept))
+                continue
+
+            if message.name in by_name:
+                kept_dialect, kept = by_name[message.name]
+                conflicts.append(Conflict('name', dialect.name, message, kept_dialect, kept))
+                continue
+
+            by_id[message.id] = by_name[message.name] = (dialect.name, message)
+            messages.append(message)
+
+        merged.append(dialect._replace(messages=tuple(messages)))
+
+    return merged, conflicts
+
+
+def describe_conflict(conflict):
+
+    """
+    Return a one line description of a conflict
+
+    """
+
+    message, kept = conflict.message, conflict.kept_message
+    if conflict.kind == 'id':
+        detail = 'ID %d is %s in %s but %s in %s' % (message.id, kept.name, conflict.kept_dialect,
+                                                  message.name, conflict.dialect)
+    elif conflict.kind == 'crc':
+        detail = '%s (ID = %d) has CRC_EXTRA %d in %s but %d in %s' % (message.name, message.id,
+                                                                     kept.crc_extra, conflict.kept_dialect,
+                                                                     message.crc_extra, conflict.dialect)
+    else:
+        detail = '%s has ID %d in %s but %d in %s' % (message.name, kept.id, conflict.kept_dialect,
+                                                   message.id, conflict.dialect)
+
+    return '%s, the definition in %s is used' % (detail, conflict.kept_dialect)
+
+
+def resolve_schema(xml_path, cache_path=None, streaming=False):
+
+    """
+    Load the dialects of a folder following their include graph, so that each file is compiled
+    once and each message belongs to a single dialect. Returns the merged dialects, with included
+    dialects first, and the list of conflicting definitions that were dropped.
+
+    Parameters
+    ----------
+    xml_path: string
+        Path to the folder containing the MAVLINK XML dialect files
+    cache_path: string
+        Folder containing the schema cache (default = None, do not cache)
+    streaming: boolean
+        Stream files with iterparse if they have to be compiled (default = False)
+    ----------
+
+    """
+
+    return merge_dialects(include_order(xml_path, cache_path, streaming))
@@ -0,0 +1,167 @@
+'''
+Created on 18 Oct 2026
+
+Statistics of a MAVLINK stream, with the packet drops of each sender and the rate of each message
+over a sliding window
+'''
+
+import time
+
+#Number of buckets of the sliding window and the length of each bucket in seconds, rates are
+#measured over the last WINDOW_BUCKETS - 1 to WINDOW_BUCKETS buckets
+WINDOW_BUCKETS = 10
+BUCKET_SECONDS = 1.0
+
+
+class MAVLinkStats(object):
+
+    """
+    Error counts and packet drops of a stream, as the MATLAB MAVLinkStats class
+
+    failed_crc, packets_dropped and packets_received match failedCRC, packetsDropped and
+    packetsReceived of MAVLinkStats after parsing the same stream with MAVLinkParser.parseChar.
+    Sequence numbers are tracked for each (sysid, compid), so the interleaved packets of several
+    senders are not counted as drops.
+
+    Recording a frame costs a few updates of fixed size lists, indexed by sysid << 8 | compid for
+    the counters of each sender and by message ID for the counters of each message. The message
+    rates are measured against snapshots of the message counters kept in a ring of WINDOW_BUCKETS
+    entries, which the parser advances at most once per bucket.
+
+    Parameters
+    ----------
+    buckets: integer
+        Number of snapshots kept for the sliding window (default = WINDOW_BUCKETS)
+    bucket_seconds: float
+        Time between snapshots in seconds (default = BUCKET_SECONDS)
+    clock: callable
+        Returns the current time in seconds (default = time.monotonic)
+    ----------
+
+    """
+
+    __slots__ = ('failed_crc', 'packets_dropped', 'packets_received', 'resyncs', 'senders',
+                 'sender_seq', 'sender_received', 'sender_dropped', 'message_received',
+                 'message_bytes', 'clock', 'bucket_seconds', 'bucket_end', 'history', 'history_index')
+
+    def __init__(self, buckets=WINDOW_BUCKETS, bucket_seconds=BUCKET_SECONDS, clock=time.monotonic):
+        self.failed_crc = 0
+        self.packets_dropped = 0
+        self.packets_received = 0
+        self.resyncs = 0
+
+        #Keys of the senders heard in the order they were first heard, with the last sequence
+        #number, packets received and packets dropped of each sender indexed by sysid << 8 | compid
+        self.senders = []
+        self.sender_seq = [-1] * 65536
+        self.sender_received = [0] * 65536
+        self.sender_dropped = [0] * 65536
+
+        #Frames and bytes received of each message ID
+        self.message_received = [0] * 256
+        self.message_bytes = [0] * 256
+
+        self.clock = clock
+        self.bucket_seconds = bucket_seconds
+        now = clock()
+        self.bucket_end = now + bucket_seconds
+        self.history = [None] * max(buckets, 1)
+        self.history[0] = (now, self.message_received[:], self.message_bytes[:])
+        self.history_index = 1 % len(self.history)
+
+    @property
+    def packet_loss(self):
+
+        """
+        Fraction of packets dropped, -1 if no packets have been received
+
+        """
+
+        if self.packets_received > 0:
+            return self.packets_dropped / float(self.packets_dropped + self.packets_received)
+        return -1
+
+    def tick(self, now=None):
+
+        """
+        Take a snapshot of the message counters if the current bucket has ended, called by the
+        parser once per chunk
+
+        """
+
+        if now is None:
+            now = self.clock()
+        if now >= self.bucket_end:
+            self.history[self.history_index] = (now, self.message_received[:], self.message_bytes[:])
+            self.history_index = (self.history_index + 1) % len(self.history)
+            self.bucket_end = now + self.bucket_seconds
+
+    def sender(self, sysid, compid):
+
+        """
+        Return the (packets received, packets dropped) of a sender
+
+        """
+
+        key = sysid << 8 | compid
+        return self.sender_received[key], self.sender_dropped[key]
+
+    def message_rates(self, now=None):
+
+        """
+        Return the (frames per second, bytes per second) of every message ID received during the
+        sliding window, keyed by message ID
+
+        """
+
+        if now is None:
+            now = self.clock()
+        oldest = self.history[self.history_index] or self.history[0]
+        start, received, nbytes = oldest
+        elapsed = now - start
+        if elapsed <= 0:
+            return {}
+
+        rates = {}
+        for msgid, count in enumerate(self.message_received):
+            if count != received[msgid]:
+                rates[msgid] = ((count - received[msgid]) / elapsed,
+                                (self.message_bytes[msgid] - nbytes[msgid]) / elapsed)
+        return rates
+
+    def snapshot(self, now=None):
+
+        """
+        Return the counters as a dictionary for display, with the counters of each sender keyed by
+        (sysid, compid) and of each message keyed by message ID
+
+        """
+
+        rates = self.message_rates(now)
+        senders = {}
+        for key in self.senders:
+            received = self.sender_received[key]
+            dropped = self.sender_dropped[key]
+            senders[key >> 8, key & 0xff] = {'received' : received,
+                                             'dropped' : dropped,
+                                             'packet_loss' : dropped / float(dropped + received)}
+        messages = {}
+        for msgid, count in enumerate(self.message_received):
+            if count:
+                rate, byte_rate = rates.get(msgid, (0.0, 0.0))
+                messages[msgid] = {'received' : count,
+                                   'bytes' : self.message_bytes[msgid],
+                                   'rate' : rate,
+                                   'byte_rate' : byte_rate}
+
+        return {'failed_crc' : self.failed_crc,
+                'packets_dropped' : self.packets_dropped,
+                'packets_received' : self.packets_received,
+                'resyncs' : self.resyncs,
+                'packet_loss' : self.packet_loss,
+                'senders' : senders,
+                'messages' : messages}
+
+    def __repr__(self):
+        return 'MAVLinkStats(failed_crc=%d, packets_dropped=%d, packets_received=%d, resyncs=%d)' % (
+            self.failed_crc, self.packets_dropped, self.packets_received, self.resyncs)
@@ -0,0 +1,297 @@
+'''
+Created on 18 Oct 2026
+
+Python implementation of the MAVString template language used by the files in the templates folder
+
+    Variable: ${var}$
+    Repetition: #{array<#>text}#
+    Conditional: ?{condition<?>expression1<?>expression2}?
+
+Each template is compiled once into a Python function which appends the rendered text to a list.
+Literal text is unescaped as MATLAB fprintf would, so both generators produce the same files.
+'''
+
+import os
+import re
+import hashlib
+
+#Folder containing the templates shared with the MATLAB generator
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates')
+
+#Tags which start or end a block of the template
+TAG_PATTERN = re.compile(r'\$\{|#\{|\?\{|\}#|\}\?|<\?>')
+
+#Escape sequences interpreted by MATLAB fprintf when the rendered text is written
+FPRINTF_PATTERN = re.compile(r'%%|\\\\|\\n|\\t|\\r')
+FPRINTF_ESCAPES = {'%%' : '%', '\\\\' : '\\', '\\n' : '\n', '\\t' : '\t', '\\r' : '\r'}
+
+#MATLAB operators used in conditions and their Python equivalents
+CONDITION_OPERATORS = [('||', ' or '), ('&&', ' and '), ('~=', '!='), ('~', ' not ')]
+
+#Compiled templates by file name
+_templates = {}
+
+
+def text(value):
+
+    """
+    Convert a schema value to the text inserted in place of a variable tag
+
+    """
+
+    return value if isinstance(value, str) else str(value)
+
+
+def strcmp(a, b):
+
+    """
+    Compare two strings in a condition as the MATLAB strcmp function
+
+    """
+
+    return a == b
+
+
+def unescape(literal, newline='\n'):
+
+    """
+    Interpret the fprintf escape sequences in a piece of literal template text, writing each \\n
+    as newline
+
+    """
+
+    escapes = dict(FPRINTF_ESCAPES)
+    escapes['\\n'] = newline
+    return FPRINTF_PATTERN.sub(lambda match: escapes[match.group(0)], literal)
+
+
+def parse(source, name, pos=0, closing=None):
+
+    """
+    Parse a template from pos into a list of nodes until the closing tag, returning the nodes and
+    the position after the closing tag. Nodes are strings for literal text or tuples of
+    ('var', name), ('repeat', name, body) and ('if', condition, expression1, expression2).
+
+    Parameters
+    ----------
+    source: string
+        Template text
+    name: string
+        Name of the template used in error messages
+    pos: integer
+        Position at which to start parsing (default = 0)
+    closing: string
+        Tag which ends this block (default = None, parse to the end of the template)
+    ----------
+
+    """
+
+    nodes = []
+    while True:
+        match = TAG_PATTERN.search(source, pos)
+        if match is None:
+            if closing is not None:
+                raise ValueError('%s: expected %s before the end of the template' % (name, closing))
+            if pos < len(source):
+                nodes.append(source[pos:])
+            return nodes, len(source)
+
+        if match.start() > pos:
+            nodes.append(source[pos:match.start()])
+        tag = match.group(0)
+        pos = match.end()
+
+        if tag == '${':
+            end = source.find('}$', pos)
+            if end < 0:
+                raise ValueError('%s: variable at %d is not closed' % (name, match.start()))
+            nodes.append(('var', source[pos:end]))
+            pos = end + 2
+
+        elif tag == '#{':
+            end = source.find('<#>', pos)
+            if end < 0:
+                raise ValueError('%s: repetition at %d has no <#>' % (name, match.start()))
+            body, pos = parse(source, name, end + 3, '}#')
+            nodes.append(('repeat', source[match.end():end], body))
+
+        elif tag == '?{':
+            condition, pos = parse(source, name, pos, '<?>')
+            expression1, pos = parse(source, name, pos, '<?>')
+            expression2, pos = parse(source, name, pos, '}?')
+            nodes.append(('if', condition, expression1, expression2))
+
+        elif tag == closing:
+            return nodes, pos
+
+        else:
+            raise ValueError('%s: unexpected %s at %d' % (name, tag, match.start()))
+
+
+def compile_condition(nodes, scope):
+
+    """
+    Translate the nodes of a MATLAB condition into a Python expression. Variables inside quotes are
+    inserted as text, other variables are inserted as their value.
+
+    Parameters
+    ----------
+    nodes: list
+        Literal text and variable nodes of the condition
+    scope: string
+        Name of the Python variable holding the current schema
+    ----------
+
+    """
+
+    expression = []
+    quoted = None
+    for node in nodes:
+        if not isinstance(node, str):
+            value = '%s[%r]' % (scope, node[1])
+            if quoted is None:
+                expression.append(value)
+            else:
+                quoted.append('text(%s)' % value)
+            continue
+
+        for i, part in enumerate(node.split("'")):
+            if i > 0:
+                if quoted is None:
+                    quoted = []
+                else:
+                    expression.append('(%s)' % ' + '.join(quoted or ["''"]))
+                    quoted = None
+            if quoted is not None:
+                if part:
+                    quoted.append(repr(part))
+            else:
+                for operator, replacement in CONDITION_OPERATORS:
+                    part = part.replace(operator, replacement)
+                expression.append(part)
+
+    if quoted is not None:
+        raise ValueError('Condition %r has an unterminated string' % nodes)
+
+    return ''.join(expression).strip()
+
+
+def append_run(lines, indent, run, values):
+
+    """
+    Append the statement rendering a run of literal text, with %% escaped, and %s in place of each
+    of the variable expressions in values
+
+    """
+
+    if not run:
+        return
+    literal = ''.join(run)
+    if values:
+        lines.append('%sappend(%r %% (%s,))' % (indent, literal, ', '.join(values)))
+    else:
+        lines.append('%sappend(%r)' % (indent, literal.replace('%%', '%')))
+
+
+def compile_nodes(nodes, lines, indent, depth, newline):
+
+    """
+    Append the Python statements rendering a list of nodes to lines. Each run of literal text and
+    variables is rendered by a single append of a % formatted string.
+
+    """
+
+    scope = 'schema%d' % depth
+    start = len(lines)
+    run = []
+    values = []
+    for node in nodes:
+        if isinstance(node, str):
+            run.append(unescape(node, newline).replace('%', '%%'))
+            continue
+        if node[0] == 'var':
+            run.append('%s')
+            values.append('%s[%r]' % (scope, node[1]))
+            continue
+
+        append_run(lines, indent, run, values)
+        run = []
+        values = []
+        if node[0] == 'repeat':
+            lines.append('%sfor schema%d in %s[%r]:' % (indent, depth + 1, scope, node[1]))
+            compile_nodes(node[2], lines, indent + '    ', depth + 1, newline)
+        else:
+            lines.append('%sif %s:' % (indent, compile_condition(node[1], scope)))
+            compile_nodes(node[2], lines, indent + '    ', depth, newline)
+            lines.append('%selse:' % indent)
+            compile_nodes(node[3], lines, indent + '    ', depth, newline)
+
+    append_run(lines, indent, run, values)
+    if len(lines) == start:
+        lines.append('%spass' % indent)
+
+
+class Template(object):
+
+    """
+    A template compiled into a Python function. Escaped new lines are written with the line ending
+    used by the template. The hash of the template text is kept so that files rendered from it are
+    regenerated when the template changes.
+
+    Parameters
+    ----------
+    source: string
+        Template text
+    name: string
+        Name of the template used in error messages (default = '<template>')
+    ----------
+
+    """
+
+    def __init__(self, source, name='<template>'):
+        self.name = name
+        self.digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        nodes, _ = parse(source, name)
+
+        lines = ['def render(schema0, out):', '    append = out.append']
+        newline = '\r\n' if '\r\n' in source else '\n'
+        compile_nodes(nodes, lines, '    ', 0, newline)
+        self.source = '\n'.join(lines) + '\n'
+
+        namespace = {'text' : text, 'strcmp' : strcmp}
+        exec(compile(self.source, '<template %s>' % name, 'exec'), namespace)
+        self.render_into = namespace['render']
+
+    def render(self, schema):
+
+        """
+        Render the template with the data of a schema, given as nested dictionaries and lists
+
+        """
+
+        out = []
+        self.render_into(schema, out)
+        return ''.join(out)
+
+
+def load_template(filename):
+
+    """
+    Return the compiled template of a file in the templates folder, compiling it on first use.
+    Line endings of the template are kept.
+
+    Parameters
+    ----------
+    filename: string
+        File name of the template
+    ----------
+
+    """
+
+    template = _templates.get(filename)
+    if template is None:
+        with open(os.path.join(TEMPLATE_PATH, filename), 'r', newline='') as fi:
+            template = Template(fi.read(), filename)
+        _templates[filename] = template
+
+    return template
@@ -0,0 +1,96 @@
+'''
+Created on 18 Oct 2026
+
+Wall time and peak memory of each phase of a generation run
+'''
+
+import json
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class NullTimer(object):
+
+    """
+    Timer which records nothing, used when a generation run is not profiled
+
+    """
+
+    @contextmanager
+    def phase(self, name):
+        yield
+
+
+class PhaseTimer(object):
+
+    """
+    Records the wall time and the peak memory allocated by Python in each phase of a generation
+    run. A phase may be entered several times, its times are summed and the largest peak is kept.
+    Phases should not be nested and memory allocated by worker processes is not traced.
+
+    """
+
+    def __init__(self):
+        self.phases = OrderedDict()
+
+    @contextmanager
+    def phase(self, name):
+
+        """
+        Return a context manager which records the time spent in a phase
+
+        Parameters
+        ----------
+        name: string
+            Name of the phase
+        ----------
+
+        """
+
+        record = self.phases.setdefault(name, {'wall_s' : 0.0, 'peak_bytes' : 0, 'calls' : 0})
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record['wall_s'] += time.perf_counter() - start
+            record['peak_bytes'] = max(record['peak_bytes'], tracemalloc.get_traced_memory()[1] - start_memory)
+            record['calls'] += 1
+
+    def close(self):
+
+        """
+        Stop tracing memory allocations
+
+        """
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def table(self):
+
+        """
+        Return the recorded phases as a text table
+
+        """
+
+        lines = ['%-24s %10s %12s %6s' % ('Phase', 'Wall (ms)', 'Peak (KiB)', 'Calls')]
+        for name, record in self.phases.items():
+            lines.append('%-24s %10.2f %12.1f %6d' % (name, record['wall_s'] * 1e3,
+                                                      record['peak_bytes'] / 1024.0, record['calls']))
+        lines.append('%-24s %10.2f' % ('Total', sum(record['wall_s'] for record in self.phases.values()) * 1e3))
+        return '\n'.join(lines)
+
+    def to_json(self):
+
+        """
+        Return the recorded phases as a JSON document
+
+        """
+
+        return json.dumps({'phases' : self.phases}, indent=4)
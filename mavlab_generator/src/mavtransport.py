@@ -0,0 +1,465 @@
+'''
+Created on 18 Oct 2026
+
+Asyncio link layer serving many vehicles from one process over UDP and stream connections
+'''
+
+import asyncio
+import logging
+from collections import OrderedDict
+
+#Drop policies applied when the queue of a vehicle is full
+DROP_OLDEST = 'oldest'
+DROP_NEWEST = 'newest'
+
+#Default number of packets held for each vehicle
+QUEUE_SIZE = 256
+
+#Largest datagram sent, so that a batch of frames fits in a single Ethernet frame
+MAX_DATAGRAM = 1472
+
+#Bytes of frames held by a stream link while its transport is paused, frames sent beyond this
+#are dropped
+MAX_PENDING = 1 << 20
+
+#Number of remote addresses a datagram link keeps a parser for, and the time in seconds after
+#which the parser of an address that has not been heard is discarded
+MAX_SENDERS = 1024
+SENDER_TIMEOUT = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class MAVLinkRouter(object):
+
+    """
+    Routes received packets to a bounded queue for each vehicle, keyed by (sysid, compid), and
+    routes messages sent to a vehicle back over the link and address it was last heard on
+
+    Parameters
+    ----------
+    maxsize: integer
+        Number of packets held for each vehicle (default = QUEUE_SIZE)
+    policy: string
+        DROP_OLDEST to discard the oldest queued packet when a queue is full, DROP_NEWEST to
+        discard the received packet (default = DROP_OLDEST)
+    ----------
+
+    """
+
+    def __init__(self, maxsize=QUEUE_SIZE, policy=DROP_OLDEST):
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError('Unknown drop policy: %s' % policy)
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.queues = {}
+        self.dropped = {}
+        self.routes = {}
+        self.vehicles = asyncio.Queue()
+
+    def queue(self, sysid, compid):
+
+        """
+        Return the queue of packets received from a vehicle, creating it if it has not been heard
+
+        """
+
+        key = (sysid, compid)
+        queue = self.queues.get(key)
+        if queue is None:
+            queue = self.queues[key] = asyncio.Queue(self.maxsize)
+            self.dropped[key] = 0
+        return queue
+
+    def route(self, packets, link, addr=None):
+
+        """
+        Put received packets on the queues of the vehicles that sent them. The (sysid, compid) of a
+        vehicle not heard before is put on the vehicles queue.
+
+        Parameters
+        ----------
+        packets: list of MAVLinkPackets
+            Packets received on the link
+        link: MAVLinkStreamProtocol or MAVLinkDatagramProtocol
+            Link the packets were received on
+        addr: tuple
+            Address the packets were received from for datagram links (default = None)
+        ----------
+
+        """
+
+        queues = self.queues
+        routes = self.routes
+        for packet in packets:
+            key = (packet.sysid, packet.compid)
+            queue = queues.get(key)
+            if queue is None:
+                queue = self.queue(*key)
+                self.vehicles.put_nowait(key)
+            routes[key] = (link, addr)
+
+            if queue.full():
+                self.dropped[key] += 1
+                if self.policy == DROP_NEWEST:
+                    continue
+                queue.get_nowait()
+            queue.put_nowait(packet)
+
+    def send(self, sysid, compid, message):
+
+        """
+        Send a message to a vehicle over the link it was last heard on
+
+        Parameters
+        ----------
+        sysid: integer
+            System ID of the vehicle
+        compid: integer
+            Component ID of the vehicle
+        message: MAVLinkMessage
+            Message to send
+        ----------
+
+        """
+
+        route = self.routes.get((sysid, compid))
+        if route is None:
+            raise KeyError('Vehicle (%d, %d) has not been heard' % (sysid, compid))
+        link, addr = route
+        link.send(message, addr)
+
+
+class _MAVLinkProtocol(object):
+
+    """
+    Parsing and sequence numbering shared by the stream and datagram links. Frames sent during an
+    iteration of the event loop are held and written together when it yields.
+
+    """
+
+    def __init__(self, parser_factory, router):
+        self.parser_factory = parser_factory
+        self.router = router
+        self.transport = None
+        self.seq = 0
+        self.flush_handle = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def send(self, message, addr=None):
+
+        """
+        Encode a message with the next sequence number of the link and queue it for sending
+
+        Parameters
+        ----------
+        message: MAVLinkMessage
+            Message to send
+        addr: tuple
+            Destination address for datagram links (default = None, the connected address)
+        ----------
+
+        """
+
+        frame = message.encode(self.seq)
+        self.seq = (self.seq + 1) & 0xff
+        self.send_frame(frame, addr)
+
+    def schedule_flush(self):
+        if self.flush_handle is None and self.transport is not None:
+            self.flush_handle = asyncio.get_running_loop().call_soon(self.flush)
+
+
+class MAVLinkStreamProtocol(_MAVLinkProtocol, asyncio.Protocol):
+
+    """
+    Link over a byte stream, such as a TCP connection, a Unix socket or a serial port bridged to a
+    socket. Writing stops while the transport is paused, the held frames are written on resume.
+    Senders should await drain() on a slow link, frames sent while more than max_pending bytes
+    are held are dropped and counted in dropped. Each stream link has its own statistics.
+
+    Parameters
+    ----------
+    parser_factory: callable
+        Called as parser_factory(stats) to return a new MAVLinkParser updating stats, or new
+        statistics when stats is None, such as the MAVLinkParser of a generated package
+    router: MAVLinkRouter
+        Router received packets are put on
+    max_pending: integer
+        Bytes of frames held while the transport is paused (default = MAX_PENDING)
+    ----------
+
+    """
+
+    def __init__(self, parser_factory, router, max_pending=MAX_PENDING):
+        _MAVLinkProtocol.__init__(self, parser_factory, router)
+        self.parser = parser_factory(None)
+        self.stats = self.parser.stats
+        self.pending = []
+        self.pending_bytes = 0
+        self.max_pending = max_pending
+        self.dropped = 0
+        self.paused = False
+        self.resumed = None
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def data_received(self, data):
+        packets = self.parser.parse(data)
+        if packets:
+            self.router.route(packets, self)
+
+    def send_frame(self, frame, addr=None):
+
+        """
+        Queue an encoded frame for sending, addr is ignored as the stream is connected
+
+        """
+
+        if self.pending_bytes + len(frame) > self.max_pending:
+            self.dropped += 1
+            return
+        self.pending.append(frame)
+        self.pending_bytes += len(frame)
+        if not self.paused:
+            self.schedule_flush()
+
+    def flush(self):
+
+        """
+        Write the frames queued since the last flush with a single write
+
+        """
+
+        self.flush_handle = None
+        if self.pending and not self.paused and not self.transport.is_closing():
+            self.transport.write(b''.join(self.pending))
+            self.pending = []
+            self.pending_bytes = 0
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+        self.flush()
+        if self.resumed is not None:
+            self.resumed.set_result(None)
+            self.resumed = None
+
+    async def drain(self):
+
+        """
+        Wait until the transport accepts writes again, so that a sender does not queue frames
+        without bound on a slow link
+
+        """
+
+        if self.paused:
+            if self.resumed is None:
+                self.resumed = asyncio.get_running_loop().create_future()
+            await self.resumed
+
+    def connection_lost(self, exc):
+        if self.resumed is not None and not self.resumed.done():
+            self.resumed.set_result(None)
+        if not self.closed.done():
+            self.closed.set_result(exc)
+
+
+class MAVLinkDatagramProtocol(_MAVLinkProtocol, asyncio.DatagramProtocol):
+
+    """
+    Link over UDP. Each remote address is parsed separately, every parser is created with the
+    statistics of the first so that stats is shared by all the senders of the link, and the
+    frames queued for an address during an iteration of the event loop are sent in as few
+    datagrams of up to MAX_DATAGRAM bytes as possible.
+
+    Parsers are kept in the order their address was last heard. When a new address is heard, the
+    parsers of addresses not heard for sender_timeout seconds are discarded, as is the parser
+    heard longest ago while more than max_senders are kept. Errors reported by the socket, such
+    as an unreachable port, are counted in errors and logged.
+
+    Parameters
+    ----------
+    parser_factory: callable
+        Called as parser_factory(stats) to return a new MAVLinkParser updating stats, or new
+        statistics when stats is None, such as the MAVLinkParser of a generated package
+    router: MAVLinkRouter
+        Router received packets are put on
+    max_senders: integer
+        Number of remote addresses a parser is kept for (default = MAX_SENDERS)
+    sender_timeout: float
+        Seconds after which the parser of an address not heard is discarded (default = SENDER_TIMEOUT)
+    ----------
+
+    """
+
+    def __init__(self, parser_factory, router, max_senders=MAX_SENDERS, sender_timeout=SENDER_TIMEOUT):
+        _MAVLinkProtocol.__init__(self, parser_factory, router)
+        self.parsers = OrderedDict()
+        self.heard = {}
+        self.max_senders = max_senders
+        self.sender_timeout = sender_timeout
+        self.pending = {}
+        self.stats = None
+        self.errors = 0
+        self.clock = asyncio.get_running_loop().time
+
+    def datagram_received(self, data, addr):
+        parser = self.parsers.get(addr)
+        now = self.clock()
+        if parser is None:
+            self.evict(now)
+            parser = self.parsers[addr] = self.parser_factory(self.stats)
+            self.stats = parser.stats
+        else:
+            self.parsers.move_to_end(addr)
+        self.heard[addr] = now
+        packets = parser.parse(data)
+        if packets:
+            self.router.route(packets, self, addr)
+
+    def send_frame(self, frame, addr=None):
+
+        """
+        Queue an encoded frame for sending to addr, or to the connected address if addr is None
+
+        """
+
+        frames = self.pending.get(addr)
+        if frames is None:
+            frames = self.pending[addr] = []
+        frames.append(frame)
+        self.schedule_flush()
+
+    def flush(self):
+
+        """
+        Send the frames queued since the last flush, joining the frames for each address into
+        datagrams of up to MAX_DATAGRAM bytes
+
+        """
+
+        self.flush_handle = None
+        pending, self.pending = self.pending, {}
+        if self.transport.is_closing():
+            return
+
+        sendto = self.transport.sendto
+        for addr, frames in pending.items():
+            batch = []
+            size = 0
+            for frame in frames:
+                if size + len(frame) > MAX_DATAGRAM and batch:
+                    sendto(b''.join(batch), addr)
+                    batch = []
+                    size = 0
+                batch.append(frame)
+                size += len(frame)
+            sendto(b''.join(batch), addr)
+
+    def evict(self, now):
+
+        """
+        Discard the parsers of addresses not heard for sender_timeout seconds, and the parsers
+        heard longest ago until there is room for one more
+
+        """
+
+        parsers = self.parsers
+        while parsers:
+            addr = next(iter(parsers))
+            if len(parsers) < self.max_senders and now - self.heard[addr] < self.sender_timeout:
+                break
+            del parsers[addr]
+            del self.heard[addr]
+
+    def error_received(self, exc):
+        self.errors += 1
+        logger.warning('MAVLink datagram link error: %s', exc)
+
+
+async def open_udp(parser_factory, router, local_addr=None, remote_addr=None):
+
+    """
+    Open a UDP link and return its MAVLinkDatagramProtocol
+
+    Parameters
+    ----------
+    parser_factory: callable
+        Called as parser_factory(stats) to return a new MAVLinkParser updating stats, or new
+        statistics when stats is None, such as the MAVLinkParser of a generated package
+    router: MAVLinkRouter
+        Router received packets are put on
+    local_addr: tuple
+        (host, port) to listen on (default = None, any free port)
+    remote_addr: tuple
+        (host, port) sends without an address go to (default = None, not connected)
+    ----------
+
+    """
+
+    loop = asyncio.get_running_loop()
+    _, protocol = await loop.create_datagram_endpoint(lambda: MAVLinkDatagramProtocol(parser_factory, router),
+                                                      local_addr=local_addr, remote_addr=remote_addr)
+    return protocol
+
+
+async def open_stream(parser_factory, router, host=None, port=None, sock=None):
+
+    """
+    Open a stream link to host and port, or over an already connected socket such as one end of a
+    socket pair, and return its MAVLinkStreamProtocol
+
+    Parameters
+    ----------
+    parser_factory: callable
+        Called as parser_factory(stats) to return a new MAVLinkParser updating stats, or new
+        statistics when stats is None, such as the MAVLinkParser of a generated package
+    router: MAVLinkRouter
+        Router received packets are put on
+    host: string
+        Host to connect to (default = None)
+    port: integer
+        Port to connect to (default = None)
+    sock: socket.socket
+        Connected socket used instead of host and port (default = None)
+    ----------
+
+    """
+
+    loop = asyncio.get_running_loop()
+    factory = lambda: MAVLinkStreamProtocol(parser_factory, router)
+    if sock is not None:
+        _, protocol = await loop.connect_accepted_socket(factory, sock)
+    else:
+        _, protocol = await loop.create_connection(factory, host, port)
+    return protocol
+
+
+async def serve_stream(parser_factory, router, host=None, port=None):
+
+    """
+    Accept stream links on host and port, each connection is parsed separately and routed to the
+    same router. Returns the asyncio server.
+
+    Parameters
+    ----------
+    parser_factory: callable
+        Called as parser_factory(stats) to return a new MAVLinkParser updating stats, or new
+        statistics when stats is None, such as the MAVLinkParser of a generated package
+    router: MAVLinkRouter
+        Router received packets are put on
+    host: string
+        Host to listen on (default = None, all interfaces)
+    port: integer
+        Port to listen on (default = None, any free port)
+    ----------
+
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(lambda: MAVLinkStreamProtocol(parser_factory, router), host, port)
@@ -0,0 +1,48 @@
+clear;
+clc();
+
+%Build a stream of attitude packets with noise between them and some corrupted checksums
+stream = zeros(0,1,'uint8');
+for i = 1:1:50
+    msg = msg_attitude(i,1,2,3,4,5,6,[]);
+    packet = msg.pack();
+    buffer = packet.encode();
+    if mod(i,7) == 0
+        buffer(end) = bitxor(buffer(end),255);
+    end
+    stream = [stream; uint8(randi([0 255],randi([0 4]),1)); buffer(:)]; %#ok<AGROW>
+end
+
+%Parse the stream one char at a time
+stats = MAVLink.stats;
+before = [stats.failedCRC stats.packetsDropped stats.packetsReceived];
+parser = MAVLinkParser();
+charPackets = {};
+for i = 1:1:numel(stream)
+    packet = parser.parseChar(stream(i));
+    if ~isempty(packet)
+        charPackets{end+1} = packet; %#ok<SAGROW>
+    end
+end
+charStats = [stats.failedCRC stats.packetsDropped stats.packetsReceived] - before;
+
+%Parse the same stream in chunks of random length
+before = [stats.failedCRC stats.packetsDropped stats.packetsReceived];
+parser = MAVLinkParser();
+bufferPackets = {};
+i = 1;
+while i <= numel(stream)
+    last = min(numel(stream), i + randi([1 100]) - 1);
+    bufferPackets = [bufferPackets parser.parseBuffer(stream(i:last))]; %#ok<AGROW>
+    i = last + 1;
+end
+bufferStats = [stats.failedCRC stats.packetsDropped stats.packetsReceived] - before;
+
+%Both parsers must return the same packets and record the same statistics
+assert(isequal(charStats, bufferStats));
+assert(numel(charPackets) == numel(bufferPackets));
+for i = 1:1:numel(charPackets)
+    assert(isequal(charPackets{i}.payload.getByteBuffer(), bufferPackets{i}.payload.getByteBuffer()));
+    assert(charPackets{i}.msgid == bufferPackets{i}.msgid);
+end
+disp('parseBuffer matches parseChar');
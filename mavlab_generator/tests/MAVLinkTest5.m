@@ -0,0 +1,37 @@
+clear;
+clc();
+
+%Load the Python CRC engine from the generator source folder
+srcPath = fullfile(fileparts(mfilename('fullpath')),'..','src');
+if count(py.sys.path,srcPath) == 0
+    insert(py.sys.path,int32(0),srcPath);
+end
+mavcrc = py.importlib.import_module('mavcrc');
+
+%The lookup tables must be identical
+assert(isequal(double(MAVLinkCRC.CRC_TABLE), cellfun(@double,cell(py.list(mavcrc.CRC_TABLE)))));
+
+%Compare the checksums of random frames of every message with a CRC_EXTRA
+crc = MAVLinkCRC();
+msgids = find(MAVLinkCRC.MAVLINK_MESSAGE_CRCS(1:256)) - 1;
+for i = 1:1:1000
+    msgid = msgids(randi(numel(msgids)));
+    len = randi([0 255]);
+    header = uint8([len randi([0 255],1,3) msgid])';
+    payload = uint8(randi([0 255],len,1));
+    crc.computeChecksum([header; payload], msgid);
+    expected = mavcrc.frame_crc(py.bytes([header; payload]'), ...
+        int32(MAVLinkCRC.MAVLINK_MESSAGE_CRCS(msgid + 1)));
+    assert(double(crc.crcValue) == double(expected));
+end
+
+%The byte at a time interface must agree with the whole vector interface
+bytes = uint8(randi([0 255],64,1));
+crc.computeChecksum(bytes);
+wholeVector = crc.crcValue;
+crc.startChecksum();
+for i = 1:1:numel(bytes)
+    crc.updateChecksum(bytes(i));
+end
+assert(crc.crcValue == wholeVector);
+disp('MAVLinkCRC matches the Python CRC engine');
@@ -0,0 +1,41 @@
+clear;
+clc();
+
+%Interleave the attitude packets of two systems, each numbering its own packets, and lose one
+%packet of system 2
+stream = zeros(0,1,'uint8');
+for i = 0:1:19
+    for sysid = [1 2]
+        if sysid == 2 && i == 10
+            continue;
+        end
+        msg = msg_attitude(i,1,2,3,4,5,6,[]);
+        packet = msg.pack();
+        packet.seq = i;
+        packet.sysid = sysid;
+        packet.compid = 1;
+        packet.generateCRC();
+        buffer = cat(1,uint8(packet.STX),uint8(packet.len),uint8(packet.seq),uint8(packet.sysid),...
+            uint8(packet.compid),uint8(packet.msgid),packet.payload.getByteBuffer(),packet.crc.getLSB(),packet.crc.getMSB());
+        stream = [stream; buffer]; %#ok<AGROW>
+    end
+end
+
+%Parse the stream and compare the statistics before and after
+stats = MAVLink.stats;
+before = stats.snapshot();
+senderDropped = stats.senderDropped;
+senderReceived = stats.senderReceived;
+parser = MAVLinkParser();
+packets = parser.parseBuffer(stream);
+after = stats.snapshot();
+
+%Only the lost packet is counted as dropped, and it is counted against system 2
+assert(numel(packets) == 39);
+assert(after.packetsReceived - before.packetsReceived == 39);
+assert(after.packetsDropped - before.packetsDropped == 1);
+assert(stats.senderReceived(1 * 256 + 1 + 1) - senderReceived(1 * 256 + 1 + 1) == 20);
+assert(stats.senderReceived(2 * 256 + 1 + 1) - senderReceived(2 * 256 + 1 + 1) == 19);
+assert(stats.senderDropped(1 * 256 + 1 + 1) - senderDropped(1 * 256 + 1 + 1) == 0);
+assert(stats.senderDropped(2 * 256 + 1 + 1) - senderDropped(2 * 256 + 1 + 1) == 1);
+disp('Packet drops are tracked for each sender');
@@ -0,0 +1,64 @@
+clear;
+clc();
+
+%Build a stream of attitude packets with false STX bytes in the noise between them
+stream = zeros(0,1,'uint8');
+for i = 1:1:50
+    msg = msg_attitude(i,1,2,3,4,5,6,[]);
+    packet = msg.pack();
+    buffer = packet.encode();
+    noise = uint8(randi([0 253],randi([0 4]),1));
+    if mod(i,5) == 0
+        noise = [noise; uint8(MAVLinkPacket.STX)]; %#ok<AGROW>
+    end
+    stream = [stream; noise; buffer(:)]; %#ok<AGROW>
+end
+
+%Parse the stream without a pool, keeping every packet
+stats = MAVLink.stats;
+parser = MAVLinkParser(0);
+before = [stats.poolHits stats.poolMisses];
+expected = [];
+for i = 1:1:numel(stream)
+    packet = parser.parseChar(stream(i));
+    if ~isempty(packet)
+        msg = packet.unpack();
+        expected(end+1) = msg.time_boot_ms; %#ok<SAGROW>
+    end
+end
+unpooled = [stats.poolHits stats.poolMisses] - before;
+
+%Parse the stream again, releasing every packet once it has been unpacked
+parser = MAVLinkParser();
+before = [stats.poolHits stats.poolMisses];
+received = [];
+for i = 1:1:numel(stream)
+    packet = parser.parseChar(stream(i));
+    if ~isempty(packet)
+        msg = packet.unpack();
+        received(end+1) = msg.time_boot_ms; %#ok<SAGROW>
+        parser.release(packet);
+    end
+end
+pooled = [stats.poolHits stats.poolMisses] - before;
+
+%Pooled packets decode the same messages, and every packet and false STX is taken from the pool
+assert(isequal(expected, received));
+assert(unpooled(1) == 0 && unpooled(2) > numel(expected));
+assert(pooled(1) == unpooled(2) && pooled(2) == 0);
+disp('Pooled packets are reused without allocating');
+
+%Release a packet twice, the pool keeps it once so the next two packets are different objects
+pair = zeros(0,1,'uint8');
+for i = 1:1:2
+    msg = msg_attitude(i,1,2,3,4,5,6,[]);
+    packet = msg.pack();
+    pair = [pair; packet.encode()]; %#ok<AGROW>
+end
+parser = MAVLinkParser(2);
+packets = parser.parseBuffer(pair);
+parser.release(packets{1});
+parser.release(packets{1});
+packets = parser.parseBuffer(pair);
+assert(numel(packets) == 2 && packets{1} ~= packets{2});
+disp('A packet released twice is only reused once');
@@ -0,0 +1,46 @@
+clear;
+clc();
+
+%Encode a burst of attitude and heartbeat messages into one send buffer
+messages = cell(0,2);
+for i = 1:1:20
+    messages(end+1,:) = {msg_attitude.ID, {uint32(i), single(1), single(2), single(3), single(4),...
+        single(5), single(6)}}; %#ok<SAGROW>
+    if mod(i,5) == 0
+        messages(end+1,:) = {msg_heartbeat.ID, {uint32(0), uint8(2), uint8(3), uint8(81), uint8(4),...
+            uint8(3)}}; %#ok<SAGROW>
+    end
+end
+batch = MAVLinkBatch(64);
+batch.encode(messages);
+stream = batch.getBytes();
+
+%Every frame passes its checksum and is numbered in sequence
+stats = MAVLink.stats;
+before = [stats.failedCRC stats.packetsDropped];
+parser = MAVLinkParser();
+packets = parser.parseBuffer(stream);
+assert(isequal([stats.failedCRC stats.packetsDropped] - before, [0 0]));
+assert(numel(packets) == size(messages,1));
+for i = 1:1:numel(packets)
+    assert(packets{i}.msgid == messages{i,1});
+    assert(mod(double(packets{i}.seq) - double(packets{1}.seq), 256) == i - 1);
+end
+
+%The frames decode to the fields they were encoded from
+msg = packets{1}.unpack();
+assert(msg.time_boot_ms == 1 && msg.yawspeed == single(6));
+
+%Packets encoded one at a time are numbered from the same sequence
+msg = msg_attitude(1,1,2,3,4,5,6,[]);
+packet = msg.pack();
+first = packet.encode();
+second = packet.encode();
+assert(first(3) == mod(double(packets{end}.seq) + 1, 256));
+assert(second(3) == mod(double(first(3)) + 1, 256));
+
+%Messages whose fields are not the length of the message are not encoded
+batch.clear();
+batch.encode({msg_attitude.ID, {uint32(1), 1, 2, 3, 4, 5, 6}});
+assert(isempty(batch.getBytes()));
+disp('Batches encode numbered frames back to back');
@@ -0,0 +1,48 @@
+function passed = runMAVLinkTests(tests)
+%RUNMAVLINKTESTS: Run the MAVLinkTest scripts against the generated mavlab folder
+%Description:
+%    Adds the main, helpers and dialect folders of mavlab to the path, runs each test script and
+%    prints whether it passed. An error is thrown after every test has run if any of them failed.
+%Arguments:
+%    tests(double): Numbers of the MAVLinkTest scripts to run (default = 1:8)
+
+    if nargin < 1
+        tests = 1:8;
+    end
+
+    testPath = fileparts(mfilename('fullpath'));
+    mavlabPath = fullfile(testPath, '..', 'mavlab');
+    addpath(fullfile(mavlabPath, 'main'), fullfile(mavlabPath, 'helpers'),...
+        fullfile(mavlabPath, 'dialects', 'common'), fullfile(mavlabPath, 'dialects', 'ardupilotmega'));
+
+    passed = false(size(tests));
+    messages = cell(size(tests));
+    for i = 1:1:numel(tests)
+        [passed(i), messages{i}] = runTest(fullfile(testPath, sprintf('MAVLinkTest%d.m', tests(i))));
+    end
+
+    %The scripts clear the command window, so the results are printed once they have all run
+    for i = 1:1:numel(tests)
+        if passed(i)
+            fprintf('MAVLinkTest%d: passed\n', tests(i));
+        else
+            fprintf('MAVLinkTest%d: FAILED - %s\n', tests(i), messages{i});
+        end
+    end
+
+    if ~all(passed)
+        error('MAVLab:testFailed', '%d of %d tests failed', sum(~passed), numel(tests));
+    end
+end
+
+function [passed, message] = runTest(script)
+%RUNTEST(script): Run a test script in its own workspace, as the scripts clear their variables
+    try
+        run(script);
+        passed = true;
+        message = '';
+    catch err
+        passed = false;
+        message = err.message;
+    end
+end
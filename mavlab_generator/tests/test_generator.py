@@ -0,0 +1,220 @@
+'''
+Created on 18 Oct 2026
+
+Unit tests of the template language, the manifest and the files written by the Python generator
+'''
+
+import os
+import sys
+import json
+
+import pytest
+
+TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_PATH, '..', 'src'))
+
+import mavoutput
+import mavtemplate
+import mavgen_m_deprecated
+
+DATA_PATH = os.path.join(TEST_PATH, '..', 'data')
+MAVLAB_PATH = os.path.join(TEST_PATH, '..', 'mavlab')
+
+
+def generate(output_path, force=False):
+
+    """
+    Generate the MAVLAB folder from the repository dialects, keeping the schema cache out of the
+    repository, and return its path
+
+    """
+
+    mavgen_m_deprecated.generate(DATA_PATH, str(output_path), force=force, jobs=1,
+                                 cache_path=os.path.join(str(output_path), 'cache'))
+    return os.path.join(str(output_path), 'mavlab')
+
+
+def read_files(path, exclude=()):
+
+    """
+    Return the contents of every file below path by relative path, ignoring carriage returns as
+    the committed files were written by MATLAB with mixed line endings
+
+    """
+
+    files = {}
+    for root, folders, filenames in os.walk(path):
+        folders[:] = [folder for folder in folders if folder not in exclude]
+        for filename in filenames:
+            if filename in exclude:
+                continue
+            with open(os.path.join(root, filename), 'r', newline='') as fi:
+                files[os.path.relpath(os.path.join(root, filename), path)] = fi.read().replace('\r', '')
+    return files
+
+
+def test_template_variables_and_repetition():
+    template = mavtemplate.Template('${name}$: #{fields<#>${type}$ ${name}$; }#end')
+    schema = {'name' : 'msg', 'fields' : [{'type' : 'uint8', 'name' : 'a'}, {'type' : 'single', 'name' : 'b'}]}
+    assert template.render(schema) == 'msg: uint8 a; single b; end'
+    assert template.render({'name' : 'empty', 'fields' : []}) == 'empty: end'
+
+    #Nested repetitions see the schema of their own element
+    template = mavtemplate.Template('#{rows<#>[#{cells<#>${value}$}#]}#')
+    assert template.render({'rows' : [{'cells' : [{'value' : 1}, {'value' : 2}]}, {'cells' : []}]}) == '[12][]'
+
+
+def test_template_conditions():
+    template = mavtemplate.Template("?{${count}$ > 1 && ~strcmp('${kind}$','char')<?>array<?>scalar}?")
+    assert template.render({'count' : 4, 'kind' : 'uint8'}) == 'array'
+    assert template.render({'count' : 4, 'kind' : 'char'}) == 'scalar'
+    assert template.render({'count' : 1, 'kind' : 'uint8'}) == 'scalar'
+
+    #Both expressions may contain variables and further blocks
+    template = mavtemplate.Template("#{f<#>?{${n}$ ~= 1<?>${t}$(${n}$)<?>${t}$}? }#")
+    assert template.render({'f' : [{'n' : 3, 't' : 'x'}, {'n' : 1, 't' : 'y'}]}) == 'x(3) y '
+
+
+def test_template_fprintf_escapes():
+    #Literal text is unescaped as fprintf would, with or without variables in the same run
+    assert mavtemplate.Template('100%% \\\\ a\\tb\\n').render({}) == '100% \\ a\tb\n'
+    assert mavtemplate.Template('%%${x}$%%\\n').render({'x' : '%d'}) == '%%d%\n'
+
+    #Escaped new lines are written with the line ending of the template
+    assert mavtemplate.Template('a\\n\r\nb').render({}) == 'a\r\n\r\nb'
+
+
+@pytest.mark.parametrize('source', ['${name', '#{items}#', '#{items<#>text', '?{a<?>b}?', '?{a<?>b<?>c', 'a}#b'])
+def test_template_errors(source):
+    with pytest.raises(ValueError):
+        mavtemplate.Template(source, 'broken')
+
+
+def test_template_digest():
+    assert mavtemplate.Template('${a}$').digest == mavtemplate.Template('${a}$').digest
+    assert mavtemplate.Template('${a}$').digest != mavtemplate.Template('${b}$').digest
+    assert mavtemplate.Template('a\n').digest != mavtemplate.Template('a\r\n').digest
+
+
+def test_load_template():
+    template = mavtemplate.load_template('message_template.txt')
+    assert mavtemplate.load_template('message_template.txt') is template
+    with open(os.path.join(mavtemplate.TEMPLATE_PATH, 'message_template.txt'), 'r', newline='') as fi:
+        assert template.digest == mavtemplate.Template(fi.read()).digest
+
+
+def test_generated_files_match_committed(tmp_path):
+    #The committed folder was generated by MAVLab.m, the helpers are copied by it and not rendered
+    generated = read_files(generate(tmp_path), ('manifest.json',))
+    committed = read_files(MAVLAB_PATH, ('helpers',))
+    assert sorted(generated) == sorted(committed)
+    assert [name for name in committed if generated[name] != committed[name]] == []
+
+
+def write_outputs(path, files, force=False):
+
+    """
+    Write files given as {filename: text} through a manifest of path, as a generation run would,
+    and save the manifest
+
+    """
+
+    manifest = mavoutput.Manifest(str(path), force)
+    for filename, text in files.items():
+        with mavoutput.OutputFile(os.path.join(str(path), filename), manifest) as fo:
+            fo.write(text)
+    manifest.save()
+
+
+def read_text(filename):
+
+    """
+    Return the contents of a file, keeping its line endings
+
+    """
+
+    with open(str(filename), 'r', newline='') as fi:
+        return fi.read()
+
+
+def test_manifest_skips_unchanged_files(tmp_path):
+    write_outputs(tmp_path, {'a.m' : 'a\r\n', 'b.m' : 'b\n'})
+    assert read_text(tmp_path / 'a.m') == 'a\r\n'
+    with open(os.path.join(str(tmp_path), mavoutput.MANIFEST_NAME), 'r') as fi:
+        manifest = json.load(fi)
+    assert manifest['version'] == mavoutput.GENERATOR_VERSION
+    assert sorted(manifest['files']) == ['a.m', 'b.m']
+
+    #Files generated from the same content are not written again
+    with open(os.path.join(str(tmp_path), 'a.m'), 'w') as fo:
+        fo.write('edited')
+    write_outputs(tmp_path, {'a.m' : 'a\r\n', 'b.m' : 'b\n'})
+    assert read_text(tmp_path / 'a.m') == 'edited'
+
+    #Changed content, a missing file and forcing all write the file again
+    write_outputs(tmp_path, {'a.m' : 'a\r\n', 'b.m' : 'c\n'})
+    assert read_text(tmp_path / 'b.m') == 'c\n'
+    os.remove(os.path.join(str(tmp_path), 'b.m'))
+    write_outputs(tmp_path, {'a.m' : 'a\r\n', 'b.m' : 'c\n'})
+    assert read_text(tmp_path / 'b.m') == 'c\n'
+    write_outputs(tmp_path, {'a.m' : 'a\r\n', 'b.m' : 'c\n'}, force=True)
+    assert read_text(tmp_path / 'a.m') == 'a\r\n'
+
+
+def test_manifest_version_regenerates(tmp_path):
+    write_outputs(tmp_path, {'a.m' : 'a\n'})
+    with open(os.path.join(str(tmp_path), 'a.m'), 'w') as fo:
+        fo.write('edited')
+
+    #A manifest written by another generator version does not skip anything
+    filename = os.path.join(str(tmp_path), mavoutput.MANIFEST_NAME)
+    with open(filename, 'r') as fi:
+        manifest = json.load(fi)
+    manifest['version'] = '0.0'
+    with open(filename, 'w') as fo:
+        json.dump(manifest, fo)
+    write_outputs(tmp_path, {'a.m' : 'a\n'})
+    assert read_text(tmp_path / 'a.m') == 'a\n'
+    with open(filename, 'r') as fi:
+        assert json.load(fi)['version'] == mavoutput.GENERATOR_VERSION
+
+
+def test_manifest_removes_files_no_longer_generated(tmp_path):
+    write_outputs(tmp_path, {'a.m' : 'a\n', 'b.m' : 'b\n'})
+    with open(os.path.join(str(tmp_path), 'other.m'), 'w') as fo:
+        fo.write('not generated')
+
+    #Only files recorded by the previous run are removed
+    write_outputs(tmp_path, {'a.m' : 'a\n'})
+    assert sorted(os.listdir(str(tmp_path))) == ['a.m', mavoutput.MANIFEST_NAME, 'other.m']
+    with open(os.path.join(str(tmp_path), mavoutput.MANIFEST_NAME), 'r') as fi:
+        assert json.load(fi)['files'] == {'a.m' : mavoutput.hash_text('a\n')}
+
+
+def test_generate_skips_unchanged_files(tmp_path):
+    mavlab_path = generate(tmp_path)
+    heartbeat = os.path.join(mavlab_path, 'dialects', 'common', 'msg_heartbeat.m')
+    attitude = os.path.join(mavlab_path, 'dialects', 'common', 'msg_attitude.m')
+    expected = read_text(attitude)
+    with open(heartbeat, 'a') as fo:
+        fo.write('%edited')
+
+    #A stale entry of the manifest stands for a message removed from the dialects
+    stale = os.path.join(mavlab_path, 'dialects', 'common', 'msg_removed.m')
+    with open(stale, 'w') as fo:
+        fo.write('removed')
+    filename = os.path.join(mavlab_path, mavoutput.MANIFEST_NAME)
+    with open(filename, 'r') as fi:
+        manifest = json.load(fi)
+    manifest['files']['dialects/common/msg_removed.m'] = mavoutput.hash_text('removed')
+    with open(filename, 'w') as fo:
+        json.dump(manifest, fo)
+    os.remove(attitude)
+
+    generate(tmp_path)
+    assert read_text(heartbeat).endswith('%edited')
+    assert read_text(attitude) == expected
+    assert not os.path.exists(stale)
+
+    generate(tmp_path, force=True)
+    assert not read_text(heartbeat).endswith('%edited')
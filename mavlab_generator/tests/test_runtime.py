@@ -0,0 +1,713 @@
+'''
+Created on 18 Oct 2026
+
+Unit tests of the generated Python package and the runtime modules copied into it
+'''
+
+import os
+import sys
+import asyncio
+import socket
+import struct
+import random
+import importlib
+
+import pytest
+
+TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_PATH, '..', 'src'))
+
+import mavcrc
+import mavschema
+import mavgen_python
+
+DATA_PATH = os.path.join(TEST_PATH, '..', 'data')
+
+
+@pytest.fixture(scope='module')
+def pymavlab(tmp_path_factory):
+
+    """
+    Generate the Python package from the repository dialects and import it
+
+    """
+
+    output_path = str(tmp_path_factory.mktemp('generated'))
+    mavgen_python.generate_python_package(mavschema.load_schema(DATA_PATH), output_path)
+    sys.path.insert(0, output_path)
+    try:
+        yield importlib.import_module(mavgen_python.PACKAGE_NAME)
+    finally:
+        sys.path.remove(output_path)
+        for name in [name for name in sys.modules if name.split('.')[0] == mavgen_python.PACKAGE_NAME]:
+            del sys.modules[name]
+
+
+def test_generated_crc_extras(pymavlab):
+    assert pymavlab.common.msg_heartbeat.CRC_EXTRA == 50
+    assert pymavlab.common.msg_attitude.CRC_EXTRA == 39
+    assert pymavlab.common.msg_file_transfer_protocol.CRC_EXTRA == 84
+    assert pymavlab.CRC_EXTRAS[0] == 50
+    assert pymavlab.MESSAGE_LENGTHS[0] == 9
+
+
+def test_pack_unpack(pymavlab):
+    msg = pymavlab.common.msg_attitude(1000, 0.5, -0.25, 1.5, 0.0, 2.0, -3.0, sysid=7, compid=9)
+    payload = msg.pack()
+    assert len(payload) == msg.LEN == 28
+
+    decoded = pymavlab.common.msg_attitude.unpack(payload, 7, 9)
+    assert decoded == msg
+    assert (decoded.sysid, decoded.compid) == (7, 9)
+    assert decoded.to_dict() == {'time_boot_ms' : 1000, 'roll' : 0.5, 'pitch' : -0.25, 'yaw' : 1.5,
+                                 'rollspeed' : 0.0, 'pitchspeed' : 2.0, 'yawspeed' : -3.0}
+
+
+def test_pack_unpack_arrays(pymavlab):
+    msg = pymavlab.common.msg_attitude_quaternion_cov(5, (1.0, 0.0, 0.0, 0.0), 0.5, 0.25, 0.125, tuple(range(9)))
+    decoded = pymavlab.decode(msg.ID, msg.pack())
+    assert decoded.q == (1.0, 0.0, 0.0, 0.0)
+    assert decoded.covariance == tuple(float(i) for i in range(9))
+
+    #Character arrays are packed as bytes, padded with zeros
+    msg = pymavlab.common.msg_param_value(1.5, 10, 3, b'RATE', 9)
+    decoded = pymavlab.decode(msg.ID, msg.pack())
+    assert decoded.param_id == b'RATE' + bytes(12)
+    assert (decoded.param_value, decoded.param_count, decoded.param_index) == (1.5, 10, 3)
+
+
+def test_pack_into(pymavlab):
+    cls = pymavlab.common.msg_heartbeat
+    buffer = bytearray(cls.LEN + 4)
+    cls.pack_into(buffer, 4, 7, 2, 3, 81, 4, 3)
+    assert bytes(buffer[4:]) == cls(7, 2, 3, 81, 4, 3).pack()
+
+
+def test_encode_decode_packet(pymavlab):
+    frame = pymavlab.common.msg_heartbeat(custom_mode=7, type=2, sysid=3).encode(5)
+    assert frame[:6] == bytes([254, 9, 5, 3, pymavlab.COMPID, 0])
+
+    msg = pymavlab.decode_packet(frame)
+    assert isinstance(msg, pymavlab.common.msg_heartbeat)
+    assert (msg.custom_mode, msg.type, msg.sysid) == (7, 2, 3)
+
+    corrupted = bytearray(frame)
+    corrupted[-1] ^= 0xff
+    with pytest.raises(pymavlab.MAVLinkError):
+        pymavlab.decode_packet(bytes(corrupted))
+
+
+def test_decode_errors(pymavlab):
+    undefined = pymavlab.MESSAGES.index(None)
+    with pytest.raises(pymavlab.MAVLinkError):
+        pymavlab.decode(undefined, bytes(255))
+    with pytest.raises(pymavlab.MAVLinkError):
+        pymavlab.decode(pymavlab.common.msg_attitude.ID, bytes(10))
+
+
+def test_message_base_is_abstract(pymavlab):
+    with pytest.raises(TypeError):
+        pymavlab.MAVLinkMessage()
+
+
+def test_crc_check_value():
+    #Check value of CRC-16/MCRF4XX, the X.25 checksum without the final inversion used by MAVLINK
+    assert mavcrc.x25crc(b'123456789') == 0x6f91
+    assert mavcrc.x25crc('123456789') == 0x6f91
+    assert mavcrc.accumulate(mavcrc.x25crc(b'1234'), b'56789') == 0x6f91
+
+
+def test_crc_table():
+    #Every entry is the bitwise checksum of one byte
+    for byte in (0, 1, 0x80, 0xff):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ mavcrc.CRC_POLYNOMIAL if crc & 1 else crc >> 1
+        assert mavcrc.CRC_TABLE[byte] == crc
+
+
+def test_crc_extra():
+    heartbeat = [('uint32_t', 'custom_mode', 1), ('uint8_t', 'type', 1), ('uint8_t', 'autopilot', 1),
+                 ('uint8_t', 'base_mode', 1), ('uint8_t', 'system_status', 1),
+                 ('uint8_t', 'mavlink_version', 1)]
+    assert mavcrc.crc_extra('HEARTBEAT', heartbeat) == 50
+
+
+def test_frame_crc(pymavlab):
+    frame = pymavlab.common.msg_heartbeat(custom_mode=7, type=2).encode(5)
+    crc = mavcrc.frame_crc(frame[1:-2], pymavlab.common.msg_heartbeat.CRC_EXTRA)
+    assert frame[-2:] == struct.pack('<H', crc)
+
+
+def random_frame(pymavlab, rng, seq, sysid=1):
+
+    """
+    Return the frame of an ATTITUDE message with a random payload
+
+    """
+
+    cls = pymavlab.common.msg_attitude
+    msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)), sysid)
+    return msg.encode(seq)
+
+
+def noise(rng, length):
+
+    """
+    Return random bytes without an STX
+
+    """
+
+    return bytes(rng.randrange(254) for _ in range(length))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, None])
+def test_parser_resync(pymavlab, chunk_size):
+    rng = random.Random(1)
+    frames = [random_frame(pymavlab, rng, seq) for seq in range(10)]
+
+    #Lose frame 3, corrupt the checksum of frame 6 and put noise before frame 8
+    corrupted = bytearray(frames[6])
+    corrupted[-1] = 0 if corrupted[-1] else 1
+    stream = b''.join(frames[:3] + frames[4:6] + [bytes(corrupted), frames[7], noise(rng, 13)] + frames[8:])
+
+    parser = pymavlab.MAVLinkParser()
+    chunk_size = chunk_size or len(stream)
+    packets = []
+    for i in range(0, len(stream), chunk_size):
+        packets.extend(parser.parse(stream[i:i + chunk_size]))
+
+    received = frames[:3] + frames[4:6] + frames[7:]
+    assert [packet.seq for packet in packets] == [0, 1, 2, 4, 5, 7, 8, 9]
+    assert [bytes(packet.payload) for packet in packets] == [frame[6:-2] for frame in received]
+    assert parser.stats.packets_received == 8
+    assert parser.stats.failed_crc == 1
+    assert parser.stats.packets_dropped == 2
+    assert parser.stats.resyncs == 2
+    assert parser.carry == b''
+
+
+def test_parser_keeps_incomplete_frame(pymavlab):
+    frame = random_frame(pymavlab, random.Random(2), 0)
+    parser = pymavlab.MAVLinkParser()
+    assert parser.parse(frame[:-1]) == []
+    packets = parser.parse(frame[-1:])
+    assert len(packets) == 1 and bytes(packets[0].payload) == frame[6:-2]
+    assert parser.stats.failed_crc == 0
+
+
+def test_parser_tracks_senders_separately(pymavlab):
+    rng = random.Random(3)
+    stream = b''.join(random_frame(pymavlab, rng, seq, sysid) for seq in range(5) for sysid in (1, 2))
+    parser = pymavlab.MAVLinkParser()
+    assert len(parser.parse(stream)) == 10
+    assert parser.stats.packets_dropped == 0
+
+
+def write_log(pymavlab, frames, seed=0):
+
+    """
+    Return the chunks of a .tlog of random messages sent 1 ms apart, with a run of noise between
+    records every few hundred frames. The last chunk is the record of the last frame.
+
+    """
+
+    rng = random.Random(seed)
+    classes = (pymavlab.common.msg_attitude, pymavlab.common.msg_vfr_hud, pymavlab.common.msg_heartbeat)
+    chunks = []
+    for i in range(frames):
+        cls = rng.choice(classes)
+        msg = cls.unpack(bytes(rng.getrandbits(8) for _ in range(cls.LEN)), rng.randint(1, 3))
+        if rng.random() < 0.005:
+            chunks.append(noise(rng, rng.randint(1, 20)))
+        chunks.append(struct.pack('>Q', i * 1000) + msg.encode(i))
+    return chunks
+
+
+def index_groups(index):
+
+    """
+    Return the offsets and timestamps of every group of an index as lists
+
+    """
+
+    return {key: (list(offsets), list(stamps)) for key, (offsets, stamps) in index.groups.items()}
+
+
+@pytest.fixture
+def log_path(pymavlab, tmp_path):
+
+    """
+    Write a log of 500 frames and return its path
+
+    """
+
+    path = str(tmp_path / 'flight.tlog')
+    with open(path, 'wb') as fo:
+        fo.write(b''.join(write_log(pymavlab, 500)))
+    return path
+
+
+def test_log_index_select(pymavlab, log_path):
+    index = pymavlab.open_log(log_path)
+    try:
+        assert len(index) == 500
+        attitude = pymavlab.common.msg_attitude.ID
+        selected = index.select(attitude, 2, 100000, 200000)
+        assert selected and all(100000 <= stamp <= 200000 for stamp, _ in selected)
+        packets = list(index.packets(attitude, 2, 100000, 200000))
+        assert [stamp for stamp, _ in packets] == [stamp for stamp, _ in selected]
+        for _, packet in packets:
+            assert (packet.msgid, packet.sysid) == (attitude, 2)
+            assert pymavlab.decode(packet.msgid, packet.payload).pack() == bytes(packet.payload)
+            packet.payload.release()
+    finally:
+        index.close()
+
+
+def test_log_index_resumes_after_truncated_tail(pymavlab, tmp_path):
+    chunks = write_log(pymavlab, 500)
+    data = b''.join(chunks)
+    log_path = str(tmp_path / 'flight.tlog')
+
+    #The last frame is still being written, so the index stops before it
+    with open(log_path, 'wb') as fo:
+        fo.write(data[:-5])
+    index = pymavlab.open_log(log_path)
+    assert len(index) == 499
+    assert index.scanned == len(data) - len(chunks[-1]) + 8
+    index.close()
+
+    #Reopening after the rest is written loads the saved index and only scans the tail
+    with open(log_path, 'ab') as fo:
+        fo.write(data[-5:])
+    index = pymavlab.open_log(log_path)
+    resumed = index_groups(index)
+    assert len(index) == 500
+    assert index.scanned == len(data)
+    index.close()
+
+    os.remove(log_path + '.idx')
+    index = pymavlab.open_log(log_path)
+    rebuilt = index_groups(index)
+    index.close()
+    assert resumed == rebuilt
+
+
+@pytest.mark.parametrize('keep', [0, 20, 33, -3])
+def test_log_index_rebuilds_truncated_sidecar(pymavlab, log_path, keep):
+    index = pymavlab.open_log(log_path)
+    expected = index_groups(index)
+    index.close()
+
+    with open(log_path + '.idx', 'rb') as fi:
+        sidecar = fi.read()
+    with open(log_path + '.idx', 'wb') as fo:
+        fo.write(sidecar[:keep])
+
+    index = pymavlab.open_log(log_path)
+    assert index_groups(index) == expected
+    index.close()
+
+
+def test_log_index_ignores_other_crc_extras(pymavlab, log_path):
+    pymavlab.open_log(log_path).close()
+
+    #An index saved with another CRC_EXTRA table is not loaded
+    crc_extras = list(pymavlab.CRC_EXTRAS)
+    crc_extras[pymavlab.common.msg_attitude.ID] ^= 1
+    index = pymavlab.mavlogindex.MAVLinkLogIndex(log_path, crc_extras)
+    index.load(log_path + '.idx')
+    assert len(index) == 0
+
+    index = pymavlab.mavlogindex.MAVLinkLogIndex.open(log_path, crc_extras)
+    assert pymavlab.common.msg_attitude.ID not in [msgid for msgid, _ in index.keys()]
+    index.close()
+
+
+def same_columns(first, second):
+
+    """
+    Return whether two decoded logs have the same columns, comparing arrays by their bytes as the
+    random payloads include NaNs
+
+    """
+
+    if sorted(first) != sorted(second):
+        return False
+    for name, columns in first.items():
+        if sorted(columns) != sorted(second[name]):
+            return False
+        for key, column in columns.items():
+            other = second[name][key]
+            if hasattr(column, 'tobytes'):
+                if column.typecode != other.typecode or column.tobytes() != other.tobytes():
+                    return False
+            elif column != other:
+                return False
+    return True
+
+
+def test_decode_log_parallel_parity(pymavlab, tmp_path, monkeypatch):
+    log_path = str(tmp_path / 'fleet.tlog')
+    with open(log_path, 'wb') as fo:
+        fo.write(b''.join(write_log(pymavlab, 3000, seed=3)))
+
+    #Split the small log into several ranges, each decoded by a worker
+    monkeypatch.setattr(pymavlab.mavparallel, 'MIN_RANGE', 4096)
+    ranges = pymavlab.mavparallel.split_log(log_path, pymavlab.CRC_EXTRAS, 4, True)
+    assert len(ranges) == 4
+
+    serial = pymavlab.decode_log(log_path, jobs=1)
+    parallel = pymavlab.decode_log(log_path, jobs=4)
+    assert sum(len(columns['_offset']) for columns in serial.values()) == 3000
+    assert same_columns(serial, parallel)
+
+    #Frames of every message are in log order
+    for columns in serial.values():
+        assert list(columns['_offset']) == sorted(columns['_offset'])
+
+
+def test_decode_log_many_ranges(pymavlab, tmp_path, monkeypatch):
+    log_path = str(tmp_path / 'fleet.tlog')
+    with open(log_path, 'wb') as fo:
+        fo.write(b''.join(write_log(pymavlab, 2000, seed=4)))
+    serial = pymavlab.decode_log(log_path, jobs=1)
+
+    #Many small ranges whose boundaries fall inside frames, each resynchronised by its worker
+    monkeypatch.setattr(pymavlab.mavparallel, 'MIN_RANGE', 512)
+    for jobs in (2, 3, 5, 8):
+        assert same_columns(serial, pymavlab.decode_log(log_path, jobs=jobs))
+
+
+def bulk_messages(pymavlab, count):
+
+    """
+    Return messages of several layouts with exactly representable field values, as decoded by
+    their own unpack
+
+    """
+
+    common = pymavlab.common
+    messages = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            msg = common.msg_attitude(i, i * 0.5, -i * 0.25, 1.0, 2.0, 3.0, 4.0)
+        elif kind == 1:
+            msg = common.msg_param_value(i * 2.0, 100, i, b'PARAM_%d' % i, 9)
+        elif kind == 2:
+            msg = common.msg_gps_status(i % 20, bytes(range(i % 7, i % 7 + 20)), bytes(20), bytes(20), bytes(20),
+                                        bytes(20))
+        else:
+            msg = common.msg_attitude_quaternion_cov(i, (1.0, 0.0, 0.5, 0.25), 0.0, 0.0, 0.0,
+                                                     tuple(float(j + i) for j in range(9)))
+        messages.append(type(msg).unpack(msg.pack(), i % 3 + 1, 1))
+    return messages
+
+
+def test_decode_bulk_matches_unpack(pymavlab):
+    np = pytest.importorskip('numpy')
+
+    messages = bulk_messages(pymavlab, 400)
+    rng = random.Random(5)
+    chunks = []
+    for i, msg in enumerate(messages):
+        frame = struct.pack('>Q', i * 1000) + msg.encode(i & 0xff)
+        if i == 101:
+            #A frame with a failed checksum is discarded
+            frame = frame[:-1] + bytes([frame[-1] ^ 0xff])
+        chunks.append(frame)
+        if i % 50 == 0:
+            chunks.append(noise(rng, 11))
+    decoded = pymavlab.decode_bulk(np.frombuffer(b''.join(chunks), dtype=np.uint8))
+
+    expected = {}
+    for i, msg in enumerate(messages):
+        if i != 101:
+            expected.setdefault(msg.NAME, []).append((i, msg))
+    assert sorted(decoded) == sorted(expected)
+
+    for name, rows in expected.items():
+        frames = decoded[name]
+        assert len(frames) == len(rows)
+        for frame, (i, msg) in zip(frames, rows):
+            header = (frame['_timestamp'], frame['_seq'], frame['_sysid'], frame['_compid'])
+            assert header == (i * 1000, i & 0xff, msg.sysid, msg.compid)
+            for field in msg.FIELDS:
+                value = getattr(msg, field)
+                column = frame[field]
+                if isinstance(value, bytes):
+                    #Character arrays are fixed length strings, numpy drops their trailing zeros
+                    assert bytes(column) == value or column == value.rstrip(b'\x00')
+                elif isinstance(value, tuple):
+                    assert tuple(column.tolist()) == value
+                else:
+                    assert column == value
+
+
+def test_batch_matches_message_encode(pymavlab):
+    messages = bulk_messages(pymavlab, 40)
+    items = [(msg.ID, [getattr(msg, field) for field in msg.FIELDS]) for msg in messages]
+
+    #A small initial buffer is grown as frames are added
+    batch = pymavlab.MAVLinkBatch(sysid=4, compid=5, capacity=16)
+    assert batch.encode(items[:25]) == 25
+    assert batch.encode(items[25:]) == 15
+
+    expected = b''.join(type(msg)(*values, sysid=4, compid=5).encode(seq)
+                        for seq, (msg, (_, values)) in enumerate(zip(messages, items)))
+    assert batch.getvalue() == expected
+    assert len(batch) == len(expected)
+
+    packets = pymavlab.MAVLinkParser().parse(batch.getvalue())
+    assert [packet.seq for packet in packets] == list(range(40))
+
+
+def test_batch_flush(pymavlab):
+    batch = pymavlab.MAVLinkBatch()
+    heartbeat = pymavlab.common.msg_heartbeat.ID
+    writes = []
+    for _ in range(2):
+        batch.encode([(heartbeat, (0, 2, 3, 81, 4, 3))] * 3)
+        assert batch.flush(lambda data: writes.append(bytes(data))) == 3 * 17
+        assert len(batch) == 0
+    assert batch.flush(writes.append) == 0
+
+    #Sequence numbers carry on across flushes and wrap at 256
+    assert len(writes) == 2
+    assert [packet.seq for packet in pymavlab.MAVLinkParser().parse(b''.join(writes))] == list(range(6))
+    batch.seq = 255
+    batch.encode([(heartbeat, (0, 2, 3, 81, 4, 3))] * 2)
+    assert [packet.seq for packet in pymavlab.MAVLinkParser().parse(batch.getvalue())] == [255, 0]
+
+
+def test_batch_undefined_message(pymavlab):
+    batch = pymavlab.MAVLinkBatch()
+    with pytest.raises(pymavlab.MAVLinkError):
+        batch.encode([(pymavlab.MESSAGES.index(None), ())])
+
+
+@pytest.fixture(scope='module')
+def transport(pymavlab):
+
+    """
+    Import the transport module of the generated package, which the package does not import itself
+
+    """
+
+    return importlib.import_module(pymavlab.__name__ + '.mavtransport')
+
+
+async def wait_until(condition, timeout=5.0):
+
+    """
+    Yield to the event loop until condition returns True, failing after timeout seconds
+
+    """
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError('Timed out waiting for the link')
+        await asyncio.sleep(0.001)
+
+
+class DatagramReceiver(asyncio.DatagramProtocol):
+
+    """
+    Records every datagram received on a plain UDP socket
+
+    """
+
+    def __init__(self):
+        self.datagrams = []
+
+    def datagram_received(self, data, addr):
+        self.datagrams.append(data)
+
+
+def test_udp_routing(pymavlab, transport):
+    heartbeat = pymavlab.common.msg_heartbeat
+
+    async def run():
+        station = transport.MAVLinkRouter()
+        server = await transport.open_udp(pymavlab.MAVLinkParser, station, ('127.0.0.1', 0))
+        server_addr = server.transport.get_extra_info('sockname')
+
+        #Two vehicles on separate sockets, the second with two components
+        vehicles = []
+        for sysid, compids in ((1, (1,)), (2, (1, 2))):
+            router = transport.MAVLinkRouter()
+            link = await transport.open_udp(pymavlab.MAVLinkParser, router, ('127.0.0.1', 0), server_addr)
+            for compid in compids:
+                link.send(heartbeat(custom_mode=compid, sysid=sysid, compid=compid))
+            vehicles.append((router, link))
+
+        heard = set()
+        for _ in range(3):
+            heard.add(await asyncio.wait_for(station.vehicles.get(), 5))
+        assert heard == {(1, 1), (2, 1), (2, 2)}
+        packet = await station.queue(2, 2).get()
+        assert pymavlab.decode(packet.msgid, packet.payload).custom_mode == 2
+
+        #Every sender of the link updates the same statistics
+        assert len(server.parsers) == 2
+        assert server.stats.packets_received == 3
+
+        #Messages sent to a vehicle go back to the address it was heard on
+        station.send(2, 2, heartbeat(custom_mode=42))
+        router, link = vehicles[1]
+        packet = await asyncio.wait_for(router.queue(pymavlab.SYSID, pymavlab.COMPID).get(), 5)
+        assert pymavlab.decode(packet.msgid, packet.payload).custom_mode == 42
+        assert vehicles[0][0].queues == {}
+        with pytest.raises(KeyError):
+            station.send(3, 1, heartbeat())
+
+        for link in [server] + [link for _, link in vehicles]:
+            link.transport.close()
+
+    asyncio.run(run())
+
+
+def test_udp_batches_frames_into_datagrams(pymavlab, transport):
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        receiver_transport, receiver = await loop.create_datagram_endpoint(DatagramReceiver,
+                                                                           local_addr=('127.0.0.1', 0))
+        link = await transport.open_udp(pymavlab.MAVLinkParser, transport.MAVLinkRouter(), ('127.0.0.1', 0),
+                                        receiver_transport.get_extra_info('sockname'))
+
+        #Frames sent during one iteration of the loop are joined into full datagrams
+        for i in range(100):
+            link.send(pymavlab.common.msg_attitude(i))
+        frame_len = 6 + pymavlab.common.msg_attitude.LEN + 2
+        per_datagram = transport.MAX_DATAGRAM // frame_len
+        count = -(-100 // per_datagram)
+        await wait_until(lambda: len(receiver.datagrams) >= count)
+        assert [len(data) for data in receiver.datagrams] == [per_datagram * frame_len] * (count - 1) + [
+            (100 - per_datagram * (count - 1)) * frame_len]
+
+        packets = pymavlab.MAVLinkParser().parse(b''.join(receiver.datagrams))
+        assert [packet.seq for packet in packets] == list(range(100))
+
+        link.transport.close()
+        receiver_transport.close()
+
+    asyncio.run(run())
+
+
+def test_udp_evicts_parsers(pymavlab, transport):
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        router = transport.MAVLinkRouter()
+        factory = lambda: transport.MAVLinkDatagramProtocol(pymavlab.MAVLinkParser, router, max_senders=2)
+        server_transport, server = await loop.create_datagram_endpoint(factory, local_addr=('127.0.0.1', 0))
+        server_addr = server_transport.get_extra_info('sockname')
+
+        links = []
+        for sysid in (1, 2, 3):
+            link = await transport.open_udp(pymavlab.MAVLinkParser, transport.MAVLinkRouter(), ('127.0.0.1', 0),
+                                            server_addr)
+            link.send(pymavlab.common.msg_heartbeat(sysid=sysid))
+            await wait_until(lambda: server.stats is not None and server.stats.packets_received == sysid)
+            links.append(link)
+
+        #The parser heard longest ago is discarded, the statistics are kept
+        assert list(server.parsers) == [link.transport.get_extra_info('sockname') for link in links[1:]]
+        assert server.stats.packets_received == 3
+
+        for link in links:
+            link.transport.close()
+        server_transport.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize('policy, kept', [('oldest', [6, 7, 8, 9]), ('newest', [0, 1, 2, 3])])
+def test_stream_drop_policies(pymavlab, transport, policy, kept):
+
+    async def run():
+        left, right = socket.socketpair()
+        station = transport.MAVLinkRouter(maxsize=4, policy=policy)
+        vehicle = await transport.open_stream(pymavlab.MAVLinkParser, transport.MAVLinkRouter(), sock=left)
+        station_link = await transport.open_stream(pymavlab.MAVLinkParser, station, sock=right)
+
+        for i in range(10):
+            vehicle.send(pymavlab.common.msg_heartbeat(custom_mode=i))
+        await wait_until(lambda: station_link.stats.packets_received == 10)
+
+        queue = station.queue(pymavlab.SYSID, pymavlab.COMPID)
+        received = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [packet.seq for packet in received] == kept
+        assert station.dropped[pymavlab.SYSID, pymavlab.COMPID] == 6
+
+        vehicle.transport.close()
+        station_link.transport.close()
+
+    asyncio.run(run())
+
+
+def test_stream_pending_bound(pymavlab, transport):
+    heartbeat = pymavlab.common.msg_heartbeat
+
+    async def run():
+        left, right = socket.socketpair()
+        station = transport.MAVLinkRouter()
+        vehicle = await transport.open_stream(pymavlab.MAVLinkParser, transport.MAVLinkRouter(), sock=left)
+        station_link = await transport.open_stream(pymavlab.MAVLinkParser, station, sock=right)
+
+        #While the transport is paused frames are held up to max_pending bytes, the rest are dropped
+        frame_len = 6 + heartbeat.LEN + 2
+        vehicle.max_pending = 10 * frame_len
+        vehicle.pause_writing()
+        for i in range(15):
+            vehicle.send(heartbeat(custom_mode=i))
+        assert (len(vehicle.pending), vehicle.pending_bytes, vehicle.dropped) == (10, 10 * frame_len, 5)
+
+        drain = asyncio.ensure_future(vehicle.drain())
+        await asyncio.sleep(0.01)
+        assert not drain.done()
+        assert station_link.stats.packets_received == 0
+
+        #Resuming writes the held frames and releases the senders waiting in drain
+        vehicle.resume_writing()
+        await asyncio.wait_for(drain, 5)
+        await wait_until(lambda: station_link.stats.packets_received == 10)
+        queue = station.queue(pymavlab.SYSID, pymavlab.COMPID)
+        assert [queue.get_nowait().seq for _ in range(10)] == list(range(10))
+        assert vehicle.pending_bytes == 0
+
+        vehicle.transport.close()
+        station_link.transport.close()
+        await asyncio.wait_for(station_link.closed, 5)
+
+    asyncio.run(run())
+
+
+def test_parser_factory_contract(pymavlab, transport):
+    calls = []
+
+    def factory(stats=None):
+        calls.append(stats)
+        return pymavlab.MAVLinkParser(stats)
+
+    async def run():
+        left, right = socket.socketpair()
+        stream = await transport.open_stream(factory, transport.MAVLinkRouter(), sock=left)
+        server = await transport.open_udp(factory, transport.MAVLinkRouter(), ('127.0.0.1', 0))
+        client = await transport.open_udp(factory, transport.MAVLinkRouter(), ('127.0.0.1', 0),
+                                          server.transport.get_extra_info('sockname'))
+        client.send(pymavlab.common.msg_heartbeat())
+        await wait_until(lambda: server.stats is not None)
+
+        #Stream links and the first sender of a datagram link are given no statistics
+        assert calls == [None, None]
+        for link in (stream, server, client):
+            link.transport.close()
+        right.close()
+
+    asyncio.run(run())